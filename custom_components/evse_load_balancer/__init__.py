@@ -12,6 +12,7 @@ from .chargers import Charger, charger_factory
 from .const import DOMAIN
 from .coordinator import EVSELoadBalancerCoordinator
 from .meters import Meter, meter_factory
+from .state_store import async_remove_state
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,22 +36,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry,
         entry.data.get(cf.CONF_CUSTOM_PHASE_CONFIG, False),
         entry.data.get(cf.CONF_METER_DEVICE),
+        entry.data.get(cf.CONF_P1_PORT),
+        local_api=entry.data.get(cf.CONF_METER_LOCAL_API, False),
+        mqtt=entry.data.get(cf.CONF_MQTT_METER, False),
     )
-    charger: Charger = await charger_factory(
-        hass, entry, entry.data.get(cf.CONF_CHARGER_DEVICE)
-    )
+    chargers: list[Charger] = [
+        await charger_factory(hass, entry, device_id)
+        for device_id in entry.data.get(cf.CONF_CHARGER_DEVICE, [])
+    ]
 
     _LOGGER.info(
-        "Setting up entry with meter '%s' and charger '%s'",
+        "Setting up entry with meter '%s' and chargers %s",
         meter.__class__.__name__,
-        charger.__class__.__name__,
+        [charger.__class__.__name__ for charger in chargers],
     )
 
     coordinator = EVSELoadBalancerCoordinator(
         hass=hass,
         config_entry=entry,
         meter=meter,
-        charger=charger,
+        chargers=chargers,
     )
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
@@ -63,6 +68,29 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
+async def async_migrate_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+    """Migrate a config entry to the current version."""
+    if entry.version > 1:
+        # Downgraded from a future version
+        return False
+
+    if entry.minor_version < 2:  # noqa: PLR2004
+        # A single charger device was stored before multiple chargers were supported
+        data = dict(entry.data)
+        charger_device = data.get(cf.CONF_CHARGER_DEVICE)
+        if isinstance(charger_device, str):
+            data[cf.CONF_CHARGER_DEVICE] = [charger_device]
+        hass.config_entries.async_update_entry(entry, data=data, minor_version=2)
+
+    _LOGGER.debug(
+        "Migrated entry %s to version %s.%s",
+        entry.entry_id,
+        entry.version,
+        entry.minor_version,
+    )
+    return True
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     coordinator: EVSELoadBalancerCoordinator = hass.data[DOMAIN].get(entry.entry_id)
@@ -75,3 +103,8 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.data[DOMAIN].pop(entry.entry_id, None)
 
     return unloaded  # Return the result of unloading platforms
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored state of a config entry that is deleted."""
+    await async_remove_state(hass, entry.entry_id)
@@ -1,28 +1,94 @@
 """Abstract Balancer Base Class for Load Balancing Algorithms."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from time import time
+from typing import Any, Self
 
+from ..const import BreakerCurve, OvercurrentMode  # noqa: TID252
 from ..meters.meter import Phase  # noqa: TID252
+from .thermal_model import DEFAULT_COOLING_TIME_CONSTANT
+
+# Seconds it takes for a new limit to take effect: about the delay between
+# two charger updates plus the time the charger takes to settle
+DEFAULT_HORIZON = 30
+
+
+@dataclass(frozen=True, slots=True)
+class BalancerSettings:
+    """
+    Settings a balancer is created with.
+
+    The settings of the breaker and the charger apply to every algorithm.
+    The options are specific to the algorithm, and are passed on to its
+    constructor as keyword arguments.
+    """
+
+    overcurrent_mode: OvercurrentMode = OvercurrentMode.OPTIMISED
+    breaker_curve: BreakerCurve = BreakerCurve.C
+    cooling_time_constant: float = DEFAULT_COOLING_TIME_CONSTANT
+    horizon: float = DEFAULT_HORIZON
+    options: Mapping[str, Any] = field(default_factory=dict)
 
 
 class Balancer(ABC):
-    """Abstract base class for a load balancing algorithm."""
+    """
+    Abstract base class for a load balancing algorithm.
+
+    A balancer turns the available current per phase into the change of the
+    charging current per phase: negative to cut, positive to allow an
+    increase and 0 to leave the chargers as they are. The power allocator
+    spreads the change over the chargers, so balancers don't need to know
+    their limits.
+    """
+
+    @classmethod
+    def from_settings(
+        cls, max_limits: dict[Phase, int], settings: BalancerSettings
+    ) -> Self:
+        """Create a balancer for the given maximum current per phase."""
+        return cls(max_limits, **settings.options)
 
     @abstractmethod
     def compute_availability(
         self,
-        current_limits: dict[Phase, int],
         available_currents: dict[Phase, int],
-        max_limits: dict[Phase, int],
         now: float = time(),
     ) -> dict[Phase, int]:
         """
-        Compute new charger limits.
+        Compute the change of the charging current.
 
-        :param current_limits: The current settings on the charger.
         :param available_currents: The available current per phase.
-        :param max_limits: The maximum allowed per phase.
-        :return: New limits per phase.
+        :param now: The time of the measurement.
+        :return: The change of the charging current per phase.
         """
         raise NotImplementedError
+
+    @abstractmethod
+    def reconfigure(
+        self,
+        max_limits: dict[Phase, int],
+        overcurrent_mode: OvercurrentMode,
+        breaker_curve: BreakerCurve = BreakerCurve.C,
+        cooling_time_constant: float = DEFAULT_COOLING_TIME_CONSTANT,
+    ) -> None:
+        """Apply new limits and breaker settings, keeping the monitored state."""
+        raise NotImplementedError
+
+    def has_trip_risk(self) -> bool:
+        """Return whether any phase risks tripping the breaker."""
+        return False
+
+    def statistics(self) -> dict[str, dict[str, float | None]]:
+        """Return the statistics of the available current, keyed by phase."""
+        return {}
+
+    def export_state(self) -> dict[str, Any]:
+        """Export the state worth keeping over a restart, keyed by phase."""
+        return {}
+
+    def restore_state(  # noqa: B027
+        self, state: dict[str, Any], elapsed: float
+    ) -> None:
+        """Restore a state exported `elapsed` seconds ago, if any is kept."""
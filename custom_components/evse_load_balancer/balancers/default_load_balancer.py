@@ -1,10 +1,12 @@
 """Default Load Balancer Algorithm."""
 
-from statistics import median
 from time import time
 
+from ..const import BreakerCurve, OvercurrentMode  # noqa: TID252
 from ..meters.meter import Phase  # noqa: TID252
 from .balancer import Balancer
+from .stats import WindowedQuantile
+from .thermal_model import DEFAULT_COOLING_TIME_CONSTANT
 
 
 class DefaultLoadBalancer(Balancer):
@@ -13,72 +15,66 @@ class DefaultLoadBalancer(Balancer):
 
     Immediately reduces the charger limit when available current is negative.
     When positive, it delays increases, smoothing the value over a set period.
+    The smoothed value is the median of the available current over the last
+    period, which is kept up to date as values come in.
+
+    As any overcurrent is cut right away, the breaker settings don't apply.
     """
 
-    def __init__(self, hysteresis_period: int = 5 * 60) -> None:
+    def __init__(
+        self,
+        max_limits: dict[Phase, int],
+        hysteresis_period: int = 5 * 60,
+    ) -> None:
         """Init."""
+        self.max_limits = dict(max_limits)
         self.hysteresis_period = hysteresis_period  # seconds
-        self._buffers: dict[Phase, list[int]] = {phase: [] for phase in Phase}
-        self._last_update: dict[Phase, float] = dict.fromkeys(Phase, 0.0)
-        self._hysteresis_start = dict.fromkeys(Phase)
-        self._hysteresis_buffer = dict.fromkeys(Phase)
+        self._medians: dict[Phase, WindowedQuantile] = {
+            phase: WindowedQuantile(window=hysteresis_period) for phase in max_limits
+        }
+        self._last_update: dict[Phase, float] = dict.fromkeys(max_limits, 0.0)
 
     def compute_availability(
         self,
-        current_limits: dict[Phase, int],
         available_currents: dict[Phase, int],
-        max_limits: dict[Phase, int],
         now: float = time(),
     ) -> dict[Phase, int]:
-        """Compute current limits limits."""
-        new_limits = current_limits.copy()
-        for phase in Phase:
-            avail = available_currents[phase]
-            current = current_limits[phase]
-            max_limit = max_limits[phase]
+        """Compute the change of the charging current."""
+        available = {}
+        for phase, avail in available_currents.items():
+            available[phase] = 0
             # Immediate reduction if consumption is over the limit:
             if avail < 0:
-                new_val = max(0, current + avail)
-                new_limits[phase] = new_val
-
-                self._reset_hysteresis(phase)
+                available[phase] = avail
                 self._last_update[phase] = now
-            else:
-                # Buffer the available current for positive adjustments.
-                self._buffers[phase].append(avail)
-                # Increase only if the hysteresis period has passed.
-                if now - self._last_update[phase] >= self.hysteresis_period:
-                    # Use median of buffered values for a "sustained" positive value.
-                    median_incr = int(median(self._buffers[phase]))
-                    new_val = min(max_limit, current + median_incr)
-                    new_limits[phase] = new_val
-                    self._buffers[phase].clear()
-                    self._last_update[phase] = now
+                continue
 
-        return new_limits
-
-    def _apply_phase_hysteresis(
-        self, phase: Phase, available_current: int
-    ) -> int | None:
-        """Apply hysteresis to the current limit for a given phase."""
-        now = int(time())
-        if self._hysteresis_start[phase] is None:
-            self._hysteresis_start[phase] = now
-            self._hysteresis_buffer[phase] = []
-
-        buffer = self._hysteresis_buffer[phase]
-        start_time = self._hysteresis_start[phase]
+            # Buffer the available current for positive adjustments.
+            median = self._medians[phase]
+            median.add(avail, now)
+            # Increase only if the hysteresis period has passed.
+            if now - self._last_update[phase] >= self.hysteresis_period:
+                # Use median of buffered values for a "sustained" positive value.
+                available[phase] = min(self.max_limits[phase], int(median.value))
+                median.clear()
+                self._last_update[phase] = now
 
-        buffer.append(available_current)
-        elapsed_min = (now - start_time) / 60
+        return available
 
-        if elapsed_min >= self.hysteresis_period:
-            smoothened_current = int(median(self._hysteresis_buffer[phase]))
-            self._reset_hysteresis(phase)
-            return smoothened_current
+    def reconfigure(
+        self,
+        max_limits: dict[Phase, int],
+        overcurrent_mode: OvercurrentMode,  # noqa: ARG002
+        breaker_curve: BreakerCurve = BreakerCurve.C,  # noqa: ARG002
+        cooling_time_constant: float = DEFAULT_COOLING_TIME_CONSTANT,  # noqa: ARG002
+    ) -> None:
+        """Apply new limits, keeping the buffered available currents."""
+        self.max_limits = dict(max_limits)
 
-        return None
+    def statistics(self) -> dict[str, dict[str, float | None]]:
+        """Return the median of the buffered available current, keyed by phase."""
+        return {phase.value: {"median": self.median(phase)} for phase in self._medians}
 
-    def _reset_hysteresis(self, phase: Phase) -> None:
-        self._hysteresis_start[phase] = None
-        self._hysteresis_buffer[phase] = []
+    def median(self, phase: Phase) -> float | None:
+        """Return the median of the available current buffered for a phase."""
+        return self._medians[phase].value
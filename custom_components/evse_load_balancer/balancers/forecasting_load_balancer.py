@@ -0,0 +1,128 @@
+"""Load balancer acting on a short-horizon forecast of the available current."""
+
+from math import floor
+from time import time
+from typing import Self
+
+from custom_components.evse_load_balancer.balancers.balancer import (
+    DEFAULT_HORIZON,
+    BalancerSettings,
+)
+from custom_components.evse_load_balancer.balancers.optimised_load_balancer import (
+    DEFAULT_TRIP_MARGIN,
+    OptimisedLoadBalancer,
+)
+from custom_components.evse_load_balancer.balancers.stats import HoltForecast
+from custom_components.evse_load_balancer.balancers.thermal_model import (
+    DEFAULT_COOLING_TIME_CONSTANT,
+)
+from custom_components.evse_load_balancer.const import BreakerCurve, OvercurrentMode
+from custom_components.evse_load_balancer.meters.meter import Phase
+
+# Time constants (in seconds) of the level and trend of the forecast, and
+# the time over which the trend dies out
+LEVEL_TIME_CONSTANT = 5
+TREND_TIME_CONSTANT = 15
+TREND_DAMPING_TIME = 60
+
+# Amps the forecast has to be below the available current before it's acted
+# on, so meter noise doesn't lower the limits
+FORECAST_DEADBAND = 2
+
+
+class ForecastingLoadBalancer(OptimisedLoadBalancer):
+    """
+    Optimised load balancer that looks ahead.
+
+    A new limit only takes effect once the charger processed it, so the
+    optimised balancer acts late when the household load rises quickly, for
+    instance when an oven or heat pump starts. This balancer forecasts the
+    available current of each phase over that horizon, from its level and
+    trend, and lowers the limit to the forecast when it is falling.
+
+    The forecast only ever lowers limits, and only while there is no
+    overcurrent yet: increases and actual overcurrent are handled as by the
+    optimised balancer. As a steady load has no trend, the average charging
+    current is unaffected.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        max_limits: dict[Phase, int],
+        horizon: float = DEFAULT_HORIZON,
+        trip_margin: float = DEFAULT_TRIP_MARGIN,
+        overcurrent_mode: OvercurrentMode = OvercurrentMode.OPTIMISED,
+        breaker_curve: BreakerCurve = BreakerCurve.C,
+        cooling_time_constant: float = DEFAULT_COOLING_TIME_CONSTANT,
+    ) -> None:
+        """Initialize the load balancer."""
+        super().__init__(
+            max_limits=max_limits,
+            trip_margin=trip_margin,
+            overcurrent_mode=overcurrent_mode,
+            breaker_curve=breaker_curve,
+            cooling_time_constant=cooling_time_constant,
+        )
+        self.horizon = horizon
+        self._forecasts = {
+            phase: HoltForecast(
+                level_time_constant=LEVEL_TIME_CONSTANT,
+                trend_time_constant=TREND_TIME_CONSTANT,
+                damping_time=TREND_DAMPING_TIME,
+            )
+            for phase in max_limits
+        }
+
+    @classmethod
+    def from_settings(
+        cls, max_limits: dict[Phase, int], settings: BalancerSettings
+    ) -> Self:
+        """Create a balancer looking ahead over the charger's settle time."""
+        return cls(
+            max_limits,
+            horizon=settings.horizon,
+            overcurrent_mode=settings.overcurrent_mode,
+            breaker_curve=settings.breaker_curve,
+            cooling_time_constant=settings.cooling_time_constant,
+            **settings.options,
+        )
+
+    def compute_availability(
+        self,
+        available_currents: dict[Phase, int],
+        now: float = time(),
+    ) -> dict[Phase, int]:
+        """Compute available currents, lowered to a falling forecast."""
+        available = super().compute_availability(available_currents, now)
+        for phase, current in available_currents.items():
+            forecast = self._forecasts[phase]
+            forecast.update(current, now)
+            expected = forecast.forecast(self.horizon)
+            if (
+                current >= 0
+                and forecast.trend < 0
+                and expected < available[phase] - FORECAST_DEADBAND
+            ):
+                available[phase] = floor(expected)
+        return available
+
+    def forecast(self, phase: Phase) -> float | None:
+        """Return the available current expected on a phase after the horizon."""
+        return self._forecasts[phase].forecast(self.horizon)
+
+    def has_trip_risk(self) -> bool:
+        """Return whether any phase has thermal load or a forecast overcurrent."""
+        return super().has_trip_risk() or any(
+            expected is not None and expected < 0
+            for expected in map(self.forecast, self._forecasts)
+        )
+
+    def statistics(self) -> dict[str, dict[str, float | None]]:
+        """Return the statistics of the available current and its forecast."""
+        statistics = super().statistics()
+        for phase in self._forecasts:
+            expected = self.forecast(phase)
+            statistics[phase.value]["forecast"] = (
+                round(expected, 2) if expected is not None else None
+            )
+        return statistics
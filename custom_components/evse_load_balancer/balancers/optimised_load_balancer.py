@@ -1,11 +1,36 @@
 """Abstract Balancer Base Class for Load Balancing Algorithms."""
 
 from time import time
-
-from custom_components.evse_load_balancer.balancers.balancer import Balancer
-from custom_components.evse_load_balancer.const import OvercurrentMode
+from typing import Any, Self
+
+from custom_components.evse_load_balancer.balancers.balancer import (
+    Balancer,
+    BalancerSettings,
+)
+from custom_components.evse_load_balancer.balancers.stats import (
+    Ewma,
+    RollingMax,
+    RollingMin,
+)
+from custom_components.evse_load_balancer.balancers.thermal_model import (
+    DEFAULT_COOLING_TIME_CONSTANT,
+    ThermalBreakerModel,
+)
+from custom_components.evse_load_balancer.const import BreakerCurve, OvercurrentMode
 from custom_components.evse_load_balancer.meters.meter import Phase
 
+# Time constant of the average available current, and the window of its
+# minimum and maximum, in seconds
+STATS_TIME_CONSTANT = 60
+STATS_WINDOW = 5 * 60
+
+# Share of the breaker's thermal budget used before the limit is reduced
+DEFAULT_TRIP_MARGIN = 0.5
+# Share of the trip margin a cooling breaker counts as a trip risk until. A
+# breaker takes about half an hour to cool down completely, while the
+# remaining load stops mattering long before.
+TRIP_RISK_SHARE = 0.2
+
 
 class OptimisedLoadBalancer(Balancer):
     """
@@ -17,28 +42,43 @@ class OptimisedLoadBalancer(Balancer):
 
     On the other hand, it does put a bit more load on your circuit, as it
     accepts temporary overcurrent situations, and only reduces the limits
-    when the risk is high enough.
+    when the breaker's thermal load is high enough.
     """
 
     def __init__(
         self,
         max_limits: dict[Phase, int],
-        trip_risk_threshold: int = 60,
-        risk_decay_per_second: float = 1.0,
+        trip_margin: float = DEFAULT_TRIP_MARGIN,
         overcurrent_mode: OvercurrentMode = OvercurrentMode.OPTIMISED,
+        breaker_curve: BreakerCurve = BreakerCurve.C,
+        cooling_time_constant: float = DEFAULT_COOLING_TIME_CONSTANT,
     ) -> None:
         """Initialize the load balancer."""
         self._phase_monitors = {
             phase: PhaseMonitor(
                 phase=phase,
                 max_limit=max_limits[phase],
-                trip_risk_threshold=trip_risk_threshold,
-                risk_decay_per_second=risk_decay_per_second,
+                trip_margin=trip_margin,
                 overcurrent_mode=overcurrent_mode,
+                breaker_curve=breaker_curve,
+                cooling_time_constant=cooling_time_constant,
             )
             for phase in max_limits
         }
 
+    @classmethod
+    def from_settings(
+        cls, max_limits: dict[Phase, int], settings: BalancerSettings
+    ) -> Self:
+        """Create a balancer for the given maximum current and breaker."""
+        return cls(
+            max_limits,
+            overcurrent_mode=settings.overcurrent_mode,
+            breaker_curve=settings.breaker_curve,
+            cooling_time_constant=settings.cooling_time_constant,
+            **settings.options,
+        )
+
     def compute_availability(
         self,
         available_currents: dict[Phase, int],
@@ -52,70 +92,158 @@ class OptimisedLoadBalancer(Balancer):
             )
         return available
 
+    def reconfigure(
+        self,
+        max_limits: dict[Phase, int],
+        overcurrent_mode: OvercurrentMode,
+        breaker_curve: BreakerCurve = BreakerCurve.C,
+        cooling_time_constant: float = DEFAULT_COOLING_TIME_CONSTANT,
+    ) -> None:
+        """Apply new limits and breaker settings, keeping the monitored state."""
+        for phase, monitor in self._phase_monitors.items():
+            monitor.reconfigure(
+                max_limit=max_limits[phase],
+                overcurrent_mode=overcurrent_mode,
+                breaker_curve=breaker_curve,
+                cooling_time_constant=cooling_time_constant,
+            )
+
+    def has_trip_risk(self) -> bool:
+        """Return whether any phase has accumulated trip risk."""
+        return any(monitor.has_trip_risk for monitor in self._phase_monitors.values())
+
+    def statistics(self) -> dict[str, dict[str, float | None]]:
+        """Return the statistics of the available current, keyed by phase."""
+        return {
+            phase.value: monitor.statistics()
+            for phase, monitor in self._phase_monitors.items()
+        }
+
+    def export_state(self) -> dict[str, Any]:
+        """Export the state of all phase monitors, keyed by phase."""
+        return {
+            phase.value: monitor.export_state()
+            for phase, monitor in self._phase_monitors.items()
+        }
+
+    def restore_state(self, state: dict[str, Any], elapsed: float) -> None:
+        """Restore the phase monitors from a state saved `elapsed` seconds ago."""
+        for phase, monitor in self._phase_monitors.items():
+            if phase.value in state:
+                monitor.restore_state(state[phase.value], elapsed)
+
 
 class PhaseMonitor:
     """Monitor a single phase."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         phase: Phase,
         max_limit: int,
-        trip_risk_threshold: int = 60,
-        risk_decay_per_second: float = 1.0,
+        trip_margin: float = DEFAULT_TRIP_MARGIN,
         overcurrent_mode: OvercurrentMode = OvercurrentMode.OPTIMISED,
+        breaker_curve: BreakerCurve = BreakerCurve.C,
+        cooling_time_constant: float = DEFAULT_COOLING_TIME_CONSTANT,
     ) -> None:
         """Monitor given phase current availability and return normalised limits."""
         self.phase = phase
         self.max_limit = max_limit
         self.phase_limit = max_limit
-        self._trip_risk_threshold = trip_risk_threshold
-        self._risk_decay_per_second = risk_decay_per_second
+        self._trip_margin = trip_margin
         self._overcurrent_mode = overcurrent_mode
+        self._breaker = ThermalBreakerModel(breaker_curve, cooling_time_constant)
+        # Whether the breaker heated up at the last update
+        self._heating = False
 
         self._last_compute: int | None = None
-        self._cumulative_trip_risk = 0.0
+
+        self._average = Ewma(time_constant=STATS_TIME_CONSTANT)
+        self._minimum = RollingMin(window=STATS_WINDOW)
+        self._maximum = RollingMax(window=STATS_WINDOW)
+
+    @property
+    def trip_risk(self) -> float:
+        """Return the thermal load of the breaker, where 1 means it may trip."""
+        return self._breaker.load
+
+    @property
+    def has_trip_risk(self) -> bool:
+        """Return whether the breaker is heating up or still has a notable load."""
+        return self._heating or (
+            self._breaker.load >= self._trip_margin * TRIP_RISK_SHARE
+        )
+
+    def statistics(self) -> dict[str, float | None]:
+        """Return the average, minimum and maximum of the available current."""
+        average = self._average.value
+        return {
+            "average": round(average, 2) if average is not None else None,
+            "minimum": self._minimum.value,
+            "maximum": self._maximum.value,
+            "thermal_load": round(self._breaker.load, 3),
+        }
+
+    def reconfigure(
+        self,
+        max_limit: int,
+        overcurrent_mode: OvercurrentMode,
+        breaker_curve: BreakerCurve = BreakerCurve.C,
+        cooling_time_constant: float = DEFAULT_COOLING_TIME_CONSTANT,
+    ) -> None:
+        """Apply a new maximum limit, overcurrent mode and breaker settings."""
+        self.max_limit = max_limit
+        self.phase_limit = min(self.phase_limit, max_limit)
+        self._overcurrent_mode = overcurrent_mode
+        self._breaker.reconfigure(breaker_curve, cooling_time_constant)
+        if overcurrent_mode != OvercurrentMode.OPTIMISED:
+            self._breaker.load = 0.0
+            self._heating = False
+
+    def export_state(self) -> dict[str, float]:
+        """Export the thermal load and current limit."""
+        return {
+            "phase_limit": self.phase_limit,
+            "thermal_load": self._breaker.load,
+        }
+
+    def restore_state(self, state: dict[str, float], elapsed: float) -> None:
+        """
+        Restore a state saved `elapsed` seconds ago.
+
+        The breaker cools down over the time nothing was monitored, as it
+        would have if the phase had stayed below its limit. The first update
+        after restoring doesn't add any load for that time either.
+        """
+        self.phase_limit = min(self.max_limit, state["phase_limit"])
+        self._breaker.load = min(1.0, max(0.0, state.get("thermal_load", 0.0)))
+        self._breaker.cool(elapsed)
+        self._heating = False
+        self._last_compute = None
 
     def update(self, avail: float, now: int) -> float:
         """Update the current availability and compute the new limit."""
         elapsed = now - self._last_compute if self._last_compute is not None else 0
+        self._average.update(avail, now)
+        self._minimum.add(avail, now)
+        self._maximum.add(avail, now)
 
+        self._heating = (
+            avail < 0 and self._overcurrent_mode == OvercurrentMode.OPTIMISED
+        )
         if avail < 0:
             if self._overcurrent_mode == OvercurrentMode.OPTIMISED:
-                risk_increase = self._calculate_trip_risk(avail) * elapsed
-                self._cumulative_trip_risk += risk_increase
-
-                if self._cumulative_trip_risk >= self._trip_risk_threshold:
-                    self._cumulative_trip_risk = 0.0
+                # Current through the breaker as a multiple of its rating
+                current = (self.max_limit - avail) / self.max_limit
+                load = self._breaker.update(current, elapsed)
+                if load >= self._trip_margin or self._breaker.is_instantaneous(current):
                     self.phase_limit = avail
             else:
-                self._cumulative_trip_risk = 0.0
+                self._breaker.load = 0.0
                 self.phase_limit = max(0, self.phase_limit + avail)
         else:
-            risk_decay = self._risk_decay_per_second * elapsed
-            self._cumulative_trip_risk = max(
-                0.0, self._cumulative_trip_risk - risk_decay
-            )
+            self._breaker.cool(elapsed)
             self.phase_limit = min(self.max_limit, avail)
 
         self._last_compute = now
 
         return self.phase_limit
-
-    def _calculate_trip_risk(self, available: float) -> float:
-        """
-        Calculate trip risk factor based on overcurrent percentage.
-
-        Overcurrent percentage is a value between 0 and 1
-        and the returned value is a fraction of the trip risk threshold
-        devided by the number of seconds the overcurrency is allowed.
-        the values here are roughly (as in extremely roughly) based on
-        the trip risk curve in C-character circuit breakers.
-        """
-        overcurrent_percentage = abs(available) / self.max_limit
-        if overcurrent_percentage <= 0.13:  # noqa: PLR2004
-            return self._trip_risk_threshold / 60
-        if overcurrent_percentage <= 0.40:  # noqa: PLR2004
-            return self._trip_risk_threshold / 30
-        if overcurrent_percentage <= 1.0:
-            return self._trip_risk_threshold / 10
-        return self._trip_risk_threshold
@@ -0,0 +1,171 @@
+"""Load balancer settling on a stable limit in as few charger writes as possible."""
+
+from math import floor
+from time import time
+from typing import Any
+
+from custom_components.evse_load_balancer.balancers.optimised_load_balancer import (
+    DEFAULT_TRIP_MARGIN,
+    OptimisedLoadBalancer,
+)
+from custom_components.evse_load_balancer.balancers.thermal_model import (
+    DEFAULT_COOLING_TIME_CONSTANT,
+)
+from custom_components.evse_load_balancer.const import BreakerCurve, OvercurrentMode
+from custom_components.evse_load_balancer.meters.meter import Phase
+
+# Amps kept free below the fuse, so small fluctuations after a change don't
+# call for another one
+DEFAULT_MARGIN = 1
+# Smallest increase (in amps) worth a write on its own
+DEFAULT_DEADBAND = 2
+# Seconds a surplus below the deadband has to last before it's used anyway
+DEFAULT_INTEGRAL_TIME = 120
+
+
+class RampController:
+    """
+    PI controller of the headroom on a single phase.
+
+    The error is the available current above the margin. Its proportional
+    part releases an increase once it reaches the deadband, while the
+    integral lets a smaller surplus through once it has lasted long enough.
+    The integral is clamped to what releases an increase by itself (anti
+    windup) and restarts after each release, so an increase is released
+    once rather than drip-fed over several writes.
+    """
+
+    __slots__ = (
+        "_integral",
+        "_last_update",
+        "deadband",
+        "integral_time",
+        "margin",
+    )
+
+    def __init__(
+        self,
+        margin: float = DEFAULT_MARGIN,
+        deadband: float = DEFAULT_DEADBAND,
+        integral_time: float = DEFAULT_INTEGRAL_TIME,
+    ) -> None:
+        """Initialize the controller without any accumulated surplus."""
+        self.margin = margin
+        self.deadband = deadband
+        self.integral_time = integral_time
+        self._integral = 0.0
+        self._last_update: float | None = None
+
+    @property
+    def integral(self) -> float:
+        """Return the accumulated surplus below the deadband, in amp seconds."""
+        return self._integral
+
+    def update(self, available: float, now: float) -> int:
+        """
+        Return the change to the charging current for the available current.
+
+        A negative available current is cut with the margin on top. A
+        positive one is only released as an increase by the controller, and
+        the change is 0 otherwise, which leaves the chargers untouched.
+        """
+        elapsed = now - self._last_update if self._last_update is not None else 0
+        self._last_update = now
+
+        error = available - self.margin
+        if available < 0:
+            self._integral = 0.0
+            return floor(error)
+        if error <= 0:
+            self._integral = 0.0
+            return 0
+
+        output = error + self._integral / self.integral_time
+        if output >= self.deadband:
+            self._integral = 0.0
+            return floor(error)
+
+        self._integral = min(
+            self._integral + error * max(0, elapsed),
+            self.deadband * self.integral_time,
+        )
+        return 0
+
+    def reset(self) -> None:
+        """Forget the accumulated surplus."""
+        self._integral = 0.0
+        self._last_update = None
+
+
+class RampControllerLoadBalancer(OptimisedLoadBalancer):
+    """
+    Optimised load balancer that changes the limits in as few writes as possible.
+
+    The optimised balancer passes on every bit of surplus as it comes, and
+    cuts to exactly the fuse size, where the next fluctuation calls for
+    another cut. As every write to a cloud charger takes seconds and counts
+    against its rate limits, this balancer runs a `RampController` per
+    phase: cuts leave a margin below the fuse, and surplus is only passed
+    on in steps worth a write.
+
+    Whether an overcurrent is cut at all is still decided by the breaker's
+    thermal model.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        max_limits: dict[Phase, int],
+        margin: float = DEFAULT_MARGIN,
+        deadband: float = DEFAULT_DEADBAND,
+        integral_time: float = DEFAULT_INTEGRAL_TIME,
+        trip_margin: float = DEFAULT_TRIP_MARGIN,
+        overcurrent_mode: OvercurrentMode = OvercurrentMode.OPTIMISED,
+        breaker_curve: BreakerCurve = BreakerCurve.C,
+        cooling_time_constant: float = DEFAULT_COOLING_TIME_CONSTANT,
+    ) -> None:
+        """Initialize the load balancer."""
+        super().__init__(
+            max_limits=max_limits,
+            trip_margin=trip_margin,
+            overcurrent_mode=overcurrent_mode,
+            breaker_curve=breaker_curve,
+            cooling_time_constant=cooling_time_constant,
+        )
+        self._controllers = {
+            phase: RampController(
+                margin=margin, deadband=deadband, integral_time=integral_time
+            )
+            for phase in max_limits
+        }
+
+    def compute_availability(
+        self,
+        available_currents: dict[Phase, int],
+        now: float = time(),
+    ) -> dict[Phase, int]:
+        """Compute the changes to the available currents worth a write."""
+        available = super().compute_availability(available_currents, now)
+        for phase, current in available_currents.items():
+            controller = self._controllers[phase]
+            if current < 0 <= available[phase]:
+                # An overcurrent the breaker's thermal model still tolerates
+                controller.reset()
+                available[phase] = 0
+            else:
+                available[phase] = min(
+                    available[phase], controller.update(current, now)
+                )
+        return available
+
+    def statistics(self) -> dict[str, dict[str, float | None]]:
+        """Return the statistics of the available current and the controllers."""
+        statistics = super().statistics()
+        for phase, controller in self._controllers.items():
+            statistics[phase.value]["ramp_integral"] = round(controller.integral, 2)
+        return statistics
+
+    def restore_state(self, state: dict[str, Any], elapsed: float) -> None:
+        """Restore the phase monitors, starting the controllers afresh."""
+        super().restore_state(state, elapsed)
+        for controller in self._controllers.values():
+            controller.reset()
@@ -0,0 +1,51 @@
+"""Registry of the algorithms balancing the available current."""
+
+from custom_components.evse_load_balancer.balancers.balancer import (
+    Balancer,
+    BalancerSettings,
+)
+from custom_components.evse_load_balancer.balancers.default_load_balancer import (
+    DefaultLoadBalancer,
+)
+from custom_components.evse_load_balancer.balancers.forecasting_load_balancer import (
+    ForecastingLoadBalancer,
+)
+from custom_components.evse_load_balancer.balancers.optimised_load_balancer import (
+    OptimisedLoadBalancer,
+)
+from custom_components.evse_load_balancer.balancers.ramp_controller_balancer import (
+    RampControllerLoadBalancer,
+)
+from custom_components.evse_load_balancer.const import BalancerAlgorithm
+from custom_components.evse_load_balancer.meters.meter import Phase
+
+_BALANCERS: dict[BalancerAlgorithm, type[Balancer]] = {}
+
+
+def register_balancer(algorithm: BalancerAlgorithm, balancer: type[Balancer]) -> None:
+    """Register the balancer implementing an algorithm."""
+    _BALANCERS[algorithm] = balancer
+
+
+def get_balancer(algorithm: BalancerAlgorithm) -> type[Balancer]:
+    """Return the balancer implementing an algorithm."""
+    try:
+        return _BALANCERS[algorithm]
+    except KeyError as ex:
+        msg = f"No balancer registered for algorithm '{algorithm.value}'"
+        raise ValueError(msg) from ex
+
+
+def create_balancer(
+    algorithm: BalancerAlgorithm,
+    max_limits: dict[Phase, int],
+    settings: BalancerSettings,
+) -> Balancer:
+    """Create a balancer of an algorithm for the given maximum current per phase."""
+    return get_balancer(algorithm).from_settings(max_limits, settings)
+
+
+register_balancer(BalancerAlgorithm.OPTIMISED, OptimisedLoadBalancer)
+register_balancer(BalancerAlgorithm.FORECASTING, ForecastingLoadBalancer)
+register_balancer(BalancerAlgorithm.RAMP, RampControllerLoadBalancer)
+register_balancer(BalancerAlgorithm.MEDIAN, DefaultLoadBalancer)
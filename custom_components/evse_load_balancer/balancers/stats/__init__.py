@@ -0,0 +1,17 @@
+"""Streaming statistics over windows of time, shared by the balancers."""
+
+from .ewma import Ewma
+from .forecast import HoltForecast
+from .quantile import WindowedQuantile
+from .ring import TimeRing
+from .rolling import RollingMax, RollingMean, RollingMin
+
+__all__ = [
+    "Ewma",
+    "HoltForecast",
+    "RollingMax",
+    "RollingMean",
+    "RollingMin",
+    "TimeRing",
+    "WindowedQuantile",
+]
@@ -0,0 +1,42 @@
+"""Exponentially weighted moving average with time-based decay."""
+
+from math import exp
+
+
+class Ewma:
+    """
+    Moving average in which older values weigh exponentially less.
+
+    The weight of a value decays with the time passed since it was added, not
+    with the number of values added after it: after `time_constant` seconds,
+    a value counts for about a third (1/e) of what it did. This keeps the
+    average meaningful when updates come in at irregular intervals. Updating
+    is O(1).
+    """
+
+    __slots__ = ("_last_update", "time_constant", "value")
+
+    def __init__(self, time_constant: float) -> None:
+        """Initialize an empty average decaying over `time_constant` seconds."""
+        if time_constant <= 0:
+            msg = f"Time constant must be positive, got {time_constant}"
+            raise ValueError(msg)
+        self.time_constant = time_constant
+        self.value: float | None = None
+        self._last_update: float | None = None
+
+    def update(self, value: float, now: float) -> float:
+        """Add a value at time `now` and return the new average."""
+        if self.value is None or self._last_update is None:
+            self.value = float(value)
+        else:
+            elapsed = max(0.0, now - self._last_update)
+            alpha = 1 - exp(-elapsed / self.time_constant)
+            self.value += alpha * (value - self.value)
+        self._last_update = now
+        return self.value
+
+    def clear(self) -> None:
+        """Forget all values."""
+        self.value = None
+        self._last_update = None
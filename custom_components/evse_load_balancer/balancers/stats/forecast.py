@@ -0,0 +1,79 @@
+"""Short-horizon forecast with Holt's linear trend method."""
+
+from math import exp
+
+
+class HoltForecast:
+    """
+    Level and trend of a series, smoothed over time.
+
+    Holt's double exponential smoothing, with smoothing factors derived from
+    the time between samples, so irregular updates weigh as much as their
+    duration. The trend is in units per second and is damped over the
+    forecast horizon, so a single jump doesn't extrapolate forever. Updating
+    and forecasting are O(1).
+    """
+
+    __slots__ = (
+        "_last_update",
+        "damping_time",
+        "level",
+        "level_time_constant",
+        "trend",
+        "trend_time_constant",
+    )
+
+    def __init__(
+        self,
+        level_time_constant: float,
+        trend_time_constant: float,
+        damping_time: float,
+    ) -> None:
+        """Initialize an empty forecast."""
+        for name, value in (
+            ("Level time constant", level_time_constant),
+            ("Trend time constant", trend_time_constant),
+            ("Damping time", damping_time),
+        ):
+            if value <= 0:
+                msg = f"{name} must be positive, got {value}"
+                raise ValueError(msg)
+        self.level_time_constant = level_time_constant
+        self.trend_time_constant = trend_time_constant
+        self.damping_time = damping_time
+        self.level: float | None = None
+        self.trend = 0.0
+        self._last_update: float | None = None
+
+    def update(self, value: float, now: float) -> None:
+        """Add a value at time `now`."""
+        if self.level is None or self._last_update is None:
+            self.level = float(value)
+            self._last_update = now
+            return
+
+        elapsed = now - self._last_update
+        if elapsed <= 0:
+            return
+
+        alpha = 1 - exp(-elapsed / self.level_time_constant)
+        beta = 1 - exp(-elapsed / self.trend_time_constant)
+        predicted = self.level + self.trend * elapsed
+        level = predicted + alpha * (value - predicted)
+        self.trend += beta * ((level - self.level) / elapsed - self.trend)
+        self.level = level
+        self._last_update = now
+
+    def forecast(self, horizon: float) -> float | None:
+        """Return the expected value `horizon` seconds after the last update."""
+        if self.level is None:
+            return None
+        # Integral of a trend decaying with the damping time
+        damped_horizon = self.damping_time * (1 - exp(-horizon / self.damping_time))
+        return self.level + self.trend * damped_horizon
+
+    def clear(self) -> None:
+        """Forget all values."""
+        self.level = None
+        self.trend = 0.0
+        self._last_update = None
@@ -0,0 +1,142 @@
+"""Streaming quantile over a sliding window of time."""
+
+from collections import deque
+from heapq import heapify, heappop, heappush
+from math import floor
+
+
+class WindowedQuantile:
+    """
+    Quantile of the values added over the last `window` seconds.
+
+    The values are split over two heaps: a max-heap with the values up to
+    the quantile and a min-heap with the values above it. Adding a value is
+    O(log n). Values leaving the window are removed lazily, once they reach
+    the top of their heap, and the heaps are rebuilt when more than half of
+    their entries are stale. Memory is bounded by the number of values in the
+    window.
+
+    Like `statistics.median`, the quantile interpolates between the two
+    nearest values when it falls between them.
+    """
+
+    __slots__ = (
+        "_high",
+        "_low",
+        "_low_ids",
+        "_next_id",
+        "_quantile",
+        "_values",
+        "window",
+    )
+
+    def __init__(self, window: float, quantile: float = 0.5) -> None:
+        """Initialize an empty window of `window` seconds."""
+        if not 0 <= quantile <= 1:
+            msg = f"Quantile must be between 0 and 1, got {quantile}"
+            raise ValueError(msg)
+        self.window = window
+        self._quantile = quantile
+        # Values in the window with the time and order they were added in.
+        # Values leave in the order they came in, so an entry in the heaps is
+        # stale once its id is older than that of the oldest value.
+        self._values: deque[tuple[float, float, int]] = deque()
+        self._next_id = 0
+        # Entries are (-value, -id) in low, so the largest value is on top,
+        # and (value, id) in high
+        self._low: list[tuple[float, int]] = []
+        self._high: list[tuple[float, int]] = []
+        # Ids of the values in the window that are in low
+        self._low_ids: set[int] = set()
+
+    def __len__(self) -> int:
+        """Return the number of values in the window."""
+        return len(self._values)
+
+    @property
+    def value(self) -> float | None:
+        """Return the quantile of the values in the window, if any."""
+        count = len(self._values)
+        if not count:
+            return None
+        position = self._quantile * (count - 1)
+        fraction = position - floor(position)
+        low = -self._low[0][0]
+        if not fraction:
+            return low
+        return low + (self._high[0][0] - low) * fraction
+
+    def add(self, value: float, now: float) -> None:
+        """Add a value at time `now`, evicting the values that left the window."""
+        self.evict(now)
+        value_id = self._next_id
+        self._next_id += 1
+        self._values.append((now, value, value_id))
+        if not self._low_ids or value <= -self._low[0][0]:
+            heappush(self._low, (-value, -value_id))
+            self._low_ids.add(value_id)
+        else:
+            heappush(self._high, (value, value_id))
+        self._rebalance()
+
+    def evict(self, now: float) -> None:
+        """Remove the values added `window` seconds or longer before `now`."""
+        values = self._values
+        cutoff = now - self.window
+        evicted = False
+        while values and values[0][0] <= cutoff:
+            _, _, value_id = values.popleft()
+            self._low_ids.discard(value_id)
+            evicted = True
+
+        if not evicted:
+            return
+        if len(self._low) + len(self._high) > 2 * len(values) + 16:
+            self._rebuild()
+        else:
+            self._prune()
+            self._rebalance()
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._values.clear()
+        self._low.clear()
+        self._high.clear()
+        self._low_ids.clear()
+
+    def _target_low_size(self, count: int) -> int:
+        """Return the number of values of the window that belong in low."""
+        return floor(self._quantile * (count - 1)) + 1 if count else 0
+
+    def _rebalance(self) -> None:
+        """Move values between the heaps until the quantile is on top of low."""
+        target = self._target_low_size(len(self._values))
+        while len(self._low_ids) > target:
+            value, value_id = heappop(self._low)
+            self._low_ids.remove(-value_id)
+            heappush(self._high, (-value, -value_id))
+            self._prune()
+        while len(self._low_ids) < target:
+            value, value_id = heappop(self._high)
+            heappush(self._low, (-value, -value_id))
+            self._low_ids.add(value_id)
+            self._prune()
+
+    def _prune(self) -> None:
+        """Pop the entries on top of the heaps that already left the window."""
+        oldest_id = self._values[0][2] if self._values else self._next_id
+        low, high = self._low, self._high
+        while low and -low[0][1] < oldest_id:
+            heappop(low)
+        while high and high[0][1] < oldest_id:
+            heappop(high)
+
+    def _rebuild(self) -> None:
+        """Rebuild the heaps from the values in the window, dropping stale ones."""
+        entries = sorted((value, value_id) for _, value, value_id in self._values)
+        low_size = self._target_low_size(len(entries))
+        self._low = [(-value, -value_id) for value, value_id in entries[:low_size]]
+        heapify(self._low)
+        # A sorted list is a valid min-heap
+        self._high = entries[low_size:]
+        self._low_ids = {value_id for _, value_id in entries[:low_size]}
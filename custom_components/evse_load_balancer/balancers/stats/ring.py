@@ -0,0 +1,46 @@
+"""Growable ring buffer of timestamped values."""
+
+from ...ring_buffer import RingBuffer  # noqa: TID252
+
+_TIME = 0
+_VALUE = 1
+
+
+class TimeRing(RingBuffer):
+    """
+    Double-ended queue of (time, value) pairs, backed by two float arrays.
+
+    Values can be added and removed at both ends in O(1). When full, the
+    arrays double in size, so the capacity follows the largest number of
+    values held at once rather than the number ever added.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, capacity: int = 16) -> None:
+        """Initialize an empty ring with room for `capacity` values."""
+        super().__init__((("d", 0.0), ("d", 0.0)), max(1, capacity), growable=True)
+
+    def first_time(self) -> float:
+        """Return the time of the oldest value."""
+        return self.get(_TIME, 0)
+
+    def first(self) -> float:
+        """Return the oldest value."""
+        return self.get(_VALUE, 0)
+
+    def last(self) -> float:
+        """Return the newest value."""
+        return self.get(_VALUE, -1)
+
+    def pop_first(self) -> float:
+        """Remove and return the oldest value."""
+        value = self.first()
+        super().pop_first()
+        return value
+
+    def pop_last(self) -> float:
+        """Remove and return the newest value."""
+        value = self.last()
+        super().pop_last()
+        return value
@@ -0,0 +1,107 @@
+"""Rolling mean, minimum and maximum over a sliding window of time."""
+
+from .ring import TimeRing
+
+
+class RollingMean:
+    """
+    Mean of the values added over the last `window` seconds.
+
+    Keeps a running sum, so adding and evicting values is O(1).
+    """
+
+    __slots__ = ("_ring", "_sum", "window")
+
+    def __init__(self, window: float) -> None:
+        """Initialize an empty window of `window` seconds."""
+        self.window = window
+        self._ring = TimeRing()
+        self._sum = 0.0
+
+    def __len__(self) -> int:
+        """Return the number of values in the window."""
+        return len(self._ring)
+
+    @property
+    def value(self) -> float | None:
+        """Return the mean of the values in the window, if any."""
+        return self._sum / len(self._ring) if self._ring else None
+
+    def add(self, value: float, now: float) -> None:
+        """Add a value at time `now`, evicting the values that left the window."""
+        self.evict(now)
+        self._ring.append(now, value)
+        self._sum += value
+
+    def evict(self, now: float) -> None:
+        """Remove the values added `window` seconds or longer before `now`."""
+        ring = self._ring
+        cutoff = now - self.window
+        while ring and ring.first_time() <= cutoff:
+            self._sum -= ring.pop_first()
+        if not ring:
+            # Don't carry rounding errors over to the next values
+            self._sum = 0.0
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._ring.clear()
+        self._sum = 0.0
+
+
+class RollingMax:
+    """
+    Maximum of the values added over the last `window` seconds.
+
+    Only the values that can still become the maximum are kept, in a
+    monotonic deque: each is newer and smaller than the one before it.
+    Adding a value is O(1) amortized.
+    """
+
+    __slots__ = ("_ring", "_sign", "window")
+
+    def __init__(self, window: float) -> None:
+        """Initialize an empty window of `window` seconds."""
+        self.window = window
+        self._ring = TimeRing()
+        self._sign = 1.0
+
+    @property
+    def value(self) -> float | None:
+        """Return the maximum of the values in the window, if any."""
+        return self._sign * self._ring.first() if self._ring else None
+
+    def add(self, value: float, now: float) -> None:
+        """Add a value at time `now`, evicting the values that left the window."""
+        self.evict(now)
+        ring = self._ring
+        value *= self._sign
+        while ring and ring.last() <= value:
+            ring.pop_last()
+        ring.append(now, value)
+
+    def evict(self, now: float) -> None:
+        """Remove the values added `window` seconds or longer before `now`."""
+        ring = self._ring
+        cutoff = now - self.window
+        while ring and ring.first_time() <= cutoff:
+            ring.pop_first()
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._ring.clear()
+
+
+class RollingMin(RollingMax):
+    """
+    Minimum of the values added over the last `window` seconds.
+
+    The maximum of the negated values.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, window: float) -> None:
+        """Initialize an empty window of `window` seconds."""
+        super().__init__(window)
+        self._sign = -1.0
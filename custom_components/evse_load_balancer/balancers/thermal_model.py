@@ -0,0 +1,136 @@
+"""Thermal model of a circuit breaker, after the IEC 60898 tripping curves."""
+
+from array import array
+from math import exp, log
+
+from custom_components.evse_load_balancer.const import BreakerCurve
+
+# Currents are expressed as a multiple of the rated current of the breaker.
+# IEC 60898 guarantees that a breaker doesn't trip within an hour at the
+# conventional non-tripping current, and takes at least a second to trip at
+# 2.55 times its rated current. In between, the shortest tripping time is
+# interpolated on a log-log scale, which is how tripping curves are drawn.
+NON_TRIPPING_CURRENT = 1.13
+NON_TRIPPING_TIME = 60 * 60
+TRIPPING_TEST_CURRENT = 2.55
+TRIPPING_TEST_TIME = 1.0
+_THERMAL_EXPONENT = log(TRIPPING_TEST_TIME / NON_TRIPPING_TIME) / log(
+    TRIPPING_TEST_CURRENT / NON_TRIPPING_CURRENT
+)
+
+# Above these currents the magnetic release may trip the breaker within 0.1s
+MAGNETIC_CURRENT: dict[BreakerCurve, float] = {
+    BreakerCurve.B: 3.0,
+    BreakerCurve.C: 5.0,
+    BreakerCurve.D: 10.0,
+}
+MAGNETIC_TIME = 0.1
+
+# Resolution of the lookup tables
+TABLE_STEP = 0.01
+
+DEFAULT_COOLING_TIME_CONSTANT = 5 * 60
+# Loads below this are considered fully cooled down
+COOLED_DOWN_LOAD = 1e-3
+
+
+def shortest_tripping_time(current: float, curve: BreakerCurve) -> float:
+    """
+    Return the shortest time (in seconds) a breaker may take to trip.
+
+    The current is a multiple of the rated current. The thermal release
+    follows the log-log line through the conventional test points, and
+    beyond 2.55 times the rated current it follows a constant I²t. From the
+    magnetic current of the curve on, the magnetic release may respond first.
+    """
+    if current <= TRIPPING_TEST_CURRENT:
+        return NON_TRIPPING_TIME * (current / NON_TRIPPING_CURRENT) ** _THERMAL_EXPONENT
+    thermal_time = TRIPPING_TEST_TIME * TRIPPING_TEST_CURRENT**2 / current**2
+    if current >= MAGNETIC_CURRENT[curve]:
+        return min(MAGNETIC_TIME, thermal_time)
+    return thermal_time
+
+
+def _heating_rates(curve: BreakerCurve) -> array:
+    """Tabulate the heating rate from the rated to the magnetic current."""
+    steps = round((MAGNETIC_CURRENT[curve] - 1) / TABLE_STEP)
+    return array(
+        "d",
+        (
+            1 / shortest_tripping_time(1 + i * TABLE_STEP, curve)
+            for i in range(steps + 1)
+        ),
+    )
+
+
+HEATING_RATES: dict[BreakerCurve, array] = {
+    curve: _heating_rates(curve) for curve in BreakerCurve
+}
+
+
+class ThermalBreakerModel:
+    """
+    Thermal load of a circuit breaker.
+
+    The load is the fraction of the breaker's thermal budget that is used,
+    where 1 means it may trip. While overloaded, the load rises at the
+    inverse of the shortest tripping time for the current, taken from a
+    precomputed table, so every update is O(1). At or below the rated
+    current the load cools down exponentially.
+
+    As the shortest tripping time within the IEC 60898 band is used, the
+    load is an upper bound: a breaker that meets the standard can't trip
+    before the load reaches 1. Acting at a margin below 1 leaves time to
+    reduce the current before it could.
+    """
+
+    __slots__ = ("_magnetic_current", "_rates", "cooling_time_constant", "load")
+
+    def __init__(
+        self,
+        curve: BreakerCurve = BreakerCurve.C,
+        cooling_time_constant: float = DEFAULT_COOLING_TIME_CONSTANT,
+    ) -> None:
+        """Initialize a cold breaker with the given characteristics."""
+        self.load = 0.0
+        self.reconfigure(curve, cooling_time_constant)
+
+    def reconfigure(self, curve: BreakerCurve, cooling_time_constant: float) -> None:
+        """Apply new breaker characteristics, keeping the load."""
+        if cooling_time_constant <= 0:
+            msg = f"Cooling time constant must be positive, got {cooling_time_constant}"
+            raise ValueError(msg)
+        self._rates = HEATING_RATES[curve]
+        self._magnetic_current = MAGNETIC_CURRENT[curve]
+        self.cooling_time_constant = cooling_time_constant
+
+    def is_instantaneous(self, current: float) -> bool:
+        """Return whether a current may trip the breaker instantly."""
+        return current >= self._magnetic_current
+
+    def heating_rate(self, current: float) -> float:
+        """Return the rise of the load per second at a current."""
+        if current <= 1:
+            return 0.0
+        rates = self._rates
+        position = (current - 1) / TABLE_STEP
+        index = int(position)
+        if index >= len(rates) - 1:
+            return rates[-1]
+        # The rates are convex, so interpolating overestimates them slightly
+        fraction = position - index
+        return rates[index] + (rates[index + 1] - rates[index]) * fraction
+
+    def update(self, current: float, elapsed: float) -> float:
+        """Apply `elapsed` seconds at a current and return the new load."""
+        if current <= 1:
+            self.cool(elapsed)
+        else:
+            self.load = min(1.0, self.load + self.heating_rate(current) * elapsed)
+        return self.load
+
+    def cool(self, elapsed: float) -> None:
+        """Cool down for `elapsed` seconds at or below the rated current."""
+        self.load *= exp(-max(0.0, elapsed) / self.cooling_time_constant)
+        if self.load < COOLED_DOWN_LOAD:
+            self.load = 0.0
@@ -0,0 +1,189 @@
+"""Command pipeline for applying new limits to a charger."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from time import perf_counter
+
+from homeassistant.core import HomeAssistant
+
+from .chargers.charger import Charger
+from .const import Phase
+from .instrumentation import STAGE_SET_CURRENT_LIMIT, CycleInstrumentation
+
+_LOGGER = logging.getLogger(__name__)
+
+# Number of seconds a single set_current_limit call may take before it is
+# considered failed. Cloud chargers can take several seconds to respond.
+COMMAND_TIMEOUT: float = 30
+
+# Number of times a failed command is retried before giving up, and the base
+# delay in seconds between attempts (doubled on every retry).
+COMMAND_MAX_RETRIES: int = 2
+COMMAND_RETRY_BACKOFF: float = 2
+
+
+@dataclass(frozen=True, slots=True)
+class ChargerCommand:
+    """A new limit for a charger, as computed at `timestamp`."""
+
+    limits: dict[Phase, int]
+    timestamp: int
+
+
+class ChargerCommandPipeline:
+    """
+    Apply new limits to a single charger, one command at a time.
+
+    Only one command is in flight at any moment. Commands submitted while one
+    is in flight are held in a single pending slot where the newest command
+    replaces any older one, so a slow charger never works through a queue of
+    stale limits. Failed commands are retried with an exponential backoff,
+    unless a newer command is waiting.
+
+    @param on_dispatch: Called when a command is sent to the charger.
+    @param on_applied: Called when the charger accepted a command.
+    @param on_failed: Called when a command failed after all its retries.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        hass: HomeAssistant,
+        charger: Charger,
+        on_dispatch: Callable[[ChargerCommand], None],
+        on_applied: Callable[[ChargerCommand], None],
+        on_failed: Callable[[ChargerCommand], None],
+        instrumentation: CycleInstrumentation | None = None,
+        timeout: float = COMMAND_TIMEOUT,
+        max_retries: int = COMMAND_MAX_RETRIES,
+        retry_backoff: float = COMMAND_RETRY_BACKOFF,
+    ) -> None:
+        """Initialize the pipeline."""
+        self._hass = hass
+        self._charger = charger
+        self._on_dispatch = on_dispatch
+        self._on_applied = on_applied
+        self._on_failed = on_failed
+        self._instrumentation = instrumentation
+        self._timeout = timeout
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+
+        self._task: asyncio.Task | None = None
+        self._pending: ChargerCommand | None = None
+        # Set when a command is submitted, to cut a retry backoff short
+        self._submitted = asyncio.Event()
+
+    @property
+    def in_flight(self) -> bool:
+        """Return whether a command is being applied."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def pending(self) -> ChargerCommand | None:
+        """Return the command waiting for the in-flight command to finish."""
+        return self._pending
+
+    def submit(self, limits: dict[Phase, int], timestamp: int) -> None:
+        """Submit new limits, superseding any command that hasn't been sent yet."""
+        command = ChargerCommand(limits=dict(limits), timestamp=timestamp)
+
+        if self.in_flight:
+            if self._pending is not None:
+                _LOGGER.debug(
+                    "Superseding pending limits %s for charger %s with %s",
+                    self._pending.limits,
+                    self._charger.id,
+                    command.limits,
+                )
+            self._pending = command
+            self._submitted.set()
+            return
+
+        self._dispatch(command)
+
+    async def async_cancel(self) -> None:
+        """Drop the pending command and cancel the one in flight."""
+        self._pending = None
+        if self.in_flight:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    def _dispatch(self, command: ChargerCommand) -> None:
+        """Send a command to the charger."""
+        self._on_dispatch(command)
+        self._task = self._hass.async_create_task(
+            self._async_apply(command),
+            name=f"evse_load_balancer_set_current_limit_{self._charger.id}",
+        )
+
+    async def _async_apply(self, command: ChargerCommand) -> None:
+        """Apply a command, retrying until it succeeds or is superseded."""
+        attempt = 0
+        while True:
+            if await self._async_attempt(command):
+                self._on_applied(command)
+                break
+
+            attempt += 1
+            if self._pending is None and attempt <= self._max_retries:
+                await self._async_backoff(self._retry_backoff * 2 ** (attempt - 1))
+
+            if self._pending is not None:
+                _LOGGER.debug(
+                    "Not retrying limits %s for charger %s, newer limits are pending",
+                    command.limits,
+                    self._charger.id,
+                )
+                self._on_failed(command)
+                break
+
+            if attempt > self._max_retries:
+                _LOGGER.error(
+                    "Failed to set limits %s on charger %s after %d attempts",
+                    command.limits,
+                    self._charger.id,
+                    attempt,
+                )
+                self._on_failed(command)
+                break
+
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            self._dispatch(pending)
+
+    async def _async_backoff(self, delay: float) -> None:
+        """Wait before a retry, unless a newer command is submitted meanwhile."""
+        self._submitted.clear()
+        with suppress(TimeoutError):
+            async with asyncio.timeout(delay):
+                await self._submitted.wait()
+
+    async def _async_attempt(self, command: ChargerCommand) -> bool:
+        """Make a single set_current_limit call and return whether it succeeded."""
+        started = perf_counter()
+        try:
+            # Created here, so a task cancelled before it ran leaves no
+            # coroutine behind that was never awaited
+            async with asyncio.timeout(self._timeout):
+                await self._charger.set_current_limit(command.limits)
+        except TimeoutError:
+            _LOGGER.warning(
+                "Setting limits on charger %s timed out after %s seconds",
+                self._charger.id,
+                self._timeout,
+            )
+            return False
+        except Exception:
+            _LOGGER.exception("Error setting limits on charger %s", self._charger.id)
+            return False
+        finally:
+            if self._instrumentation is not None:
+                self._instrumentation.record(
+                    STAGE_SET_CURRENT_LIMIT, perf_counter() - started
+                )
+        return True
@@ -38,8 +38,13 @@ class Charger(ABC):
 
     @property
     def id(self) -> str:
-        """Return the unique ID of the charger."""
-        return self.config_entry.entry_id
+        """
+        Return the unique ID of the charger.
+
+        A config entry can manage multiple chargers, so the ID is the one of
+        the charger's device.
+        """
+        return self.device.id
 
     @property
     def current_change_settle_time(self) -> int:
@@ -7,19 +7,27 @@ from typing import Any
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
+from homeassistant.components.mqtt import valid_publish_topic
 from homeassistant.components.sensor import (
     SensorDeviceClass,
 )
 from homeassistant.config_entries import ConfigEntry, ConfigFlow, ConfigFlowResult
+from homeassistant.const import UnitOfPower
 from homeassistant.const import __version__ as ha_version
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import section
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.selector import (
     DeviceSelector,
     DeviceSelectorConfig,
     EntitySelector,
     EntitySelectorConfig,
     NumberSelector,
+    SelectOptionDict,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+    TextSelector,
 )
 from packaging.version import parse as parse_version
 
@@ -34,6 +42,7 @@ from .const import (
     SUPPORTED_METER_DEVICES,
 )
 from .exceptions.validation_exception import ValidationExceptionError
+from .fuse_tree import ROOT_NODE_ID
 from .options_flow import EvseLoadBalancerOptionsFlow
 
 _LOGGER = logging.getLogger(__name__)
@@ -51,7 +60,15 @@ CONF_PHASE_SENSOR_VOLTAGE = "voltage"
 CONF_PHASE_SENSOR_CURRENT = "current"
 CONF_CUSTOM_PHASE_CONFIG = "custom_phase_config"
 CONF_METER_DEVICE = "meter_device"
+CONF_P1_PORT = "p1_port"
+CONF_METER_LOCAL_API = "meter_local_api"
+CONF_MQTT_METER = "mqtt_meter"
+CONF_MQTT_POWER_UNIT = "mqtt_power_unit"
 CONF_CHARGER_DEVICE = "charger_device"
+CONF_ADD_FUSE_GROUP = "add_fuse_group"
+CONF_FUSE_GROUPS = "fuse_groups"
+CONF_FUSE_GROUP_NAME = "name"
+CONF_FUSE_GROUP_PARENT = "parent"
 
 _charger_device_filter_list: list[dict[str, str]] = [
     {"integration": CHARGER_DOMAIN_EASEE},
@@ -77,7 +94,7 @@ STEP_INIT_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_CHARGER_DEVICE): DeviceSelector(
             DeviceSelectorConfig(
-                multiple=False,
+                multiple=True,
                 filter=_charger_device_filter_list,
             )
         ),
@@ -93,7 +110,11 @@ STEP_INIT_SCHEMA = vol.Schema(
                 filter=_meter_device_filter_list,
             )
         ),
+        vol.Optional(CONF_METER_LOCAL_API): cv.boolean,
+        vol.Optional(CONF_P1_PORT): TextSelector(),
+        vol.Optional(CONF_MQTT_METER): cv.boolean,
         vol.Optional(CONF_CUSTOM_PHASE_CONFIG): cv.boolean,
+        vol.Optional(CONF_ADD_FUSE_GROUP): cv.boolean,
     }
 )
 
@@ -104,10 +125,25 @@ async def validate_init_input(
     _hass: HomeAssistant, data: dict[str, Any]
 ) -> dict[str, Any]:
     """Validate the user input for the initial step."""
-    if not data.get(CONF_METER_DEVICE) and not data.get(CONF_CUSTOM_PHASE_CONFIG):
+    if not data.get(CONF_CHARGER_DEVICE):
+        raise ValidationExceptionError("base", "charger_selection_required")  # noqa: EM101
+
+    metering_selections = sum(
+        bool(data.get(key))
+        for key in (
+            CONF_METER_DEVICE,
+            CONF_P1_PORT,
+            CONF_MQTT_METER,
+            CONF_CUSTOM_PHASE_CONFIG,
+        )
+    )
+    if not metering_selections:
         # If the user has selected a custom phase configuration, but not a meter device,
         # we need to show an error message.
         raise ValidationExceptionError("base", "metering_selection_required")  # noqa: EM101
+    if metering_selections > 1:
+        # Only one of them would be used, so don't leave the user guessing which
+        raise ValidationExceptionError("base", "multiple_metering_selections")  # noqa: EM101
 
     return data
 
@@ -120,6 +156,83 @@ async def validate_power_input(
     return data
 
 
+async def validate_mqtt_input(
+    _hass: HomeAssistant, data: dict[str, Any]
+) -> dict[str, Any]:
+    """Validate the topics of the MQTT meter."""
+    # Imported lazily, the meter depends on the constants of this module
+    from .meters.mqtt_meter import MQTT_METER_SENSORS, parse_mqtt_source
+
+    for phase_key in (CONF_PHASE_KEY_ONE, CONF_PHASE_KEY_TWO, CONF_PHASE_KEY_THREE):
+        for sensor in MQTT_METER_SENSORS:
+            source = data.get(phase_key, {}).get(sensor)
+            if not source:
+                continue
+            topic, _ = parse_mqtt_source(source)
+            try:
+                valid_publish_topic(topic)
+            except vol.Invalid as ex:
+                raise ValidationExceptionError("base", "invalid_mqtt_topic") from ex  # noqa: EM101
+
+    return data
+
+
+async def validate_fuse_group_input(
+    _hass: HomeAssistant, data: dict[str, Any], fuse_groups: list[dict[str, Any]]
+) -> dict[str, Any]:
+    """Validate the user input for a fuse group."""
+    name = data.get(CONF_FUSE_GROUP_NAME, "").strip()
+    if not name or name == ROOT_NODE_ID:
+        raise ValidationExceptionError("base", "invalid_fuse_group_name")  # noqa: EM101
+    if any(group[CONF_FUSE_GROUP_NAME] == name for group in fuse_groups):
+        raise ValidationExceptionError("base", "duplicate_fuse_group_name")  # noqa: EM101
+    if any(
+        charger in group.get(CONF_CHARGER_DEVICE, [])
+        for group in fuse_groups
+        for charger in data.get(CONF_CHARGER_DEVICE, [])
+    ):
+        raise ValidationExceptionError("base", "charger_in_multiple_fuse_groups")  # noqa: EM101
+
+    return {**data, CONF_FUSE_GROUP_NAME: name}
+
+
+def create_fuse_group_schema(
+    charger_options: list[SelectOptionDict],
+    parent_options: list[str],
+    phase_count: int,
+) -> vol.Schema:
+    """Create a schema for a fuse group behind the main fuse or another group."""
+    phase_sensors = {
+        vol.Optional(phase_key): EntitySelector(
+            EntitySelectorConfig(
+                multiple=False,
+                domain="sensor",
+                device_class=[SensorDeviceClass.CURRENT],
+            )
+        )
+        for phase_key in [CONF_PHASE_KEY_ONE, CONF_PHASE_KEY_TWO, CONF_PHASE_KEY_THREE][
+            : int(phase_count)
+        ]
+    }
+
+    return vol.Schema(
+        {
+            vol.Required(CONF_FUSE_GROUP_NAME): TextSelector(),
+            vol.Required(CONF_FUSE_SIZE): NumberSelector(
+                {"min": 1, "mode": "box", "unit_of_measurement": "A"}
+            ),
+            vol.Required(CONF_FUSE_GROUP_PARENT, default=ROOT_NODE_ID): SelectSelector(
+                SelectSelectorConfig(options=parent_options)
+            ),
+            vol.Required(CONF_CHARGER_DEVICE): SelectSelector(
+                SelectSelectorConfig(options=charger_options, multiple=True)
+            ),
+            **phase_sensors,
+            vol.Optional(CONF_ADD_FUSE_GROUP): cv.boolean,
+        }
+    )
+
+
 def create_phase_power_data_schema(phase_count: int) -> vol.Schema:
     """Create a schema for the power collection step based on the phase count."""
     extra_schema = {}
@@ -162,11 +275,45 @@ def create_phase_power_data_schema(phase_count: int) -> vol.Schema:
     return vol.Schema(STEP_POWER_DATA_SCHEMA | extra_schema)
 
 
+def create_phase_mqtt_data_schema(phase_count: int) -> vol.Schema:
+    """Create a schema for the MQTT topics of each phase."""
+    extra_schema = {}
+
+    for phase_key in [CONF_PHASE_KEY_ONE, CONF_PHASE_KEY_TWO, CONF_PHASE_KEY_THREE][
+        : int(phase_count)
+    ]:
+        extra_schema[vol.Required(phase_key)] = section(
+            vol.Schema(
+                {
+                    vol.Required(CONF_PHASE_SENSOR_CONSUMPTION): TextSelector(),
+                    vol.Optional(CONF_PHASE_SENSOR_PRODUCTION): TextSelector(),
+                    vol.Required(CONF_PHASE_SENSOR_VOLTAGE): TextSelector(),
+                }
+            ),
+            {"collapsed": False},
+        )
+
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_MQTT_POWER_UNIT, default=UnitOfPower.WATT
+            ): SelectSelector(
+                SelectSelectorConfig(
+                    options=[UnitOfPower.WATT, UnitOfPower.KILO_WATT],
+                    mode=SelectSelectorMode.DROPDOWN,
+                )
+            ),
+        }
+        | extra_schema
+    )
+
+
 class EvseLoadBalancerConfigFlow(ConfigFlow, domain=DOMAIN):
     """Handle a config flow for evse-load-balancer."""
 
     VERSION = 1
-    MINOR_VERSION = 1
+    # 1.2: CONF_CHARGER_DEVICE holds a list of charger devices
+    MINOR_VERSION = 2
 
     cf_data: dict | None = None
 
@@ -201,10 +348,9 @@ class EvseLoadBalancerConfigFlow(ConfigFlow, domain=DOMAIN):
                 self.cf_data = input_data
                 if self.cf_data.get(CONF_CUSTOM_PHASE_CONFIG, False):
                     return await self.async_step_power()
-                return self.async_create_entry(
-                    title="EVSE Load Balancer",
-                    data=self.cf_data,
-                )
+                if self.cf_data.get(CONF_MQTT_METER, False):
+                    return await self.async_step_mqtt()
+                return await self._async_finish_step()
 
         return self.async_show_form(
             step_id="user", data_schema=STEP_INIT_SCHEMA, errors=errors
@@ -223,10 +369,7 @@ class EvseLoadBalancerConfigFlow(ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
             if not errors:
                 self.cf_data.update(input_data)
-                return self.async_create_entry(
-                    title="EVSE Load Balancer",
-                    data=self.cf_data,
-                )
+                return await self._async_finish_step()
 
         return self.async_show_form(
             step_id="power",
@@ -235,3 +378,79 @@ class EvseLoadBalancerConfigFlow(ConfigFlow, domain=DOMAIN):
             ),
             errors=errors,
         )
+
+    async def async_step_mqtt(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the MQTT topics collection step."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            try:
+                input_data = await validate_mqtt_input(self.hass, user_input)
+            except ValidationExceptionError as ex:
+                errors[ex.base] = ex.key
+            if not errors:
+                self.cf_data.update(input_data)
+                return await self._async_finish_step()
+
+        return self.async_show_form(
+            step_id="mqtt",
+            data_schema=create_phase_mqtt_data_schema(
+                phase_count=self.cf_data.get(CONF_PHASE_COUNT, 1)
+            ),
+            errors=errors,
+        )
+
+    async def async_step_fuse_group(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle a fuse group (sub-board or breaker) behind the main fuse."""
+        errors: dict[str, str] = {}
+        fuse_groups: list[dict[str, Any]] = self.cf_data.setdefault(
+            CONF_FUSE_GROUPS, []
+        )
+        if user_input is not None:
+            try:
+                input_data = await validate_fuse_group_input(
+                    self.hass, user_input, fuse_groups
+                )
+            except ValidationExceptionError as ex:
+                errors[ex.base] = ex.key
+            if not errors:
+                self.cf_data[CONF_ADD_FUSE_GROUP] = input_data.pop(
+                    CONF_ADD_FUSE_GROUP, False
+                )
+                fuse_groups.append(input_data)
+                return await self._async_finish_step()
+
+        device_registry = dr.async_get(self.hass)
+        charger_options = []
+        for device_id in self.cf_data.get(CONF_CHARGER_DEVICE, []):
+            device = device_registry.async_get(device_id)
+            label = (device.name_by_user or device.name) if device else None
+            charger_options.append(
+                SelectOptionDict(value=device_id, label=label or device_id)
+            )
+
+        return self.async_show_form(
+            step_id="fuse_group",
+            data_schema=create_fuse_group_schema(
+                charger_options=charger_options,
+                parent_options=[
+                    ROOT_NODE_ID,
+                    *(group[CONF_FUSE_GROUP_NAME] for group in fuse_groups),
+                ],
+                phase_count=self.cf_data.get(CONF_PHASE_COUNT, 1),
+            ),
+            errors=errors,
+        )
+
+    async def _async_finish_step(self) -> ConfigFlowResult:
+        """Continue with a fuse group when requested, or create the entry."""
+        if self.cf_data.pop(CONF_ADD_FUSE_GROUP, False):
+            return await self.async_step_fuse_group()
+
+        return self.async_create_entry(
+            title="EVSE Load Balancer",
+            data=self.cf_data,
+        )
@@ -38,6 +38,7 @@ COORDINATOR_STATES: tuple[str, ...] = (
 EVSE_LOAD_BALANCER_COORDINATOR_EVENT = f"{DOMAIN}_coordinator_event"
 EVENT_ACTION_NEW_CHARGER_LIMITS = "new_charger_limits"
 EVENT_ATTR_ACTION = "action"
+EVENT_ATTR_CHARGER_ID = "charger_id"
 EVENT_ATTR_NEW_LIMITS = "new_limits"
 
 
@@ -54,3 +55,28 @@ class OvercurrentMode(Enum):
 
     CONSERVATIVE = "conservative"
     OPTIMISED = "optimised"
+
+
+class BalancerAlgorithm(Enum):
+    """Enum for the algorithms balancing the available current."""
+
+    OPTIMISED = "optimised"
+    FORECASTING = "forecasting"
+    RAMP = "ramp"
+    MEDIAN = "median"
+
+
+class BreakerCurve(Enum):
+    """Enum for the tripping characteristics of IEC 60898 circuit breakers."""
+
+    B = "b"
+    C = "c"
+    D = "d"
+
+
+class StalenessPolicy(Enum):
+    """Enum for the handling of meter readings that are too old."""
+
+    HOLD = "hold"
+    DEGRADE = "degrade"
+    PAUSE = "pause"
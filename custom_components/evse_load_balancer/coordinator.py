@@ -2,19 +2,30 @@
 
 import logging
 from datetime import datetime, timedelta  # Ensure datetime is imported
-from functools import cached_property
+from functools import cached_property, partial
 from math import floor
+from time import monotonic, perf_counter, time
+from typing import Any
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_DEVICE_ID
-from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.core import (
+    CALLBACK_TYPE,
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    callback,
+)
 from homeassistant.helpers import device_registry as dr
-from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.event import (
+    async_track_state_change_event,
+    async_track_time_interval,
+)
 
-from . import config_flow as cf
-from . import options_flow as of
-from .balancers.optimised_load_balancer import OptimisedLoadBalancer
+from .balancers.balancer import DEFAULT_HORIZON, Balancer, BalancerSettings
+from .balancers.registry import create_balancer
+from .charger_command_pipeline import ChargerCommand, ChargerCommandPipeline
 from .chargers.charger import Charger
 from .const import (
     COORDINATOR_STATE_AWAITING_CHARGER,
@@ -22,37 +33,82 @@ from .const import (
     DOMAIN,
     EVENT_ACTION_NEW_CHARGER_LIMITS,
     EVENT_ATTR_ACTION,
+    EVENT_ATTR_CHARGER_ID,
     EVENT_ATTR_NEW_LIMITS,
     EVSE_LOAD_BALANCER_COORDINATOR_EVENT,
-    OvercurrentMode,
+    StalenessPolicy,
+)
+from .cycle_scheduler import CoalescingCycleScheduler
+from .fuse_tree import ROOT_NODE_ID, FuseNode, FuseTree
+from .ha_device import HaDevice
+from .instrumentation import (
+    STAGE_COMPUTE_AVAILABILITY,
+    STAGE_CYCLE,
+    STAGE_GET_CURRENT_LIMIT,
+    STAGE_METER_READ,
+    STAGE_UPDATE_ALLOCATION,
+    CycleInstrumentation,
 )
-from .meters.meter import Meter, Phase
+from .meter_history import MeterHistory
+from .meters.meter import Meter, MeterSnapshot, Phase
+from .meters.sensor_parser import CURRENT_SCALES, SensorParser
 from .power_allocator import PowerAllocator
+from .runtime_config import RuntimeConfig
+from .state_store import ATTR_SAVED_AT, BalancerStateStore
 
 _LOGGER = logging.getLogger(__name__)
 
-# Number of seconds between each check cycle
+# Number of seconds between each check cycle when the meter does not
+# expose any entities to track state changes for. Also used, regardless of
+# the meter, when a phase is close to or over its limit.
 EXECUTION_CYCLE_DELAY: int = 1
 
+# Number of seconds between each safety-net check cycle when cycles are
+# driven by meter state changes. Makes sure the charger state is still
+# evaluated when the meter readings don't change for a while.
+SAFETY_NET_CYCLE_DELAY: int = 10
+
+# Number of seconds between each check cycle while no charger can charge.
+# Meter state changes only trigger a cycle in this state once a charger can
+# charge again.
+IDLE_CYCLE_DELAY: int = 30
+
+# Available current (A) below which a phase is considered to be close to its
+# limit and cycles are run at the fastest rate
+HEADROOM_MARGIN: int = 2
+
+# Steps of the breaker's thermal load that are worth writing the state soon
+THERMAL_LOAD_SAVE_STEP: float = 0.1
+
+# Number of seconds to wait for more meter updates of the same telegram
+# before running a cycle, and the maximum number of seconds a cycle can be
+# postponed by a burst of meter updates.
+COALESCE_WINDOW: float = 0.1
+COALESCE_MAX_DELAY: float = 0.5
+
 # Number of seconds between each charger update. This setting
 # makes sure that the charger is not updated too frequently and
 # allows a change of the charger's limit to actually take affect
 MIN_CHARGER_UPDATE_DELAY: int = 20
 
+# Current (A) chargers are lowered to while the meter readings are stale and
+# the staleness policy is to degrade. The lowest current at which chargers
+# keep charging.
+DEGRADED_CHARGER_CURRENT: int = 6
+
 
 class EVSELoadBalancerCoordinator:
     """Coordinator for the EVSE Load Balancer."""
 
     # MODIFIED: Store as datetime object or None
     _last_check_timestamp: datetime | None = None
-    _last_charger_update_time: int | None = None
 
     def __init__(
         self,
         hass: HomeAssistant,
         config_entry: ConfigEntry,
         meter: Meter,
-        charger: Charger,
+        chargers: list[Charger],
     ) -> None:
         """Initialize the coordinator."""
         self.hass: HomeAssistant = hass
@@ -61,49 +117,190 @@ class EVSELoadBalancerCoordinator:
         self._sensors: list[SensorEntity] = []
 
         self._meter: Meter = meter
-        self._charger: Charger = charger
+        self._chargers: list[Charger] = chargers
+        self._config: RuntimeConfig = RuntimeConfig.from_config_entry(config_entry)
+        self._entry_data: dict[str, Any] = dict(config_entry.data)
+        self._fuse_tree = self._build_fuse_tree()
+        # Parser of the current sensors of the fuse groups, by entity id
+        self._group_current_parsers: dict[str, SensorParser] = {
+            entity_id: SensorParser(CURRENT_SCALES)
+            for group in self._fuse_tree.groups
+            for entity_id in group.current_entities.values()
+        }
+        # Balancer per fuse group, by node id
+        self._group_balancers: dict[str, Balancer] = {}
+
+        # Time of the last limit change, per charger id
+        self._last_charger_update_times: dict[str, int] = {}
+
+        self._meter_snapshot: MeterSnapshot | None = None
+        self._meter_history = MeterHistory(self._config.phases)
+        self._meter_readings_stale: bool = False
+        self._available_currents: dict[Phase, int] | None = None
+        self._active_cycle_delay: int = EXECUTION_CYCLE_DELAY
+        self._cycle_delay: int | None = None
+        self._cancel_cycle_timer: CALLBACK_TYPE | None = None
+
+        self._cycle_scheduler = CoalescingCycleScheduler(
+            hass,
+            self._execute_update_cycle,
+            window=COALESCE_WINDOW,
+            max_delay=COALESCE_MAX_DELAY,
+        )
+        self.instrumentation = CycleInstrumentation()
+        self._charger_pipelines: dict[str, ChargerCommandPipeline] = {
+            charger.id: ChargerCommandPipeline(
+                hass,
+                charger,
+                on_dispatch=partial(self._handle_charger_command_dispatch, charger),
+                on_applied=partial(self._handle_charger_command_applied, charger),
+                on_failed=partial(self._handle_charger_command_failed, charger),
+                instrumentation=self.instrumentation,
+            )
+            for charger in chargers
+        }
+        self._state_store = BalancerStateStore(
+            hass,
+            config_entry.entry_id,
+            self._export_state,
+            significant_state=self._significant_state,
+        )
 
     async def async_setup(self) -> None:
         """Set up the coordinator and its managed components."""
-        await self._charger.async_setup()
-
-        self._unsub.append(
-            async_track_time_interval(
-                self.hass,
-                self._execute_update_cycle,
-                timedelta(seconds=EXECUTION_CYCLE_DELAY),
+        for charger in self._chargers:
+            await charger.async_setup()
+
+        self._create_balancers()
+
+        self._power_allocator = PowerAllocator(fuse_tree=self._fuse_tree)
+        for charger in self._chargers:
+            self._power_allocator.add_charger(charger=charger)
+
+        await self._async_restore_state()
+
+        # Keep the entity lookups of the devices in sync with the registry
+        for component in (self._meter, *self._chargers):
+            if isinstance(component, HaDevice):
+                self._unsub.append(component.async_track_entity_registry_updates())
+
+        # Prefer running a cycle whenever one of the meter's readings changes,
+        # and fall back to polling when the meter has nothing to track.
+        tracking_entities = [
+            *self._meter.get_tracking_entities(),
+            *(
+                entity_id
+                for group in self._fuse_tree.groups
+                for entity_id in group.current_entities.values()
+            ),
+        ]
+        if tracking_entities:
+            self._unsub.append(
+                async_track_state_change_event(
+                    self.hass,
+                    tracking_entities,
+                    self._handle_meter_state_change,
+                )
             )
+            self._active_cycle_delay = SAFETY_NET_CYCLE_DELAY
+        # Meters that read their readings directly push them instead
+        unsub_meter_updates = self._meter.async_track_updates(self._handle_meter_update)
+        if unsub_meter_updates is not None:
+            self._unsub.append(unsub_meter_updates)
+            self._active_cycle_delay = SAFETY_NET_CYCLE_DELAY
+
+        _LOGGER.debug(
+            "Tracking %d meter entities, cycle every %s seconds while charging",
+            len(tracking_entities),
+            self._active_cycle_delay,
         )
+        self._set_cycle_delay(self._select_cycle_delay())
         self._unsub.append(
             self.config_entry.add_update_listener(self._handle_options_update)
         )
 
-        max_limits = dict.fromkeys(self._available_phases, self.fuse_size)
-        allow_temporary_overcurrent = of.EvseLoadBalancerOptionsFlow.get_option_value(
-            self.config_entry,
-            of.OPTION_ALLOW_TEMPORARY_OVERCURRENT,
-        )
-        overcurrent_mode = (
-            OvercurrentMode.OPTIMISED
-            if allow_temporary_overcurrent
-            else OvercurrentMode.CONSERVATIVE
-        )
-        self._balancer_algo = OptimisedLoadBalancer(
-            max_limits=max_limits,
-            overcurrent_mode=overcurrent_mode,
-        )
-
-        self._power_allocator = PowerAllocator()
-        self._power_allocator.add_charger(charger=self._charger)
-
     async def async_unload(self) -> None:
         """Unload the coordinator and its managed components."""
-        await self._charger.async_unload()
+        for pipeline in self._charger_pipelines.values():
+            await pipeline.async_cancel()
+        for charger in self._chargers:
+            await charger.async_unload()
+        self._cycle_scheduler.async_cancel()
+        if self._cancel_cycle_timer is not None:
+            self._cancel_cycle_timer()
+            self._cancel_cycle_timer = None
+
+        # Make the state available right away when the entry is reloaded
+        if self._cycle_delay is not None:
+            await self._state_store.async_save()
+        self._cycle_delay = None
 
         for unsub_method in self._unsub:
             unsub_method()
         self._unsub.clear()
 
+    def _export_state(self) -> dict[str, Any]:
+        """Export the state that should survive a restart."""
+        return {
+            "balancer": self._balancer_algo.export_state(),
+            "group_balancers": {
+                node_id: balancer.export_state()
+                for node_id, balancer in self._group_balancers.items()
+            },
+            "allocator": self._power_allocator.export_state(),
+            "last_charger_update_times": self._last_charger_update_times,
+        }
+
+    def _significant_state(self) -> dict[str, Any]:
+        """
+        Export the part of the state that has to be saved soon when it changes.
+
+        The limits and manual overrides of the chargers, and the thermal load
+        of the breakers in steps. The available current changes every cycle,
+        but isn't worth a write on its own.
+        """
+        return {
+            "allocator": self._power_allocator.export_state(),
+            "thermal_loads": [
+                {
+                    phase: floor(
+                        phase_state.get("thermal_load", 0.0) / THERMAL_LOAD_SAVE_STEP
+                    )
+                    for phase, phase_state in balancer.export_state().items()
+                }
+                for balancer in (self._balancer_algo, *self._group_balancers.values())
+            ],
+        }
+
+    def _restore_balancer_state(self, state: dict[str, Any], elapsed: float) -> None:
+        """Restore the balancers from a state exported `elapsed` seconds ago."""
+        self._balancer_algo.restore_state(state.get("balancer", {}), elapsed)
+        group_states = state.get("group_balancers", {})
+        for node_id, balancer in self._group_balancers.items():
+            if node_id in group_states:
+                balancer.restore_state(group_states[node_id], elapsed)
+
+    async def _async_restore_state(self) -> None:
+        """Restore the state saved before the last restart, unless it is stale."""
+        state = await self._state_store.async_load()
+        if state is None:
+            return
+
+        elapsed = time() - state[ATTR_SAVED_AT]
+        self._restore_balancer_state(state, elapsed)
+        self._power_allocator.restore_state(state.get("allocator", {}))
+        self._last_charger_update_times = {
+            charger.id: update_time
+            for charger in self._chargers
+            if (
+                update_time := state.get("last_charger_update_times", {}).get(
+                    charger.id
+                )
+            )
+            is not None
+        }
+        _LOGGER.debug("Restored state saved %d seconds ago", elapsed)
+
     @cached_property
     def _device(self) -> dr.DeviceEntry:
         """Get the device entry for the coordinator."""
@@ -124,8 +321,99 @@ class EVSELoadBalancerCoordinator:
         hass: HomeAssistant,
         entry: ConfigEntry,
     ) -> None:
-        """Handle options update by reloading the config entry."""
-        await hass.config_entries.async_reload(entry.entry_id)
+        """
+        Handle an update of the config entry.
+
+        A change of the meter, charger or other setup data requires the entry to
+        be reloaded. Options are applied to the running balancer instead, so
+        protection isn't interrupted while the charger is set up again.
+        """
+        if dict(entry.data) != self._entry_data:
+            await hass.config_entries.async_reload(entry.entry_id)
+            return
+
+        self._apply_options(entry)
+
+    def _create_balancer(self, max_limits: dict[Phase, int]) -> Balancer:
+        """Create a balancer of the configured algorithm."""
+        return create_balancer(
+            self._config.balancer_algorithm,
+            max_limits,
+            BalancerSettings(
+                overcurrent_mode=self._config.overcurrent_mode,
+                breaker_curve=self._config.breaker_curve,
+                cooling_time_constant=self._config.breaker_cooling_seconds,
+                horizon=self._forecast_horizon,
+                options=self._config.balancer_options,
+            ),
+        )
+
+    def _build_fuse_tree(self) -> FuseTree:
+        """Build the fuse tree of the configured main fuse and fuse groups."""
+        return FuseTree(
+            FuseNode(ROOT_NODE_ID, self._config.fuse_size, parent_id=None),
+            self._config.fuse_groups,
+            charger_ids=[charger.id for charger in self._chargers],
+        )
+
+    def _create_balancers(self) -> None:
+        """Create the balancers of the main fuse and of each fuse group."""
+        self._balancer_algo = self._create_balancer(self._config.max_limits)
+        self._group_balancers = {
+            group.node_id: self._create_balancer(
+                dict.fromkeys(self._config.phases, group.fuse_size)
+            )
+            for group in self._fuse_tree.groups
+        }
+
+    @property
+    def _forecast_horizon(self) -> float:
+        """
+        Get the seconds a new limit is in force before it can be corrected.
+
+        Any change, including a reduction, has to wait for the minimum delay
+        between charger updates, and then takes the charger's settle time
+        to take effect.
+        """
+        if not self._chargers:
+            return DEFAULT_HORIZON
+        return MIN_CHARGER_UPDATE_DELAY + max(
+            charger.current_change_settle_time for charger in self._chargers
+        )
+
+    def _apply_options(self, entry: ConfigEntry) -> None:
+        """Apply the options of the config entry to the running components."""
+        previous = self._config
+        self._config = RuntimeConfig.from_config_entry(entry)
+        if self._config.fuse_size != previous.fuse_size:
+            # The fuse groups are setup data, changing them reloads the entry
+            self._fuse_tree = self._build_fuse_tree()
+            self._power_allocator.set_fuse_tree(self._fuse_tree)
+        if (
+            self._config.balancer_algorithm != previous.balancer_algorithm
+            or self._config.balancer_options != previous.balancer_options
+        ):
+            # Hand the monitored state over to the new balancers
+            state = self._export_state()
+            self._create_balancers()
+            self._restore_balancer_state(state, elapsed=0)
+        self._balancer_algo.reconfigure(
+            max_limits=self._config.max_limits,
+            overcurrent_mode=self._config.overcurrent_mode,
+            breaker_curve=self._config.breaker_curve,
+            cooling_time_constant=self._config.breaker_cooling_seconds,
+        )
+        for group in self._fuse_tree.groups:
+            self._group_balancers[group.node_id].reconfigure(
+                max_limits=dict.fromkeys(self._config.phases, group.fuse_size),
+                overcurrent_mode=self._config.overcurrent_mode,
+                breaker_curve=self._config.breaker_curve,
+                cooling_time_constant=self._config.breaker_cooling_seconds,
+            )
+        _LOGGER.debug("Applied options: %s", self._config)
+
+        # Evaluate the new limits right away instead of at the next cycle
+        self._cycle_scheduler.async_schedule()
 
     def register_sensor(self, sensor: SensorEntity) -> None:
         """Register a sensor to be updated by the coordinator."""
@@ -142,23 +430,24 @@ class EVSELoadBalancerCoordinator:
         """
         Get the effective fuse size for load balancing.
 
-        Considers the main fuse size from initial setup (config_entry.data)
-        and the optional override from the integration's options (config_entry.options).
+        Read from the runtime config, which is resolved once at setup from
+        the main fuse size and its optional override in the options.
         """
-        config_fuse_amps = self.config_entry.data.get(cf.CONF_FUSE_SIZE, 0)
-        options_fuse_amps = self.config_entry.options.get(
-            of.OPTION_MAX_FUSE_LOAD_AMPS, None
-        )
+        return self._config.fuse_size
 
-        return int(
-            options_fuse_amps if options_fuse_amps is not None else config_fuse_amps
-        )
+    @property
+    def meter_snapshot(self) -> MeterSnapshot | None:
+        """Get the meter readings taken during the last cycle."""
+        return self._meter_snapshot
 
     def get_available_current_for_phase(self, phase: Phase) -> int | None:
-        """Get the available current for a given phase."""
-        active_current = self._meter.get_active_phase_current(phase)
+        """Get the available current for a given phase from the last readings."""
+        if self._meter_snapshot is None:
+            return None
+        active_current = self._meter_snapshot.current(phase)
+        fuse_size = self._config.fuse_size
         return (
-            min(self.fuse_size, floor(self.fuse_size - active_current))
+            min(fuse_size, floor(fuse_size - active_current))
             if active_current is not None
             else None
         )
@@ -178,12 +467,10 @@ class EVSELoadBalancerCoordinator:
             available_currents[phase_obj] = current
         return available_currents
 
-    @cached_property
-    def _available_phases(self) -> list[Phase]:
+    @property
+    def _available_phases(self) -> tuple[Phase, ...]:
         """Get the available phases based on the user's configuration (1 or 3 phase)."""
-        # Assumes CONF_PHASE_COUNT is stored in config_entry.data
-        phase_count = int(self.config_entry.data.get(cf.CONF_PHASE_COUNT, 3))
-        return list(Phase)[:phase_count]
+        return self._config.phases
 
     @property
     def get_load_balancing_state(self) -> str:
@@ -197,11 +484,152 @@ class EVSELoadBalancerCoordinator:
         """Get the timestamp of the last check cycle."""
         return self._last_check_timestamp
 
+    @property
+    def get_cycle_latency(self) -> float | None:
+        """Get the duration of the last check cycle in milliseconds."""
+        return self.instrumentation.last_cycle_duration
+
+    @property
+    def get_meter_data_age(self) -> float | None:
+        """Get the age in seconds of the meter readings of the last cycle."""
+        if self._meter_snapshot is None:
+            return None
+        return self._meter_snapshot.max_age
+
+    @property
+    def meter_history(self) -> MeterHistory:
+        """Get the history of the meter readings of recent cycles."""
+        return self._meter_history
+
+    @property
+    def balancer_statistics(self) -> dict[str, dict[str, float | None]]:
+        """Get the statistics of the available current seen by the balancer."""
+        return self._balancer_algo.statistics()
+
+    @property
+    def meter(self) -> Meter:
+        """Get the meter the coordinator balances against."""
+        return self._meter
+
+    @property
+    def chargers(self) -> list[Charger]:
+        """Get the chargers managed by the coordinator."""
+        return self._chargers
+
+    def get_charger_current_limit(self, charger_id: str) -> int | None:
+        """Get the lowest phase limit of a charger."""
+        for charger in self._chargers:
+            if charger.id == charger_id:
+                current_limit = charger.get_current_limit()
+                return min(current_limit.values()) if current_limit else None
+        return None
+
+    def get_charger_last_update_time(self, charger_id: str) -> int | None:
+        """Get the time the limits of a charger were last changed."""
+        return self._last_charger_update_times.get(charger_id)
+
+    @property
+    def last_merged_events(self) -> int:
+        """Get the number of meter updates merged into the last cycle."""
+        return self._cycle_scheduler.last_merged_events
+
+    @callback
+    def _handle_meter_state_change(self, event: Event[EventStateChangedData]) -> None:
+        """Schedule a cycle when one of the meter's readings has changed."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+
+        # Attribute-only updates and removals don't change the readings
+        if new_state is None or (
+            old_state is not None and old_state.state == new_state.state
+        ):
+            return
+
+        self._handle_meter_update()
+
+    @callback
+    def _handle_meter_update(self) -> None:
+        """Schedule a cycle for new readings of the meter."""
+        # No need to follow the meter while there's no charger to balance. A
+        # charger that starts drawing current shows up on the meter, so check
+        # for one rather than wait for the next idle cycle. The cycle then
+        # selects the faster delay.
+        if self._cycle_delay == IDLE_CYCLE_DELAY and not self._should_check_charger():
+            return
+
+        self._cycle_scheduler.async_schedule()
+
     @callback
     def _execute_update_cycle(self, now: datetime) -> None:
         """Execute the main update cycle for load balancing."""
+        started = perf_counter()
+        try:
+            self._run_update_cycle(now)
+        finally:
+            self.instrumentation.record(STAGE_CYCLE, perf_counter() - started)
+
+        if self._cycle_delay is not None:
+            if self._should_check_charger():
+                self._state_store.async_schedule_save()
+            self._set_cycle_delay(self._select_cycle_delay())
+
+    def _select_cycle_delay(self) -> int:
+        """
+        Select the number of seconds between cycles based on the current state.
+
+        Runs rarely while no charger can charge and meter updates can wake the
+        coordinator up, at the fastest rate when any phase accumulated trip
+        risk or is close to its limit, and otherwise at the regular rate for
+        the meter.
+        """
+        if not self._should_check_charger():
+            # Without meter updates to wake up on, a charger that starts is
+            # only noticed by polling, so keep polling at the regular rate
+            if self._active_cycle_delay == EXECUTION_CYCLE_DELAY:
+                return EXECUTION_CYCLE_DELAY
+            return IDLE_CYCLE_DELAY
+
+        if (
+            self._balancer_algo.has_trip_risk()
+            or any(
+                balancer.has_trip_risk() for balancer in self._group_balancers.values()
+            )
+        ) or (
+            self._available_currents is not None
+            and min(self._available_currents.values()) < HEADROOM_MARGIN
+        ):
+            return EXECUTION_CYCLE_DELAY
+
+        return self._active_cycle_delay
+
+    def _set_cycle_delay(self, cycle_delay: int) -> None:
+        """(Re)start the cycle timer when the delay between cycles changed."""
+        if cycle_delay == self._cycle_delay:
+            return
+
+        _LOGGER.debug(
+            "Changing cycle delay from %s to %s seconds", self._cycle_delay, cycle_delay
+        )
+        if self._cancel_cycle_timer is not None:
+            self._cancel_cycle_timer()
+
+        self._cycle_delay = cycle_delay
+        self._cancel_cycle_timer = async_track_time_interval(
+            self.hass,
+            self._execute_update_cycle,
+            timedelta(seconds=cycle_delay),
+        )
+
+    def _run_update_cycle(self, now: datetime) -> None:
+        """Run the balancing steps of a single update cycle."""
         self._last_check_timestamp = datetime.now().astimezone()
+
+        started = perf_counter()
+        self._meter_snapshot = self._meter.read_snapshot(self._available_phases)
+        self._meter_history.record(self._meter_snapshot)
         available_currents = self._get_available_currents()
+        self.instrumentation.record(STAGE_METER_READ, perf_counter() - started)
+        self._available_currents = available_currents
 
         self._async_update_sensors()
 
@@ -213,46 +641,174 @@ class EVSELoadBalancerCoordinator:
         if not self._should_check_charger():
             return
 
+        if self._check_meter_readings_stale():
+            self._apply_staleness_policy(now.timestamp())
+            return
+
         # Computes relative limit. Negative in case of overcurrent
         # and positive in case of availability
+        started = perf_counter()
         computed_availability = self._balancer_algo.compute_availability(
             available_currents=available_currents,
             now=now.timestamp(),
         )
+        group_availability = self._compute_group_availability(now.timestamp())
+        self.instrumentation.record(
+            STAGE_COMPUTE_AVAILABILITY, perf_counter() - started
+        )
 
+        started = perf_counter()
         allocation_results = self._power_allocator.update_allocation(
-            available_currents=computed_availability
+            available_currents=computed_availability,
+            group_available_currents=group_availability,
+        )
+        self.instrumentation.record(STAGE_UPDATE_ALLOCATION, perf_counter() - started)
+
+        for charger in self._chargers:
+            self._update_charger(
+                charger, allocation_results.get(charger.id), now.timestamp()
+            )
+
+    def _check_meter_readings_stale(self) -> bool:
+        """Check if the meter readings of this cycle exceed the staleness budget."""
+        data_age = self.get_meter_data_age
+        budget = self._config.staleness_budget_seconds
+        stale = data_age is not None and data_age > budget
+        if stale and not self._meter_readings_stale:
+            _LOGGER.warning(
+                "Meter readings are %.1f seconds old, exceeding the budget of %s "
+                "seconds. Applying staleness policy '%s'.",
+                data_age,
+                budget,
+                self._config.staleness_policy.value,
+            )
+        elif not stale and self._meter_readings_stale:
+            _LOGGER.info("Meter readings are fresh again. Resuming load balancing.")
+        self._meter_readings_stale = stale
+        return stale
+
+    def _apply_staleness_policy(self, timestamp: float) -> None:
+        """
+        Protect the fuse while the meter readings can't be trusted.
+
+        Holding leaves the current limits as they are. Degrading and pausing
+        only ever lower the limits of chargers that can charge.
+        """
+        policy = self._config.staleness_policy
+        if policy == StalenessPolicy.HOLD:
+            return
+
+        fail_safe_current = (
+            DEGRADED_CHARGER_CURRENT if policy == StalenessPolicy.DEGRADE else 0
         )
+        for charger in self._chargers:
+            if not charger.can_charge():
+                continue
+            current_limit = charger.get_current_limit()
+            if current_limit is None:
+                continue
+            new_limits = {
+                phase: min(limit, fail_safe_current)
+                for phase, limit in current_limit.items()
+            }
+            if new_limits != current_limit and self._may_update_charger_settings(
+                charger_id=charger.id,
+                new_settings=new_limits,
+                current_limits=current_limit,
+                timestamp=timestamp,
+            ):
+                self._update_charger_settings(
+                    charger=charger, new_limits=new_limits, timestamp=timestamp
+                )
+
+    def _compute_group_availability(
+        self, timestamp: float
+    ) -> dict[str, dict[Phase, int]]:
+        """Compute the available current of each fuse group through its balancer."""
+        group_availability = {}
+        for group in self._fuse_tree.groups:
+            available_currents = self._get_group_available_currents(group)
+            if available_currents is None:
+                _LOGGER.warning(
+                    "Available current of fuse group '%s' unknown. "
+                    "Not increasing its chargers.",
+                    group.node_id,
+                )
+                continue
+            group_availability[group.node_id] = self._group_balancers[
+                group.node_id
+            ].compute_availability(available_currents=available_currents, now=timestamp)
+        return group_availability
+
+    def _get_group_available_currents(self, group: FuseNode) -> dict[Phase, int] | None:
+        """
+        Get the available current of a fuse group.
+
+        Measured by the group's current sensors when it has them. Otherwise
+        derived from the limits of the chargers behind the group that can
+        charge, so their sum never exceeds the group's fuse.
+        """
+        if group.current_entities:
+            available_currents = {}
+            for phase in self._available_phases:
+                entity_id = group.current_entities.get(phase)
+                state = self.hass.states.get(entity_id) if entity_id else None
+                current = (
+                    self._group_current_parsers[entity_id].parse(state)
+                    if state is not None
+                    else None
+                )
+                if current is None:
+                    return None
+                available_currents[phase] = min(
+                    group.fuse_size, floor(group.fuse_size - current)
+                )
+            return available_currents
+
+        charger_ids = self._fuse_tree.chargers_below(group.node_id)
+        used = dict.fromkeys(self._available_phases, 0)
+        for charger in self._chargers:
+            if charger.id not in charger_ids or not charger.can_charge():
+                continue
+            current_limit = charger.get_current_limit()
+            if current_limit is None:
+                return None
+            for phase in used:
+                used[phase] += current_limit.get(phase, 0)
+        return {phase: group.fuse_size - current for phase, current in used.items()}
 
-        # Allocator has been build to support multiple chargers. Right now
-        # the coordinator only supports one charger. So we need to
-        # iterate over the allocation results and update the charger
-        # with the results. Just a bit of prep for the future...
-        allocation_result = allocation_results.get(self._charger.id, None)
-        current_limit = self._charger.get_current_limit()
+    def _update_charger(
+        self,
+        charger: Charger,
+        allocation_result: dict[Phase, int] | None,
+        timestamp: float,
+    ) -> None:
+        """Apply the allocation result to a charger if its timing allows it."""
+        started = perf_counter()
+        current_limit = charger.get_current_limit()
+        self.instrumentation.record(STAGE_GET_CURRENT_LIMIT, perf_counter() - started)
 
         if current_limit is None:
-            _LOGGER.warning("Current charger limit unknown. Cannot adjust limit.")
+            _LOGGER.warning(
+                "Current limit of charger %s unknown. Cannot adjust limit.", charger.id
+            )
             return
 
         if allocation_result and self._may_update_charger_settings(
+            charger_id=charger.id,
             new_settings=allocation_result,
             current_limits=current_limit,
-            timestamp=now.timestamp(),
+            timestamp=timestamp,
         ):
             self._update_charger_settings(
-                new_limits=allocation_result, timestamp=now.timestamp()
-            )
-            self._power_allocator.update_applied_current(
-                charger_id=self._charger.id,
-                applied_current=allocation_result,
-                timestamp=now.timestamp(),
+                charger=charger, new_limits=allocation_result, timestamp=timestamp
             )
 
     def _async_update_sensors(self) -> None:
-        """Update all registered sensor states."""
+        """Write the state of all registered sensors that changed meaningfully."""
+        now = monotonic()
         for sensor in self._sensors:
-            if sensor.enabled and sensor.hass:
+            if sensor.enabled and sensor.hass and sensor.should_write_state(now):
                 sensor.async_write_ha_state()
 
     def _should_check_charger(self) -> bool:
@@ -261,19 +817,17 @@ class EVSELoadBalancerCoordinator:
 
     def _may_update_charger_settings(
         self,
+        charger_id: str,
         new_settings: dict[Phase, int],
         current_limits: dict[Phase, int],
         timestamp: int,
     ) -> bool:
         """Check if the charger settings haven't been updated too recently."""
-        if self._last_charger_update_time is None:
+        last_update_time = self._last_charger_update_times.get(charger_id)
+        if last_update_time is None:
             return True
 
-        last_update_time = self._last_charger_update_time
-
-        of_charger_delay_minutes = of.EvseLoadBalancerOptionsFlow.get_option_value(
-            self.config_entry, of.OPTION_CHARGE_LIMIT_HYSTERESIS
-        )
+        charger_delay_seconds = self._config.charge_limit_hysteresis_seconds
 
         # For any change a minimum delay is required
         if timestamp - last_update_time <= MIN_CHARGER_UPDATE_DELAY:
@@ -298,39 +852,86 @@ class EVSELoadBalancerCoordinator:
             return True
 
         # For increases, also require additional configured delay
-        if any(
-            new_settings[p] > current_limits[p] for p in new_settings
-        ) and timestamp - last_update_time > (of_charger_delay_minutes * 60):
+        if (
+            any(new_settings[p] > current_limits[p] for p in new_settings)
+            and timestamp - last_update_time > charger_delay_seconds
+        ):
             return True
 
         _LOGGER.debug(
             "Charger settings was updated too recently (configured delay). "
             "Last update: %s, current time: %s. "
-            "Configured delay: %s minutes",
+            "Configured delay: %s seconds",
             last_update_time,
             timestamp,
-            of_charger_delay_minutes,
+            charger_delay_seconds,
         )
         return False
 
     def _update_charger_settings(
-        self, new_limits: dict[Phase, int], timestamp: int
+        self, charger: Charger, new_limits: dict[Phase, int], timestamp: int
+    ) -> None:
+        _LOGGER.debug("New settings for charger %s: %s", charger.id, new_limits)
+        self._last_charger_update_times[charger.id] = timestamp
+        self._emit_charger_event(charger, EVENT_ACTION_NEW_CHARGER_LIMITS, new_limits)
+        self._charger_pipelines[charger.id].submit(new_limits, timestamp)
+
+    def _handle_charger_command_dispatch(
+        self, charger: Charger, command: ChargerCommand
+    ) -> None:
+        """
+        Record limits sent to the charger as applied.
+
+        Makes the allocator use the new limits while the charger settles, so
+        the change isn't mistaken for a manual override.
+        """
+        self._power_allocator.update_applied_current(
+            charger_id=charger.id,
+            applied_current=command.limits,
+            timestamp=command.timestamp,
+        )
+
+    def _handle_charger_command_applied(
+        self, charger: Charger, command: ChargerCommand
     ) -> None:
-        _LOGGER.debug("New charger settings: %s", new_limits)
-        self._last_charger_update_time = timestamp
-        self._emit_charger_event(EVENT_ACTION_NEW_CHARGER_LIMITS, new_limits)
-        self.hass.async_create_task(self._charger.set_current_limit(new_limits))
+        """Restart the settle time once the charger accepted the limits."""
+        self._power_allocator.update_applied_current(
+            charger_id=charger.id,
+            applied_current=command.limits,
+            timestamp=int(time()),
+        )
 
-    def _emit_charger_event(self, action: str, new_limits: dict[Phase, int]) -> None:
+    def _handle_charger_command_failed(
+        self, charger: Charger, command: ChargerCommand
+    ) -> None:
+        """Fall back to the limits the charger actually reports."""
+        _LOGGER.warning(
+            "Charger %s did not apply limits %s", charger.id, command.limits
+        )
+        current_limit = charger.get_current_limit()
+        if current_limit is not None:
+            self._power_allocator.update_applied_current(
+                charger_id=charger.id,
+                applied_current=current_limit,
+                timestamp=int(time()),
+            )
+
+    def _emit_charger_event(
+        self, charger: Charger, action: str, new_limits: dict[Phase, int]
+    ) -> None:
         """Emit an event to Home Assistant's device event log."""
         self.hass.bus.async_fire(
             EVSE_LOAD_BALANCER_COORDINATOR_EVENT,
             {
                 ATTR_DEVICE_ID: self._device.id,
+                EVENT_ATTR_CHARGER_ID: charger.id,
                 EVENT_ATTR_ACTION: action,
                 EVENT_ATTR_NEW_LIMITS: new_limits,
             },
         )
         _LOGGER.info(
-            "Emitted charger event: action=%s, new_limits=%s", action, new_limits
+            "Emitted charger event: charger=%s, action=%s, new_limits=%s",
+            charger.id,
+            action,
+            new_limits,
         )
@@ -0,0 +1,99 @@
+"""Coalescing scheduler for balancing cycles."""
+
+import logging
+from collections.abc import Callable
+from datetime import datetime
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CoalescingCycleScheduler:
+    """
+    Merge bursts of meter updates into a single balancing cycle.
+
+    Meters write the power and voltage of each phase as separate state changes,
+    usually within a few milliseconds of each other. Every update extends a
+    short settle window and the cycle runs once no update arrived for `window`
+    seconds, so it sees a consistent snapshot of the whole telegram.
+
+    To make sure an overcurrent is never held back by a meter that keeps
+    reporting, the cycle always runs at most `max_delay` seconds after the
+    first update of a burst.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        action: Callable[[datetime], None],
+        window: float = 0.1,
+        max_delay: float = 0.5,
+    ) -> None:
+        """Initialize the scheduler."""
+        self._hass = hass
+        self._action = action
+        self._window = window
+        self._max_delay = max(window, max_delay)
+
+        self._cancel_timer: CALLBACK_TYPE | None = None
+        self._burst_deadline: float = 0.0
+        self._last_event: float = 0.0
+        self._pending_events: int = 0
+
+        # Number of events merged into the most recent cycle
+        self.last_merged_events: int = 0
+
+    @property
+    def is_pending(self) -> bool:
+        """Return whether a cycle is scheduled."""
+        return self._cancel_timer is not None
+
+    @callback
+    def async_schedule(self) -> None:
+        """Register an update and schedule a cycle for the current burst."""
+        now = self._hass.loop.time()
+        self._last_event = now
+        self._pending_events += 1
+
+        if self._cancel_timer is not None:
+            # The running timer re-arms itself if the burst isn't settled yet,
+            # which saves cancelling and scheduling a timer for every event.
+            return
+
+        self._burst_deadline = now + self._max_delay
+        self._cancel_timer = async_call_later(
+            self._hass, self._window, self._async_handle_timer
+        )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel a scheduled cycle."""
+        if self._cancel_timer is not None:
+            self._cancel_timer()
+            self._cancel_timer = None
+        self._pending_events = 0
+
+    @callback
+    def _async_handle_timer(self, _now: datetime) -> None:
+        """Run the cycle once the burst settled or the deadline passed."""
+        now = self._hass.loop.time()
+        quiet_for = now - self._last_event
+        remaining = self._burst_deadline - now
+
+        if quiet_for < self._window and remaining > 0:
+            self._cancel_timer = async_call_later(
+                self._hass,
+                min(self._window - quiet_for, remaining),
+                self._async_handle_timer,
+            )
+            return
+
+        self._cancel_timer = None
+        self.last_merged_events = self._pending_events
+        self._pending_events = 0
+
+        _LOGGER.debug("Running cycle for %d merged events", self.last_merged_events)
+        self._action(dt_util.utcnow())
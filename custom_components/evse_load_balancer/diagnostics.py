@@ -0,0 +1,56 @@
+"""Diagnostics support for EVSE Load Balancer."""
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from . import config_flow as cf
+from .const import DOMAIN
+from .meters.mqtt_meter import MQTT_METER_SENSORS
+
+if TYPE_CHECKING:
+    from .coordinator import EVSELoadBalancerCoordinator
+
+# The address of the P1 port, which can be the host and port of a P1 reader
+TO_REDACT = {cf.CONF_P1_PORT}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: EVSELoadBalancerCoordinator = hass.data[DOMAIN][entry.entry_id]
+    to_redact = set(TO_REDACT)
+    if entry.data.get(cf.CONF_MQTT_METER):
+        # The phase sensors are the meter's topics rather than entity ids
+        to_redact.update(MQTT_METER_SENSORS)
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, to_redact),
+            "options": async_redact_data(entry.options, to_redact),
+        },
+        "coordinator": {
+            "state": coordinator.get_load_balancing_state,
+            "last_check": coordinator.get_last_check_timestamp,
+            "last_merged_events": coordinator.last_merged_events,
+        },
+        "meter": {
+            "type": coordinator.meter.__class__.__name__,
+            "invalid_readings": coordinator.meter.invalid_readings,
+            "history": coordinator.meter_history.as_dict(),
+        },
+        "balancer": coordinator.balancer_statistics,
+        "chargers": [
+            {
+                "id": charger.id,
+                "type": charger.__class__.__name__,
+                "current_limit": coordinator.get_charger_current_limit(charger.id),
+                "last_update": coordinator.get_charger_last_update_time(charger.id),
+            }
+            for charger in coordinator.chargers
+        ],
+        "latency": coordinator.instrumentation.as_dict(),
+    }
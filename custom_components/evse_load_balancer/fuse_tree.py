@@ -0,0 +1,115 @@
+"""Hierarchy of fuses the chargers are connected behind."""
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+from .const import Phase
+
+ROOT_NODE_ID = "main"
+
+
+@dataclass(frozen=True, slots=True)
+class FuseNode:
+    """
+    A fuse or breaker in the installation.
+
+    Chargers are connected directly behind exactly one node. A node without
+    current sensors is protected by keeping the sum of the limits of the
+    chargers behind it below its fuse size.
+    """
+
+    node_id: str
+    fuse_size: int
+    parent_id: str | None = ROOT_NODE_ID
+    charger_ids: tuple[str, ...] = ()
+    current_entities: Mapping[Phase, str] = field(default_factory=dict)
+
+
+class FuseTree:
+    """
+    Fuse hierarchy with the lookups needed by every cycle precomputed.
+
+    The root node is the main fuse, measured by the meter. Every other node
+    is a sub-group of the main fuse or of another group. Chargers that aren't
+    connected behind a group are connected directly behind the main fuse.
+    """
+
+    def __init__(
+        self,
+        root: FuseNode,
+        groups: Iterable[FuseNode] = (),
+        charger_ids: Iterable[str] = (),
+    ) -> None:
+        """Build the tree and validate its structure."""
+        self.root = root
+        nodes = {root.node_id: root}
+        for group in groups:
+            if group.node_id in nodes:
+                msg = f"Duplicate fuse group '{group.node_id}'"
+                raise ValueError(msg)
+            nodes[group.node_id] = group
+
+        children: dict[str, list[str]] = {node_id: [] for node_id in nodes}
+        for node in nodes.values():
+            if node is root:
+                continue
+            if node.parent_id not in nodes:
+                msg = (
+                    f"Unknown parent '{node.parent_id}' of fuse group '{node.node_id}'"
+                )
+                raise ValueError(msg)
+            children[node.parent_id].append(node.node_id)
+
+        # Depth-first walk from the root. Groups that can't be reached are
+        # part of a cycle.
+        order: list[str] = []
+        paths: dict[str, tuple[str, ...]] = {root.node_id: (root.node_id,)}
+        stack = [root.node_id]
+        while stack:
+            node_id = stack.pop()
+            order.append(node_id)
+            for child_id in children[node_id]:
+                paths[child_id] = (*paths[node_id], child_id)
+                stack.append(child_id)
+        if len(order) != len(nodes):
+            unreachable = sorted(set(nodes) - set(order))
+            msg = f"Fuse groups {unreachable} are part of a cycle"
+            raise ValueError(msg)
+
+        charger_nodes: dict[str, str] = {}
+        for node in nodes.values():
+            for charger_id in node.charger_ids:
+                if charger_id in charger_nodes:
+                    msg = f"Charger '{charger_id}' is part of multiple fuse groups"
+                    raise ValueError(msg)
+                charger_nodes[charger_id] = node.node_id
+        for charger_id in charger_ids:
+            charger_nodes.setdefault(charger_id, root.node_id)
+
+        # Groups ordered so that every group comes before its parent
+        self.groups: tuple[FuseNode, ...] = tuple(
+            nodes[node_id] for node_id in reversed(order) if node_id != root.node_id
+        )
+        self._charger_paths: dict[str, tuple[str, ...]] = {
+            charger_id: paths[node_id] for charger_id, node_id in charger_nodes.items()
+        }
+        self._chargers_below: dict[str, frozenset[str]] = {
+            node_id: frozenset(
+                charger_id
+                for charger_id, path in self._charger_paths.items()
+                if node_id in path
+            )
+            for node_id in nodes
+        }
+
+    def path(self, charger_id: str) -> tuple[str, ...]:
+        """Return the ids of the nodes from the main fuse down to the charger."""
+        return self._charger_paths.get(charger_id, (self.root.node_id,))
+
+    def group_path(self, charger_id: str) -> tuple[str, ...]:
+        """Return the ids of the groups a charger is connected behind."""
+        return self.path(charger_id)[1:]
+
+    def chargers_below(self, node_id: str) -> frozenset[str]:
+        """Return the ids of all chargers connected behind a node."""
+        return self._chargers_below[node_id]
@@ -1,10 +1,10 @@
 """HA Device."""
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
 from homeassistant.helpers import (
     entity_registry as er,
 )
@@ -19,7 +19,13 @@ _LOGGER = logging.getLogger(__name__)
 
 
 class HaDevice:
-    """Base class for HA devices."""
+    """
+    Base class for HA devices.
+
+    The device's entities are indexed by translation key, unique ID and
+    unique ID suffix whenever they are (re)loaded, so looking up an entity is
+    a dictionary lookup instead of a scan over all entities of the device.
+    """
 
     def __init__(self, hass: HomeAssistant, device_entry: DeviceEntry) -> None:
         """Initialize the HaDevice instance."""
@@ -27,9 +33,67 @@ class HaDevice:
         self.device_entry = device_entry
         self.entity_registry = er.async_get(self.hass)
 
+    @property
+    def entities(self) -> list["RegistryEntry"]:
+        """Return the entities of the device."""
+        return self._entities
+
+    @entities.setter
+    def entities(self, entities: Iterable["RegistryEntry"]) -> None:
+        """Set the entities of the device and rebuild the lookup indexes."""
+        self._entities = list(entities)
+        self._entities_by_translation_key: dict[str, RegistryEntry] = {}
+        self._entities_by_unique_id: dict[str, RegistryEntry] = {}
+        self._entities_by_key: dict[str, RegistryEntry] = {}
+
+        # The first entity wins on duplicates, like a scan over the list would
+        for entity in self._entities:
+            if entity.translation_key is not None:
+                self._entities_by_translation_key.setdefault(
+                    entity.translation_key, entity
+                )
+            self._entities_by_unique_id.setdefault(entity.unique_id, entity)
+
+            # Every part after an underscore is a key the unique_id ends with
+            parts = entity.unique_id.split("_")
+            for index in range(1, len(parts)):
+                self._entities_by_key.setdefault("_".join(parts[index:]), entity)
+
     def refresh_entities(self) -> None:
         """Refresh local list of entity maps for the meter."""
-        self._entities = self._get_entities_for_device()
+        self._get_entities_for_device()
+
+    @callback
+    def async_track_entity_registry_updates(self) -> CALLBACK_TYPE:
+        """
+        Refresh the entities whenever one of the device's entities changes.
+
+        Returns a callable that stops tracking.
+        """
+
+        @callback
+        def _is_device_entity(event_data: er.EventEntityRegistryUpdatedData) -> bool:
+            entity_id = event_data["entity_id"]
+            if any(entity.entity_id == entity_id for entity in self._entities):
+                return True
+            # Also covers entities that were renamed (entity_id changed)
+            entity = self.entity_registry.async_get(entity_id)
+            return entity is not None and entity.device_id == self.device_entry.id
+
+        @callback
+        def _handle_entity_registry_updated(
+            _event: Event[er.EventEntityRegistryUpdatedData],
+        ) -> None:
+            _LOGGER.debug(
+                "Entities of device %s changed, refreshing", self.device_entry.id
+            )
+            self.refresh_entities()
+
+        return self.hass.bus.async_listen(
+            er.EVENT_ENTITY_REGISTRY_UPDATED,
+            _handle_entity_registry_updated,
+            event_filter=_is_device_entity,
+        )
 
     def _get_entities_for_device(self) -> None:
         """Get all available entities for the linked HA device."""
@@ -40,10 +104,7 @@ class HaDevice:
 
     def _get_entity_id_by_translation_key(self, entity_translation_key: str) -> str:
         """Get the entity ID for a given translation key."""
-        entity: RegistryEntry | None = next(
-            (e for e in self.entities if e.translation_key == entity_translation_key),
-            None,
-        )
+        entity = self._entities_by_translation_key.get(entity_translation_key)
         if entity is None:
             msg = f"Entity not found for translation_key '{entity_translation_key}'"
             raise ValueError(msg)
@@ -55,10 +116,7 @@ class HaDevice:
 
     def _get_entity_id_by_unique_id(self, entity_unique_id: str) -> str | None:
         """Get the entity ID for a given unique ID."""
-        entity: RegistryEntry | None = next(
-            (e for e in self.entities if e.unique_id == entity_unique_id),
-            None,
-        )
+        entity = self._entities_by_unique_id.get(entity_unique_id)
         if entity is None:
             msg = f"Entity not found for unique_id '{entity_unique_id}'"
             raise ValueError(msg)
@@ -72,13 +130,10 @@ class HaDevice:
         """
         Get the entity ID for a given key.
 
-        Looks up the entity by checking all entities associated with the device
-        whose unique_id end with the provided key.
+        Looks up the entity associated with the device whose unique_id ends
+        with the provided key.
         """
-        entity: RegistryEntry | None = next(
-            (e for e in self.entities if e.unique_id.endswith(f"_{entity_key}")),
-            None,
-        )
+        entity = self._entities_by_key.get(entity_key)
         if entity is None:
             msg = f"Entity with unique_id ending with '_{entity_key}' not found"
             raise ValueError(msg)
@@ -0,0 +1,146 @@
+"""Latency instrumentation for the coordinator's balancing cycle."""
+
+from array import array
+from bisect import bisect_left
+from typing import Any
+
+# Stages of the balancing cycle that are timed
+STAGE_CYCLE = "cycle"
+STAGE_METER_READ = "meter_read"
+STAGE_COMPUTE_AVAILABILITY = "compute_availability"
+STAGE_UPDATE_ALLOCATION = "update_allocation"
+STAGE_GET_CURRENT_LIMIT = "get_current_limit"
+STAGE_SET_CURRENT_LIMIT = "set_current_limit"
+
+CYCLE_STAGES: tuple[str, ...] = (
+    STAGE_CYCLE,
+    STAGE_METER_READ,
+    STAGE_COMPUTE_AVAILABILITY,
+    STAGE_UPDATE_ALLOCATION,
+    STAGE_GET_CURRENT_LIMIT,
+    STAGE_SET_CURRENT_LIMIT,
+)
+
+# Upper bounds (in milliseconds) of the histogram buckets. Covers both the
+# sub-millisecond synchronous stages and the seconds it can take a cloud
+# charger to acknowledge a new limit. Anything slower lands in an overflow
+# bucket.
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    25,
+    50,
+    100,
+    250,
+    500,
+    1000,
+    2500,
+    5000,
+    10000,
+    30000,
+)
+
+
+class LatencyHistogram:
+    """Fixed-size histogram of latencies in milliseconds."""
+
+    __slots__ = ("_counts", "count", "last", "max", "total")
+
+    def __init__(self) -> None:
+        """Initialize an empty histogram."""
+        self._counts = array("L", [0]) * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+        self.last: float | None = None
+
+    def record(self, duration_ms: float) -> None:
+        """Record a single duration."""
+        self._counts[bisect_left(LATENCY_BUCKETS_MS, duration_ms)] += 1
+        self.count += 1
+        self.total += duration_ms
+        self.last = duration_ms
+        self.max = max(self.max, duration_ms)
+
+    @property
+    def mean(self) -> float | None:
+        """Return the mean of all recorded durations."""
+        return self.total / self.count if self.count else None
+
+    def percentile(self, percentile: float) -> float | None:
+        """
+        Return the given percentile (0-100).
+
+        The result is the upper bound of the bucket holding the percentile, or
+        the maximum recorded value when it falls in the overflow bucket.
+        """
+        if not self.count:
+            return None
+
+        rank = percentile / 100 * self.count
+        cumulative = 0
+        for index, bucket_count in enumerate(self._counts):
+            cumulative += bucket_count
+            if cumulative >= rank and bucket_count:
+                if index < len(LATENCY_BUCKETS_MS):
+                    return min(LATENCY_BUCKETS_MS[index], self.max)
+                break
+        return self.max
+
+    def summary(self) -> dict[str, float | int | None]:
+        """Return a short summary of the histogram."""
+        return {
+            "count": self.count,
+            "last": _round(self.last),
+            "mean": _round(self.mean),
+            "p50": _round(self.percentile(50)),
+            "p95": _round(self.percentile(95)),
+            "max": _round(self.max) if self.count else None,
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the summary together with the bucket counts."""
+        buckets = {
+            f"le_{bound}": count
+            for bound, count in zip(LATENCY_BUCKETS_MS, self._counts, strict=False)
+        }
+        buckets["overflow"] = self._counts[-1]
+        return {**self.summary(), "buckets": buckets}
+
+
+class CycleInstrumentation:
+    """Latency histograms for each stage of the balancing cycle."""
+
+    def __init__(self) -> None:
+        """Initialize a histogram per stage."""
+        self.stages: dict[str, LatencyHistogram] = {
+            stage: LatencyHistogram() for stage in CYCLE_STAGES
+        }
+
+    def record(self, stage: str, duration_s: float) -> None:
+        """Record the duration (in seconds) of a stage."""
+        self.stages[stage].record(duration_s * 1000)
+
+    @property
+    def last_cycle_duration(self) -> float | None:
+        """Return the duration of the last full cycle in milliseconds."""
+        last = self.stages[STAGE_CYCLE].last
+        return _round(last)
+
+    def summary(self) -> dict[str, dict[str, float | int | None]]:
+        """Return a summary per stage."""
+        return {stage: histogram.summary() for stage, histogram in self.stages.items()}
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the full histograms per stage."""
+        return {stage: histogram.as_dict() for stage, histogram in self.stages.items()}
+
+
+def _round(value: float | None) -> float | None:
+    return round(value, 3) if value is not None else None
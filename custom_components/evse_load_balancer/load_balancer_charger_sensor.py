@@ -0,0 +1,61 @@
+"""EVSE Load Balancer per-charger sensors."""
+
+import logging
+from datetime import UTC, datetime
+
+from homeassistant.components.sensor.const import UnitOfElectricCurrent
+from homeassistant.helpers.entity import (
+    EntityCategory,
+)
+
+from .chargers.charger import Charger
+from .coordinator import EVSELoadBalancerCoordinator
+from .load_balancer_sensor import (
+    LoadBalancerSensor,
+    LoadBalancerSensorEntityDescription,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+SENSOR_KEY_CHARGER_CURRENT_LIMIT = "charger_current_limit"
+SENSOR_KEY_CHARGER_LAST_UPDATE = "charger_last_update"
+
+
+class LoadBalancerChargerSensor(LoadBalancerSensor):
+    """Sensor for one of the chargers managed by the load balancer."""
+
+    def __init__(
+        self,
+        coordinator: EVSELoadBalancerCoordinator,
+        entity_description: LoadBalancerSensorEntityDescription,
+        charger: Charger,
+    ) -> None:
+        """Initialize the LoadBalancerChargerSensor."""
+        super().__init__(coordinator, entity_description)
+        self._charger = charger
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_unique_id = (
+            f"{coordinator.config_entry.entry_id}_{charger.id}_{entity_description.key}"
+        )
+        self._attr_translation_placeholders = {
+            "charger": charger.device.name_by_user or charger.device.name or charger.id
+        }
+        if entity_description.key == SENSOR_KEY_CHARGER_CURRENT_LIMIT:
+            self._attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
+
+    @property
+    def native_value(self) -> int | datetime | None:
+        """Return the value for the charger from the coordinator."""
+        key = self.entity_description.key
+        if key == SENSOR_KEY_CHARGER_CURRENT_LIMIT:
+            return self._coordinator.get_charger_current_limit(self._charger.id)
+        if key == SENSOR_KEY_CHARGER_LAST_UPDATE:
+            timestamp = self._coordinator.get_charger_last_update_time(self._charger.id)
+            return (
+                datetime.fromtimestamp(timestamp, tz=UTC)
+                if timestamp is not None
+                else None
+            )
+
+        _LOGGER.error("Cant get sensor value. Invalid charger sensor key: %s", key)
+        return None
@@ -0,0 +1,36 @@
+"""EVSE Load Balancer cycle latency sensor."""
+
+from typing import Any
+
+from homeassistant.const import UnitOfTime
+from homeassistant.helpers.entity import (
+    EntityCategory,
+)
+
+from .coordinator import EVSELoadBalancerCoordinator
+from .load_balancer_sensor import (
+    LoadBalancerSensor,
+    LoadBalancerSensorEntityDescription,
+)
+
+
+class LoadBalancerLatencySensor(LoadBalancerSensor):
+    """Diagnostic sensor exposing how long the balancing cycle takes."""
+
+    def __init__(
+        self,
+        coordinator: EVSELoadBalancerCoordinator,
+        entity_description: LoadBalancerSensorEntityDescription,
+    ) -> None:
+        """Initialize the LoadBalancerLatencySensor."""
+        super().__init__(coordinator, entity_description)
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+        self._attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the latency summary of each stage of the cycle."""
+        return {
+            **self._coordinator.instrumentation.summary(),
+            "merged_events": self._coordinator.last_merged_events,
+        }
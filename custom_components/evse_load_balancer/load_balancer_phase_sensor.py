@@ -2,8 +2,9 @@
 
 import logging
 from functools import cached_property
+from typing import Any
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntityDescription
+from homeassistant.components.sensor import SensorDeviceClass
 from homeassistant.components.sensor.const import UnitOfElectricCurrent
 from homeassistant.helpers.entity import (
     EntityCategory,
@@ -13,7 +14,10 @@ from .const import (
     Phase,
 )
 from .coordinator import EVSELoadBalancerCoordinator
-from .load_balancer_sensor import LoadBalancerSensor
+from .load_balancer_sensor import (
+    LoadBalancerSensor,
+    LoadBalancerSensorEntityDescription,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,18 +29,29 @@ SENSOR_KEY_AVAILABLE_CURRENT_L3 = "available_current_l3"
 class LoadBalancerPhaseSensor(LoadBalancerSensor):
     """Representation of a EVSE Load Balancer sensor."""
 
+    # Kept out of the recorder, they change with nearly every state
+    _unrecorded_attributes = frozenset(
+        {
+            "average",
+            "minimum",
+            "maximum",
+            "thermal_load",
+            "forecast",
+            "ramp_integral",
+            "median",
+        }
+    )
+
     def __init__(
         self,
         coordinator: EVSELoadBalancerCoordinator,
-        entity_description: SensorEntityDescription,
+        entity_description: LoadBalancerSensorEntityDescription,
     ) -> None:
         """Initialize the LoadBalancerPhaseSensor."""
         super().__init__(coordinator, entity_description)
         self._attr_entity_category = EntityCategory.DIAGNOSTIC
         self._attr_native_unit_of_measurement = UnitOfElectricCurrent.AMPERE
 
-        coordinator.register_sensor(self)
-
     @property
     def native_value(self) -> int | None:
         """Return the available current from the coordinator."""
@@ -52,6 +67,11 @@ class LoadBalancerPhaseSensor(LoadBalancerSensor):
 
         return None
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the available current statistics and the thermal load."""
+        return self._coordinator.balancer_statistics.get(self._phase.value, {})
+
     @cached_property
     def _phase(self) -> Phase:
         """Return the phase for the sensor."""
@@ -1,6 +1,8 @@
 """Load Balancer sensor platform."""
 
 import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.helpers.entity import (
@@ -12,20 +14,45 @@ from .const import (
 )
 from .coordinator import EVSELoadBalancerCoordinator
 
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
 _LOGGER = logging.getLogger(__name__)
 
 
+@dataclass(frozen=True, kw_only=True)
+class LoadBalancerSensorEntityDescription(SensorEntityDescription):
+    """
+    Describes an EVSE Load Balancer sensor.
+
+    The coordinator only writes a sensor's state when its value changed, at
+    most once every `min_update_interval` seconds. Numeric values also have to
+    differ at least `deadband` from the last written value. Attributes, such
+    as statistics that drift with every cycle, are only written on their own
+    once every `attributes_update_interval` seconds.
+    """
+
+    min_update_interval: float = 0
+    deadband: float = 0
+    attributes_update_interval: float = 60
+
+
 class LoadBalancerSensor(SensorEntity):
     """Representation of a EVSE Load Balancer sensor."""
 
+    entity_description: LoadBalancerSensorEntityDescription
+
     def __init__(
         self,
         coordinator: EVSELoadBalancerCoordinator,
-        entity_description: SensorEntityDescription,
+        entity_description: LoadBalancerSensorEntityDescription,
     ) -> None:
         """Initialize the LoadBalancerSensor."""
         super().__init__()
         self.entity_description = entity_description
+        self._last_written_value: Any = None
+        self._last_written_attributes: Mapping[str, Any] | None = None
+        self._last_written_at: float | None = None
         self._coordinator = coordinator
         self._attr_should_poll = False
         self._attr_has_entity_name = True
@@ -53,6 +80,37 @@ class LoadBalancerSensor(SensorEntity):
         """Return if entity is available."""
         return self.state is not None
 
+    def should_write_state(self, now: float) -> bool:
+        """
+        Return whether the sensor's state changed enough to be written.
+
+        `now` is a monotonic timestamp in seconds. When this returns True the
+        current value and attributes are remembered as the last written ones.
+        """
+        value = self.native_value
+        attributes = self.extra_state_attributes
+        if self._last_written_at is not None:
+            description = self.entity_description
+            elapsed = now - self._last_written_at
+            if elapsed < description.min_update_interval:
+                return False
+            value_changed = value != self._last_written_value and not (
+                description.deadband
+                and isinstance(value, int | float)
+                and isinstance(self._last_written_value, int | float)
+                and abs(value - self._last_written_value) < description.deadband
+            )
+            if not value_changed and (
+                attributes == self._last_written_attributes
+                or elapsed < description.attributes_update_interval
+            ):
+                return False
+
+        self._last_written_value = value
+        self._last_written_attributes = attributes
+        self._last_written_at = now
+        return True
+
     def _get_value_from_coordinator(self) -> any:
         """Override in subclass or implement coordinator lookup based on key."""
         return getattr(self._coordinator, self.entity_description.key, None)
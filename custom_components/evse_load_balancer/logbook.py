@@ -9,11 +9,13 @@ from homeassistant.components.logbook import (
     LOGBOOK_ENTRY_NAME,
 )
 from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
 
 from .const import (
     DOMAIN,
     EVENT_ACTION_NEW_CHARGER_LIMITS,
     EVENT_ATTR_ACTION,
+    EVENT_ATTR_CHARGER_ID,
     EVENT_ATTR_NEW_LIMITS,
     EVSE_LOAD_BALANCER_COORDINATOR_EVENT,
     Phase,
@@ -22,11 +24,18 @@ from .const import (
 
 @callback
 def async_describe_events(
-    _hass: HomeAssistant,
+    hass: HomeAssistant,
     async_describe_event: Callable[[str, str, Callable[[Event], dict[str, Any]]], None],
 ) -> None:
     """Describe EVSE events."""
 
+    def _charger_name(charger_id: str | None) -> str:
+        """Return the name of a charger's device, or its ID if it's not found."""
+        device = dr.async_get(hass).async_get(charger_id) if charger_id else None
+        if device is None:
+            return f"charger {charger_id}" if charger_id else "charger"
+        return device.name_by_user or device.name or f"charger {charger_id}"
+
     @callback
     def async_describe_charger_event(event: Event) -> dict[str, Any]:
         """Describe a charger change event."""
@@ -35,10 +44,12 @@ def async_describe_events(
 
         if action == EVENT_ACTION_NEW_CHARGER_LIMITS:
             new_limits: dict[Phase, int] = data.get(EVENT_ATTR_NEW_LIMITS, {})
-            message = (
-                "charger limits set to: ",
-                ", ".join(f"{phase}: {limit}A" for phase, limit in new_limits.items()),
+            # Phases are strings once the event is read back from the database
+            limits = ", ".join(
+                f"{Phase(phase).value}: {limit}A" for phase, limit in new_limits.items()
             )
+            charger = _charger_name(data.get(EVENT_ATTR_CHARGER_ID))
+            message = f"{charger} limits set to: {limits}"
         else:
             msg = f"Unknown action: {action}"
             raise ValueError(msg)
@@ -0,0 +1,177 @@
+"""Compact history of the meter readings of recent balancing cycles."""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from math import isnan, nan
+from typing import Any
+
+from .meters.meter import MeterSnapshot, Phase
+from .ring_buffer import RingBuffer, RingView
+
+# An hour of readings at one cycle per second, more than a diagnostics dump
+# looks back on. The columns are allocated up front: 8 bytes for the
+# timestamp and 10 bytes per phase, ~134 kB for three phases.
+DEFAULT_CAPACITY = 60 * 60
+
+# Stored for currents that couldn't be read, as they're kept as 16 bit ints
+MISSING_CURRENT = -(2**15)
+
+# The ring buffer holds the timestamp in its first column, followed by these
+# columns for each phase, at these offsets
+_TIMESTAMP = 0
+_CURRENT = 0
+_VOLTAGE = 1
+_POWER = 2
+_PHASE_COLUMNS = (("h", MISSING_CURRENT), ("f", nan), ("f", nan))
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryWindow:
+    """
+    The readings of a phase over a window of time.
+
+    Timestamps are in seconds since the epoch. Currents that couldn't be read
+    are `MISSING_CURRENT`, voltages and powers (in kW) NaN.
+    """
+
+    timestamps: RingView
+    currents: RingView
+    voltages: RingView
+    powers: RingView
+
+    def __len__(self) -> int:
+        """Return the number of samples in the window."""
+        return len(self.timestamps)
+
+    def valid_currents(self) -> Iterator[int]:
+        """Iterate the currents that could be read."""
+        return (int(current) for current in self.currents if current != MISSING_CURRENT)
+
+
+class MeterHistory:
+    """
+    Fixed-capacity ring buffer of the meter readings of each cycle.
+
+    Samples share a single timestamp column, with a current, voltage and
+    power column per phase. Recording a sample is O(1) and overwrites the
+    oldest one once the buffer is full. Windows are views on the buffer,
+    found by a binary search on the timestamps.
+
+    The balancers don't read from it: they work on the available current of
+    their own fuse, which for fuse groups isn't measured by the meter, and
+    keep running statistics over windows of their own instead.
+    """
+
+    __slots__ = ("_buffer", "_phases")
+
+    def __init__(
+        self, phases: Iterable[Phase] = tuple(Phase), capacity: int = DEFAULT_CAPACITY
+    ) -> None:
+        """Initialize an empty history for the given phases."""
+        self._phases = tuple(dict.fromkeys(phases))
+        self._buffer = RingBuffer(
+            (("d", 0.0), *(_PHASE_COLUMNS * len(self._phases))), capacity
+        )
+
+    def __len__(self) -> int:
+        """Return the number of samples in the history."""
+        return len(self._buffer)
+
+    @property
+    def capacity(self) -> int:
+        """Return the maximum number of samples kept."""
+        return self._buffer.capacity
+
+    @property
+    def phases(self) -> tuple[Phase, ...]:
+        """Return the phases with a history."""
+        return self._phases
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the columns of the history."""
+        return self._buffer.nbytes
+
+    def record(self, snapshot: MeterSnapshot) -> None:
+        """Add the readings of a snapshot as the newest sample."""
+        row = [snapshot.taken_at.timestamp()]
+        for phase in self._phases:
+            reading = snapshot.phases.get(phase)
+            current = reading.current if reading is not None else None
+            voltage = reading.voltage if reading is not None else None
+            power = reading.power if reading is not None else None
+            row.extend(
+                (
+                    max(MISSING_CURRENT + 1, min(2**15 - 1, current))
+                    if current is not None
+                    else MISSING_CURRENT,
+                    voltage if voltage is not None else nan,
+                    power if power is not None else nan,
+                )
+            )
+        self._buffer.append(*row)
+
+    def window(
+        self, phase: Phase, seconds: float | None = None, now: float | None = None
+    ) -> HistoryWindow:
+        """
+        Return the samples of a phase of the last `seconds` before `now`.
+
+        Without `seconds`, all samples up to `now` are returned. `now`
+        defaults to the timestamp of the newest sample.
+        """
+        buffer = self._buffer
+        size = len(buffer)
+        start, end = 0, size
+        if size and (seconds is not None or now is not None):
+
+            def timestamp_at(i: int) -> float:
+                return buffer.get(_TIMESTAMP, i)
+
+            if now is not None:
+                end = bisect_right(range(size), now, key=timestamp_at)
+            else:
+                now = timestamp_at(size - 1)
+            if seconds is not None:
+                start = bisect_left(range(end), now - seconds, key=timestamp_at)
+
+        column = 1 + len(_PHASE_COLUMNS) * self._phases.index(phase)
+        length = end - start
+        return HistoryWindow(
+            timestamps=buffer.view(_TIMESTAMP, start, length),
+            currents=buffer.view(column + _CURRENT, start, length),
+            voltages=buffer.view(column + _VOLTAGE, start, length),
+            powers=buffer.view(column + _POWER, start, length),
+        )
+
+    def as_dict(self, window_seconds: float = 5 * 60) -> dict[str, Any]:
+        """Return a summary of the history and its last `window_seconds`."""
+        phases = {}
+        for phase in self._phases:
+            window = self.window(phase, window_seconds)
+            currents = list(window.valid_currents())
+            voltages = [voltage for voltage in window.voltages if not isnan(voltage)]
+            phases[phase.value] = {
+                "samples": len(window),
+                "current_min": min(currents) if currents else None,
+                "current_max": max(currents) if currents else None,
+                "current_mean": round(sum(currents) / len(currents), 2)
+                if currents
+                else None,
+                "voltage_mean": round(sum(voltages) / len(voltages), 1)
+                if voltages
+                else None,
+            }
+
+        buffer = self._buffer
+        return {
+            "capacity": buffer.capacity,
+            "samples": len(buffer),
+            "nbytes": buffer.nbytes,
+            "span_seconds": buffer.get(_TIMESTAMP, -1) - buffer.get(_TIMESTAMP, 0)
+            if buffer
+            else 0.0,
+            "window_seconds": window_seconds,
+            "phases": phases,
+        }
@@ -3,6 +3,7 @@
 from typing import TYPE_CHECKING
 
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_IP_ADDRESS, CONF_TOKEN
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr
 
@@ -17,8 +18,11 @@ from ..const import (  # noqa: TID252
 from .amsleser_meter import AmsleserMeter
 from .custom_meter import CustomMeter
 from .dsmr_meter import DsmrMeter
+from .homewizard_api_meter import HomeWizardApiMeter
 from .homewizard_meter import HomeWizardMeter
 from .meter import Meter
+from .mqtt_meter import MqttMeter
+from .p1_meter import P1Meter
 from .tibber_meter import TibberMeter
 
 if TYPE_CHECKING:
@@ -27,13 +31,32 @@ if TYPE_CHECKING:
 CONST_CUSTOM_METER = "custom_meter"
 
 
-async def meter_factory(
+async def meter_factory(  # noqa: PLR0911, PLR0913
     hass: HomeAssistant,
     config_entry: ConfigEntry,
     custom_config: bool,  # noqa: FBT001
     device_entry_id: str,
+    p1_port: str | None = None,
+    *,
+    local_api: bool = False,
+    mqtt: bool = False,
 ) -> Meter:
     """Create a charger instance based on the manufacturer."""
+    sources = [p1_port, mqtt, custom_config, device_entry_id]
+    if sum(bool(source) for source in sources) > 1:
+        msg = (
+            "Configure only one of a P1 port, MQTT topics, custom sensors or a device."
+        )
+        raise ValueError(msg)
+
+    # direct P1 reader does not come from device either
+    if p1_port:
+        return P1Meter(hass, config_entry, p1_port)
+
+    # neither do meters publishing on MQTT themselves
+    if mqtt:
+        return MqttMeter(hass, config_entry)
+
     # custom implementation meter does not come from device
     if custom_config:
         return CustomMeter(hass, config_entry)
@@ -57,7 +80,7 @@ async def meter_factory(
     if manufacturer == METER_DOMAIN_DSMR:
         return DsmrMeter(hass, config_entry, device)
     if manufacturer == METER_DOMAIN_HOMEWIZARD:
-        return HomeWizardMeter(hass, config_entry, device)
+        return _homewizard_meter(hass, config_entry, device, local_api=local_api)
     if (
         manufacturer == HA_INTEGRATION_DOMAIN_MQTT
         and device.manufacturer == METER_MANUFACTURER_AMSLESER
@@ -68,3 +91,36 @@ async def meter_factory(
 
     msg = f"Unsupported manufacturer: {device.identifiers}"
     raise ValueError(msg)
+
+
+def _homewizard_meter(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    device: "DeviceEntry",
+    *,
+    local_api: bool,
+) -> Meter:
+    """Create a meter for a HomeWizard device, through its entities or API."""
+    if not local_api:
+        return HomeWizardMeter(hass, config_entry, device)
+
+    # The address and token are those the HomeWizard integration was set up with
+    homewizard_entry = next(
+        (
+            entry
+            for entry_id in device.config_entries
+            if (entry := hass.config_entries.async_get_entry(entry_id))
+            and entry.domain == METER_DOMAIN_HOMEWIZARD
+        ),
+        None,
+    )
+    if not homewizard_entry or not homewizard_entry.data.get(CONF_IP_ADDRESS):
+        msg = f"No HomeWizard config entry with an address for device {device.id}."
+        raise ValueError(msg)
+
+    return HomeWizardApiMeter(
+        hass,
+        config_entry,
+        homewizard_entry.data[CONF_IP_ADDRESS],
+        homewizard_entry.data.get(CONF_TOKEN),
+    )
@@ -11,7 +11,7 @@ from homeassistant.helpers.device_registry import (
 
 from .. import config_flow as cf  # noqa: TID252
 from ..ha_device import HaDevice  # noqa: TID252
-from .meter import Meter, Phase
+from .meter import Meter, Phase, PhaseReading, latest_timestamp
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -117,6 +117,32 @@ class AmsleserMeter(Meter, HaDevice):
         # Amsleser returns W, convert to kW for consistency.
         return consumption_state / 1000.0
 
+    def _read_phase(self, phase: Phase) -> PhaseReading:
+        """Read the consumption, voltage and current of a phase at once."""
+        entity_map = self._get_entity_map_for_phase(phase)
+        consumption_w, consumption_at = self._read_float_state(
+            self._get_entity_id_by_key(entity_map[cf.CONF_PHASE_SENSOR_CONSUMPTION])
+        )
+        voltage, voltage_at = self._read_float_state(
+            self._get_entity_id_by_key(entity_map[cf.CONF_PHASE_SENSOR_VOLTAGE])
+        )
+        current, current_at = self._read_float_state(
+            self._get_entity_id_by_key(entity_map[cf.CONF_PHASE_SENSOR_CURRENT])
+        )
+
+        if consumption_w is None and current is not None and voltage is not None:
+            consumption_w = current * voltage
+        if current is None and consumption_w is not None and voltage:
+            current = consumption_w / voltage
+
+        return PhaseReading(
+            current=floor(current) if current is not None else None,
+            # Amsleser returns W, convert to kW for consistency.
+            power=consumption_w / 1000.0 if consumption_w is not None else None,
+            voltage=voltage,
+            updated_at=latest_timestamp(consumption_at, voltage_at, current_at),
+        )
+
     def get_tracking_entities(self) -> list[str]:
         """Return a list of entity IDs that should be tracked for this meter."""
         keys = [
@@ -1,13 +1,15 @@
 """Custom Meter leveraging existing sensors."""
 
 import logging
+from datetime import datetime
 from math import floor
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .. import config_flow as cf  # noqa: TID252
-from .meter import Meter, Phase
+from .meter import Meter, Phase, PhaseReading, latest_timestamp
+from .sensor_parser import POWER_SCALES, VOLTAGE_SCALES, SensorParser
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,6 +19,12 @@ PHASE_CONF_MAP: dict[Phase, str] = {
     Phase.L3: cf.CONF_PHASE_KEY_THREE,
 }
 
+SENSOR_SCALES: dict[str, dict[str | None, float]] = {
+    cf.CONF_PHASE_SENSOR_CONSUMPTION: POWER_SCALES,
+    cf.CONF_PHASE_SENSOR_PRODUCTION: POWER_SCALES,
+    cf.CONF_PHASE_SENSOR_VOLTAGE: VOLTAGE_SCALES,
+}
+
 
 class CustomMeter(Meter):
     """Customer Meter implementation of the Meter class."""
@@ -25,6 +33,23 @@ class CustomMeter(Meter):
         """Initialize the Custom Meter instance."""
         Meter.__init__(self, hass, config_entry)
         self._config_entry_data = config_entry.data
+        # Parsers of the configured sensors, converting their states to kW or V
+        self._parsers: dict[str, SensorParser] = {}
+        for phase_cf in PHASE_CONF_MAP.values():
+            phase_config = self._config_entry_data.get(phase_cf, None)
+            if phase_config is None:
+                continue
+            for cf_sensor, scales in SENSOR_SCALES.items():
+                self._parsers[phase_config[cf_sensor]] = SensorParser(scales)
+
+    @property
+    def invalid_readings(self) -> dict[str, int]:
+        """Return the number of states that weren't a number, per entity."""
+        return {
+            entity_id: parser.invalid_count
+            for entity_id, parser in self._parsers.items()
+            if parser.invalid_count
+        }
 
     def get_active_phase_current(self, phase: Phase) -> int | None:
         """Return available current on a given phase."""
@@ -65,31 +90,67 @@ class CustomMeter(Meter):
             return None
         return consumption - production
 
+    def _read_phase(self, phase: Phase) -> PhaseReading:
+        """Read consumption, production and voltage of a phase at once."""
+        phase_config = self._config_entry_data.get(PHASE_CONF_MAP[phase], None)
+        if phase_config is None:
+            return PhaseReading()
+
+        consumption, consumption_at = self._read_sensor(
+            phase_config[cf.CONF_PHASE_SENSOR_CONSUMPTION]
+        )
+        production, production_at = self._read_sensor(
+            phase_config[cf.CONF_PHASE_SENSOR_PRODUCTION]
+        )
+        voltage, voltage_at = self._read_sensor(
+            phase_config[cf.CONF_PHASE_SENSOR_VOLTAGE]
+        )
+        power = (
+            consumption - production
+            if consumption is not None and production is not None
+            else None
+        )
+        return PhaseReading(
+            current=floor((power * 1000) / voltage)
+            if power is not None and voltage
+            else None,
+            power=power,
+            voltage=voltage,
+            production=production,
+            updated_at=latest_timestamp(consumption_at, production_at, voltage_at),
+        )
+
     def get_tracking_entities(self) -> list[str]:
         """Return a list of entity IDs that should be tracked for this meter."""
         sensors = []
         for phase_cf in PHASE_CONF_MAP.values():
-            for cf_sensor in [
-                cf.CONF_PHASE_SENSOR_CONSUMPTION,
-                cf.CONF_PHASE_SENSOR_PRODUCTION,
-                cf.CONF_PHASE_SENSOR_VOLTAGE,
-            ]:
-                sensors.extend(self._config_entry_data[phase_cf][cf_sensor])
+            phase_config = self._config_entry_data.get(phase_cf, None)
+            if phase_config is None:
+                continue
+            sensors.extend(
+                phase_config[cf_sensor]
+                for cf_sensor in [
+                    cf.CONF_PHASE_SENSOR_CONSUMPTION,
+                    cf.CONF_PHASE_SENSOR_PRODUCTION,
+                    cf.CONF_PHASE_SENSOR_VOLTAGE,
+                ]
+            )
         return sensors
 
+    def _read_sensor(self, entity_id: str) -> tuple[float | None, datetime | None]:
+        """Return the converted state of a sensor and when it was last reported."""
+        state = self.hass.states.get(entity_id)
+        if state is None:
+            return None, None
+        value = self._parsers[entity_id].parse(state)
+        if value is None:
+            # Unavailable or unknown states don't count as a fresh reading
+            return None, None
+        return value, state.last_reported
+
     def _get_state(self, entity_id: str) -> float | None:
         state = self.hass.states.get(entity_id)
         if state is None:
             _LOGGER.debug("State not found for entity %s", entity_id)
             return None
-        state_value = state.state
-        try:
-            return float(state_value)
-        except ValueError as ex:
-            _LOGGER.exception(
-                "Failed to parse state %s for entity %s: %s",
-                state_value,
-                entity_id,
-                ex,  # noqa: TRY401
-            )
-            return None
+        return self._parsers[entity_id].parse(state)
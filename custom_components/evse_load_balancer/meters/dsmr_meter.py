@@ -11,7 +11,7 @@ from homeassistant.helpers.device_registry import (
 
 from .. import config_flow as cf  # noqa: TID252
 from ..ha_device import HaDevice  # noqa: TID252
-from .meter import Meter, Phase
+from .meter import Meter, Phase, PhaseReading, latest_timestamp
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -87,6 +87,35 @@ class DsmrMeter(Meter, HaDevice):
             return None
         return consumption_state - production_state
 
+    def _read_phase(self, phase: Phase) -> PhaseReading:
+        """Read consumption, production and voltage of a phase at once."""
+        consumption, consumption_at = self._read_float_state(
+            self._get_entity_id_for_phase_sensor(
+                phase, cf.CONF_PHASE_SENSOR_CONSUMPTION
+            )
+        )
+        production, production_at = self._read_float_state(
+            self._get_entity_id_for_phase_sensor(phase, cf.CONF_PHASE_SENSOR_PRODUCTION)
+        )
+        voltage, voltage_at = self._read_float_state(
+            self._get_entity_id_for_phase_sensor(phase, cf.CONF_PHASE_SENSOR_VOLTAGE)
+        )
+        power = (
+            consumption - production
+            if consumption is not None and production is not None
+            else None
+        )
+        return PhaseReading(
+            # convert kW to W in order to calculate the current
+            current=floor((power * 1000) / voltage)
+            if power is not None and voltage
+            else None,
+            power=power,
+            voltage=voltage,
+            production=production,
+            updated_at=latest_timestamp(consumption_at, production_at, voltage_at),
+        )
+
     def get_tracking_entities(self) -> list[str]:
         """Return a list of entity IDs that should be tracked for this meter."""
         # Grab each phase in ENTITY_REGISTRATION_MAP and get the values. Return
@@ -0,0 +1,221 @@
+"""HomeWizard P1 Meter implementation, talking to the local API directly."""
+
+import asyncio
+import logging
+from collections.abc import Callable, Mapping
+from math import floor
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientError, ClientSession, ClientWSTimeout, WSMsgType
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util import dt as dt_util
+
+from .. import config_flow as cf  # noqa: TID252
+from .meter import Meter, Phase, PhaseReading
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+# Fields of the measurements of the local API, in W and V
+# @see https://api-documentation.homewizard.com/docs/category/api-v1
+API_V1_FIELD_MAP: dict[Phase, dict[str, str]] = {
+    Phase.L1: {
+        cf.CONF_PHASE_SENSOR: "active_power_l1_w",
+        cf.CONF_PHASE_SENSOR_VOLTAGE: "active_voltage_l1_v",
+    },
+    Phase.L2: {
+        cf.CONF_PHASE_SENSOR: "active_power_l2_w",
+        cf.CONF_PHASE_SENSOR_VOLTAGE: "active_voltage_l2_v",
+    },
+    Phase.L3: {
+        cf.CONF_PHASE_SENSOR: "active_power_l3_w",
+        cf.CONF_PHASE_SENSOR_VOLTAGE: "active_voltage_l3_v",
+    },
+}
+# @see https://api-documentation.homewizard.com/docs/category/api-v2
+API_V2_FIELD_MAP: dict[Phase, dict[str, str]] = {
+    Phase.L1: {
+        cf.CONF_PHASE_SENSOR: "power_l1_w",
+        cf.CONF_PHASE_SENSOR_VOLTAGE: "voltage_l1_v",
+    },
+    Phase.L2: {
+        cf.CONF_PHASE_SENSOR: "power_l2_w",
+        cf.CONF_PHASE_SENSOR_VOLTAGE: "voltage_l2_v",
+    },
+    Phase.L3: {
+        cf.CONF_PHASE_SENSOR: "power_l3_w",
+        cf.CONF_PHASE_SENSOR_VOLTAGE: "voltage_l3_v",
+    },
+}
+
+# Number of seconds between each request to the v1 API, which can't push its
+# measurements. The meter sends a new telegram every second.
+POLL_INTERVAL = 1
+
+# Number of seconds to wait for a response of the API
+REQUEST_TIMEOUT = 5
+
+# Number of seconds to wait before connecting again after the connection to
+# the API was lost or couldn't be made
+RECONNECT_DELAY = 10
+
+
+class HomeWizardApiMeter(Meter):
+    """
+    HomeWizard P1 Meter reading measurements from the local API.
+
+    With a token of the v2 API, measurements are pushed by the meter through
+    a websocket as soon as it has read a telegram. Without one, the v1 API is
+    polled every second. Requests reuse the pooled session of Home Assistant.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        host: str,
+        token: str | None = None,
+    ) -> None:
+        """Initialize the HomeWizard API Meter instance."""
+        Meter.__init__(self, hass, config_entry)
+        self._host = host
+        self._token = token
+        self._v1_url = f"http://{host}/api/v1/data"
+        self._ws_url = f"wss://{host}/api/ws"
+        self._field_map = API_V2_FIELD_MAP if token else API_V1_FIELD_MAP
+        self._measurement: Mapping[str, Any] = {}
+        self._received_at: datetime | None = None
+
+    def get_active_phase_current(self, phase: Phase) -> int | None:
+        """Return the active current on a given phase."""
+        return self._read_phase(phase).current
+
+    def get_tracking_entities(self) -> list[str]:
+        """Return no entities, measurements are read from the API itself."""
+        return []
+
+    @callback
+    def async_track_updates(self, on_update: Callable[[], None]) -> CALLBACK_TYPE:
+        """Start reading measurements from the API in the background."""
+        # The v2 API is only served over TLS, with a certificate signed by
+        # HomeWizard itself rather than a public CA, so it can't be verified.
+        # The v1 API is plain HTTP and keeps the default, verifying session.
+        session = async_get_clientsession(self.hass, verify_ssl=not self._token)
+        task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_read_measurements(session, on_update),
+            name=f"HomeWizard API reader {self._host}",
+        )
+        return task.cancel
+
+    def _read_phase(self, phase: Phase) -> PhaseReading:
+        """Read the values of a phase from the last measurement."""
+        fields = self._field_map[phase]
+        power_w = _number(self._measurement.get(fields[cf.CONF_PHASE_SENSOR]))
+        voltage = _number(self._measurement.get(fields[cf.CONF_PHASE_SENSOR_VOLTAGE]))
+        return PhaseReading(
+            current=floor(power_w / voltage)
+            if power_w is not None and voltage
+            else None,
+            # HomeWizard returns W, convert to kW for consistency
+            power=power_w / 1000.0 if power_w is not None else None,
+            voltage=voltage,
+            updated_at=self._received_at,
+        )
+
+    def _set_measurement(self, measurement: Any, on_update: Callable[[], None]) -> None:
+        """Store a complete measurement and push it to the coordinator."""
+        if not isinstance(measurement, Mapping):
+            _LOGGER.warning(
+                "Ignoring malformed measurement of HomeWizard API %s: %s",
+                self._host,
+                measurement,
+            )
+            return
+        self._measurement = measurement
+        self._received_at = dt_util.utcnow()
+        on_update()
+
+    async def _async_read_measurements(
+        self, session: ClientSession, on_update: Callable[[], None]
+    ) -> None:
+        """Read measurements from the API, connecting again when it's lost."""
+        read_measurements = (
+            self._async_receive_measurements
+            if self._token
+            else self._async_poll_measurements
+        )
+        while True:
+            try:
+                await read_measurements(session, on_update)
+            except (ClientError, TimeoutError, ValueError) as ex:
+                _LOGGER.warning(
+                    "Lost connection to HomeWizard API %s: %s", self._host, ex
+                )
+            except (KeyError, TypeError, AttributeError):
+                # Connect again rather than stop reading for good
+                _LOGGER.exception(
+                    "Unexpected response of HomeWizard API %s", self._host
+                )
+            await asyncio.sleep(RECONNECT_DELAY)
+
+    async def _async_poll_measurements(
+        self, session: ClientSession, on_update: Callable[[], None]
+    ) -> None:
+        """Poll the v1 API for new measurements."""
+        while True:
+            async with (
+                asyncio.timeout(REQUEST_TIMEOUT),
+                session.get(self._v1_url) as response,
+            ):
+                response.raise_for_status()
+                measurement = await response.json()
+            self._set_measurement(measurement, on_update)
+            await asyncio.sleep(POLL_INTERVAL)
+
+    async def _async_receive_measurements(
+        self, session: ClientSession, on_update: Callable[[], None]
+    ) -> None:
+        """Subscribe to the measurements pushed through the v2 websocket."""
+        async with session.ws_connect(
+            self._ws_url,
+            timeout=ClientWSTimeout(ws_receive=None, ws_close=REQUEST_TIMEOUT),
+            heartbeat=30,
+        ) as ws:
+            await ws.send_json({"type": "authorization", "data": self._token})
+            async for message in ws:
+                if message.type != WSMsgType.TEXT:
+                    break
+                try:
+                    data = message.json()
+                    message_type = data.get("type")
+                except (ValueError, AttributeError):
+                    _LOGGER.warning(
+                        "Ignoring malformed message of HomeWizard API %s: %s",
+                        self._host,
+                        message.data,
+                    )
+                    continue
+                if message_type == "authorized":
+                    _LOGGER.debug("Authorized with HomeWizard API %s", self._host)
+                    await ws.send_json({"type": "subscribe", "data": "measurement"})
+                elif message_type == "measurement":
+                    self._set_measurement(data.get("data"), on_update)
+                elif message_type == "error":
+                    _LOGGER.warning(
+                        "HomeWizard API %s returned an error: %s",
+                        self._host,
+                        data.get("data"),
+                    )
+            _LOGGER.warning("HomeWizard API %s closed the connection", self._host)
+
+
+def _number(value: Any) -> float | None:
+    """Return a value of a measurement if it's a number, None otherwise."""
+    if isinstance(value, int | float) and not isinstance(value, bool):
+        return value
+    return None
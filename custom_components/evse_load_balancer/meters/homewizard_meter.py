@@ -11,7 +11,7 @@ from homeassistant.helpers.device_registry import (
 
 from .. import config_flow as cf  # noqa: TID252
 from ..ha_device import HaDevice  # noqa: TID252
-from .meter import Meter, Phase
+from .meter import Meter, Phase, PhaseReading, latest_timestamp
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -82,6 +82,25 @@ class HomeWizardMeter(Meter, HaDevice):
         # HomeWizard returns W, convert to kW for consistency
         return power_state / 1000.0
 
+    def _read_phase(self, phase: Phase) -> PhaseReading:
+        """Read the active power and voltage of a phase at once."""
+        power_w, power_at = self._read_float_state(
+            self._get_entity_id_for_phase_sensor(phase, cf.CONF_PHASE_SENSOR)
+        )
+        voltage, voltage_at = self._read_float_state(
+            self._get_entity_id_for_phase_sensor(phase, cf.CONF_PHASE_SENSOR_VOLTAGE)
+        )
+        # HomeWizard returns W, convert to kW for consistency
+        power = power_w / 1000.0 if power_w is not None else None
+        return PhaseReading(
+            current=floor(power_w / voltage)
+            if power_w is not None and voltage
+            else None,
+            power=power,
+            voltage=voltage,
+            updated_at=latest_timestamp(power_at, voltage_at),
+        )
+
     def get_tracking_entities(self) -> list[str]:
         """Return a list of entity IDs that should be tracked for this meter."""
         keys = [
@@ -1,12 +1,74 @@
 """Meter implementations."""
 
+import logging
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass, field
+from datetime import datetime
+from types import MappingProxyType
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
 
 from ..const import Phase  # noqa: TID252
 
+_LOGGER = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class PhaseReading:
+    """
+    Readings of a single phase.
+
+    Power and production are in kW, with positive power meaning consumption.
+    `updated_at` is the last time any of the states the reading was computed
+    from was reported. The most recent one is used, as helpers with a fixed
+    value (e.g. a production sensor that is always 0) are never reported
+    again while the meter's readings keep coming in.
+    """
+
+    current: int | None = None
+    power: float | None = None
+    voltage: float | None = None
+    production: float | None = None
+    updated_at: datetime | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class MeterSnapshot:
+    """Readings of all phases of a meter, taken at once during a cycle."""
+
+    taken_at: datetime
+    phases: Mapping[Phase, PhaseReading] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+
+    def current(self, phase: Phase) -> int | None:
+        """Return the active current on a given phase."""
+        reading = self.phases.get(phase)
+        return reading.current if reading is not None else None
+
+    def age(self, phase: Phase) -> float | None:
+        """Return the age in seconds of the readings of a phase when taken."""
+        reading = self.phases.get(phase)
+        if reading is None or reading.updated_at is None:
+            return None
+        return max(0.0, (self.taken_at - reading.updated_at).total_seconds())
+
+    @property
+    def max_age(self) -> float | None:
+        """Return the age in seconds of the oldest phase, if known."""
+        ages = [age for age in map(self.age, self.phases) if age is not None]
+        return max(ages) if ages else None
+
+    @property
+    def missing_phases(self) -> tuple[Phase, ...]:
+        """Return the phases for which no current could be read."""
+        return tuple(
+            phase for phase, reading in self.phases.items() if reading.current is None
+        )
+
 
 class Meter(ABC):
     """Base class for all energy meter."""
@@ -23,3 +85,72 @@ class Meter(ABC):
     @abstractmethod
     def get_tracking_entities(self) -> list[str]:
         """Return a list of entity IDs that should be tracked for the meter."""
+
+    @callback
+    def async_track_updates(
+        self,
+        on_update: Callable[[], None],  # noqa: ARG002
+    ) -> CALLBACK_TYPE | None:
+        """
+        Start pushing new readings of the meter.
+
+        Meters that receive their readings directly, instead of through the
+        entities from `get_tracking_entities`, call `on_update` whenever a new
+        reading is complete. Returns a callback that stops pushing, or None
+        when the meter doesn't push its readings.
+        """
+        return None
+
+    @property
+    def invalid_readings(self) -> dict[str, int]:
+        """Return the number of states that couldn't be parsed, per entity."""
+        return {}
+
+    def read_snapshot(self, phases: Iterable[Phase] = tuple(Phase)) -> MeterSnapshot:
+        """
+        Read all given phases of the meter in one pass.
+
+        Missing readings are logged once for the whole snapshot instead of
+        once per phase and value.
+        """
+        readings = {phase: self._read_phase(phase) for phase in phases}
+        snapshot = MeterSnapshot(
+            taken_at=dt_util.utcnow(), phases=MappingProxyType(readings)
+        )
+        if snapshot.missing_phases:
+            _LOGGER.warning(
+                "Missing readings for phases %s of meter %s: %s. "
+                "Are the entities enabled?",
+                [phase.value for phase in snapshot.missing_phases],
+                self.__class__.__name__,
+                readings,
+            )
+        return snapshot
+
+    def _read_phase(self, phase: Phase) -> PhaseReading:
+        """
+        Read all values of a single phase.
+
+        Implementations override this to read each state only once. The
+        default falls back to the current of the phase.
+        """
+        return PhaseReading(current=self.get_active_phase_current(phase))
+
+    def _read_float_state(
+        self, entity_id: str | None
+    ) -> tuple[float | None, datetime | None]:
+        """Return the parsed state of an entity and when it was last reported."""
+        state = self.hass.states.get(entity_id) if entity_id is not None else None
+        if state is None:
+            return None, None
+        try:
+            return float(state.state), state.last_reported
+        except ValueError:
+            # Unavailable or unknown states don't count as a fresh reading
+            return None, None
+
+
+def latest_timestamp(*timestamps: datetime | None) -> datetime | None:
+    """Return the most recent of the given timestamps, ignoring unknown ones."""
+    known = [timestamp for timestamp in timestamps if timestamp is not None]
+    return max(known) if known else None
@@ -0,0 +1,232 @@
+"""MQTT Meter implementation, subscribing to the topics of the meter directly."""
+
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from math import floor
+from typing import Any
+
+from homeassistant.components import mqtt
+from homeassistant.components.mqtt.models import ReceiveMessage
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import UnitOfPower
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+
+from .. import config_flow as cf  # noqa: TID252
+from .meter import Meter, Phase, PhaseReading, latest_timestamp
+
+_LOGGER = logging.getLogger(__name__)
+
+PHASE_CONF_MAP: dict[Phase, str] = {
+    Phase.L1: cf.CONF_PHASE_KEY_ONE,
+    Phase.L2: cf.CONF_PHASE_KEY_TWO,
+    Phase.L3: cf.CONF_PHASE_KEY_THREE,
+}
+
+MQTT_METER_SENSORS = (
+    cf.CONF_PHASE_SENSOR_CONSUMPTION,
+    cf.CONF_PHASE_SENSOR_PRODUCTION,
+    cf.CONF_PHASE_SENSOR_VOLTAGE,
+)
+
+# Separates the topic from the path to the value in its JSON payload, e.g.
+# `tele/meter/SENSOR#ENERGY.Power.0`. `#` can't be part of a topic name.
+SOURCE_PATH_SEPARATOR = "#"
+
+type JsonPath = tuple[str | int, ...]
+
+
+def parse_mqtt_source(source: str) -> tuple[str, JsonPath]:
+    """
+    Split a source into its topic and the path to its value.
+
+    Path elements are separated by dots, numbers index into lists. Without a
+    path the whole payload is the value.
+    """
+    topic, _, path = source.strip().partition(SOURCE_PATH_SEPARATOR)
+    return topic, tuple(
+        int(key) if key.isdigit() else key for key in path.split(".") if key
+    )
+
+
+def _value_at(payload: Any, path: JsonPath) -> float | None:
+    """Return the number at a path of a decoded payload."""
+    for key in path:
+        try:
+            payload = payload[key]
+        except (KeyError, IndexError, TypeError):
+            return None
+    if isinstance(payload, bool) or not isinstance(payload, (int, float, str)):
+        return None
+    try:
+        return float(payload)
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
+class _PhaseValues:
+    """The latest values received for a phase, in kW and V."""
+
+    consumption: float | None = None
+    production: float | None = None
+    voltage: float | None = None
+    consumption_at: datetime | None = None
+    production_at: datetime | None = None
+    voltage_at: datetime | None = None
+
+
+class MqttMeter(Meter):
+    """
+    Meter reading the values of each phase from MQTT topics.
+
+    Meant for meters publishing their readings on MQTT themselves, like
+    AmsLeser, Tasmota or Shelly, without the Home Assistant entities in
+    between. Each topic is subscribed to once and its payload decoded once,
+    however many values are read from it. Every message triggers a cycle.
+    """
+
+    def __init__(self, hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+        """Initialize the MQTT Meter instance."""
+        Meter.__init__(self, hass, config_entry)
+        data = config_entry.data
+        self._power_scale = (
+            1.0
+            if data.get(cf.CONF_MQTT_POWER_UNIT) == UnitOfPower.KILO_WATT
+            else 1 / 1000
+        )
+        self._values: dict[Phase, _PhaseValues] = {}
+        # Values read from each topic: (phase, sensor, path to the value)
+        self._topics: dict[str, list[tuple[Phase, str, JsonPath]]] = {}
+        for phase, phase_key in PHASE_CONF_MAP.items():
+            phase_config = data.get(phase_key)
+            if not phase_config:
+                continue
+            # Without a production topic the consumption is the net power
+            self._values[phase] = _PhaseValues(
+                production=None
+                if phase_config.get(cf.CONF_PHASE_SENSOR_PRODUCTION)
+                else 0.0
+            )
+            for sensor in MQTT_METER_SENSORS:
+                if not phase_config.get(sensor):
+                    continue
+                topic, path = parse_mqtt_source(phase_config[sensor])
+                self._topics.setdefault(topic, []).append((phase, sensor, path))
+
+    def get_active_phase_current(self, phase: Phase) -> int | None:
+        """Return the active current on a given phase."""
+        return self._read_phase(phase).current
+
+    def get_tracking_entities(self) -> list[str]:
+        """Return no entities, values are received from MQTT directly."""
+        return []
+
+    @callback
+    def async_track_updates(self, on_update: Callable[[], None]) -> CALLBACK_TYPE:
+        """Subscribe to the topics of the meter."""
+        unsubscribes: list[CALLBACK_TYPE] = []
+
+        async def async_subscribe() -> None:
+            if not await mqtt.async_wait_for_mqtt_client(self.hass):
+                _LOGGER.error("MQTT integration is not available")
+                return
+            for topic, values in self._topics.items():
+                unsubscribes.append(
+                    await mqtt.async_subscribe(
+                        self.hass,
+                        topic,
+                        self._message_handler(values, on_update),
+                        qos=0,
+                    )
+                )
+
+        task = self.config_entry.async_create_background_task(
+            self.hass, async_subscribe(), name="MQTT meter subscriptions"
+        )
+
+        @callback
+        def unsubscribe() -> None:
+            task.cancel()
+            while unsubscribes:
+                unsubscribes.pop()()
+
+        return unsubscribe
+
+    def _message_handler(
+        self,
+        values: list[tuple[Phase, str, JsonPath]],
+        on_update: Callable[[], None],
+    ) -> Callable[[ReceiveMessage], None]:
+        """Return the handler of the messages of a topic."""
+        decode_json = any(path for _, _, path in values)
+
+        @callback
+        def message_received(msg: ReceiveMessage) -> None:
+            payload = msg.payload
+            if decode_json:
+                try:
+                    payload = json.loads(payload)
+                except ValueError:
+                    _LOGGER.warning(
+                        "Invalid JSON on MQTT topic '%s': '%s'", msg.topic, payload
+                    )
+                    return
+
+            received_at = dt_util.utcnow()
+            for phase, sensor, path in values:
+                value = _value_at(payload, path)
+                if value is None:
+                    _LOGGER.debug(
+                        "No value for %s of phase %s on MQTT topic '%s'",
+                        sensor,
+                        phase,
+                        msg.topic,
+                    )
+                    continue
+                self._set_value(phase, sensor, value, received_at)
+            on_update()
+
+        return message_received
+
+    def _set_value(
+        self, phase: Phase, sensor: str, value: float, received_at: datetime
+    ) -> None:
+        phase_values = self._values[phase]
+        if sensor == cf.CONF_PHASE_SENSOR_CONSUMPTION:
+            phase_values.consumption = value * self._power_scale
+            phase_values.consumption_at = received_at
+        elif sensor == cf.CONF_PHASE_SENSOR_PRODUCTION:
+            phase_values.production = value * self._power_scale
+            phase_values.production_at = received_at
+        else:
+            phase_values.voltage = value
+            phase_values.voltage_at = received_at
+
+    def _read_phase(self, phase: Phase) -> PhaseReading:
+        """Read the latest values received for a phase."""
+        phase_values = self._values.get(phase)
+        if (
+            phase_values is None
+            or phase_values.consumption is None
+            or phase_values.production is None
+        ):
+            return PhaseReading()
+
+        power = phase_values.consumption - phase_values.production
+        voltage = phase_values.voltage
+        return PhaseReading(
+            # convert kW to W in order to calculate the current
+            current=floor((power * 1000) / voltage) if voltage else None,
+            power=power,
+            voltage=voltage,
+            production=phase_values.production,
+            updated_at=latest_timestamp(
+                phase_values.consumption_at,
+                phase_values.production_at,
+                phase_values.voltage_at,
+            ),
+        )
@@ -0,0 +1,138 @@
+"""DSMR P1 port Meter implementation, reading telegrams directly."""
+
+import asyncio
+import logging
+from collections.abc import Callable
+from contextlib import suppress
+from math import floor
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .. import config_flow as cf  # noqa: TID252
+from .meter import Meter, Phase, PhaseReading
+from .p1_telegram import P1Telegram, P1TelegramParser
+
+_LOGGER = logging.getLogger(__name__)
+
+# DSMR 4 and 5 meters send telegrams at 115200 baud, 8N1
+P1_BAUDRATE = 115200
+
+# Number of seconds to wait before connecting again after the connection to
+# the P1 port was lost or couldn't be made
+RECONNECT_DELAY = 10
+
+READ_SIZE = 4096
+
+
+class P1Meter(Meter):
+    """
+    Meter reading telegrams straight from a DSMR P1 port.
+
+    Connects to a serial device (e.g. `/dev/ttyUSB0`) or to a TCP socket
+    exposing the port (e.g. `192.168.1.10:2001` for ser2net) and pushes every
+    complete telegram to the coordinator, without the Home Assistant entities
+    of the DSMR integration in between.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, config_entry: ConfigEntry, port: str
+    ) -> None:
+        """Initialize the P1 Meter instance."""
+        Meter.__init__(self, hass, config_entry)
+        self._port = port
+        self._telegram: P1Telegram | None = None
+
+    def get_active_phase_current(self, phase: Phase) -> int | None:
+        """Return the active current on a given phase."""
+        return self._read_phase(phase).current
+
+    def get_tracking_entities(self) -> list[str]:
+        """Return no entities, telegrams are pushed by the meter itself."""
+        return []
+
+    @callback
+    def async_track_updates(self, on_update: Callable[[], None]) -> CALLBACK_TYPE:
+        """Start reading telegrams from the P1 port in the background."""
+        task = self.config_entry.async_create_background_task(
+            self.hass,
+            self._async_read_telegrams(on_update),
+            name=f"P1 reader {self._port}",
+        )
+        return task.cancel
+
+    def _read_phase(self, phase: Phase) -> PhaseReading:
+        """Read the values of a phase from the last telegram."""
+        telegram = self._telegram
+        if telegram is None:
+            return PhaseReading()
+
+        consumption = telegram.value(phase, cf.CONF_PHASE_SENSOR_CONSUMPTION)
+        production = telegram.value(phase, cf.CONF_PHASE_SENSOR_PRODUCTION)
+        voltage = telegram.value(phase, cf.CONF_PHASE_SENSOR_VOLTAGE)
+        current = telegram.value(phase, cf.CONF_PHASE_SENSOR_CURRENT)
+        power = (
+            consumption - production
+            if consumption is not None and production is not None
+            else None
+        )
+
+        if power is not None and voltage:
+            # convert kW to W in order to calculate the current
+            active_current = floor((power * 1000) / voltage)
+        elif power is not None and current is not None:
+            # Meters without voltage report the current without a direction
+            active_current = floor(current) if power >= 0 else floor(-current)
+        else:
+            active_current = None
+
+        return PhaseReading(
+            current=active_current,
+            power=power,
+            voltage=voltage,
+            production=production,
+            updated_at=telegram.received_at,
+        )
+
+    async def _async_read_telegrams(self, on_update: Callable[[], None]) -> None:
+        """Read telegrams from the P1 port, connecting again when it's lost."""
+        while True:
+            try:
+                reader, writer = await self._async_open_connection()
+            except OSError as ex:
+                _LOGGER.warning("Can't connect to P1 port %s: %s", self._port, ex)
+                await asyncio.sleep(RECONNECT_DELAY)
+                continue
+
+            _LOGGER.debug("Connected to P1 port %s", self._port)
+            parser = P1TelegramParser()
+            try:
+                while data := await reader.read(READ_SIZE):
+                    telegrams = parser.feed(data)
+                    if telegrams:
+                        self._telegram = telegrams[-1]
+                        on_update()
+                _LOGGER.warning("P1 port %s closed the connection", self._port)
+            except OSError as ex:
+                _LOGGER.warning("Lost connection to P1 port %s: %s", self._port, ex)
+            finally:
+                writer.close()
+                # Also when cancelled, so the socket isn't left to the garbage
+                # collector
+                with suppress(OSError, asyncio.CancelledError):
+                    await writer.wait_closed()
+
+            await asyncio.sleep(RECONNECT_DELAY)
+
+    async def _async_open_connection(
+        self,
+    ) -> tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+        """Open a TCP connection for `host:port`, a serial connection otherwise."""
+        host, separator, port = self._port.rpartition(":")
+        if separator and host and port.isdigit() and not host.startswith("/"):
+            return await asyncio.open_connection(host, int(port))
+
+        # Imported lazily, it's only needed for meters on a serial device
+        from serial_asyncio_fast import open_serial_connection
+
+        return await open_serial_connection(url=self._port, baudrate=P1_BAUDRATE)
@@ -0,0 +1,178 @@
+"""Incremental parser for DSMR P1 telegrams."""
+
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
+from datetime import datetime
+from types import MappingProxyType
+
+from homeassistant.util import dt as dt_util
+
+from .. import config_flow as cf  # noqa: TID252
+from ..const import Phase  # noqa: TID252
+
+_LOGGER = logging.getLogger(__name__)
+
+# OBIS references of the per-phase values the meter needs. Power is in kW,
+# voltage in V and current in A.
+# @see https://www.netbeheernederland.nl/publicatie/dsmr-502-p1-companion-standard
+OBIS_REGISTRATION_MAP: dict[Phase, dict[str, bytes]] = {
+    Phase.L1: {
+        cf.CONF_PHASE_SENSOR_CONSUMPTION: b"1-0:21.7.0",
+        cf.CONF_PHASE_SENSOR_PRODUCTION: b"1-0:22.7.0",
+        cf.CONF_PHASE_SENSOR_VOLTAGE: b"1-0:32.7.0",
+        cf.CONF_PHASE_SENSOR_CURRENT: b"1-0:31.7.0",
+    },
+    Phase.L2: {
+        cf.CONF_PHASE_SENSOR_CONSUMPTION: b"1-0:41.7.0",
+        cf.CONF_PHASE_SENSOR_PRODUCTION: b"1-0:42.7.0",
+        cf.CONF_PHASE_SENSOR_VOLTAGE: b"1-0:52.7.0",
+        cf.CONF_PHASE_SENSOR_CURRENT: b"1-0:51.7.0",
+    },
+    Phase.L3: {
+        cf.CONF_PHASE_SENSOR_CONSUMPTION: b"1-0:61.7.0",
+        cf.CONF_PHASE_SENSOR_PRODUCTION: b"1-0:62.7.0",
+        cf.CONF_PHASE_SENSOR_VOLTAGE: b"1-0:72.7.0",
+        cf.CONF_PHASE_SENSOR_CURRENT: b"1-0:71.7.0",
+    },
+}
+
+# Telegrams are a few kB at most. Anything larger without an end marker is
+# noise on the line and is dropped.
+MAX_TELEGRAM_SIZE = 16 * 1024
+
+TELEGRAM_START = ord("/")
+TELEGRAM_END = ord("!")
+CRC_LENGTH = 4
+
+
+def _crc16_table() -> tuple[int, ...]:
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+        table.append(crc)
+    return tuple(table)
+
+
+_CRC16_TABLE = _crc16_table()
+
+
+def crc16(data: bytes) -> int:
+    """Return the CRC16 (ARC) used to check DSMR 4+ telegrams."""
+    crc = 0
+    for byte in data:
+        crc = (crc >> 8) ^ _CRC16_TABLE[(crc ^ byte) & 0xFF]
+    return crc
+
+
+@dataclass(frozen=True, slots=True)
+class P1Telegram:
+    """The per-phase values of a single telegram."""
+
+    received_at: datetime
+    values: Mapping[Phase, Mapping[str, float]]
+
+    def value(self, phase: Phase, sensor_const: str) -> float | None:
+        """Return a value of a phase, or None when it wasn't in the telegram."""
+        return self.values.get(phase, {}).get(sensor_const)
+
+
+class P1TelegramParser:
+    """
+    Parse telegrams from a stream of bytes as they come in.
+
+    Bytes can be fed in chunks of any size. Only the lines with an OBIS
+    reference from the registration map are parsed, all others are skipped
+    without being decoded. Telegrams with a CRC that doesn't match are
+    dropped.
+    """
+
+    def __init__(
+        self, registration_map: Mapping[Phase, Mapping[str, bytes]] | None = None
+    ) -> None:
+        """Initialize the parser."""
+        self._buffer = bytearray()
+        self._references: dict[bytes, tuple[Phase, str]] = {
+            reference: (phase, sensor_const)
+            for phase, references in (registration_map or OBIS_REGISTRATION_MAP).items()
+            for sensor_const, reference in references.items()
+        }
+
+    def feed(self, data: bytes) -> list[P1Telegram]:
+        """Add bytes from the stream and return the telegrams they completed."""
+        buffer = self._buffer
+        buffer += data
+        telegrams = []
+        while True:
+            start = buffer.find(TELEGRAM_START)
+            if start == -1:
+                buffer.clear()
+                break
+            if start:
+                del buffer[:start]
+
+            end = buffer.find(TELEGRAM_END)
+            if end == -1:
+                break
+            line_end = buffer.find(b"\n", end)
+            if line_end == -1:
+                break
+
+            # The start of a new telegram before the end of this one means the
+            # rest of this one got lost
+            restart = buffer.find(TELEGRAM_START, 1, end)
+            if restart != -1:
+                del buffer[:restart]
+                continue
+
+            telegram = self._parse(bytes(buffer[: line_end + 1]), end)
+            del buffer[: line_end + 1]
+            if telegram is not None:
+                telegrams.append(telegram)
+
+        if len(buffer) > MAX_TELEGRAM_SIZE:
+            _LOGGER.warning("Dropping %d bytes without a telegram end", len(buffer))
+            buffer.clear()
+        return telegrams
+
+    def _parse(self, raw: bytes, end: int) -> P1Telegram | None:
+        """Parse a complete telegram, from its start up to its CRC line."""
+        crc = raw[end + 1 : end + 1 + CRC_LENGTH]
+        # DSMR 2.2 and 3 telegrams don't have a CRC
+        if len(crc) == CRC_LENGTH and crc.isalnum():
+            try:
+                expected = int(crc, 16)
+            except ValueError:
+                expected = None
+            if expected != crc16(raw[: end + 1]):
+                _LOGGER.warning("Dropping P1 telegram with invalid CRC %s", crc)
+                return None
+
+        values: dict[Phase, dict[str, float]] = {}
+        references = self._references
+        for line in raw[:end].splitlines():
+            value_start = line.find(b"(")
+            if value_start == -1:
+                continue
+            reference = references.get(line[:value_start])
+            if reference is None:
+                continue
+            value_end = line.find(b")", value_start)
+            unit_start = line.find(b"*", value_start, value_end)
+            if unit_start != -1:
+                value_end = unit_start
+            try:
+                value = float(line[value_start + 1 : value_end])
+            except ValueError:
+                continue
+            phase, sensor_const = reference
+            values.setdefault(phase, {})[sensor_const] = value
+
+        return P1Telegram(
+            received_at=dt_util.utcnow(),
+            values=MappingProxyType(
+                {phase: MappingProxyType(v) for phase, v in values.items()}
+            ),
+        )
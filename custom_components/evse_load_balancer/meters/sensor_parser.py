@@ -0,0 +1,63 @@
+"""Unit-aware parsing of the states of meter sensors."""
+
+import re
+from dataclasses import dataclass
+
+from homeassistant.const import (
+    ATTR_UNIT_OF_MEASUREMENT,
+    UnitOfElectricCurrent,
+    UnitOfElectricPotential,
+    UnitOfPower,
+)
+from homeassistant.core import State
+
+# Factors to convert a state to the unit the meters work with: kW for power,
+# V for voltage and A for current.
+POWER_SCALES: dict[str | None, float] = {
+    UnitOfPower.WATT: 1 / 1000,
+    UnitOfPower.KILO_WATT: 1.0,
+    UnitOfPower.MEGA_WATT: 1000.0,
+}
+VOLTAGE_SCALES: dict[str | None, float] = {
+    UnitOfElectricPotential.MILLIVOLT: 1 / 1000,
+    UnitOfElectricPotential.VOLT: 1.0,
+    UnitOfElectricPotential.KILOVOLT: 1000.0,
+}
+CURRENT_SCALES: dict[str | None, float] = {
+    UnitOfElectricCurrent.MILLIAMPERE: 1 / 1000,
+    UnitOfElectricCurrent.AMPERE: 1.0,
+}
+
+# Matches the states float() accepts, apart from nan and infinity. Checking
+# this is cheaper than raising for each `unavailable` or `unknown` state.
+_NUMBER_RE = re.compile(r"\s*[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?\s*")
+
+
+@dataclass(slots=True)
+class SensorParser:
+    """
+    Parser of the states of a single sensor.
+
+    The scale for the sensor's unit is resolved on the first state and again
+    only when the unit changes. Sensors without a (known) unit are taken to
+    be in kW, V or A already. States that aren't a number are
+    counted in `invalid_count`.
+    """
+
+    scales: dict[str | None, float]
+    unit: str | None = None
+    scale: float | None = None
+    invalid_count: int = 0
+
+    def parse(self, state: State) -> float | None:
+        """Return the value of a state in the unit of the scales."""
+        unit = state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
+        if self.scale is None or unit != self.unit:
+            self.unit = unit
+            self.scale = self.scales.get(unit, 1.0)
+
+        value = state.state
+        if _NUMBER_RE.fullmatch(value) is None:
+            self.invalid_count += 1
+            return None
+        return float(value) * self.scale
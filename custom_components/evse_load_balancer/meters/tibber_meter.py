@@ -10,7 +10,7 @@ from homeassistant.helpers.device_registry import (
 
 from .. import config_flow as cf  # noqa: TID252
 from ..ha_device import HaDevice  # noqa: TID252
-from .meter import Meter, Phase
+from .meter import Meter, Phase, PhaseReading, latest_timestamp
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,6 +66,23 @@ class TibberMeter(Meter, HaDevice):
         # Tibber returns current in Amperes, return as integer
         return int(current_state)
 
+    def _read_phase(self, phase: Phase) -> PhaseReading:
+        """Read the current and voltage of a phase at once."""
+        current, current_at = self._read_float_state(
+            self._get_entity_id_for_phase_sensor(phase, cf.CONF_PHASE_SENSOR_CURRENT)
+        )
+        voltage, voltage_at = self._read_float_state(
+            self._get_entity_id_for_phase_sensor(phase, cf.CONF_PHASE_SENSOR_VOLTAGE)
+        )
+        return PhaseReading(
+            current=int(current) if current is not None else None,
+            power=current * voltage / 1000.0
+            if current is not None and voltage is not None
+            else None,
+            voltage=voltage,
+            updated_at=latest_timestamp(current_at, voltage_at),
+        )
+
     def get_tracking_entities(self) -> list[str]:
         """Return a list of entity IDs that should be tracked for this meter."""
         keys = [
@@ -6,9 +6,16 @@ from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry, ConfigFlowResult, OptionsFlow
-from homeassistant.helpers.selector import BooleanSelector, NumberSelector
+from homeassistant.helpers.selector import (
+    BooleanSelector,
+    NumberSelector,
+    SelectSelector,
+    SelectSelectorConfig,
+    SelectSelectorMode,
+)
 
 from . import config_flow as cf
+from .const import BalancerAlgorithm, BreakerCurve, StalenessPolicy
 from .exceptions.validation_exception import ValidationExceptionError
 
 if TYPE_CHECKING:
@@ -17,10 +24,53 @@ if TYPE_CHECKING:
 OPTION_CHARGE_LIMIT_HYSTERESIS = "charge_limit_hysteresis"
 OPTION_MAX_FUSE_LOAD_AMPS = "max_fuse_load_amps"
 OPTION_ALLOW_TEMPORARY_OVERCURRENT = "allow_temporary_overcurrent"
+OPTION_STALENESS_BUDGET = "staleness_budget"
+OPTION_STALENESS_POLICY = "staleness_policy"
+OPTION_BREAKER_CURVE = "breaker_curve"
+OPTION_BREAKER_COOLING = "breaker_cooling"
+OPTION_BALANCER_ALGORITHM = "balancer_algorithm"
+OPTION_MEDIAN_PERIOD = "median_period"
+OPTION_RAMP_MARGIN = "ramp_margin"
+OPTION_RAMP_DEADBAND = "ramp_deadband"
 
 DEFAULT_VALUES: dict[str, Any] = {
     OPTION_CHARGE_LIMIT_HYSTERESIS: 15,
     OPTION_ALLOW_TEMPORARY_OVERCURRENT: True,
+    OPTION_STALENESS_BUDGET: 60,
+    OPTION_STALENESS_POLICY: StalenessPolicy.DEGRADE.value,
+    OPTION_BREAKER_CURVE: BreakerCurve.C.value,
+    OPTION_BREAKER_COOLING: 5,
+    OPTION_BALANCER_ALGORITHM: BalancerAlgorithm.OPTIMISED.value,
+    OPTION_MEDIAN_PERIOD: 5,
+    OPTION_RAMP_MARGIN: 1,
+    OPTION_RAMP_DEADBAND: 2,
+}
+
+# Options specific to a balancing algorithm, with the config of their number
+# selector. They are asked for in a separate step once the algorithm is chosen.
+ALGORITHM_OPTIONS: dict[BalancerAlgorithm, dict[str, dict[str, Any]]] = {
+    BalancerAlgorithm.MEDIAN: {
+        OPTION_MEDIAN_PERIOD: {
+            "min": 1,
+            "step": 1,
+            "mode": "box",
+            "unit_of_measurement": "minutes",
+        },
+    },
+    BalancerAlgorithm.RAMP: {
+        OPTION_RAMP_MARGIN: {
+            "min": 0,
+            "step": 1,
+            "mode": "box",
+            "unit_of_measurement": "A",
+        },
+        OPTION_RAMP_DEADBAND: {
+            "min": 1,
+            "step": 1,
+            "mode": "box",
+            "unit_of_measurement": "A",
+        },
+    },
 }
 
 
@@ -38,6 +88,9 @@ class EvseLoadBalancerOptionsFlow(OptionsFlow):
     # No custom __init__ needed - config_entry is set by the framework
     # @see https://developers.home-assistant.io/blog/2024/11/12/options-flow/
 
+    # Input of the init step, while the algorithm's options are asked for
+    _init_input: dict[str, Any]
+
     @staticmethod
     def get_option_value(config_entry: ConfigEntry, key: str) -> Any:
         """Get the value of an option from the config entry."""
@@ -86,9 +139,99 @@ class EvseLoadBalancerOptionsFlow(OptionsFlow):
                         DEFAULT_VALUES[OPTION_ALLOW_TEMPORARY_OVERCURRENT],
                     ),
                 ): BooleanSelector(),
+                vol.Optional(
+                    OPTION_BALANCER_ALGORITHM,
+                    default=options_values.get(
+                        OPTION_BALANCER_ALGORITHM,
+                        DEFAULT_VALUES[OPTION_BALANCER_ALGORITHM],
+                    ),
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[algorithm.value for algorithm in BalancerAlgorithm],
+                        mode=SelectSelectorMode.DROPDOWN,
+                        translation_key=OPTION_BALANCER_ALGORITHM,
+                    )
+                ),
+                vol.Optional(
+                    OPTION_BREAKER_CURVE,
+                    default=options_values.get(
+                        OPTION_BREAKER_CURVE,
+                        DEFAULT_VALUES[OPTION_BREAKER_CURVE],
+                    ),
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[curve.value for curve in BreakerCurve],
+                        mode=SelectSelectorMode.DROPDOWN,
+                        translation_key=OPTION_BREAKER_CURVE,
+                    )
+                ),
+                vol.Optional(
+                    OPTION_BREAKER_COOLING,
+                    default=options_values.get(
+                        OPTION_BREAKER_COOLING,
+                        DEFAULT_VALUES[OPTION_BREAKER_COOLING],
+                    ),
+                ): NumberSelector(
+                    {
+                        "min": 1,
+                        "step": 1,
+                        "mode": "box",
+                        "unit_of_measurement": "minutes",
+                    }
+                ),
+                vol.Optional(
+                    OPTION_STALENESS_BUDGET,
+                    default=options_values.get(
+                        OPTION_STALENESS_BUDGET,
+                        DEFAULT_VALUES[OPTION_STALENESS_BUDGET],
+                    ),
+                ): NumberSelector(
+                    {
+                        "min": 5,
+                        "step": 1,
+                        "mode": "box",
+                        "unit_of_measurement": "seconds",
+                    }
+                ),
+                vol.Optional(
+                    OPTION_STALENESS_POLICY,
+                    default=options_values.get(
+                        OPTION_STALENESS_POLICY,
+                        DEFAULT_VALUES[OPTION_STALENESS_POLICY],
+                    ),
+                ): SelectSelector(
+                    SelectSelectorConfig(
+                        options=[policy.value for policy in StalenessPolicy],
+                        mode=SelectSelectorMode.DROPDOWN,
+                        translation_key=OPTION_STALENESS_POLICY,
+                    )
+                ),
             }
         )
 
+    def _algorithm_schema(self, algorithm: BalancerAlgorithm) -> vol.Schema:
+        """Define the schema for the options of a balancing algorithm."""
+        options_values = self.config_entry.options
+
+        return vol.Schema(
+            {
+                vol.Required(
+                    key,
+                    default=options_values.get(key, DEFAULT_VALUES[key]),
+                ): NumberSelector(config)
+                for key, config in ALGORITHM_OPTIONS[algorithm].items()
+            }
+        )
+
+    def _create_options_entry(self, data: dict[str, Any]) -> ConfigFlowResult:
+        """Store the options, keeping those of the other algorithms."""
+        algorithm_options = {
+            key: value
+            for key, value in self.config_entry.options.items()
+            if any(key in options for options in ALGORITHM_OPTIONS.values())
+        }
+        return self.async_create_entry(title="", data={**algorithm_options, **data})
+
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
@@ -104,8 +247,30 @@ class EvseLoadBalancerOptionsFlow(OptionsFlow):
                 errors["base"] = "invalid_number_format"
 
             if not errors:
-                return self.async_create_entry(title="", data=input_data)
+                algorithm = BalancerAlgorithm(
+                    input_data.get(
+                        OPTION_BALANCER_ALGORITHM,
+                        DEFAULT_VALUES[OPTION_BALANCER_ALGORITHM],
+                    )
+                )
+                if algorithm in ALGORITHM_OPTIONS:
+                    self._init_input = input_data
+                    return await self.async_step_algorithm()
+                return self._create_options_entry(input_data)
 
         return self.async_show_form(
             step_id="init", data_schema=self._options_schema(), errors=errors
         )
+
+    async def async_step_algorithm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle the options of the chosen balancing algorithm."""
+        algorithm = BalancerAlgorithm(self._init_input[OPTION_BALANCER_ALGORITHM])
+        if user_input is not None:
+            return self._create_options_entry({**self._init_input, **user_input})
+
+        return self.async_show_form(
+            step_id="algorithm",
+            data_schema=self._algorithm_schema(algorithm),
+        )
@@ -3,9 +3,11 @@
 import logging
 from math import floor
 from time import time
+from typing import Any
 
 from .chargers.charger import Charger
 from .const import Phase
+from .fuse_tree import ROOT_NODE_ID, FuseNode, FuseTree
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -82,6 +84,36 @@ class ChargerState:
         # Always set active_session
         self._active_session = is_charging
 
+    def export_state(self) -> dict[str, Any]:
+        """Export the allocation state, with limits keyed by phase value."""
+        return {
+            "requested_current": _limits_to_dict(self.requested_current),
+            "last_applied_current": _limits_to_dict(self.last_applied_current),
+            "last_update_time": self.last_update_time,
+            "manual_override_detected": self.manual_override_detected,
+            "active_session": self._active_session,
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """
+        Restore a previously exported allocation state.
+
+        A restored state counts as initialized, so an ongoing session keeps the
+        current the user requested and a limit changed while Home Assistant
+        was down is detected as a manual override.
+        """
+        requested_current = _limits_from_dict(state.get("requested_current"))
+        last_applied_current = _limits_from_dict(state.get("last_applied_current"))
+        if requested_current is None or last_applied_current is None:
+            return
+
+        self.requested_current = requested_current
+        self.last_applied_current = last_applied_current
+        self.last_update_time = int(state.get("last_update_time", 0))
+        self.manual_override_detected = bool(state.get("manual_override_detected"))
+        self._active_session = bool(state.get("active_session"))
+        self.initialized = True
+
     def get_current_limit(self) -> dict[Phase, int] | None:
         """Get the current limit of the charger."""
         if (
@@ -105,11 +137,19 @@ class PowerAllocator:
     - Handle manual overrides by users
 
     All without actually updating the chargers, which is done in the coordinator.
+
+    The chargers can be connected behind fuse groups of a `FuseTree`, in which
+    case the limits of every group on a charger's path are respected as well.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, fuse_tree: FuseTree | None = None) -> None:
         """Initialize the power allocator."""
         self._chargers: dict[str, ChargerState] = {}
+        self._fuse_tree = fuse_tree or FuseTree(FuseNode(ROOT_NODE_ID, 0, None))
+
+    def set_fuse_tree(self, fuse_tree: FuseTree) -> None:
+        """Replace the fuse tree, keeping the state of the chargers."""
+        self._fuse_tree = fuse_tree
 
     def add_charger(self, charger: Charger) -> bool:
         """
@@ -143,6 +183,19 @@ class PowerAllocator:
             return True
         return False
 
+    def export_state(self) -> dict[str, Any]:
+        """Export the allocation state of all chargers, keyed by charger id."""
+        return {
+            charger_id: state.export_state()
+            for charger_id, state in self._chargers.items()
+        }
+
+    def restore_state(self, state: dict[str, Any]) -> None:
+        """Restore the allocation state of the chargers that are still managed."""
+        for charger_id, charger_state in state.items():
+            if charger_id in self._chargers:
+                self._chargers[charger_id].restore_state(charger_state)
+
     @property
     def _active_chargers(self) -> dict[str, ChargerState]:
         """Return a dictionary of chargers that can take a charge."""
@@ -157,11 +210,17 @@ class PowerAllocator:
         return len(self._active_chargers) > 0
 
     def update_allocation(
-        self, available_currents: dict[Phase, int]
+        self,
+        available_currents: dict[Phase, int],
+        group_available_currents: dict[str, dict[Phase, int]] | None = None,
     ) -> dict[str, dict[Phase, int]]:
         """
         Update power allocation for all chargers based on available current.
 
+        `group_available_currents` holds the available current of each fuse
+        group by node id. Chargers behind a group without a known available
+        current are not increased.
+
         Returns:
             Dict mapping charger_id to new current limits (empty if no updates)
 
@@ -177,7 +236,9 @@ class PowerAllocator:
             state.detect_manual_override()
 
         # Allocate current based on strategy
-        allocated_currents = self._allocate_current(available_currents)
+        allocated_currents = self._allocate_current(
+            available_currents, group_available_currents or {}
+        )
 
         # Create result dictionary for chargers that need updating
         result = {}
@@ -221,7 +282,9 @@ class PowerAllocator:
         )
 
     def _allocate_current(
-        self, available_currents: dict[Phase, int]
+        self,
+        available_currents: dict[Phase, int],
+        group_available_currents: dict[str, dict[Phase, int]],
     ) -> dict[str, dict[Phase, int]]:
         """
         Allocate current proportionally to requested currents.
@@ -229,18 +292,36 @@ class PowerAllocator:
         For negative available current (overcurrent), distribute cuts proportionally.
         For positive available current, distribute increases proportionally.
 
+        Fuse groups are handled before their parents, so cuts made for a group
+        count towards the deficit of the groups above it and the main fuse.
+
         Returns a dictionary mapping charger_id to new current limits.
         """
         result: dict[str, dict[Phase, int]] = {}
+        tree = self._fuse_tree
 
         # Handle overcurrent and recovery separately for each phase
         for phase, available_current in available_currents.items():
+            for group in tree.groups:
+                group_current = group_available_currents.get(group.node_id, {}).get(
+                    phase
+                )
+                if group_current is not None and group_current < 0:
+                    self._distribute_cuts(
+                        phase,
+                        group_current,
+                        result,
+                        tree.chargers_below(group.node_id),
+                    )
+
             if available_current < 0:
                 # Overcurrent situation - distribute cuts proportionally
                 self._distribute_cuts(phase, available_current, result)
             elif available_current > 0:
                 # Recovery situation - distribute increases proportionally
-                self._distribute_increases(phase, available_current, result)
+                self._distribute_increases(
+                    phase, available_current, result, group_available_currents
+                )
 
         # Grab phases that should be processed
         processed_phases = set(available_currents.keys())
@@ -268,24 +349,39 @@ class PowerAllocator:
         return result
 
     def _distribute_cuts(
-        self, phase: Phase, deficit: int, result: dict[str, dict[Phase, int]]
+        self,
+        phase: Phase,
+        deficit: int,
+        result: dict[str, dict[Phase, int]],
+        charger_ids: frozenset[str] | None = None,
     ) -> None:
-        """Distribute current cuts proportionally during overcurrent."""
+        """
+        Distribute current cuts proportionally during overcurrent.
+
+        Only the chargers in `charger_ids` are cut when given. Cuts already made
+        to these chargers, for a group further down the tree, count towards
+        the deficit.
+        """
         charger_currents = []
         total_current = 0
 
         # Collect current settings for active chargers
         for charger_id, state in self._active_chargers.items():
+            if charger_ids is not None and charger_id not in charger_ids:
+                continue
             current_setting = state.get_current_limit()
             if not current_setting:
                 continue
 
             current = current_setting[phase]
+            if charger_id in result:
+                deficit += current - result[charger_id][phase]
+                current = result[charger_id][phase]
             charger_currents.append((charger_id, current))
             total_current += current
 
-        if total_current == 0:
-            return  # No active chargers or all at minimum
+        if total_current == 0 or deficit >= 0:
+            return  # No active chargers, all at minimum or already cut enough
 
         # Calculate cuts proportionally
         for charger_id, current in charger_currents:
@@ -293,42 +389,73 @@ class PowerAllocator:
             proportion = current / total_current
             cut = floor(deficit * proportion)
 
-            state = self._chargers[charger_id]
-            current_setting = state.get_current_limit()
-
             if charger_id not in result:
-                result[charger_id] = current_setting.copy()
+                result[charger_id] = (
+                    self._chargers[charger_id].get_current_limit().copy()
+                )
 
-            result[charger_id][phase] = max(0, current_setting[phase] + int(cut))
+            result[charger_id][phase] = max(0, current + int(cut))
 
     def _distribute_increases(
-        self, phase: Phase, surplus: int, result: dict[str, dict[Phase, int]]
+        self,
+        phase: Phase,
+        surplus: int,
+        result: dict[str, dict[Phase, int]],
+        group_available_currents: dict[str, dict[Phase, int]],
     ) -> None:
-        """Distribute current increases proportionally during recovery."""
+        """
+        Distribute current increases proportionally during recovery.
+
+        A charger behind fuse groups gets at most its proportional share of
+        the surplus of each of those groups, and nothing when one of them has
+        no surplus.
+        """
         potential_increases = []
         total_potential = 0
+        group_potentials: dict[str, int] = {}
 
         # Calculate potential increases for each charger
         for charger_id, state in self._active_chargers.items():
             current_setting = state.get_current_limit()
             if not current_setting or not state.requested_current:
                 continue
+            if (
+                charger_id in result
+                and result[charger_id][phase] < current_setting[phase]
+            ):
+                continue  # Cut for one of its groups
+
+            group_path = self._fuse_tree.group_path(charger_id)
+            if any(
+                group_available_currents.get(group_id, {}).get(phase, 0) <= 0
+                for group_id in group_path
+            ):
+                continue
 
             current = current_setting[phase]
             requested = state.requested_current[phase]
 
             if requested > current:
                 potential = requested - current
-                potential_increases.append((charger_id, potential))
+                potential_increases.append((charger_id, potential, group_path))
                 total_potential += potential
+                for group_id in group_path:
+                    group_potentials[group_id] = (
+                        group_potentials.get(group_id, 0) + potential
+                    )
 
         if total_potential == 0:
             return  # No potential increases
 
         # Calculate increases proportionally
-        for charger_id, potential in potential_increases:
+        for charger_id, potential, group_path in potential_increases:
             proportion = potential / total_potential
             increase = min(surplus * proportion, potential)
+            for group_id in group_path:
+                group_surplus = group_available_currents[group_id][phase]
+                increase = min(
+                    increase, group_surplus * potential / group_potentials[group_id]
+                )
 
             state = self._chargers[charger_id]
             current_setting = state.get_current_limit()
@@ -337,3 +464,17 @@ class PowerAllocator:
                 result[charger_id] = current_setting.copy()
 
             result[charger_id][phase] = current_setting[phase] + int(increase)
+
+
+def _limits_to_dict(limits: dict[Phase, int] | None) -> dict[str, int] | None:
+    """Convert limits to a dict that can be stored as JSON."""
+    if limits is None:
+        return None
+    return {phase.value: current for phase, current in limits.items()}
+
+
+def _limits_from_dict(limits: dict[str, int] | None) -> dict[Phase, int] | None:
+    """Convert stored limits back to limits per phase."""
+    if limits is None:
+        return None
+    return {Phase(phase): int(current) for phase, current in limits.items()}
@@ -0,0 +1,158 @@
+"""Ring buffer of rows of numbers, stored column by column."""
+
+from array import array
+from collections.abc import Iterator, Sequence
+from itertools import chain
+from typing import overload
+
+
+class RingView(Sequence[float]):
+    """
+    Read-only view on a column of a ring buffer, oldest value first.
+
+    The values are not copied: the view consists of at most two slices of
+    the column, as a range of rows can wrap around its end. A view is only
+    valid until the next row is added.
+    """
+
+    __slots__ = ("_head", "_tail")
+
+    def __init__(self, head: memoryview, tail: memoryview) -> None:
+        """Initialize the view on the given slices."""
+        self._head = head
+        self._tail = tail
+
+    def __len__(self) -> int:
+        """Return the number of values in the view."""
+        return len(self._head) + len(self._tail)
+
+    @overload
+    def __getitem__(self, index: int) -> float: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[float]: ...
+
+    def __getitem__(self, index: int | slice) -> float | list[float]:
+        """Return the value at an index, or a list of the values of a slice."""
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        head_length = len(self._head)
+        if index < 0:
+            index += len(self)
+        if 0 <= index < head_length:
+            return self._head[index]
+        return self._tail[index - head_length]
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate the values, oldest first."""
+        return chain(self._head, self._tail)
+
+
+class RingBuffer:
+    """
+    Ring buffer of rows of numbers, with a typed array per column.
+
+    Rows are added at the end and removed at either end in O(1). When full,
+    a growable buffer doubles its capacity, so it follows the largest number
+    of rows held at once; any other buffer overwrites its oldest row.
+    """
+
+    __slots__ = ("_columns", "_growable", "_size", "_start")
+
+    def __init__(
+        self,
+        columns: Sequence[tuple[str, float]],
+        capacity: int,
+        *,
+        growable: bool = False,
+    ) -> None:
+        """
+        Initialize an empty buffer with room for `capacity` rows.
+
+        :param columns: The typecode and fill value of each column.
+        :param capacity: The number of rows the buffer holds.
+        :param growable: Whether to grow rather than overwrite when full.
+        """
+        if capacity < 1:
+            msg = f"Capacity must be at least 1, got {capacity}"
+            raise ValueError(msg)
+        # Allocated up front, so views never block writes by resizing
+        self._columns = [
+            array(typecode, [fill]) * capacity for typecode, fill in columns
+        ]
+        self._growable = growable
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of rows in the buffer."""
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Return the number of rows the buffer holds before growing."""
+        return len(self._columns[0])
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the columns."""
+        return sum(column.itemsize * len(column) for column in self._columns)
+
+    def get(self, column: int, index: int) -> float:
+        """Return the value in a column of the `index`th oldest row."""
+        if index < 0:
+            index += self._size
+        return self._columns[column][(self._start + index) % self.capacity]
+
+    def append(self, *values: float) -> None:
+        """Add a row as the newest one, one value per column."""
+        capacity = self.capacity
+        if self._size == capacity:
+            if self._growable:
+                self._grow()
+                capacity = self.capacity
+            else:
+                self._start = (self._start + 1) % capacity
+                self._size -= 1
+        index = (self._start + self._size) % capacity
+        for column, value in zip(self._columns, values, strict=True):
+            column[index] = value
+        self._size += 1
+
+    def pop_first(self) -> None:
+        """Remove the oldest row."""
+        self._start = (self._start + 1) % self.capacity
+        self._size -= 1
+
+    def pop_last(self) -> None:
+        """Remove the newest row."""
+        self._size -= 1
+
+    def clear(self) -> None:
+        """Remove all rows, keeping the capacity."""
+        self._start = 0
+        self._size = 0
+
+    def view(self, column: int, start: int = 0, length: int | None = None) -> RingView:
+        """Return a view on `length` values of a column, from the `start`th oldest."""
+        if length is None:
+            length = self._size - start
+        capacity = self.capacity
+        values = memoryview(self._columns[column])
+        first = (self._start + start) % capacity
+        end = first + length
+        if end <= capacity:
+            return RingView(values[first:end], values[0:0])
+        return RingView(values[first:], values[: end - capacity])
+
+    def _grow(self) -> None:
+        """Double the capacity, moving the rows to the start of the columns."""
+        capacity = self.capacity
+        order = [(self._start + i) % capacity for i in range(self._size)]
+        # The padding is overwritten before it's read, so any value does
+        self._columns = [
+            array(column.typecode, (column[i] for i in order))
+            + array(column.typecode, [column[0]]) * capacity
+            for column in self._columns
+        ]
+        self._start = 0
@@ -0,0 +1,138 @@
+"""Runtime configuration of the load balancer."""
+
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+
+from . import config_flow as cf
+from . import options_flow as of
+from .const import (
+    BalancerAlgorithm,
+    BreakerCurve,
+    OvercurrentMode,
+    Phase,
+    StalenessPolicy,
+)
+from .fuse_tree import ROOT_NODE_ID, FuseNode
+
+# Constructor argument of the balancers per algorithm option, and the factor
+# converting the option to it
+_BALANCER_ARGUMENTS: dict[str, tuple[str, float]] = {
+    of.OPTION_MEDIAN_PERIOD: ("hysteresis_period", 60),
+    of.OPTION_RAMP_MARGIN: ("margin", 1),
+    of.OPTION_RAMP_DEADBAND: ("deadband", 1),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RuntimeConfig:
+    """
+    Configuration used by the balancing cycle.
+
+    Resolved once from the config entry's data and options, so the hot path
+    doesn't have to look up and convert the same values every cycle. Rebuild
+    it when the options change.
+    """
+
+    fuse_size: int
+    phases: tuple[Phase, ...]
+    charge_limit_hysteresis_seconds: int
+    overcurrent_mode: OvercurrentMode
+    fuse_groups: tuple[FuseNode, ...] = ()
+    staleness_budget_seconds: float = 60
+    staleness_policy: StalenessPolicy = StalenessPolicy.DEGRADE
+    breaker_curve: BreakerCurve = BreakerCurve.C
+    breaker_cooling_seconds: float = 5 * 60
+    balancer_algorithm: BalancerAlgorithm = BalancerAlgorithm.OPTIMISED
+    # Keyword arguments for the balancer of the algorithm
+    balancer_options: Mapping[str, Any] = field(default_factory=dict)
+
+    @property
+    def max_limits(self) -> dict[Phase, int]:
+        """Return the maximum current per phase."""
+        return dict.fromkeys(self.phases, self.fuse_size)
+
+    @classmethod
+    def from_config_entry(cls, config_entry: ConfigEntry) -> "RuntimeConfig":
+        """Build the runtime configuration from a config entry."""
+        # The options override the main fuse size from the initial setup
+        options_fuse_amps = config_entry.options.get(of.OPTION_MAX_FUSE_LOAD_AMPS)
+        fuse_size = (
+            options_fuse_amps
+            if options_fuse_amps is not None
+            else config_entry.data.get(cf.CONF_FUSE_SIZE, 0)
+        )
+
+        phase_count = int(config_entry.data.get(cf.CONF_PHASE_COUNT, 3))
+
+        allow_temporary_overcurrent = of.EvseLoadBalancerOptionsFlow.get_option_value(
+            config_entry, of.OPTION_ALLOW_TEMPORARY_OVERCURRENT
+        )
+
+        balancer_algorithm = BalancerAlgorithm(
+            of.EvseLoadBalancerOptionsFlow.get_option_value(
+                config_entry, of.OPTION_BALANCER_ALGORITHM
+            )
+        )
+        balancer_options = {}
+        for option in of.ALGORITHM_OPTIONS.get(balancer_algorithm, {}):
+            argument, factor = _BALANCER_ARGUMENTS[option]
+            balancer_options[argument] = (
+                of.EvseLoadBalancerOptionsFlow.get_option_value(config_entry, option)
+                * factor
+            )
+
+        return cls(
+            fuse_size=int(fuse_size),
+            phases=tuple(Phase)[:phase_count],
+            charge_limit_hysteresis_seconds=int(
+                of.EvseLoadBalancerOptionsFlow.get_option_value(
+                    config_entry, of.OPTION_CHARGE_LIMIT_HYSTERESIS
+                )
+                * 60
+            ),
+            overcurrent_mode=(
+                OvercurrentMode.OPTIMISED
+                if allow_temporary_overcurrent
+                else OvercurrentMode.CONSERVATIVE
+            ),
+            fuse_groups=tuple(
+                FuseNode(
+                    node_id=group[cf.CONF_FUSE_GROUP_NAME],
+                    fuse_size=int(group[cf.CONF_FUSE_SIZE]),
+                    parent_id=group.get(cf.CONF_FUSE_GROUP_PARENT, ROOT_NODE_ID),
+                    charger_ids=tuple(group.get(cf.CONF_CHARGER_DEVICE, [])),
+                    current_entities={
+                        phase: group[phase.value]
+                        for phase in tuple(Phase)[:phase_count]
+                        if group.get(phase.value)
+                    },
+                )
+                for group in config_entry.data.get(cf.CONF_FUSE_GROUPS, [])
+            ),
+            staleness_budget_seconds=float(
+                of.EvseLoadBalancerOptionsFlow.get_option_value(
+                    config_entry, of.OPTION_STALENESS_BUDGET
+                )
+            ),
+            staleness_policy=StalenessPolicy(
+                of.EvseLoadBalancerOptionsFlow.get_option_value(
+                    config_entry, of.OPTION_STALENESS_POLICY
+                )
+            ),
+            breaker_curve=BreakerCurve(
+                of.EvseLoadBalancerOptionsFlow.get_option_value(
+                    config_entry, of.OPTION_BREAKER_CURVE
+                )
+            ),
+            breaker_cooling_seconds=float(
+                of.EvseLoadBalancerOptionsFlow.get_option_value(
+                    config_entry, of.OPTION_BREAKER_COOLING
+                )
+                * 60
+            ),
+            balancer_algorithm=balancer_algorithm,
+            balancer_options=balancer_options,
+        )
@@ -6,21 +6,30 @@ from homeassistant import config_entries, core
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
-    SensorEntityDescription,
 )
+from homeassistant.const import EntityCategory, UnitOfTime
 
 from .const import (
     COORDINATOR_STATES,
     DOMAIN,
 )
 from .coordinator import EVSELoadBalancerCoordinator
+from .load_balancer_charger_sensor import (
+    SENSOR_KEY_CHARGER_CURRENT_LIMIT,
+    SENSOR_KEY_CHARGER_LAST_UPDATE,
+    LoadBalancerChargerSensor,
+)
+from .load_balancer_latency_sensor import LoadBalancerLatencySensor
 from .load_balancer_phase_sensor import (
     SENSOR_KEY_AVAILABLE_CURRENT_L1,
     SENSOR_KEY_AVAILABLE_CURRENT_L2,
     SENSOR_KEY_AVAILABLE_CURRENT_L3,
     LoadBalancerPhaseSensor,
 )
-from .load_balancer_sensor import LoadBalancerSensor
+from .load_balancer_sensor import (
+    LoadBalancerSensor,
+    LoadBalancerSensorEntityDescription,
+)
 from .utils import get_callable_name
 
 
@@ -36,13 +45,18 @@ async def async_setup_entry(
         SensorCls(coordinator, entity_description)
         for SensorCls, entity_description in SENSORS
     ]
+    sensors.extend(
+        SensorCls(coordinator, entity_description, charger)
+        for charger in coordinator.chargers
+        for SensorCls, entity_description in CHARGER_SENSORS
+    )
     async_add_entities(sensors, update_before_add=False)
 
 
-SENSORS: tuple[tuple[SensorEntity, SensorEntityDescription], ...] = (
+SENSORS: tuple[tuple[SensorEntity, LoadBalancerSensorEntityDescription], ...] = (
     (
         LoadBalancerSensor,
-        SensorEntityDescription(
+        LoadBalancerSensorEntityDescription(
             key=get_callable_name(EVSELoadBalancerCoordinator.get_load_balancing_state),
             translation_key="evse_load_balancing_state",
             options=list(COORDINATOR_STATES),
@@ -52,41 +66,98 @@ SENSORS: tuple[tuple[SensorEntity, SensorEntityDescription], ...] = (
     ),
     (
         LoadBalancerSensor,
-        SensorEntityDescription(
+        LoadBalancerSensorEntityDescription(
             key=get_callable_name(EVSELoadBalancerCoordinator.get_last_check_timestamp),
             translation_key="evse_last_check",
             device_class=SensorDeviceClass.TIMESTAMP,
             entity_registry_enabled_default=False,
+            # Changes every cycle by design
+            min_update_interval=60,
+        ),
+    ),
+    (
+        LoadBalancerLatencySensor,
+        LoadBalancerSensorEntityDescription(
+            key=get_callable_name(EVSELoadBalancerCoordinator.get_cycle_latency),
+            translation_key="evse_cycle_latency",
+            device_class=SensorDeviceClass.DURATION,
+            suggested_display_precision=2,
+            entity_registry_enabled_default=False,
+            min_update_interval=60,
+        ),
+    ),
+    (
+        LoadBalancerSensor,
+        LoadBalancerSensorEntityDescription(
+            key=get_callable_name(EVSELoadBalancerCoordinator.get_meter_data_age),
+            translation_key="evse_meter_data_age",
+            device_class=SensorDeviceClass.DURATION,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            suggested_display_precision=0,
+            entity_registry_enabled_default=False,
+            min_update_interval=10,
+            deadband=1,
         ),
     ),
     (
         LoadBalancerPhaseSensor,
-        SensorEntityDescription(
+        LoadBalancerSensorEntityDescription(
             key=SENSOR_KEY_AVAILABLE_CURRENT_L1,
             translation_key="evse_available_current_l1",
             device_class=SensorDeviceClass.CURRENT,
             suggested_display_precision=0,
             entity_registry_enabled_default=False,
+            min_update_interval=5,
+            deadband=1,
         ),
     ),
     (
         LoadBalancerPhaseSensor,
-        SensorEntityDescription(
+        LoadBalancerSensorEntityDescription(
             key=SENSOR_KEY_AVAILABLE_CURRENT_L2,
             translation_key="evse_available_current_l2",
             device_class=SensorDeviceClass.CURRENT,
             suggested_display_precision=0,
             entity_registry_enabled_default=False,
+            min_update_interval=5,
+            deadband=1,
         ),
     ),
     (
         LoadBalancerPhaseSensor,
-        SensorEntityDescription(
+        LoadBalancerSensorEntityDescription(
             key=SENSOR_KEY_AVAILABLE_CURRENT_L3,
             translation_key="evse_available_current_l3",
             device_class=SensorDeviceClass.CURRENT,
             suggested_display_precision=0,
             entity_registry_enabled_default=False,
+            min_update_interval=5,
+            deadband=1,
+        ),
+    ),
+)
+
+CHARGER_SENSORS: tuple[
+    tuple[SensorEntity, LoadBalancerSensorEntityDescription], ...
+] = (
+    (
+        LoadBalancerChargerSensor,
+        LoadBalancerSensorEntityDescription(
+            key=SENSOR_KEY_CHARGER_CURRENT_LIMIT,
+            translation_key="evse_charger_current_limit",
+            device_class=SensorDeviceClass.CURRENT,
+            suggested_display_precision=0,
+            entity_registry_enabled_default=True,
+        ),
+    ),
+    (
+        LoadBalancerChargerSensor,
+        LoadBalancerSensorEntityDescription(
+            key=SENSOR_KEY_CHARGER_LAST_UPDATE,
+            translation_key="evse_charger_last_update",
+            device_class=SensorDeviceClass.TIMESTAMP,
+            entity_registry_enabled_default=False,
         ),
     ),
 )
@@ -0,0 +1,116 @@
+"""Persistence of the load balancer's runtime state."""
+
+import logging
+from collections.abc import Callable
+from time import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION: int = 1
+
+# Number of seconds state changes are collected before they are written
+STATE_SAVE_DELAY: float = 10
+
+# Number of seconds after which stored state no longer reflects the situation
+# at the meter and charger, and is discarded instead of restored
+STATE_MAX_AGE: float = 300
+
+# Number of seconds after which unchanged state is written again, so the
+# stored state doesn't go stale while nothing significant changes
+STATE_REFRESH_DELAY: float = STATE_MAX_AGE / 2
+
+ATTR_SAVED_AT = "saved_at"
+
+
+def _create_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}")
+
+
+async def async_remove_state(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the stored state of a config entry."""
+    await _create_store(hass, entry_id).async_remove()
+
+
+class BalancerStateStore:
+    """
+    Store the state of the balancer and allocator of a single config entry.
+
+    Writes are debounced: the first change schedules a write `save_delay`
+    seconds later, and every change in between is picked up by that write.
+    Home Assistant writes pending data when it stops.
+
+    As most installs run from an SD card or flash, state is only written
+    soon when its significant part changed since the last write. Otherwise
+    it is written `refresh_delay` seconds later, just to keep it from going
+    stale.
+
+    @param export_state: Returns the state to store, called at write time.
+    @param significant_state: Returns the part of the state that has to be
+        written soon when it changes. Without it, every change is significant.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        export_state: Callable[[], dict[str, Any]],
+        significant_state: Callable[[], Any] | None = None,
+        save_delay: float = STATE_SAVE_DELAY,
+        max_age: float = STATE_MAX_AGE,
+        refresh_delay: float = STATE_REFRESH_DELAY,
+    ) -> None:
+        """Initialize the store."""
+        self._store = _create_store(hass, entry_id)
+        self._export_state = export_state
+        self._significant_state = significant_state
+        self._save_delay = save_delay
+        self._max_age = max_age
+        self._refresh_delay = refresh_delay
+        # Delay of the pending write, if any
+        self._pending_delay: float | None = None
+        # Significant state at the last write
+        self._saved_significant_state: Any = None
+
+    async def async_load(self) -> dict[str, Any] | None:
+        """Load the stored state, or None when there is none or it is stale."""
+        data = await self._store.async_load()
+        if not data:
+            return None
+
+        age = time() - data.get(ATTR_SAVED_AT, 0)
+        if age > self._max_age:
+            _LOGGER.debug("Discarding stored state saved %d seconds ago", age)
+            return None
+
+        return data
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a write of the current state, unless one is already pending."""
+        delay = (
+            self._save_delay
+            if self._significant_state is None
+            or self._significant_state() != self._saved_significant_state
+            else self._refresh_delay
+        )
+        if self._pending_delay is not None and self._pending_delay <= delay:
+            return
+        # Rescheduling replaces a pending write that would come later
+        self._pending_delay = delay
+        self._store.async_delay_save(self._collect_state, delay)
+
+    async def async_save(self) -> None:
+        """Write the current state immediately."""
+        await self._store.async_save(self._collect_state())
+
+    def _collect_state(self) -> dict[str, Any]:
+        self._pending_delay = None
+        if self._significant_state is not None:
+            self._saved_significant_state = self._significant_state()
+        return {**self._export_state(), ATTR_SAVED_AT: time()}
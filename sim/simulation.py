@@ -7,6 +7,7 @@ import pandas as pd
 from custom_components.evse_load_balancer.balancers.optimised_load_balancer import (
     OptimisedLoadBalancer,
 )
+from custom_components.evse_load_balancer.balancers.stats import RollingMean
 from custom_components.evse_load_balancer.chargers.charger import Charger
 from custom_components.evse_load_balancer.const import Phase
 from custom_components.evse_load_balancer.power_allocator import PowerAllocator
@@ -78,6 +79,7 @@ log_charger_limits = []
 log_computed_current = {phase: [] for phase in Phase}
 log_available_current = {phase: [] for phase in Phase}
 stat_kwh_charged = 0.0
+stat_charger_limit = RollingMean(window=60 * 60)
 
 _previous_computed_current = None
 _previous_applied_current_timestamp = 0
@@ -125,6 +127,7 @@ for timestamp, row in df.iterrows():
     # Logging for analysis
     log_time.append(now)
     log_charger_limits.append(min(charger.get_current_limit().values()))
+    stat_charger_limit.add(log_charger_limits[-1], now.timestamp())
     for phase in Phase:
         log_available_current[phase].append(available_currents[phase])
 
@@ -137,6 +140,11 @@ for timestamp, row in df.iterrows():
 
     prev_timestamp = now
 
+_LOGGER.info("Charged %.2f kWh", stat_kwh_charged)
+_LOGGER.info("Mean charger limit over the last hour: %.1f A", stat_charger_limit.value)
+for phase, statistics in balancer.statistics().items():
+    _LOGGER.info("Available current on %s over the last minutes: %s", phase, statistics)
+
 # Optionally, plot results as in your original script
 
 df_log = pd.DataFrame(
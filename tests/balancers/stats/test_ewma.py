@@ -0,0 +1,42 @@
+"""Tests for the time-decayed moving average."""
+
+from math import exp
+
+import pytest
+
+from custom_components.evse_load_balancer.balancers.stats import Ewma
+
+
+def test_first_value_is_the_average():
+    average = Ewma(time_constant=60)
+    assert average.value is None
+    assert average.update(10, now=0) == 10
+
+
+def test_decays_with_time_not_updates():
+    average = Ewma(time_constant=60)
+    average.update(0, now=0)
+    average.update(10, now=60)
+    assert average.value == pytest.approx(10 * (1 - exp(-1)))
+
+    # Many updates in the same instant don't move the average
+    for _ in range(100):
+        average.update(1000, now=60)
+    assert average.value == pytest.approx(10 * (1 - exp(-1)))
+
+
+def test_irregular_intervals_match_regular_ones():
+    regular = Ewma(time_constant=30)
+    irregular = Ewma(time_constant=30)
+    regular.update(0, now=0)
+    irregular.update(0, now=0)
+    for now in range(1, 11):
+        regular.update(5, now=now)
+    irregular.update(5, now=3)
+    irregular.update(5, now=10)
+    assert irregular.value == pytest.approx(regular.value)
+
+
+def test_invalid_time_constant():
+    with pytest.raises(ValueError):
+        Ewma(time_constant=0)
@@ -0,0 +1,53 @@
+"""Tests for the Holt forecast."""
+
+import pytest
+
+from custom_components.evse_load_balancer.balancers.stats import HoltForecast
+
+
+def _forecast():
+    return HoltForecast(level_time_constant=5, trend_time_constant=15, damping_time=60)
+
+
+def test_empty_forecast():
+    assert _forecast().forecast(30) is None
+
+
+def test_constant_series_has_no_trend():
+    forecast = _forecast()
+    for now in range(0, 120, 2):
+        forecast.update(10, now)
+    assert forecast.trend == 0
+    assert forecast.forecast(30) == 10
+
+
+def test_follows_a_ramp():
+    forecast = _forecast()
+    for now in range(0, 300, 2):
+        forecast.update(100 - now * 0.5, now)
+    assert forecast.trend == pytest.approx(-0.5, rel=0.01)
+    # The damped trend extrapolates a little less than the ramp
+    assert -15 < forecast.forecast(30) - forecast.level < -10
+
+
+def test_irregular_updates():
+    regular = _forecast()
+    irregular = _forecast()
+    for now in range(0, 121):
+        regular.update(now, now)
+        if now % 7 == 0 or now == 120:
+            irregular.update(now, now)
+    assert irregular.trend == pytest.approx(regular.trend, rel=0.05)
+    assert irregular.forecast(10) == pytest.approx(regular.forecast(10), rel=0.05)
+
+
+def test_repeated_timestamps_are_ignored():
+    forecast = _forecast()
+    forecast.update(10, 0)
+    forecast.update(0, 0)
+    assert forecast.level == 10
+
+
+def test_invalid_time_constants():
+    with pytest.raises(ValueError):
+        HoltForecast(level_time_constant=0, trend_time_constant=1, damping_time=1)
@@ -0,0 +1,81 @@
+"""Tests for the streaming windowed quantile."""
+
+import random
+from statistics import median, quantiles
+
+import pytest
+
+from custom_components.evse_load_balancer.balancers.stats import WindowedQuantile
+
+
+def test_empty_window():
+    assert WindowedQuantile(window=60).value is None
+
+
+def test_median_matches_statistics():
+    window = WindowedQuantile(window=60)
+    values = []
+    for value in [5, 1, 4, 4, 9, -2, 7, 3]:
+        window.add(value, now=0)
+        values.append(value)
+        assert window.value == median(values)
+
+
+def test_values_leave_the_window():
+    window = WindowedQuantile(window=10)
+    for now in range(10):
+        window.add(100, now=now)
+    for now in range(10, 20):
+        window.add(1, now=now)
+
+    assert len(window) == 10
+    assert window.value == 1
+
+    window.evict(now=100)
+    assert len(window) == 0
+    assert window.value is None
+
+
+@pytest.mark.parametrize("q", [0.0, 0.1, 0.25, 0.5, 0.9, 1.0])
+def test_sliding_quantile_matches_naive(q):
+    rng = random.Random(42)
+    window = WindowedQuantile(window=30, quantile=q)
+    samples = []
+    now = 0.0
+    for _ in range(2000):
+        now += rng.choice([0.5, 1, 1, 2, 7])
+        value = rng.randint(-10, 10)
+        window.add(value, now)
+        samples.append((now, value))
+        in_window = sorted(v for t, v in samples if t > now - 30)
+        position = q * (len(in_window) - 1)
+        low = in_window[int(position)]
+        high = in_window[min(int(position) + 1, len(in_window) - 1)]
+        expected = low + (high - low) * (position - int(position))
+        assert window.value == pytest.approx(expected)
+
+
+def test_quartiles_match_statistics():
+    values = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5]
+    expected = quantiles(values, n=4, method="inclusive")
+    for q, quartile in zip([0.25, 0.5, 0.75], expected, strict=True):
+        window = WindowedQuantile(window=60, quantile=q)
+        for value in values:
+            window.add(value, now=0)
+        assert window.value == pytest.approx(quartile)
+
+
+def test_memory_is_bounded_by_window():
+    window = WindowedQuantile(window=10)
+    # Increasing values leave stale entries deep in the low heap
+    for now in range(10_000):
+        window.add(now, now=now)
+
+    assert len(window) == 10
+    assert len(window._low) + len(window._high) <= 2 * len(window) + 16
+    assert window.value == pytest.approx(9994.5)
+
+
+def test_invalid_quantile():
+    with pytest.raises(ValueError):
+        WindowedQuantile(window=10, quantile=1.5)
@@ -0,0 +1,76 @@
+"""Tests for the rolling mean, minimum and maximum."""
+
+import random
+
+import pytest
+
+from custom_components.evse_load_balancer.balancers.stats import (
+    RollingMax,
+    RollingMean,
+    RollingMin,
+    TimeRing,
+)
+
+
+def test_empty_windows():
+    assert RollingMean(window=60).value is None
+    assert RollingMin(window=60).value is None
+    assert RollingMax(window=60).value is None
+
+
+def test_sliding_statistics_match_naive():
+    rng = random.Random(7)
+    mean, minimum, maximum = (cls(window=30) for cls in (RollingMean, RollingMin, RollingMax))
+    samples = []
+    now = 0.0
+    for _ in range(2000):
+        now += rng.choice([0.5, 1, 1, 2, 7])
+        value = rng.uniform(-20, 20)
+        for statistic in (mean, minimum, maximum):
+            statistic.add(value, now)
+        samples.append((now, value))
+        in_window = [v for t, v in samples if t > now - 30]
+        assert len(mean) == len(in_window)
+        assert mean.value == pytest.approx(sum(in_window) / len(in_window))
+        assert minimum.value == min(in_window)
+        assert maximum.value == max(in_window)
+
+
+def test_values_leave_the_window():
+    maximum = RollingMax(window=10)
+    maximum.add(100, now=0)
+    maximum.add(1, now=5)
+    assert maximum.value == 100
+
+    maximum.evict(now=10)
+    assert maximum.value == 1
+    maximum.evict(now=15)
+    assert maximum.value is None
+
+
+def test_monotonic_deque_only_keeps_candidates():
+    minimum = RollingMin(window=1000)
+    for now in range(500):
+        minimum.add(now, now=now)
+    # Every value could still become the minimum once older ones leave
+    assert len(minimum._ring) == 500
+
+    minimum.add(-1, now=500)
+    assert len(minimum._ring) == 1
+    assert minimum.value == -1
+
+
+def test_ring_grows_and_keeps_order():
+    ring = TimeRing(capacity=2)
+    for i in range(3):
+        ring.append(i, i * 10)
+    assert ring.pop_first() == 0
+    for i in range(3, 6):
+        ring.append(i, i * 10)
+
+    assert ring.capacity == 8
+    assert len(ring) == 5
+    assert ring.first_time() == 1
+    assert ring.last() == 50
+    assert ring.pop_last() == 50
+    assert [ring.pop_first() for _ in range(len(ring))] == [10, 20, 30, 40]
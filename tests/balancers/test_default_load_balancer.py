@@ -4,6 +4,7 @@ import time
 from statistics import median
 
 from custom_components.evse_load_balancer.balancers.default_load_balancer import DefaultLoadBalancer
+from custom_components.evse_load_balancer.const import OvercurrentMode
 from custom_components.evse_load_balancer.meters.meter import Phase
 
 # Note: Adjust the import paths as needed to match your project structure.
@@ -15,34 +16,27 @@ def test_immediate_reduction():
     the balancer immediately reduces the charger limit.
     """
     hysteresis_period = 300  # 5 minutes
-    balancer = DefaultLoadBalancer(hysteresis_period=hysteresis_period)
-    # Setup initial conditions
-    # Current limits for each phase (e.g., in Amps)
-    current_limits = {
-        Phase.L1: 16,
-        Phase.L2: 16,
-        Phase.L3: 16,
+    # Maximum limits per phase
+    max_limits = {
+        Phase.L1: 32,
+        Phase.L2: 32,
+        Phase.L3: 32,
     }
+    balancer = DefaultLoadBalancer(max_limits, hysteresis_period=hysteresis_period)
     # Available current for each phase is negative – we are over our limit.
     available_currents = {
         Phase.L1: -4,
         Phase.L2: -3,
         Phase.L3: -2,
     }
-    # Maximum limits per phase
-    max_limits = {
-        Phase.L1: 32,
-        Phase.L2: 32,
-        Phase.L3: 32,
-    }
     # Simulate time (ensure hysteresis period has passed for immediate reduction)
     now = time.time() + hysteresis_period + 1
 
-    new_limits = balancer.compute_availability(current_limits, available_currents, max_limits, now=now)
-    # Expect that each phase is reduced immediately: new_limit = current + available_current (clamped to non-negative).
-    assert new_limits[Phase.L1] == max(0, current_limits[Phase.L1] + available_currents[Phase.L1])
-    assert new_limits[Phase.L2] == max(0, current_limits[Phase.L2] + available_currents[Phase.L2])
-    assert new_limits[Phase.L3] == max(0, current_limits[Phase.L3] + available_currents[Phase.L3])
+    new_limits = balancer.compute_availability(available_currents, now=now)
+    # Expect that each phase is reduced immediately by the full overcurrent.
+    assert new_limits[Phase.L1] == available_currents[Phase.L1]
+    assert new_limits[Phase.L2] == available_currents[Phase.L2]
+    assert new_limits[Phase.L3] == available_currents[Phase.L3]
 
 
 def test_buffered_increase():
@@ -51,17 +45,12 @@ def test_buffered_increase():
     the balancer buffers increases until the hysteresis period has elapsed.
     """
     hysteresis_period = 300  # 5 minutes in seconds
-    balancer = DefaultLoadBalancer(hysteresis_period=hysteresis_period)
-    current_limits = {
-        Phase.L1: 16,
-        Phase.L2: 16,
-        Phase.L3: 16,
-    }
     max_limits = {
         Phase.L1: 32,
         Phase.L2: 32,
         Phase.L3: 32,
     }
+    balancer = DefaultLoadBalancer(max_limits, hysteresis_period=hysteresis_period)
     # Define available current for each phase.
     available_currents = {
         Phase.L1: 4,
@@ -72,23 +61,61 @@ def test_buffered_increase():
     # Simulate repeated calls within the hysteresis period (e.g., every 10 seconds),
     # so that the buffer is populated.
     start_time = time.time()
+    # The first call flushes right away and starts the hysteresis period
+    balancer.compute_availability(available_currents, now=start_time - 1)
     # Number of calls to simulate (e.g., 5 calls over 40 seconds).
     num_calls = 5
     for i in range(num_calls):
         current_time = start_time + i * 10  # every 10 seconds
         # Call compute_availability; it won't flush because hysteresis_period hasn't elapsed.
-        _ = balancer.compute_availability(current_limits, available_currents, max_limits, now=current_time)
+        held = balancer.compute_availability(available_currents, now=current_time)
+        assert held == dict.fromkeys(Phase, 0)
 
     # Now, simulate a final call after the hysteresis period has elapsed.
     final_time = start_time + hysteresis_period + 1
-    new_limits = balancer.compute_availability(current_limits, available_currents, max_limits, now=final_time)
+    new_limits = balancer.compute_availability(available_currents, now=final_time)
 
     # The buffered values for each phase should be [available_current]*num_calls.
     # Thus, the median for Phase.L1 is median([4,4,4,4,4]) which is 4, etc.
-    expected_L1 = min(max_limits[Phase.L1], current_limits[Phase.L1] + int(median([available_currents[Phase.L1]] * num_calls)))
-    expected_L2 = min(max_limits[Phase.L2], current_limits[Phase.L2] + int(median([available_currents[Phase.L2]] * num_calls)))
-    expected_L3 = min(max_limits[Phase.L3], current_limits[Phase.L3] + int(median([available_currents[Phase.L3]] * num_calls)))
+    expected_L1 = min(max_limits[Phase.L1], int(median([available_currents[Phase.L1]] * (num_calls + 1))))
+    expected_L2 = min(max_limits[Phase.L2], int(median([available_currents[Phase.L2]] * (num_calls + 1))))
+    expected_L3 = min(max_limits[Phase.L3], int(median([available_currents[Phase.L3]] * (num_calls + 1))))
 
     assert new_limits[Phase.L1] == expected_L1, f"Expected {expected_L1}, got {new_limits[Phase.L1]}"
     assert new_limits[Phase.L2] == expected_L2, f"Expected {expected_L2}, got {new_limits[Phase.L2]}"
     assert new_limits[Phase.L3] == expected_L3, f"Expected {expected_L3}, got {new_limits[Phase.L3]}"
+
+
+def test_buffer_is_bounded_by_hysteresis_period():
+    """Test that only the available currents of the last period are buffered."""
+    balancer = DefaultLoadBalancer(dict.fromkeys(Phase, 32), hysteresis_period=300)
+    start_time = time.time()
+    # Flush once, so the hysteresis period starts
+    balancer.compute_availability(dict.fromkeys(Phase, 1), now=start_time)
+
+    for i in range(1, 300):
+        available = 2 if i < 200 else 8
+        balancer.compute_availability(
+            dict.fromkeys(Phase, available), now=start_time + i
+        )
+
+    assert len(balancer._medians[Phase.L1]) == 299
+    assert balancer.median(Phase.L1) == 2
+
+    new_limits = balancer.compute_availability(
+        dict.fromkeys(Phase, 8), now=start_time + 600
+    )
+    # Only the values of the last 300 seconds count
+    assert new_limits[Phase.L1] == 8
+    assert balancer.median(Phase.L1) is None
+
+
+def test_increase_is_capped_at_max_limit():
+    """Test that an increase never exceeds the maximum of the phase."""
+    balancer = DefaultLoadBalancer({Phase.L1: 16}, hysteresis_period=300)
+    new_limits = balancer.compute_availability({Phase.L1: 40}, now=time.time())
+    assert new_limits[Phase.L1] == 16
+
+    balancer.reconfigure({Phase.L1: 20}, overcurrent_mode=OvercurrentMode.CONSERVATIVE)
+    new_limits = balancer.compute_availability({Phase.L1: 40}, now=time.time() + 300)
+    assert new_limits[Phase.L1] == 20
@@ -0,0 +1,57 @@
+"""Tests for the forecasting load balancer."""
+
+import random
+
+from custom_components.evse_load_balancer.balancers.forecasting_load_balancer import (
+    ForecastingLoadBalancer,
+)
+from custom_components.evse_load_balancer.balancers.optimised_load_balancer import (
+    OptimisedLoadBalancer,
+)
+from custom_components.evse_load_balancer.const import Phase
+
+
+def _ramp(now):
+    """Available current dropping 0.5 A/s from 10 A after 100 seconds."""
+    return 10 if now < 100 else max(-10, 10 - (now - 100) // 2)
+
+
+def test_rising_load_is_preempted():
+    forecasting = ForecastingLoadBalancer(max_limits={Phase.L1: 25}, horizon=15)
+    optimised = OptimisedLoadBalancer(max_limits={Phase.L1: 25})
+
+    first_reduction = {}
+    for now in range(0, 200, 2):
+        for name, balancer in (("forecasting", forecasting), ("optimised", optimised)):
+            limits = balancer.compute_availability({Phase.L1: _ramp(now)}, now)
+            if limits[Phase.L1] < 0:
+                first_reduction.setdefault(name, now)
+
+    assert first_reduction["forecasting"] <= first_reduction.get("optimised", 200) - 10
+    assert forecasting.has_trip_risk()
+
+
+def test_steady_load_is_not_lowered():
+    rng = random.Random(1)
+    balancer = ForecastingLoadBalancer(max_limits={Phase.L1: 25})
+    lowered = 0
+    for now in range(0, 3600, 2):
+        available = 10 + rng.randint(-1, 1)
+        limits = balancer.compute_availability({Phase.L1: available}, now)
+        lowered += available - limits[Phase.L1]
+    assert lowered == 0
+
+
+def test_increases_follow_the_measurement():
+    balancer = ForecastingLoadBalancer(max_limits={Phase.L1: 25})
+    balancer.compute_availability({Phase.L1: 2}, 0)
+    limits = balancer.compute_availability({Phase.L1: 12}, 2)
+    assert limits[Phase.L1] == 12
+
+
+def test_statistics_include_forecast():
+    balancer = ForecastingLoadBalancer(max_limits={Phase.L1: 25})
+    assert balancer.statistics()["l1"]["forecast"] is None
+    balancer.compute_availability({Phase.L1: 8}, 0)
+    assert balancer.statistics()["l1"]["forecast"] == 8
+    assert balancer.forecast(Phase.L1) == 8
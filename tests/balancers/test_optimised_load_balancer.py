@@ -1,5 +1,13 @@
-from custom_components.evse_load_balancer.balancers.optimised_load_balancer import OptimisedLoadBalancer, PhaseMonitor
-from custom_components.evse_load_balancer.const import OvercurrentMode, Phase
+from math import exp
+
+import pytest
+
+from custom_components.evse_load_balancer.balancers.optimised_load_balancer import (
+    TRIP_RISK_SHARE,
+    OptimisedLoadBalancer,
+    PhaseMonitor,
+)
+from custom_components.evse_load_balancer.const import BreakerCurve, OvercurrentMode, Phase
 
 
 def test_default_init():
@@ -7,8 +15,8 @@ def test_default_init():
     for controller in lb._phase_monitors:
         assert isinstance(lb._phase_monitors[controller], PhaseMonitor)
         # Check that the default values are set correctly.
-        assert lb._phase_monitors[controller]._trip_risk_threshold == 60
-        assert lb._phase_monitors[controller]._risk_decay_per_second == 1.0
+        assert lb._phase_monitors[controller]._trip_margin == 0.5
+        assert lb._phase_monitors[controller]._breaker.cooling_time_constant == 300
         assert lb._phase_monitors[controller].max_limit == 25
         assert lb._phase_monitors[controller].phase_limit == 25
 
@@ -16,16 +24,14 @@ def test_default_init():
 def test_negative_available_current_triggers_reduction():
     lb = OptimisedLoadBalancer(max_limits=dict.fromkeys(Phase, 25))
     available_currents_one = {phase: 10 for phase in Phase}
-    available_currents_two = {phase: -5 for phase in Phase}
+    available_currents_two = {phase: -15 for phase in Phase}
     now = 100
     lb.compute_availability(available_currents_one, 0)
     computed_availability = lb.compute_availability(available_currents_two, now)
-    # Calculation:
-    # overcurrent_percentage = abs(-5)/32 ~ 0.15625 => risk increase rate = 60/30 = 2.
-    # risk_increase = 2 * (100) = 200, which exceeds trip_risk_threshold (60).
-    # Therefore, the returned available current should be -5.
+    # 40 A on a 25 A breaker (1.6x) may trip it after ~108 seconds, so 100
+    # seconds use more than half of its thermal budget.
     for phase in Phase:
-        assert computed_availability[phase] == -5
+        assert computed_availability[phase] == -15
 
 
 def test_negative_available_current_within_risk_boundary():
@@ -35,10 +41,7 @@ def test_negative_available_current_within_risk_boundary():
     now = 5
     lb.compute_availability(available_currents_one, 0)
     computed_availability = lb.compute_availability(available_currents_two, now)
-    # Calculation:
-    # overcurrent_percentage = abs(-5)/32 ~ 0.15625 => risk increase rate = 60/30 = 2.
-    # risk_increase = 2 * (5) = 10, which is less than trip_risk_threshold (60).
-    # Therefore, the returned available current should be -5.
+    # 30 A on a 25 A breaker (1.2x) takes over half an hour to trip it.
     for phase in Phase:
         assert computed_availability[phase] == 5
 
@@ -53,14 +56,24 @@ def test_stable_recovery_triggers_increase():
         assert new_limits[phase] == 5
 
 
-def test_calculate_trip_risk():
+def test_sustained_small_overcurrent_is_tolerated():
     lb = OptimisedLoadBalancer(max_limits=dict.fromkeys(Phase, 25))
-    pm = lb._phase_monitors[Phase.L1]
-    # Test the trip risk calculation for various overcurrent percentages.
-    assert pm._calculate_trip_risk(-2) == 60.0 / 60
-    assert pm._calculate_trip_risk(-10) == 60.0 / 30
-    assert pm._calculate_trip_risk(-15) == 60.0 / 10
-    assert pm._calculate_trip_risk(-35) == 60.0
+    lb.compute_availability(dict.fromkeys(Phase, 10), 0)
+    # 27 A on a 25 A breaker, below its conventional non-tripping current
+    for now in range(10, 610, 10):
+        limits = lb.compute_availability(dict.fromkeys(Phase, -2), now)
+        assert limits[Phase.L1] == 10
+    assert 0 < lb._phase_monitors[Phase.L1].trip_risk < 0.2
+
+
+def test_magnetic_current_reduces_immediately():
+    lb = OptimisedLoadBalancer(
+        max_limits=dict.fromkeys(Phase, 25), breaker_curve=BreakerCurve.B
+    )
+    lb.compute_availability(dict.fromkeys(Phase, 10), 0)
+    # 75 A is three times the rating of a B breaker
+    limits = lb.compute_availability(dict.fromkeys(Phase, -50), 0)
+    assert limits[Phase.L1] == -50
 
 
 def test_conservative_mode_init():
@@ -139,7 +152,7 @@ def test_conservative_mode_risk_not_accumulated():
     lb.compute_availability(available_currents, 20)
 
     for phase in Phase:
-        assert lb._phase_monitors[phase]._cumulative_trip_risk == 0.0
+        assert lb._phase_monitors[phase].trip_risk == 0.0
 
 
 def test_optimised_mode_default_allows_temporary_overcurrent():
@@ -172,3 +185,112 @@ def test_conservative_vs_optimised_mode_behavior():
         assert limits_optimised_one[phase] == 20
         assert limits_conservative_two[phase] == 17
         assert limits_optimised_two[phase] == 20
+
+
+def test_has_trip_risk():
+    lb = OptimisedLoadBalancer(max_limits=dict.fromkeys(Phase, 25))
+    lb.compute_availability(dict.fromkeys(Phase, 5), 0)
+    assert not lb.has_trip_risk()
+
+    # Short overcurrent accumulates risk without crossing the threshold
+    lb.compute_availability({Phase.L1: -2, Phase.L2: 5, Phase.L3: 5}, 5)
+    assert lb._phase_monitors[Phase.L1].trip_risk > 0
+    assert lb.has_trip_risk()
+
+    # Once the overcurrent is over, the little load left isn't a risk
+    lb.compute_availability(dict.fromkeys(Phase, 5), 10)
+    assert not lb.has_trip_risk()
+
+
+def test_cooling_breaker_has_trip_risk_until_cooled_down():
+    lb = OptimisedLoadBalancer(max_limits=dict.fromkeys(Phase, 25))
+    lb.compute_availability(dict.fromkeys(Phase, 5), 0)
+    lb.compute_availability({Phase.L1: -25, Phase.L2: 5, Phase.L3: 5}, 1)
+    lb.compute_availability({Phase.L1: -25, Phase.L2: 5, Phase.L3: 5}, 30)
+    assert lb._phase_monitors[Phase.L1].trip_risk > TRIP_RISK_SHARE * 0.5
+
+    lb.compute_availability(dict.fromkeys(Phase, 5), 31)
+    assert lb.has_trip_risk()
+    lb.compute_availability(dict.fromkeys(Phase, 5), 31 + 5 * 60)
+    assert lb.has_trip_risk()
+    # Well before the load is completely gone
+    lb.compute_availability(dict.fromkeys(Phase, 5), 31 + 15 * 60)
+    assert 0 < lb._phase_monitors[Phase.L1].trip_risk < TRIP_RISK_SHARE * 0.5
+    assert not lb.has_trip_risk()
+
+
+def test_export_and_restore_state():
+    lb = OptimisedLoadBalancer(max_limits=dict.fromkeys(Phase, 25))
+    lb.compute_availability(dict.fromkeys(Phase, 5), 0)
+    lb.compute_availability({Phase.L1: -10, Phase.L2: 5, Phase.L3: 5}, 10)
+    state = lb.export_state()
+    thermal_load = state["l1"]["thermal_load"]
+    assert thermal_load > 0
+
+    restored = OptimisedLoadBalancer(max_limits=dict.fromkeys(Phase, 25))
+    restored.restore_state(state, elapsed=300)
+
+    # The breaker cooled down for the time nothing was monitored
+    assert restored._phase_monitors[Phase.L1].trip_risk == pytest.approx(
+        thermal_load * exp(-1)
+    )
+    assert restored._phase_monitors[Phase.L1].phase_limit == 5
+
+    # States saved before the thermal model are restored cold
+    restored.restore_state({"l1": {"phase_limit": 5, "trip_risk": 10}}, elapsed=0)
+    assert restored._phase_monitors[Phase.L1].trip_risk == 0
+    assert restored._phase_monitors[Phase.L2].trip_risk == 0
+
+    # The downtime doesn't count as time spent in overcurrent
+    restored.compute_availability({Phase.L1: -2, Phase.L2: 5, Phase.L3: 5}, 1000)
+    assert restored._phase_monitors[Phase.L1].trip_risk == 0
+
+
+def test_reconfigure_keeps_state():
+    lb = OptimisedLoadBalancer(max_limits=dict.fromkeys(Phase, 25))
+    lb.compute_availability(dict.fromkeys(Phase, 20), 0)
+    lb.compute_availability({Phase.L1: -2, Phase.L2: 20, Phase.L3: 20}, 10)
+    thermal_load = lb._phase_monitors[Phase.L1].trip_risk
+
+    lb.reconfigure(
+        max_limits=dict.fromkeys(Phase, 16),
+        overcurrent_mode=OvercurrentMode.OPTIMISED,
+        breaker_curve=BreakerCurve.B,
+        cooling_time_constant=60,
+    )
+
+    monitor = lb._phase_monitors[Phase.L2]
+    assert monitor.max_limit == 16
+    assert monitor.phase_limit == 16
+    assert lb._phase_monitors[Phase.L1].trip_risk == thermal_load > 0
+    assert lb._phase_monitors[Phase.L1]._breaker.cooling_time_constant == 60
+
+    lb.reconfigure(
+        max_limits=dict.fromkeys(Phase, 16),
+        overcurrent_mode=OvercurrentMode.CONSERVATIVE,
+    )
+    assert not lb.has_trip_risk()
+    assert lb._phase_monitors[Phase.L1]._overcurrent_mode == OvercurrentMode.CONSERVATIVE
+
+
+def test_statistics_of_available_current():
+    lb = OptimisedLoadBalancer(max_limits=dict.fromkeys(Phase, 25))
+    assert lb.statistics()["l1"] == {
+        "average": None,
+        "minimum": None,
+        "maximum": None,
+        "thermal_load": 0.0,
+    }
+
+    lb.compute_availability(dict.fromkeys(Phase, 10), 0)
+    lb.compute_availability(dict.fromkeys(Phase, -2), 60)
+    lb.compute_availability(dict.fromkeys(Phase, 4), 120)
+
+    statistics = lb.statistics()[Phase.L2.value]
+    assert statistics["minimum"] == -2
+    assert statistics["maximum"] == 10
+    assert -2 < statistics["average"] < 10
+
+    # Only the last five minutes count for the minimum and maximum
+    lb.compute_availability(dict.fromkeys(Phase, 4), 400)
+    assert lb.statistics()[Phase.L2.value]["minimum"] == 4
@@ -0,0 +1,159 @@
+"""Tests for the ramp controller load balancer."""
+
+import random
+from math import sin
+
+from custom_components.evse_load_balancer.balancers.optimised_load_balancer import (
+    OptimisedLoadBalancer,
+)
+from custom_components.evse_load_balancer.balancers.ramp_controller_balancer import (
+    RampController,
+    RampControllerLoadBalancer,
+)
+from custom_components.evse_load_balancer.const import OvercurrentMode, Phase
+
+
+def test_controller_releases_large_surplus_at_once():
+    controller = RampController(margin=1, deadband=2)
+    assert controller.update(9, 0) == 8
+
+
+def test_controller_holds_small_surplus_until_integrated():
+    controller = RampController(margin=1, deadband=2, integral_time=120)
+    assert controller.update(2, 0) == 0
+    now = 0
+    while controller.update(2, now) == 0:
+        now += 5
+    # 1 A above the margin takes 120 s to make up for the missing 1 A
+    assert now == 125
+    assert controller.integral == 0
+
+
+def test_controller_integral_is_clamped():
+    controller = RampController(margin=1, deadband=2, integral_time=60)
+    controller.update(1.5, 0)
+    controller.update(1.5, 10_000)
+    assert controller.integral == 2 * 60
+
+
+def test_controller_cuts_with_margin():
+    controller = RampController(margin=1)
+    controller.update(1.5, 0)
+    assert controller.update(-3, 5) == -4
+    assert controller.integral == 0
+
+
+def test_controller_holds_within_margin():
+    controller = RampController(margin=1)
+    assert controller.update(0, 0) == 0
+    assert controller.update(1, 5) == 0
+
+
+def test_tolerated_overcurrent_is_held():
+    balancer = RampControllerLoadBalancer(max_limits={Phase.L1: 25})
+    balancer.compute_availability({Phase.L1: 10}, 0)
+    limits = balancer.compute_availability({Phase.L1: -2}, 5)
+    assert limits[Phase.L1] == 0
+
+
+def test_overcurrent_never_raises_limits():
+    balancer = RampControllerLoadBalancer(
+        max_limits={Phase.L1: 25}, overcurrent_mode=OvercurrentMode.CONSERVATIVE
+    )
+    balancer.compute_availability({Phase.L1: 10}, 0)
+    limits = balancer.compute_availability({Phase.L1: -2}, 5)
+    assert limits[Phase.L1] == 0
+
+
+def test_untolerated_overcurrent_is_cut_with_margin():
+    balancer = RampControllerLoadBalancer(max_limits={Phase.L1: 25})
+    limits = balancer.compute_availability({Phase.L1: -200}, 0)
+    assert limits[Phase.L1] == -201
+
+
+def test_increases_are_capped_at_max_limit():
+    balancer = RampControllerLoadBalancer(max_limits={Phase.L1: 16})
+    limits = balancer.compute_availability({Phase.L1: 30}, 0)
+    assert limits[Phase.L1] == 16
+
+
+def _writes(balancer, seed):
+    """Count the limit changes of a charger following the balancer."""
+    rng = random.Random(seed)
+    limit = draw = 16
+    changed = -100
+    writes = 0
+    for now in range(0, 3600, 5):
+        household = 6 + (12 if 900 < now < 1500 else 0) + rng.gauss(0, 0.7)
+        if now - changed >= 15:
+            draw = limit
+        available = round(25 - household - draw)
+        change = balancer.compute_availability({Phase.L1: available}, now)[Phase.L1]
+        new_limit = max(6, min(16, limit + change))
+        if new_limit != limit and now - changed >= 20:
+            limit = new_limit
+            changed = now
+            writes += 1
+    return writes
+
+
+def test_fewer_writes_than_optimised():
+    ramp = sum(
+        _writes(RampControllerLoadBalancer(max_limits={Phase.L1: 25}), seed)
+        for seed in range(10)
+    )
+    optimised = sum(
+        _writes(OptimisedLoadBalancer(max_limits={Phase.L1: 25}), seed)
+        for seed in range(10)
+    )
+    assert ramp < optimised * 0.75
+
+
+# An hour of household load on a 20 A fuse, every 10 seconds: a step
+# through the appliances with a ripple on top
+LOAD_TRACE = [
+    (4, 8, 12, 16, 10, 6)[i // 60] + 0.8 * sin(i * 0.7) + 0.5 * sin(i * 1.9)
+    for i in range(360)
+]
+
+
+def _replay(balancer):
+    """Count the limit changes of a charger following the balancer on the trace."""
+    limit = draw = 16
+    changed = -100
+    writes = 0
+    for i, household in enumerate(LOAD_TRACE):
+        now = i * 10
+        # The charger settles on a new limit within 20 seconds
+        if now - changed >= 20:
+            draw = limit
+        available = round(20 - household - draw)
+        change = balancer.compute_availability({Phase.L1: available}, now)[Phase.L1]
+        new_limit = max(6, min(16, limit + change))
+        if new_limit != limit:
+            limit = new_limit
+            changed = now
+            writes += 1
+    return writes
+
+
+def test_load_trace_takes_fewer_writes_than_optimised():
+    ramp = _replay(RampControllerLoadBalancer(max_limits={Phase.L1: 20}))
+    optimised = _replay(OptimisedLoadBalancer(max_limits={Phase.L1: 20}))
+    # 57 against 98 limit changes
+    assert ramp < optimised * 0.65
+
+
+def test_statistics_include_integral():
+    balancer = RampControllerLoadBalancer(max_limits={Phase.L1: 25})
+    balancer.compute_availability({Phase.L1: 2}, 0)
+    balancer.compute_availability({Phase.L1: 2}, 10)
+    assert balancer.statistics()["l1"]["ramp_integral"] == 10
+
+
+def test_restore_resets_controllers():
+    balancer = RampControllerLoadBalancer(max_limits={Phase.L1: 25})
+    balancer.compute_availability({Phase.L1: 2}, 0)
+    balancer.compute_availability({Phase.L1: 2}, 10)
+    balancer.restore_state(balancer.export_state(), elapsed=60)
+    assert balancer.statistics()["l1"]["ramp_integral"] == 0
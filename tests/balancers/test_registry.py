@@ -0,0 +1,84 @@
+"""Tests for the registry of balancing algorithms."""
+
+from unittest.mock import patch
+
+import pytest
+
+from custom_components.evse_load_balancer.balancers import registry
+from custom_components.evse_load_balancer.balancers.balancer import (
+    Balancer,
+    BalancerSettings,
+)
+from custom_components.evse_load_balancer.balancers.default_load_balancer import (
+    DefaultLoadBalancer,
+)
+from custom_components.evse_load_balancer.balancers.forecasting_load_balancer import (
+    ForecastingLoadBalancer,
+)
+from custom_components.evse_load_balancer.balancers.ramp_controller_balancer import (
+    RampControllerLoadBalancer,
+)
+from custom_components.evse_load_balancer.const import (
+    BalancerAlgorithm,
+    BreakerCurve,
+    OvercurrentMode,
+    Phase,
+)
+
+
+@pytest.mark.parametrize("algorithm", list(BalancerAlgorithm))
+def test_every_algorithm_shares_the_interface(algorithm):
+    balancer = registry.create_balancer(
+        algorithm, dict.fromkeys(Phase, 25), BalancerSettings()
+    )
+    assert isinstance(balancer, Balancer)
+
+    limits = balancer.compute_availability(dict.fromkeys(Phase, -200), 0)
+    assert all(limit < 0 for limit in limits.values())
+    balancer.reconfigure(dict.fromkeys(Phase, 20), OvercurrentMode.CONSERVATIVE)
+    balancer.restore_state(balancer.export_state(), elapsed=0)
+    assert isinstance(balancer.has_trip_risk(), bool)
+    assert isinstance(balancer.statistics(), dict)
+
+
+def test_settings_are_passed_on():
+    balancer = registry.create_balancer(
+        BalancerAlgorithm.FORECASTING,
+        {Phase.L1: 25},
+        BalancerSettings(breaker_curve=BreakerCurve.B, horizon=12),
+    )
+    assert isinstance(balancer, ForecastingLoadBalancer)
+    assert balancer.horizon == 12
+
+
+def test_options_are_passed_to_the_algorithm():
+    ramp = registry.create_balancer(
+        BalancerAlgorithm.RAMP,
+        {Phase.L1: 25},
+        BalancerSettings(options={"margin": 3, "deadband": 4}),
+    )
+    assert isinstance(ramp, RampControllerLoadBalancer)
+    assert ramp.compute_availability({Phase.L1: 6}, 0) == {Phase.L1: 0}
+    assert ramp.compute_availability({Phase.L1: 7}, 1) == {Phase.L1: 4}
+
+    median = registry.create_balancer(
+        BalancerAlgorithm.MEDIAN,
+        {Phase.L1: 25},
+        BalancerSettings(options={"hysteresis_period": 60}),
+    )
+    assert isinstance(median, DefaultLoadBalancer)
+    assert median.hysteresis_period == 60
+
+
+def test_unregistered_algorithm_raises():
+    with patch.dict(registry._BALANCERS, clear=True), pytest.raises(ValueError):
+        registry.get_balancer(BalancerAlgorithm.OPTIMISED)
+
+
+def test_register_balancer_replaces_the_algorithm():
+    with patch.dict(registry._BALANCERS):
+        registry.register_balancer(BalancerAlgorithm.OPTIMISED, DefaultLoadBalancer)
+        balancer = registry.create_balancer(
+            BalancerAlgorithm.OPTIMISED, {Phase.L1: 25}, BalancerSettings()
+        )
+    assert isinstance(balancer, DefaultLoadBalancer)
@@ -0,0 +1,77 @@
+"""Tests for the thermal model of a circuit breaker."""
+
+import pytest
+
+from custom_components.evse_load_balancer.balancers.thermal_model import (
+    MAGNETIC_TIME,
+    NON_TRIPPING_CURRENT,
+    NON_TRIPPING_TIME,
+    TRIPPING_TEST_CURRENT,
+    TRIPPING_TEST_TIME,
+    ThermalBreakerModel,
+    shortest_tripping_time,
+)
+from custom_components.evse_load_balancer.const import BreakerCurve
+
+
+@pytest.mark.parametrize("curve", list(BreakerCurve))
+def test_curve_passes_through_conventional_test_points(curve):
+    assert shortest_tripping_time(NON_TRIPPING_CURRENT, curve) == pytest.approx(
+        NON_TRIPPING_TIME
+    )
+    assert shortest_tripping_time(TRIPPING_TEST_CURRENT, curve) == pytest.approx(
+        TRIPPING_TEST_TIME
+    )
+
+
+def test_magnetic_release_depends_on_curve():
+    assert shortest_tripping_time(4, BreakerCurve.B) == MAGNETIC_TIME
+    assert shortest_tripping_time(4, BreakerCurve.C) > MAGNETIC_TIME
+    assert ThermalBreakerModel(BreakerCurve.C).is_instantaneous(5)
+    assert not ThermalBreakerModel(BreakerCurve.D).is_instantaneous(9.9)
+
+
+@pytest.mark.parametrize("curve", list(BreakerCurve))
+def test_table_never_underestimates_heating(curve):
+    model = ThermalBreakerModel(curve)
+    current = 1.005
+    # Above the magnetic current the limit is reduced right away
+    while not model.is_instantaneous(current):
+        exact = 1 / shortest_tripping_time(current, curve)
+        assert model.heating_rate(current) >= exact * (1 - 1e-9)
+        assert model.heating_rate(current) <= exact * 1.15 or current > 2.5
+        current += 0.0137
+
+
+def test_load_reaches_one_at_the_shortest_tripping_time():
+    model = ThermalBreakerModel(BreakerCurve.C)
+    trip_time = shortest_tripping_time(2.0, BreakerCurve.C)
+    steps = 100
+    for _ in range(steps):
+        model.update(2.0, trip_time / steps)
+    assert model.load == pytest.approx(1.0, rel=0.01)
+
+    model.update(2.0, trip_time)
+    assert model.load == 1.0
+
+
+def test_cooling():
+    model = ThermalBreakerModel(cooling_time_constant=60)
+    model.load = 0.5
+    model.update(0.8, 60)
+    assert model.load == pytest.approx(0.5 / 2.718281828, rel=1e-6)
+
+    model.cool(3600)
+    assert model.load == 0.0
+
+
+def test_rated_current_does_not_heat():
+    model = ThermalBreakerModel()
+    assert model.heating_rate(1.0) == 0.0
+    model.update(1.0, 3600)
+    assert model.load == 0.0
+
+
+def test_invalid_cooling_time_constant():
+    with pytest.raises(ValueError):
+        ThermalBreakerModel(cooling_time_constant=0)
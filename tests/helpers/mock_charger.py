@@ -14,13 +14,15 @@ class MockCharger(Charger):
                  max_current: int = 16,
                  synced_phases: bool = True,
                  charger_id: str = "mock_id",
-                 device_id: str = "mock_device_id") -> None:
+                 device_id: str | None = None) -> None:
         """Initialize MockCharger with configurable parameters."""
         # Skip the parent class initialization to avoid needing HomeAssistant, etc.
         # This is safe for testing but wouldn't work in production
         self.hass = None
         self.config_entry = type('ConfigEntry', (), {'entry_id': charger_id})()
-        self.device = type('DeviceEntry', (), {'id': device_id})()
+        self.device = type('DeviceEntry', (), {
+            'id': device_id or charger_id, 'name': charger_id, 'name_by_user': None
+        })()
 
         # Charger state
         self._current_limit = {phase: initial_current for phase in Phase}
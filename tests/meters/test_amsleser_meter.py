@@ -2,6 +2,7 @@
 
 from unittest.mock import MagicMock
 import pytest
+from homeassistant.core import State
 from homeassistant.helpers.device_registry import DeviceEntry
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -134,6 +135,7 @@ def test_get_tracking_entities(amsleser_meter):
             self.entity_id = entity_id
             self.unique_id = f"amsleser_{key}"
             self.key = key
+            self.translation_key = None
     amsleser_meter.entities = [
         Entity("sensor.P1", "P1"),
         Entity("sensor.U1", "U1"),
@@ -164,3 +166,49 @@ def test_get_entity_state_for_phase_sensor(amsleser_meter):
     assert result == 10
 
 
+
+
+def test_read_snapshot(amsleser_meter):
+    states = {
+        "sensor.p1": State("sensor.p1", "2300"),
+        "sensor.u1": State("sensor.u1", "230"),
+        "sensor.i1": State("sensor.i1", "9.6"),
+        # Current derived from consumption and voltage
+        "sensor.p2": State("sensor.p2", "2300"),
+        "sensor.u2": State("sensor.u2", "230"),
+        # Consumption derived from current and voltage
+        "sensor.u3": State("sensor.u3", "230"),
+        "sensor.i3": State("sensor.i3", "unavailable"),
+    }
+    amsleser_meter._get_entity_id_by_key = MagicMock(
+        side_effect=lambda key: f"sensor.{key.lower()}"
+    )
+    amsleser_meter.hass.states.get.side_effect = states.get
+
+    snapshot = amsleser_meter.read_snapshot()
+
+    assert snapshot.phases[Phase.L1].current == 9
+    assert snapshot.phases[Phase.L1].power == 2.3
+    assert snapshot.phases[Phase.L2].current == 10
+    assert snapshot.phases[Phase.L3].current is None
+    assert snapshot.phases[Phase.L3].power is None
+    assert snapshot.phases[Phase.L3].updated_at == states["sensor.u3"].last_reported
+    assert snapshot.missing_phases == (Phase.L3,)
+
+
+def test_read_snapshot_zero_current(amsleser_meter):
+    states = {
+        "sensor.p1": State("sensor.p1", "0"),
+        "sensor.u1": State("sensor.u1", "230"),
+        "sensor.i1": State("sensor.i1", "0"),
+    }
+    amsleser_meter._get_entity_id_by_key = MagicMock(
+        side_effect=lambda key: f"sensor.{key.lower()}"
+    )
+    amsleser_meter.hass.states.get.side_effect = states.get
+
+    snapshot = amsleser_meter.read_snapshot([Phase.L1])
+
+    assert snapshot.phases[Phase.L1].current == 0
+    assert snapshot.phases[Phase.L1].power == 0
+    assert snapshot.missing_phases == ()
@@ -0,0 +1,225 @@
+"""Tests for the HomeWizard API Meter implementation."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from aiohttp import web
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.evse_load_balancer.meters import meter_factory
+from custom_components.evse_load_balancer.meters.homewizard_api_meter import (
+    HomeWizardApiMeter,
+)
+from custom_components.evse_load_balancer.meters.meter import Phase
+
+V1_MEASUREMENT = {
+    "active_power_w": 3226,
+    "active_power_l1_w": 2301,
+    "active_power_l2_w": 925,
+    "active_power_l3_w": -229,
+    "active_voltage_l1_v": 230.1,
+    "active_voltage_l2_v": 231.4,
+    "active_voltage_l3_v": 229.0,
+}
+
+V2_MEASUREMENT = {
+    "power_w": 3226,
+    "power_l1_w": 2301,
+    "power_l2_w": 925,
+    "power_l3_w": -229,
+    "voltage_l1_v": 230.1,
+    "voltage_l2_v": 231.4,
+    "voltage_l3_v": 229.0,
+}
+
+
+@pytest.fixture
+def config_entry(hass):
+    config_entry = MockConfigEntry(domain="evse_load_balancer")
+    config_entry.add_to_hass(hass)
+    return config_entry
+
+
+def test_read_snapshot_from_measurement():
+    meter = HomeWizardApiMeter(MagicMock(), MagicMock(), "192.168.1.20")
+    assert meter.read_snapshot().missing_phases == (Phase.L1, Phase.L2, Phase.L3)
+
+    meter._measurement = V1_MEASUREMENT
+    snapshot = meter.read_snapshot()
+
+    assert snapshot.current(Phase.L1) == 10  # floor(2301 / 230.1)
+    assert snapshot.current(Phase.L2) == 3  # floor(925 / 231.4)
+    assert snapshot.current(Phase.L3) == -1  # floor(-229 / 229.0)
+    assert snapshot.phases[Phase.L1].power == 2.301
+    assert meter.get_tracking_entities() == []
+
+
+@pytest.mark.parametrize(("token", "verify_ssl"), [(None, True), ("ABCDEF", False)])
+def test_only_v2_api_skips_certificate_verification(token, verify_ssl):
+    config_entry = MagicMock()
+    config_entry.async_create_background_task.side_effect = (
+        lambda hass, coro, **_: coro.close() or MagicMock()
+    )
+    meter = HomeWizardApiMeter(MagicMock(), config_entry, "192.168.1.20", token)
+
+    with patch(
+        "custom_components.evse_load_balancer.meters.homewizard_api_meter"
+        ".async_get_clientsession"
+    ) as get_session:
+        meter.async_track_updates(lambda: None)
+
+    get_session.assert_called_once_with(meter.hass, verify_ssl=verify_ssl)
+
+
+async def test_measurements_polled_from_v1_api(
+    hass, socket_enabled, aiohttp_server, config_entry
+):
+    """Test polling a local stand-in of the v1 API."""
+    measurements = [
+        V1_MEASUREMENT,
+        {**V1_MEASUREMENT, "active_power_l1_w": 3451},
+    ]
+
+    requests = []
+
+    async def data(request):
+        requests.append(request)
+        return web.json_response(measurements[min(len(requests), 2) - 1])
+
+    app = web.Application()
+    app.router.add_get("/api/v1/data", data)
+    server = await aiohttp_server(app)
+
+    meter = HomeWizardApiMeter(hass, config_entry, f"127.0.0.1:{server.port}")
+    assert meter._v1_url == f"http://127.0.0.1:{server.port}/api/v1/data"
+
+    updates = asyncio.Queue()
+    unsub = meter.async_track_updates(
+        lambda: updates.put_nowait(meter.read_snapshot([Phase.L1]))
+    )
+    try:
+        first = await asyncio.wait_for(updates.get(), 5)
+        second = await asyncio.wait_for(updates.get(), 5)
+    finally:
+        unsub()
+
+    assert first.current(Phase.L1) == 10  # floor(2301 / 230.1)
+    assert second.current(Phase.L1) == 14  # floor(3451 / 230.1)
+    assert second.phases[Phase.L1].updated_at >= first.phases[Phase.L1].updated_at
+
+
+async def test_measurements_pushed_through_v2_websocket(
+    hass, socket_enabled, aiohttp_server, config_entry
+):
+    """Test the measurements pushed by a local stand-in of the v2 API."""
+    received = []
+    next_measurement = asyncio.Event()
+
+    async def websocket(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for message in ws:
+            data = message.json()
+            received.append(data)
+            if data["type"] == "authorization":
+                await ws.send_json({"type": "authorized", "data": None})
+            elif data["type"] == "subscribe":
+                await ws.send_json({"type": "measurement", "data": V2_MEASUREMENT})
+                await next_measurement.wait()
+                await ws.send_json(
+                    {
+                        "type": "measurement",
+                        "data": {**V2_MEASUREMENT, "power_l2_w": -1851},
+                    }
+                )
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/api/ws", websocket)
+    server = await aiohttp_server(app)
+
+    meter = HomeWizardApiMeter(hass, config_entry, "127.0.0.1", token="ABCDEF")
+    # The stand-in doesn't use TLS
+    meter._ws_url = f"ws://127.0.0.1:{server.port}/api/ws"
+
+    updates = asyncio.Queue()
+    unsub = meter.async_track_updates(
+        lambda: updates.put_nowait(meter.read_snapshot([Phase.L1, Phase.L2]))
+    )
+    try:
+        first = await asyncio.wait_for(updates.get(), 5)
+        next_measurement.set()
+        second = await asyncio.wait_for(updates.get(), 5)
+    finally:
+        unsub()
+
+    assert received == [
+        {"type": "authorization", "data": "ABCDEF"},
+        {"type": "subscribe", "data": "measurement"},
+    ]
+    assert first.current(Phase.L1) == 10  # floor(2301 / 230.1)
+    assert first.current(Phase.L2) == 3  # floor(925 / 231.4)
+    assert second.current(Phase.L2) == -8  # floor(-1851 / 231.4)
+
+
+async def test_malformed_v2_messages_are_skipped(
+    hass, socket_enabled, aiohttp_server, config_entry
+):
+    """Test the reader keeps going after messages it can't make sense of."""
+
+    async def websocket(request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for message in ws:
+            if message.json()["type"] == "authorization":
+                await ws.send_str("not json")
+                await ws.send_json(["not", "a", "message"])
+                await ws.send_json({"type": "measurement"})
+                await ws.send_json({"type": "measurement", "data": "not a dict"})
+                await ws.send_json(
+                    {
+                        "type": "measurement",
+                        "data": {**V2_MEASUREMENT, "power_l1_w": "unknown"},
+                    }
+                )
+                await ws.send_json({"type": "measurement", "data": V2_MEASUREMENT})
+        return ws
+
+    app = web.Application()
+    app.router.add_get("/api/ws", websocket)
+    server = await aiohttp_server(app)
+
+    meter = HomeWizardApiMeter(hass, config_entry, "127.0.0.1", token="ABCDEF")
+    meter._ws_url = f"ws://127.0.0.1:{server.port}/api/ws"
+
+    updates = asyncio.Queue()
+    unsub = meter.async_track_updates(
+        lambda: updates.put_nowait(meter.read_snapshot([Phase.L1]))
+    )
+    try:
+        first = await asyncio.wait_for(updates.get(), 5)
+        second = await asyncio.wait_for(updates.get(), 5)
+    finally:
+        unsub()
+
+    assert first.current(Phase.L1) is None
+    assert second.current(Phase.L1) == 10  # floor(2301 / 230.1)
+
+
+@patch("custom_components.evse_load_balancer.meters.dr.async_get")
+async def test_meter_factory_homewizard_api_meter(mock_async_get, hass):
+    homewizard_entry = MockConfigEntry(
+        domain="homewizard", data={"ip_address": "192.168.1.20", "token": "ABCDEF"}
+    )
+    homewizard_entry.add_to_hass(hass)
+    device = MagicMock()
+    device.identifiers = {("homewizard", "test_meter")}
+    device.config_entries = {homewizard_entry.entry_id}
+    mock_async_get.return_value.async_get.return_value = device
+
+    meter = await meter_factory(hass, MagicMock(), False, "device_id", local_api=True)
+
+    assert isinstance(meter, HomeWizardApiMeter)
+    assert meter._ws_url == "wss://192.168.1.20/api/ws"
+    assert meter._token == "ABCDEF"
@@ -2,6 +2,7 @@
 
 from unittest.mock import MagicMock
 import pytest
+from homeassistant.core import State
 from homeassistant.helpers.device_registry import DeviceEntry
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -94,6 +95,7 @@ def test_get_tracking_entities(homewizard_meter):
             self.entity_id = entity_id
             self.unique_id = f"homewizard_{key}"
             self.key = key
+            self.translation_key = None
     homewizard_meter.entities = [
         Entity("sensor.active_power_l1_w", "active_power_l1_w"),
         Entity("sensor.active_voltage_l1_v", "active_voltage_l1_v"),
@@ -115,3 +117,31 @@ def test_get_entity_map_for_phase_valid(homewizard_meter):
 def test_get_entity_map_for_phase_invalid(homewizard_meter):
     with pytest.raises(ValueError):
         homewizard_meter._get_entity_map_for_phase("invalid_phase")
+
+
+def test_read_snapshot(homewizard_meter):
+    states = {
+        "sensor.active_power_l1_w": State("sensor.active_power_l1_w", "2300"),
+        "sensor.active_voltage_l1_v": State("sensor.active_voltage_l1_v", "230"),
+        "sensor.active_power_l2_w": State("sensor.active_power_l2_w", "-1150"),
+        "sensor.active_voltage_l2_v": State("sensor.active_voltage_l2_v", "230"),
+    }
+    homewizard_meter._get_entity_id_by_key.side_effect = lambda key: f"sensor.{key}"
+    homewizard_meter.hass.states.get.side_effect = states.get
+
+    snapshot = homewizard_meter.read_snapshot([Phase.L1, Phase.L2, Phase.L3])
+
+    assert snapshot.phases[Phase.L1].current == 10
+    assert snapshot.phases[Phase.L1].power == 2.3
+    assert snapshot.phases[Phase.L1].voltage == 230
+    assert snapshot.phases[Phase.L2].current == -5
+    assert snapshot.phases[Phase.L2].power == -1.15
+    assert snapshot.phases[Phase.L1].updated_at == max(
+        states["sensor.active_power_l1_w"].last_reported,
+        states["sensor.active_voltage_l1_v"].last_reported,
+    )
+    assert snapshot.current(Phase.L3) is None
+    assert snapshot.missing_phases == (Phase.L3,)
+    # Every state is only read once
+    assert homewizard_meter.hass.states.get.call_count == 6
+    homewizard_meter._get_entity_state.assert_not_called()
@@ -0,0 +1,147 @@
+"""Tests for the Meter base class and its snapshots."""
+
+import dataclasses
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import State
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.evse_load_balancer import config_flow as cf
+from custom_components.evse_load_balancer.meters.custom_meter import CustomMeter
+from custom_components.evse_load_balancer.meters.meter import (
+    Meter,
+    MeterSnapshot,
+    Phase,
+    PhaseReading,
+    latest_timestamp,
+)
+
+
+class FakeMeter(Meter):
+    """Meter that only implements the per-phase current."""
+
+    def get_active_phase_current(self, phase):
+        return {Phase.L1: 10, Phase.L2: 12}.get(phase)
+
+    def get_tracking_entities(self):
+        return []
+
+
+def test_read_snapshot_falls_back_to_phase_current():
+    meter = FakeMeter(MagicMock(), MagicMock())
+
+    snapshot = meter.read_snapshot([Phase.L1, Phase.L2, Phase.L3])
+
+    assert snapshot.current(Phase.L1) == 10
+    assert snapshot.current(Phase.L2) == 12
+    assert snapshot.current(Phase.L3) is None
+    assert snapshot.missing_phases == (Phase.L3,)
+
+
+def test_snapshot_is_immutable():
+    meter = FakeMeter(MagicMock(), MagicMock())
+    snapshot = meter.read_snapshot([Phase.L1])
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        snapshot.taken_at = None
+    with pytest.raises(TypeError):
+        snapshot.phases[Phase.L2] = PhaseReading(current=1)
+    assert not hasattr(snapshot, "__dict__")
+    assert not hasattr(snapshot.phases[Phase.L1], "__dict__")
+
+
+def test_snapshot_current_of_unread_phase():
+    snapshot = MeterSnapshot(taken_at=datetime.now())
+    assert snapshot.current(Phase.L1) is None
+    assert snapshot.missing_phases == ()
+
+
+def test_latest_timestamp():
+    now = datetime.now()
+    assert latest_timestamp(now - timedelta(seconds=5), None, now) == now
+    assert latest_timestamp(None, None) is None
+
+
+def test_snapshot_ages():
+    now = datetime.now()
+    snapshot = MeterSnapshot(
+        taken_at=now,
+        phases={
+            Phase.L1: PhaseReading(current=10, updated_at=now - timedelta(seconds=2)),
+            Phase.L2: PhaseReading(current=10, updated_at=now - timedelta(seconds=7)),
+            Phase.L3: PhaseReading(current=10),
+        },
+    )
+    assert snapshot.age(Phase.L1) == 2
+    assert snapshot.age(Phase.L2) == 7
+    assert snapshot.age(Phase.L3) is None
+    assert snapshot.max_age == 7
+    assert MeterSnapshot(taken_at=now).max_age is None
+
+
+def test_custom_meter_read_snapshot():
+    hass = MagicMock()
+    states = {
+        "sensor.consumption": State("sensor.consumption", "3.45"),
+        "sensor.production": State("sensor.production", "1.15"),
+        "sensor.voltage": State("sensor.voltage", "230"),
+    }
+    hass.states.get.side_effect = states.get
+    config_entry = MockConfigEntry(
+        domain="evse_load_balancer",
+        data={
+            cf.CONF_PHASE_KEY_ONE: {
+                cf.CONF_PHASE_SENSOR_CONSUMPTION: "sensor.consumption",
+                cf.CONF_PHASE_SENSOR_PRODUCTION: "sensor.production",
+                cf.CONF_PHASE_SENSOR_VOLTAGE: "sensor.voltage",
+            },
+        },
+    )
+    meter = CustomMeter(hass, config_entry)
+
+    snapshot = meter.read_snapshot([Phase.L1, Phase.L2])
+
+    reading = snapshot.phases[Phase.L1]
+    assert reading.current == 10
+    assert reading.power == pytest.approx(2.3)
+    assert reading.production == 1.15
+    assert reading.voltage == 230
+    assert snapshot.phases[Phase.L2] == PhaseReading()
+    assert hass.states.get.call_count == 3
+
+
+def test_custom_meter_converts_units():
+    hass = MagicMock()
+    states = {
+        "sensor.consumption": State(
+            "sensor.consumption", "3450", {"unit_of_measurement": "W"}
+        ),
+        "sensor.production": State(
+            "sensor.production", "unavailable", {"unit_of_measurement": "W"}
+        ),
+        "sensor.voltage": State("sensor.voltage", "230", {"unit_of_measurement": "V"}),
+    }
+    hass.states.get.side_effect = states.get
+    config_entry = MockConfigEntry(
+        domain="evse_load_balancer",
+        data={
+            cf.CONF_PHASE_KEY_ONE: {
+                cf.CONF_PHASE_SENSOR_CONSUMPTION: "sensor.consumption",
+                cf.CONF_PHASE_SENSOR_PRODUCTION: "sensor.production",
+                cf.CONF_PHASE_SENSOR_VOLTAGE: "sensor.voltage",
+            },
+        },
+    )
+    meter = CustomMeter(hass, config_entry)
+
+    assert meter.read_snapshot([Phase.L1]).current(Phase.L1) is None
+    assert meter.invalid_readings == {"sensor.production": 1}
+
+    states["sensor.production"] = State(
+        "sensor.production", "1150", {"unit_of_measurement": "W"}
+    )
+    assert meter.read_snapshot([Phase.L1]).current(Phase.L1) == 10
+    assert meter.get_active_phase_current(Phase.L1) == 10
+    assert meter.get_active_phase_power(Phase.L1) == pytest.approx(2.3)
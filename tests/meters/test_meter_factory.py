@@ -87,3 +87,13 @@ async def test_meter_factory_device_not_found(mock_async_get, mock_hass, mock_co
     mock_async_get.return_value.async_get.return_value = None
     with pytest.raises(ValueError, match="Device with ID device_id not found in registry."):
         await meter_factory(mock_hass, mock_config_entry, False, "device_id")
+
+
+@pytest.mark.asyncio
+async def test_meter_factory_multiple_sources(mock_hass, mock_config_entry):
+    with pytest.raises(ValueError, match="only one"):
+        await meter_factory(
+            mock_hass, mock_config_entry, False, "device_id", "/dev/ttyUSB0"
+        )
+    with pytest.raises(ValueError, match="only one"):
+        await meter_factory(mock_hass, mock_config_entry, True, None, mqtt=True)
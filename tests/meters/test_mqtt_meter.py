@@ -0,0 +1,172 @@
+"""Tests for the MQTT Meter implementation."""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from homeassistant.components.mqtt.models import ReceiveMessage
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.evse_load_balancer import config_flow as cf
+from custom_components.evse_load_balancer.exceptions.validation_exception import (
+    ValidationExceptionError,
+)
+from custom_components.evse_load_balancer.meters import meter_factory
+from custom_components.evse_load_balancer.meters.meter import Phase
+from custom_components.evse_load_balancer.meters.mqtt_meter import (
+    MqttMeter,
+    parse_mqtt_source,
+)
+
+TASMOTA_TOPIC = "tele/meter/SENSOR"
+TASMOTA_PAYLOAD = {
+    "Time": "2025-06-01T12:00:00",
+    "ENERGY": {
+        "Power": [2301, 925, -229],
+        "Voltage": [230.1, 231.4, 229.0],
+    },
+}
+
+
+def _message(topic, payload):
+    if not isinstance(payload, str):
+        payload = json.dumps(payload)
+    return ReceiveMessage(topic, payload, 0, False, topic, 0.0)
+
+
+def _tasmota_config():
+    return {
+        cf.CONF_PHASE_KEY_ONE: {
+            cf.CONF_PHASE_SENSOR_CONSUMPTION: f"{TASMOTA_TOPIC}#ENERGY.Power.0",
+            cf.CONF_PHASE_SENSOR_VOLTAGE: f"{TASMOTA_TOPIC}#ENERGY.Voltage.0",
+        },
+        cf.CONF_PHASE_KEY_TWO: {
+            cf.CONF_PHASE_SENSOR_CONSUMPTION: f"{TASMOTA_TOPIC}#ENERGY.Power.1",
+            cf.CONF_PHASE_SENSOR_VOLTAGE: f"{TASMOTA_TOPIC}#ENERGY.Voltage.1",
+        },
+        cf.CONF_PHASE_KEY_THREE: {
+            cf.CONF_PHASE_SENSOR_CONSUMPTION: f"{TASMOTA_TOPIC}#ENERGY.Power.2",
+            cf.CONF_PHASE_SENSOR_VOLTAGE: f"{TASMOTA_TOPIC}#ENERGY.Voltage.2",
+        },
+    }
+
+
+def _meter(data):
+    return MqttMeter(MagicMock(), MockConfigEntry(domain="evse_load_balancer", data=data))
+
+
+def test_parse_mqtt_source():
+    assert parse_mqtt_source("meter/power") == ("meter/power", ())
+    assert parse_mqtt_source(" tele/meter/SENSOR#ENERGY.Power.0 ") == (
+        "tele/meter/SENSOR",
+        ("ENERGY", "Power", 0),
+    )
+
+
+def test_single_subscription_per_topic():
+    meter = _meter(_tasmota_config())
+    assert list(meter._topics) == [TASMOTA_TOPIC]
+    assert len(meter._topics[TASMOTA_TOPIC]) == 6
+    assert meter.get_tracking_entities() == []
+
+
+def test_read_snapshot_from_json_payload():
+    meter = _meter(_tasmota_config())
+    on_update = MagicMock()
+    handler = meter._message_handler(meter._topics[TASMOTA_TOPIC], on_update)
+    assert meter.read_snapshot().missing_phases == (Phase.L1, Phase.L2, Phase.L3)
+
+    handler(_message(TASMOTA_TOPIC, TASMOTA_PAYLOAD))
+    snapshot = meter.read_snapshot()
+
+    on_update.assert_called_once()
+    assert snapshot.current(Phase.L1) == 10  # floor(2301 / 230.1)
+    assert snapshot.current(Phase.L2) == 3  # floor(925 / 231.4)
+    assert snapshot.current(Phase.L3) == -1  # floor(-229 / 229.0)
+    assert snapshot.phases[Phase.L1].power == 2.301
+    assert snapshot.phases[Phase.L1].updated_at is not None
+
+
+def test_plain_payloads_in_kw_with_production():
+    meter = _meter(
+        {
+            cf.CONF_MQTT_POWER_UNIT: "kW",
+            cf.CONF_PHASE_KEY_ONE: {
+                cf.CONF_PHASE_SENSOR_CONSUMPTION: "meter/l1/consumption",
+                cf.CONF_PHASE_SENSOR_PRODUCTION: "meter/l1/production",
+                cf.CONF_PHASE_SENSOR_VOLTAGE: "meter/l1/voltage",
+            },
+        }
+    )
+    on_update = MagicMock()
+    for topic, payload in (
+        ("meter/l1/consumption", "0.5"),
+        ("meter/l1/voltage", "230"),
+    ):
+        meter._message_handler(meter._topics[topic], on_update)(
+            _message(topic, payload)
+        )
+    # Production was configured but not received yet
+    assert meter.read_snapshot([Phase.L1]).current(Phase.L1) is None
+
+    meter._message_handler(meter._topics["meter/l1/production"], on_update)(
+        _message("meter/l1/production", "2.8")
+    )
+
+    assert meter.read_snapshot([Phase.L1]).current(Phase.L1) == -10  # -2300 / 230
+    assert on_update.call_count == 3
+
+
+def test_invalid_payloads_keep_last_values():
+    meter = _meter(_tasmota_config())
+    handler = meter._message_handler(meter._topics[TASMOTA_TOPIC], MagicMock())
+    handler(_message(TASMOTA_TOPIC, TASMOTA_PAYLOAD))
+
+    handler(_message(TASMOTA_TOPIC, "not json"))
+    handler(_message(TASMOTA_TOPIC, {"ENERGY": {"Power": ["n/a"]}}))
+
+    assert meter.read_snapshot([Phase.L1]).current(Phase.L1) == 10
+
+
+@patch("custom_components.evse_load_balancer.meters.mqtt_meter.mqtt")
+async def test_async_track_updates_subscribes(mock_mqtt, hass):
+    mock_mqtt.async_wait_for_mqtt_client = AsyncMock(return_value=True)
+    unsubscribe_topic = MagicMock()
+    mock_mqtt.async_subscribe = AsyncMock(return_value=unsubscribe_topic)
+    config_entry = MockConfigEntry(domain="evse_load_balancer", data=_tasmota_config())
+    config_entry.add_to_hass(hass)
+    meter = MqttMeter(hass, config_entry)
+    on_update = MagicMock()
+
+    unsub = meter.async_track_updates(on_update)
+    await hass.async_block_till_done()
+
+    mock_mqtt.async_subscribe.assert_awaited_once()
+    _, topic, handler = mock_mqtt.async_subscribe.await_args.args
+    assert topic == TASMOTA_TOPIC
+    handler(_message(TASMOTA_TOPIC, TASMOTA_PAYLOAD))
+    on_update.assert_called_once()
+
+    unsub()
+    unsubscribe_topic.assert_called_once()
+
+
+async def test_meter_factory_mqtt_meter():
+    meter = await meter_factory(
+        MagicMock(),
+        MockConfigEntry(domain="evse_load_balancer", data=_tasmota_config()),
+        False,
+        None,
+        mqtt=True,
+    )
+    assert isinstance(meter, MqttMeter)
+
+
+@pytest.mark.parametrize("topic", ["tele/+/SENSOR", "#ENERGY.Power.0"])
+async def test_validate_mqtt_input_rejects_invalid_topics(hass, topic):
+    with pytest.raises(ValidationExceptionError) as ex:
+        await cf.validate_mqtt_input(
+            hass,
+            {cf.CONF_PHASE_KEY_ONE: {cf.CONF_PHASE_SENSOR_CONSUMPTION: topic}},
+        )
+    assert ex.value.key == "invalid_mqtt_topic"
@@ -0,0 +1,190 @@
+"""Tests for the DSMR P1 telegram parser and the P1 Meter."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.evse_load_balancer import config_flow as cf
+from custom_components.evse_load_balancer.meters import meter_factory
+from custom_components.evse_load_balancer.meters.meter import Phase
+from custom_components.evse_load_balancer.meters.p1_meter import P1Meter
+from custom_components.evse_load_balancer.meters.p1_telegram import (
+    P1TelegramParser,
+    crc16,
+)
+
+
+def _bitwise_crc16(data: bytes) -> int:
+    crc = 0
+    for byte in data:
+        crc ^= byte
+        for _ in range(8):
+            crc = (crc >> 1) ^ 0xA001 if crc & 1 else crc >> 1
+    return crc
+
+
+def _telegram(body: bytes, crc: bytes | None = None) -> bytes:
+    """Complete a telegram body with its end marker and CRC."""
+    content = b"/ISK5\\2M550T-1012\r\n\r\n" + body + b"!"
+    if crc is None:
+        crc = b"%04X" % _bitwise_crc16(content)
+    return content + crc + b"\r\n"
+
+
+# Recorded from a three-phase DSMR 5 meter
+TELEGRAM_BODY = (
+    b"1-3:0.2.8(50)\r\n"
+    b"0-0:1.0.0(231017120000S)\r\n"
+    b"0-0:96.1.1(4530303434303037333832323436303139)\r\n"
+    b"1-0:1.8.1(007404.435*kWh)\r\n"
+    b"1-0:1.8.2(005854.313*kWh)\r\n"
+    b"1-0:2.8.1(002069.962*kWh)\r\n"
+    b"1-0:2.8.2(004866.236*kWh)\r\n"
+    b"0-0:96.14.0(0002)\r\n"
+    b"1-0:1.7.0(03.122*kW)\r\n"
+    b"1-0:2.7.0(00.000*kW)\r\n"
+    b"0-0:96.7.21(00008)\r\n"
+    b"0-0:96.7.9(00004)\r\n"
+    b"1-0:99.97.0(1)(0-0:96.7.19)(190911154321S)(0000000394*s)\r\n"
+    b"1-0:32.32.0(00006)\r\n"
+    b"1-0:32.7.0(230.1*V)\r\n"
+    b"1-0:52.7.0(231.4*V)\r\n"
+    b"1-0:72.7.0(229.0*V)\r\n"
+    b"1-0:31.7.0(010*A)\r\n"
+    b"1-0:51.7.0(004*A)\r\n"
+    b"1-0:71.7.0(001*A)\r\n"
+    b"1-0:21.7.0(02.301*kW)\r\n"
+    b"1-0:41.7.0(00.925*kW)\r\n"
+    b"1-0:61.7.0(00.000*kW)\r\n"
+    b"1-0:22.7.0(00.000*kW)\r\n"
+    b"1-0:42.7.0(00.000*kW)\r\n"
+    b"1-0:62.7.0(00.229*kW)\r\n"
+)
+TELEGRAM = _telegram(TELEGRAM_BODY)
+
+
+def test_crc16():
+    assert crc16(b"123456789") == 0xBB3D
+    assert crc16(TELEGRAM[: TELEGRAM.index(b"!") + 1]) == int(
+        TELEGRAM[-6:-2], 16
+    )
+
+
+def test_parse_telegram():
+    telegrams = P1TelegramParser().feed(TELEGRAM)
+
+    assert len(telegrams) == 1
+    telegram = telegrams[0]
+    assert telegram.value(Phase.L1, cf.CONF_PHASE_SENSOR_CONSUMPTION) == 2.301
+    assert telegram.value(Phase.L1, cf.CONF_PHASE_SENSOR_VOLTAGE) == 230.1
+    assert telegram.value(Phase.L1, cf.CONF_PHASE_SENSOR_CURRENT) == 10
+    assert telegram.value(Phase.L3, cf.CONF_PHASE_SENSOR_PRODUCTION) == 0.229
+    # Only the per-phase values are extracted
+    assert sum(len(values) for values in telegram.values.values()) == 12
+
+
+def test_parse_telegram_in_chunks():
+    parser = P1TelegramParser()
+    stream = b"\x00noise" + TELEGRAM + TELEGRAM
+
+    telegrams = []
+    for i in range(0, len(stream), 7):
+        telegrams.extend(parser.feed(stream[i : i + 7]))
+
+    assert len(telegrams) == 2
+    assert telegrams[1].value(Phase.L2, cf.CONF_PHASE_SENSOR_CONSUMPTION) == 0.925
+
+
+def test_telegram_with_invalid_crc_is_dropped():
+    parser = P1TelegramParser()
+    assert parser.feed(_telegram(TELEGRAM_BODY, crc=b"0000")) == []
+    # The parser recovers with the next telegram
+    assert len(parser.feed(TELEGRAM)) == 1
+
+
+def test_telegram_without_crc():
+    telegrams = P1TelegramParser().feed(_telegram(TELEGRAM_BODY, crc=b""))
+    assert telegrams[0].value(Phase.L1, cf.CONF_PHASE_SENSOR_VOLTAGE) == 230.1
+
+
+def test_truncated_telegram_is_dropped():
+    parser = P1TelegramParser()
+    truncated = TELEGRAM[: len(TELEGRAM) // 2]
+    telegrams = parser.feed(truncated + TELEGRAM)
+    assert len(telegrams) == 1
+    assert telegrams[0].value(Phase.L3, cf.CONF_PHASE_SENSOR_PRODUCTION) == 0.229
+
+
+def test_read_snapshot_from_telegram():
+    meter = P1Meter(MagicMock(), MagicMock(), "localhost:2001")
+    assert meter.read_snapshot().missing_phases == (Phase.L1, Phase.L2, Phase.L3)
+
+    meter._telegram = P1TelegramParser().feed(TELEGRAM)[0]
+    snapshot = meter.read_snapshot()
+
+    assert snapshot.current(Phase.L1) == 10  # floor(2301 / 230.1)
+    assert snapshot.current(Phase.L2) == 3  # floor(925 / 231.4)
+    assert snapshot.current(Phase.L3) == -1  # floor(-229 / 229.0)
+    assert snapshot.phases[Phase.L3].production == 0.229
+    assert snapshot.phases[Phase.L1].updated_at == meter._telegram.received_at
+    assert meter.get_tracking_entities() == []
+
+
+def test_read_snapshot_without_voltage_rounds_export_down():
+    body = b"".join(
+        line + b"\r\n"
+        for line in TELEGRAM_BODY.split(b"\r\n")
+        if line and not line.endswith(b"*V)")
+    ).replace(b"1-0:71.7.0(001*A)", b"1-0:71.7.0(001.4*A)")
+    meter = P1Meter(MagicMock(), MagicMock(), "localhost:2001")
+    meter._telegram = P1TelegramParser().feed(_telegram(body))[0]
+    snapshot = meter.read_snapshot()
+
+    assert snapshot.phases[Phase.L3].voltage is None
+    assert snapshot.current(Phase.L1) == 10
+    # Rounded down, like the currents computed from the power
+    assert snapshot.current(Phase.L3) == -2  # floor(-1.4)
+
+
+async def test_meter_factory_p1_meter():
+    meter = await meter_factory(MagicMock(), MagicMock(), False, None, "/dev/ttyUSB0")
+    assert isinstance(meter, P1Meter)
+
+
+async def test_telegrams_pushed_from_tcp_socket(hass, socket_enabled):
+    """Test reading telegrams replayed by a local ser2net stand-in."""
+    next_telegram = asyncio.Event()
+
+    async def replay(reader, writer):
+        for i in range(0, len(TELEGRAM), 100):
+            writer.write(TELEGRAM[i : i + 100])
+            await writer.drain()
+        await next_telegram.wait()
+        writer.write(_telegram(TELEGRAM_BODY.replace(b"02.301", b"03.451")))
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    server = await asyncio.start_server(replay, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    config_entry = MockConfigEntry(domain="evse_load_balancer")
+    config_entry.add_to_hass(hass)
+    meter = P1Meter(hass, config_entry, f"127.0.0.1:{port}")
+
+    updates = asyncio.Queue()
+    unsub = meter.async_track_updates(
+        lambda: updates.put_nowait(meter.read_snapshot([Phase.L1]))
+    )
+    try:
+        first = await asyncio.wait_for(updates.get(), 5)
+        next_telegram.set()
+        second = await asyncio.wait_for(updates.get(), 5)
+    finally:
+        unsub()
+        server.close()
+        await server.wait_closed()
+
+    assert first.current(Phase.L1) == 10  # floor(2301 / 230.1)
+    assert second.current(Phase.L1) == 14  # floor(3451 / 230.1)
@@ -0,0 +1,48 @@
+"""Tests for the unit-aware sensor state parser."""
+
+import pytest
+from homeassistant.core import State
+
+from custom_components.evse_load_balancer.meters.sensor_parser import (
+    CURRENT_SCALES,
+    POWER_SCALES,
+    VOLTAGE_SCALES,
+    SensorParser,
+)
+
+
+def _state(value, unit=None):
+    attributes = {"unit_of_measurement": unit} if unit else {}
+    return State("sensor.test", value, attributes)
+
+
+@pytest.mark.parametrize(
+    ("scales", "value", "unit", "expected"),
+    [
+        (POWER_SCALES, "2300", "W", 2.3),
+        (POWER_SCALES, "2.3", "kW", 2.3),
+        (POWER_SCALES, "0.0023", "MW", 2.3),
+        (POWER_SCALES, "2.3", None, 2.3),
+        (VOLTAGE_SCALES, "230", "V", 230),
+        (VOLTAGE_SCALES, "0.23", "kV", 230),
+        (CURRENT_SCALES, "16000", "mA", 16),
+        (CURRENT_SCALES, "-1.5e1", "A", -15),
+    ],
+)
+def test_parse_converts_unit(scales, value, unit, expected):
+    assert SensorParser(scales).parse(_state(value, unit)) == pytest.approx(expected)
+
+
+def test_parse_follows_unit_changes():
+    parser = SensorParser(POWER_SCALES)
+    assert parser.parse(_state("2300", "W")) == pytest.approx(2.3)
+    assert parser.parse(_state("2.3", "kW")) == pytest.approx(2.3)
+    assert parser.unit == "kW"
+
+
+@pytest.mark.parametrize("value", ["unavailable", "unknown", "", "nan", "inf", "1,5"])
+def test_parse_counts_invalid_states(value):
+    parser = SensorParser(POWER_SCALES)
+    assert parser.parse(_state(value, "W")) is None
+    assert parser.parse(_state(value, "W")) is None
+    assert parser.invalid_count == 2
@@ -2,6 +2,7 @@
 
 from unittest.mock import MagicMock
 import pytest
+from homeassistant.core import State
 from homeassistant.helpers.device_registry import DeviceEntry
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
@@ -64,6 +65,7 @@ def test_get_tracking_entities(tibber_meter):
             self.entity_id = entity_id
             self.unique_id = f"tibber_{key}"
             self.key = key
+            self.translation_key = None
 
     tibber_meter.entities = [
         Entity("sensor.current_l1", "_rt_currentL1"),
@@ -120,3 +122,19 @@ def test_tibber_entity_map_keys():
     assert l3_map["current"] == "currentL3"
     assert l3_map["voltage"] == "voltagePhase3"
     assert "power" not in l3_map
+
+
+def test_read_snapshot(tibber_meter):
+    states = {
+        "sensor.currentl1": State("sensor.currentl1", "10.5"),
+        "sensor.voltagephase1": State("sensor.voltagephase1", "230"),
+    }
+    tibber_meter._get_entity_id_by_key.side_effect = lambda key: f"sensor.{key.lower()}"
+    tibber_meter.hass.states.get.side_effect = states.get
+
+    snapshot = tibber_meter.read_snapshot([Phase.L1, Phase.L2])
+
+    assert snapshot.phases[Phase.L1].current == 10
+    assert snapshot.phases[Phase.L1].power == 10.5 * 230 / 1000
+    assert snapshot.phases[Phase.L1].voltage == 230
+    assert snapshot.missing_phases == (Phase.L2,)
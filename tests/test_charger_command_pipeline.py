@@ -0,0 +1,187 @@
+"""Tests for the ChargerCommandPipeline."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from custom_components.evse_load_balancer.charger_command_pipeline import (
+    ChargerCommandPipeline,
+)
+from custom_components.evse_load_balancer.const import Phase
+from custom_components.evse_load_balancer.instrumentation import (
+    STAGE_SET_CURRENT_LIMIT,
+    CycleInstrumentation,
+)
+from .helpers.mock_charger import MockCharger
+
+
+def _limits(value: int) -> dict[Phase, int]:
+    return dict.fromkeys(Phase, value)
+
+
+@pytest.fixture
+def charger():
+    """Create a mock charger with a controllable set_current_limit."""
+    charger = MockCharger(charger_id="pipeline_charger")
+    charger.set_current_limit = AsyncMock()
+    return charger
+
+
+@pytest.fixture
+def callbacks():
+    """Create the pipeline callbacks."""
+    return MagicMock()
+
+
+@pytest.fixture
+def pipeline(hass, charger, callbacks):
+    """Create a pipeline with short timeouts."""
+    return ChargerCommandPipeline(
+        hass,
+        charger,
+        on_dispatch=callbacks.on_dispatch,
+        on_applied=callbacks.on_applied,
+        on_failed=callbacks.on_failed,
+        instrumentation=CycleInstrumentation(),
+        timeout=0.1,
+        max_retries=2,
+        retry_backoff=0.01,
+    )
+
+
+async def test_command_is_applied(hass, pipeline, charger, callbacks):
+    """Test that a command is sent and reported as applied."""
+    pipeline.submit(_limits(10), 100)
+    await hass.async_block_till_done()
+
+    charger.set_current_limit.assert_awaited_once_with(_limits(10))
+    callbacks.on_dispatch.assert_called_once()
+    applied = callbacks.on_applied.call_args[0][0]
+    assert applied.limits == _limits(10)
+    assert applied.timestamp == 100
+    callbacks.on_failed.assert_not_called()
+    assert pipeline._instrumentation.stages[STAGE_SET_CURRENT_LIMIT].count == 1
+
+
+async def test_newest_pending_command_wins(hass, pipeline, charger, callbacks):
+    """Test that commands submitted while one is in flight supersede each other."""
+    release = asyncio.Event()
+
+    async def slow_set_current_limit(_limit):
+        await release.wait()
+
+    charger.set_current_limit = AsyncMock(side_effect=slow_set_current_limit)
+
+    pipeline.submit(_limits(10), 1)
+    await asyncio.sleep(0)
+    assert pipeline.in_flight
+
+    pipeline.submit(_limits(8), 2)
+    pipeline.submit(_limits(6), 3)
+    assert pipeline.pending.limits == _limits(6)
+
+    release.set()
+    await hass.async_block_till_done()
+
+    sent = [call.args[0] for call in charger.set_current_limit.call_args_list]
+    assert sent == [_limits(10), _limits(6)]
+    assert pipeline.pending is None
+    assert not pipeline.in_flight
+
+
+async def test_failed_command_is_retried(hass, pipeline, charger, callbacks):
+    """Test that a failing command is retried before succeeding."""
+    charger.set_current_limit = AsyncMock(side_effect=[RuntimeError("cloud"), None])
+
+    pipeline.submit(_limits(10), 1)
+    await hass.async_block_till_done()
+
+    assert charger.set_current_limit.await_count == 2
+    callbacks.on_applied.assert_called_once()
+    callbacks.on_failed.assert_not_called()
+
+
+async def test_command_fails_after_max_retries(hass, pipeline, charger, callbacks):
+    """Test that a command is given up on after the configured retries."""
+    charger.set_current_limit = AsyncMock(side_effect=RuntimeError("cloud"))
+
+    pipeline.submit(_limits(10), 1)
+    await hass.async_block_till_done()
+
+    assert charger.set_current_limit.await_count == 3
+    callbacks.on_applied.assert_not_called()
+    callbacks.on_failed.assert_called_once()
+
+
+async def test_timeout_counts_as_failure(hass, pipeline, charger, callbacks):
+    """Test that a charger that doesn't respond in time fails the attempt."""
+
+    async def hanging_set_current_limit(_limit):
+        await asyncio.sleep(10)
+
+    charger.set_current_limit = AsyncMock(side_effect=hanging_set_current_limit)
+    pipeline._max_retries = 0
+
+    pipeline.submit(_limits(10), 1)
+    await hass.async_block_till_done()
+
+    callbacks.on_failed.assert_called_once()
+
+
+async def test_cancel_drops_pending_command(hass, pipeline, charger, callbacks):
+    """Test that cancelling stops the in-flight and pending commands."""
+    charger.set_current_limit = AsyncMock(side_effect=asyncio.Event().wait)
+
+    pipeline.submit(_limits(10), 1)
+    await asyncio.sleep(0)
+    pipeline.submit(_limits(8), 2)
+
+    await pipeline.async_cancel()
+
+    assert not pipeline.in_flight
+    assert pipeline.pending is None
+    assert charger.set_current_limit.await_count == 1
+
+
+async def test_cancel_before_start_makes_no_request(hass, pipeline, charger, callbacks):
+    """Test that a command cancelled before its task ran never calls the charger."""
+    # Home Assistant starts tasks eagerly, so only schedule this one
+    pipeline._hass = MagicMock()
+    pipeline._hass.async_create_task.side_effect = (
+        lambda coro, **_: hass.loop.create_task(coro)
+    )
+    pipeline.submit(_limits(10), 1)
+
+    await pipeline.async_cancel()
+
+    charger.set_current_limit.assert_not_called()
+    callbacks.on_applied.assert_not_called()
+
+
+async def test_newer_command_cuts_backoff_short(hass, charger, callbacks):
+    """Test that a decrease submitted during a retry backoff is sent right away."""
+    pipeline = ChargerCommandPipeline(
+        hass,
+        charger,
+        on_dispatch=callbacks.on_dispatch,
+        on_applied=callbacks.on_applied,
+        on_failed=callbacks.on_failed,
+        timeout=0.1,
+        max_retries=2,
+        retry_backoff=60,
+    )
+    charger.set_current_limit = AsyncMock(side_effect=[RuntimeError, None])
+
+    pipeline.submit(_limits(16), 1)
+    await asyncio.sleep(0)
+    assert pipeline.in_flight
+    pipeline.submit(_limits(6), 2)
+
+    async with asyncio.timeout(1):
+        await pipeline._task
+    await hass.async_block_till_done()
+
+    charger.set_current_limit.assert_awaited_with(_limits(6))
+    callbacks.on_failed.assert_called_once()
+    assert callbacks.on_applied.call_args[0][0].limits == _limits(6)
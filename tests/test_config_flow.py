@@ -45,7 +45,7 @@ async def test_flow_user_init_validation(hass):
         user_input={
             config_flow.CONF_PHASE_COUNT: 3,
             config_flow.CONF_FUSE_SIZE: 25,
-            config_flow.CONF_CHARGER_DEVICE: "abc-123",
+            config_flow.CONF_CHARGER_DEVICE: ["abc-123"],
             config_flow.CONF_CUSTOM_PHASE_CONFIG: True,
         },
     )
@@ -63,7 +63,7 @@ async def test_flow_user_init_with_meter_device(hass):
         user_input={
             config_flow.CONF_PHASE_COUNT: 3,
             config_flow.CONF_FUSE_SIZE: 25,
-            config_flow.CONF_CHARGER_DEVICE: "abc-123",
+            config_flow.CONF_CHARGER_DEVICE: ["abc-123"],
             config_flow.CONF_METER_DEVICE: "meter-123",
         },
     )
@@ -76,14 +76,14 @@ async def test_flow_user_init_with_meter_device(hass):
         "data": {
             config_flow.CONF_PHASE_COUNT: 3,
             config_flow.CONF_FUSE_SIZE: 25,
-            config_flow.CONF_CHARGER_DEVICE: "abc-123",
+            config_flow.CONF_CHARGER_DEVICE: ["abc-123"],
             config_flow.CONF_METER_DEVICE: "meter-123",
         },
         "description": None,
         "description_placeholders": None,
         "result": mock.ANY,
         "context": {"source": "user"},
-        "minor_version": 1,
+        "minor_version": 2,
         "options": {},
         "subentries": (),
     }
@@ -100,12 +100,30 @@ async def test_flow_user_init_data_custom_phase_step(hass):
         user_input={
             config_flow.CONF_PHASE_COUNT: 3,
             config_flow.CONF_FUSE_SIZE: 25,
-            config_flow.CONF_CHARGER_DEVICE: "abc-123",
+            config_flow.CONF_CHARGER_DEVICE: ["abc-123"],
         },
     )
     assert result["errors"] == {"base": "metering_selection_required"}
 
 
+async def test_flow_user_init_data_multiple_meter_sources(hass):
+    """Test a meter device and a P1 port can't be selected at the same time."""
+    _result = await hass.config_entries.flow.async_init(
+        const.DOMAIN, context={"source": "user"}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        _result["flow_id"],
+        user_input={
+            config_flow.CONF_PHASE_COUNT: 3,
+            config_flow.CONF_FUSE_SIZE: 25,
+            config_flow.CONF_CHARGER_DEVICE: ["abc-123"],
+            config_flow.CONF_METER_DEVICE: "meter-123",
+            config_flow.CONF_P1_PORT: "/dev/ttyUSB0",
+        },
+    )
+    assert result["errors"] == {"base": "multiple_metering_selections"}
+
+
 async def test_flow_power_init_form(hass):
     """Test the initialization of the form in the power step of the config flow."""
     result = await hass.config_entries.flow.async_init(
@@ -135,10 +153,107 @@ async def test_flow_power_step(hass):
         user_input={
             config_flow.CONF_PHASE_COUNT: 3,
             config_flow.CONF_FUSE_SIZE: 25,
-            config_flow.CONF_CHARGER_DEVICE: "abc-123",
+            config_flow.CONF_CHARGER_DEVICE: ["abc-123"],
             config_flow.CONF_CUSTOM_PHASE_CONFIG: True,
         },
     )
     assert config_flow.CONF_PHASE_KEY_ONE in result["data_schema"].schema
     assert config_flow.CONF_PHASE_KEY_TWO in result["data_schema"].schema
     assert config_flow.CONF_PHASE_KEY_THREE in result["data_schema"].schema
+
+
+async def test_flow_fuse_group_step(hass):
+    """Test that fuse groups are added to the entry data."""
+    _result = await hass.config_entries.flow.async_init(
+        const.DOMAIN, context={"source": "user"}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        _result["flow_id"],
+        user_input={
+            config_flow.CONF_PHASE_COUNT: 3,
+            config_flow.CONF_FUSE_SIZE: 50,
+            config_flow.CONF_CHARGER_DEVICE: ["abc-123", "def-456"],
+            config_flow.CONF_METER_DEVICE: "meter-123",
+            config_flow.CONF_ADD_FUSE_GROUP: True,
+        },
+    )
+    assert result["step_id"] == "fuse_group"
+
+    group = {
+        config_flow.CONF_FUSE_GROUP_NAME: "garage",
+        config_flow.CONF_FUSE_SIZE: 25,
+        config_flow.CONF_FUSE_GROUP_PARENT: "main",
+        config_flow.CONF_CHARGER_DEVICE: ["abc-123", "def-456"],
+    }
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={**group, config_flow.CONF_ADD_FUSE_GROUP: True},
+    )
+    assert result["step_id"] == "fuse_group"
+
+    # The name of a group has to be unique
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            **group,
+            config_flow.CONF_CHARGER_DEVICE: [],
+        },
+    )
+    assert result["errors"] == {"base": "duplicate_fuse_group_name"}
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            **group,
+            config_flow.CONF_FUSE_GROUP_NAME: "carport",
+            config_flow.CONF_FUSE_GROUP_PARENT: "garage",
+            config_flow.CONF_CHARGER_DEVICE: [],
+        },
+    )
+    assert result["type"] == "create_entry"
+    assert config_flow.CONF_ADD_FUSE_GROUP not in result["data"]
+    assert [
+        group[config_flow.CONF_FUSE_GROUP_NAME]
+        for group in result["data"][config_flow.CONF_FUSE_GROUPS]
+    ] == ["garage", "carport"]
+
+
+async def test_flow_mqtt_step(hass):
+    """Test that the MQTT topics are added to the entry data."""
+    _result = await hass.config_entries.flow.async_init(
+        const.DOMAIN, context={"source": "user"}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        _result["flow_id"],
+        user_input={
+            config_flow.CONF_PHASE_COUNT: 1,
+            config_flow.CONF_FUSE_SIZE: 25,
+            config_flow.CONF_CHARGER_DEVICE: ["abc-123"],
+            config_flow.CONF_MQTT_METER: True,
+        },
+    )
+    assert result["step_id"] == "mqtt"
+    assert config_flow.CONF_PHASE_KEY_ONE in result["data_schema"].schema
+    assert config_flow.CONF_PHASE_KEY_TWO not in result["data_schema"].schema
+
+    phase_config = {
+        config_flow.CONF_PHASE_SENSOR_CONSUMPTION: "tele/+/SENSOR#ENERGY.Power.0",
+        config_flow.CONF_PHASE_SENSOR_VOLTAGE: "tele/meter/SENSOR#ENERGY.Voltage.0",
+    }
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={config_flow.CONF_PHASE_KEY_ONE: phase_config},
+    )
+    assert result["errors"] == {"base": "invalid_mqtt_topic"}
+
+    phase_config[config_flow.CONF_PHASE_SENSOR_CONSUMPTION] = (
+        "tele/meter/SENSOR#ENERGY.Power.0"
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={config_flow.CONF_PHASE_KEY_ONE: phase_config},
+    )
+    assert result["type"] == "create_entry"
+    assert result["data"][config_flow.CONF_MQTT_METER] is True
+    assert result["data"][config_flow.CONF_MQTT_POWER_UNIT] == "W"
+    assert result["data"][config_flow.CONF_PHASE_KEY_ONE] == phase_config
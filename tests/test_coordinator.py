@@ -1,22 +1,60 @@
 """Tests for the EVSELoadBalancerCoordinator."""
 
+import asyncio
+import dataclasses
 from datetime import datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from homeassistant.core import State
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.evse_load_balancer.const import (
     DOMAIN,
     EVENT_ACTION_NEW_CHARGER_LIMITS,
     EVENT_ATTR_ACTION,
+    EVENT_ATTR_CHARGER_ID,
     EVENT_ATTR_NEW_LIMITS,
     EVSE_LOAD_BALANCER_COORDINATOR_EVENT,
+    BalancerAlgorithm,
+    BreakerCurve,
+    OvercurrentMode,
     Phase,
+    StalenessPolicy,
+)
+from custom_components.evse_load_balancer.balancers.default_load_balancer import (
+    DefaultLoadBalancer,
+)
+from custom_components.evse_load_balancer.balancers.forecasting_load_balancer import (
+    ForecastingLoadBalancer,
+)
+from custom_components.evse_load_balancer.balancers.ramp_controller_balancer import (
+    RampControllerLoadBalancer,
+)
+from custom_components.evse_load_balancer.balancers.optimised_load_balancer import (
+    OptimisedLoadBalancer,
 )
 from custom_components.evse_load_balancer.coordinator import (
+    DEGRADED_CHARGER_CURRENT,
     EVSELoadBalancerCoordinator,
+    EXECUTION_CYCLE_DELAY,
+    HEADROOM_MARGIN,
+    IDLE_CYCLE_DELAY,
     MIN_CHARGER_UPDATE_DELAY,
+    SAFETY_NET_CYCLE_DELAY,
+)
+from custom_components.evse_load_balancer.instrumentation import (
+    STAGE_COMPUTE_AVAILABILITY,
+    STAGE_CYCLE,
+    STAGE_GET_CURRENT_LIMIT,
+    STAGE_METER_READ,
+    STAGE_UPDATE_ALLOCATION,
+)
+from custom_components.evse_load_balancer.charger_command_pipeline import ChargerCommand
+from custom_components.evse_load_balancer.state_store import ATTR_SAVED_AT
+from custom_components.evse_load_balancer.meters.meter import (
+    MeterSnapshot,
+    PhaseReading,
 )
 from .helpers.mock_charger import MockCharger
 from custom_components.evse_load_balancer import options_flow as of
@@ -25,10 +63,22 @@ from custom_components.evse_load_balancer import config_flow as cf
 TEST_CHARGER_ID = "test_charger_id_1"
 
 
+def _run_task(coro, *_args, **_kwargs):
+    """Run a coroutine to completion on its own event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(coro)
+    finally:
+        loop.close()
+    return MagicMock(done=MagicMock(return_value=True))
+
+
 @pytest.fixture
 def mock_hass():
     """Create a mock Home Assistant instance."""
     hass = MagicMock()
+    # Run tasks, such as charger commands, to completion right away
+    hass.async_create_task = MagicMock(side_effect=_run_task)
     # Mock fire event
     hass.bus.async_fire = MagicMock()
     # Mock async_track_time_interval
@@ -59,10 +109,25 @@ def mock_config_entry_single_phase():
     )
 
 
+def _read_snapshot_from_currents(meter, phases):
+    """Build a meter snapshot from the meter's per-phase currents."""
+    return MeterSnapshot(
+        taken_at=datetime.now(),
+        phases={
+            phase: PhaseReading(current=meter.get_active_phase_current(phase))
+            for phase in phases
+        },
+    )
+
+
 @pytest.fixture
 def mock_meter():
     """Create a mock meter."""
     meter = MagicMock()
+    meter.read_snapshot.side_effect = lambda phases: _read_snapshot_from_currents(
+        meter, phases
+    )
+    meter.async_track_updates.return_value = None
 
     def get_active_phase_current(phase):
         return 14 if phase == Phase.L1 else 16
@@ -74,6 +139,10 @@ def mock_meter():
 def mock_meter_single_phase():
     """Create a mock meter for single phase testing."""
     meter = MagicMock()
+    meter.read_snapshot.side_effect = lambda phases: _read_snapshot_from_currents(
+        meter, phases
+    )
+    meter.async_track_updates.return_value = None
 
     # Mock active_phase_current - only L1 should be used
     def get_active_phase_current(phase):
@@ -174,7 +243,7 @@ def coordinator(
 ):
     """Create a coordinator with mocked dependencies."""
     with patch(
-        "custom_components.evse_load_balancer.coordinator.OptimisedLoadBalancer",
+        "custom_components.evse_load_balancer.coordinator.create_balancer",
         return_value=mock_balancer_algo,
     ), patch(
         "custom_components.evse_load_balancer.coordinator.PowerAllocator",
@@ -184,11 +253,11 @@ def coordinator(
             hass=mock_hass,
             config_entry=mock_config_entry,
             meter=mock_meter,
-            charger=mock_charger,
+            chargers=[mock_charger],
         )
 
         # Mock needed properties and methods
-        coordinator._last_charger_update_time = None
+        coordinator._last_charger_update_times.clear()
         coordinator._device = MagicMock()
         coordinator._sensors = [MagicMock(), MagicMock()]
 
@@ -206,7 +275,7 @@ def coordinator_single_phase(
 ):
     """Create a coordinator with single phase setup."""
     with patch(
-        "custom_components.evse_load_balancer.coordinator.OptimisedLoadBalancer",
+        "custom_components.evse_load_balancer.coordinator.create_balancer",
         return_value=mock_balancer_algo_single_phase,
     ), patch(
         "custom_components.evse_load_balancer.coordinator.PowerAllocator",
@@ -216,11 +285,11 @@ def coordinator_single_phase(
             hass=mock_hass,
             config_entry=mock_config_entry_single_phase,
             meter=mock_meter_single_phase,
-            charger=mock_charger_single_phase,
+            chargers=[mock_charger_single_phase],
         )
 
         # Mock needed properties and methods
-        coordinator._last_charger_update_time = None
+        coordinator._last_charger_update_times.clear()
         coordinator._device = MagicMock()
         coordinator._sensors = [MagicMock(), MagicMock()]
 
@@ -260,7 +329,7 @@ def test_charger_allocation(coordinator):
         Phase.L3: 5
     }
 
-    coordinator._charger.set_current_limit.assert_called_once_with({
+    coordinator._chargers[0].set_current_limit.assert_called_once_with({
         Phase.L1: 14,
         Phase.L2: 16,
         Phase.L3: 16,
@@ -278,7 +347,7 @@ def test_no_update_when_available_current_unknown(coordinator):
     # Verify balancer was not called
     coordinator._balancer_algo.compute_availability.assert_not_called()
     coordinator._power_allocator.update_allocation.assert_not_called()
-    coordinator._charger.set_current_limit.assert_not_called()
+    coordinator._chargers[0].set_current_limit.assert_not_called()
 
 
 def test_allocator_always_called_to_check_current_power(coordinator):
@@ -327,13 +396,13 @@ def test_no_update_when_charger_shouldnt_be_checked(coordinator):
     # Verify balancer was not called
     coordinator._balancer_algo.compute_availability.assert_not_called()
     coordinator._power_allocator.update_allocation.assert_not_called()
-    coordinator._charger.set_current_limit.assert_not_called()
+    coordinator._chargers[0].set_current_limit.assert_not_called()
 
 
 def test_no_update_too_frequent(coordinator):
     """Test that no update happens when last update was too recent."""
     # Set recent update time
-    coordinator._last_charger_update_time = int(datetime.now().timestamp()) - 10
+    coordinator._last_charger_update_times[TEST_CHARGER_ID] = int(datetime.now().timestamp()) - 10
 
     # Execute update cycle
     coordinator._execute_update_cycle(datetime.now())
@@ -343,7 +412,7 @@ def test_no_update_too_frequent(coordinator):
     assert coordinator._power_allocator.update_allocation.called
 
     # But charger should not be updated
-    coordinator._charger.set_current_limit.assert_not_called()
+    coordinator._chargers[0].set_current_limit.assert_not_called()
 
 
 def test_update_after_delay(coordinator):
@@ -361,7 +430,7 @@ def test_update_after_delay(coordinator):
     coordinator._execute_update_cycle(datetime.now())
 
     # Charger should be updated
-    coordinator._charger.set_current_limit.assert_called_once()
+    coordinator._chargers[0].set_current_limit.assert_called_once()
 
 
 def test_event_fired_on_update(coordinator):
@@ -374,6 +443,7 @@ def test_event_fired_on_update(coordinator):
         EVSE_LOAD_BALANCER_COORDINATOR_EVENT,
         {
             EVENT_ATTR_ACTION: EVENT_ACTION_NEW_CHARGER_LIMITS,
+            EVENT_ATTR_CHARGER_ID: TEST_CHARGER_ID,
             EVENT_ATTR_NEW_LIMITS: {
                 Phase.L1: 14,
                 Phase.L2: 16,
@@ -434,7 +504,7 @@ def test_charger_allocation_single_phase(coordinator_single_phase):
         Phase.L1: -2,
     }
 
-    coordinator_single_phase._charger.set_current_limit.assert_called_once_with({
+    coordinator_single_phase._chargers[0].set_current_limit.assert_called_once_with({
         Phase.L1: 14,
     })
 
@@ -450,7 +520,7 @@ def test_no_update_when_available_current_unknown_single_phase(coordinator_singl
     # Verify balancer was not called
     coordinator_single_phase._balancer_algo.compute_availability.assert_not_called()
     coordinator_single_phase._power_allocator.update_allocation.assert_not_called()
-    coordinator_single_phase._charger.set_current_limit.assert_not_called()
+    coordinator_single_phase._chargers[0].set_current_limit.assert_not_called()
 
 
 def test_allocator_always_called_to_check_current_power_single_phase(coordinator_single_phase):
@@ -495,13 +565,13 @@ def test_no_update_when_charger_shouldnt_be_checked_single_phase(coordinator_sin
     # Verify balancer was not called
     coordinator_single_phase._balancer_algo.compute_availability.assert_not_called()
     coordinator_single_phase._power_allocator.update_allocation.assert_not_called()
-    coordinator_single_phase._charger.set_current_limit.assert_not_called()
+    coordinator_single_phase._chargers[0].set_current_limit.assert_not_called()
 
 
 def test_no_update_too_frequent_single_phase(coordinator_single_phase):
     """Test that no update happens when last update was too recent in single phase setup."""
     # Set recent update time
-    coordinator_single_phase._last_charger_update_time = int(datetime.now().timestamp()) - 10  # 10 seconds ago (less than MIN_CHARGER_UPDATE_DELAY)
+    coordinator_single_phase._last_charger_update_times[TEST_CHARGER_ID] = int(datetime.now().timestamp()) - 10  # 10 seconds ago (less than MIN_CHARGER_UPDATE_DELAY)
 
     # Execute update cycle
     coordinator_single_phase._execute_update_cycle(datetime.now())
@@ -511,7 +581,7 @@ def test_no_update_too_frequent_single_phase(coordinator_single_phase):
     assert coordinator_single_phase._power_allocator.update_allocation.called
 
     # But charger should not be updated
-    coordinator_single_phase._charger.set_current_limit.assert_not_called()
+    coordinator_single_phase._chargers[0].set_current_limit.assert_not_called()
 
 
 def test_update_after_delay_single_phase(coordinator_single_phase):
@@ -520,13 +590,13 @@ def test_update_after_delay_single_phase(coordinator_single_phase):
         coordinator_single_phase.config_entry, of.OPTION_CHARGE_LIMIT_HYSTERESIS
     )
     # Set update time far enough in the past
-    coordinator_single_phase._last_charger_update_time = int(datetime.now().timestamp()) - (MIN_CHARGER_UPDATE_DELAY + 10 + (min_charge_minutes * 60))
+    coordinator_single_phase._last_charger_update_times[TEST_CHARGER_ID] = int(datetime.now().timestamp()) - (MIN_CHARGER_UPDATE_DELAY + 10 + (min_charge_minutes * 60))
 
     # Execute update cycle
     coordinator_single_phase._execute_update_cycle(datetime.now())
 
     # Charger should be updated
-    coordinator_single_phase._charger.set_current_limit.assert_called_once()
+    coordinator_single_phase._chargers[0].set_current_limit.assert_called_once()
 
 
 def test_event_fired_on_update_single_phase(coordinator_single_phase):
@@ -539,6 +609,7 @@ def test_event_fired_on_update_single_phase(coordinator_single_phase):
         EVSE_LOAD_BALANCER_COORDINATOR_EVENT,
         {
             EVENT_ATTR_ACTION: EVENT_ACTION_NEW_CHARGER_LIMITS,
+            EVENT_ATTR_CHARGER_ID: TEST_CHARGER_ID,
             EVENT_ATTR_NEW_LIMITS: {
                 Phase.L1: 14,
             },
@@ -605,7 +676,7 @@ def test_single_phase_charger_allocation_overcurrent(coordinator_single_phase):
     assert allocation_args["available_currents"] == {Phase.L1: -3}
 
     # Verify charger was updated with single phase allocation results
-    coordinator_single_phase._charger.set_current_limit.assert_called_once_with({
+    coordinator_single_phase._chargers[0].set_current_limit.assert_called_once_with({
         Phase.L1: 13,
     })
 
@@ -637,7 +708,7 @@ def test_single_phase_charger_allocation_recovery(coordinator_single_phase):
     assert allocation_args["available_currents"] == {Phase.L1: 5}
 
     # Verify charger was updated with single phase allocation results
-    coordinator_single_phase._charger.set_current_limit.assert_called_once_with({
+    coordinator_single_phase._chargers[0].set_current_limit.assert_called_once_with({
         Phase.L1: 16,
     })
 
@@ -653,7 +724,7 @@ def test_single_phase_no_update_when_meter_returns_none(coordinator_single_phase
     # Verify balancer was not called when meter returns None
     coordinator_single_phase._balancer_algo.compute_availability.assert_not_called()
     coordinator_single_phase._power_allocator.update_allocation.assert_not_called()
-    coordinator_single_phase._charger.set_current_limit.assert_not_called()
+    coordinator_single_phase._chargers[0].set_current_limit.assert_not_called()
 
 
 def test_single_phase_event_fired_on_update(coordinator_single_phase):
@@ -666,6 +737,7 @@ def test_single_phase_event_fired_on_update(coordinator_single_phase):
         EVSE_LOAD_BALANCER_COORDINATOR_EVENT,
         {
             EVENT_ATTR_ACTION: EVENT_ACTION_NEW_CHARGER_LIMITS,
+            EVENT_ATTR_CHARGER_ID: TEST_CHARGER_ID,
             EVENT_ATTR_NEW_LIMITS: {
                 Phase.L1: 14,
             },
@@ -679,8 +751,12 @@ def test_single_phase_fuse_size_calculation(coordinator_single_phase):
     # Test default fuse size
     assert coordinator_single_phase.fuse_size == 25
 
+    # Nothing has been read from the meter before the first cycle
+    assert coordinator_single_phase.get_available_current_for_phase(Phase.L1) is None
+
     # Test available current calculation for single phase
     # With meter returning 14A active current and 25A fuse size
+    coordinator_single_phase._execute_update_cycle(datetime.now())
     available_current = coordinator_single_phase.get_available_current_for_phase(Phase.L1)
     assert available_current == 11  # floor(25 - 14) = 11
 
@@ -697,7 +773,7 @@ def test_single_phase_balancer_initialization(coordinator_single_phase):
 def test_single_phase_timing_restrictions_work_correctly(coordinator_single_phase):
     """Test that single phase timing restrictions work correctly"""
     # Set recent update time to test timing restrictions
-    coordinator_single_phase._last_charger_update_time = int(datetime.now().timestamp()) - 10  # 10 seconds ago
+    coordinator_single_phase._last_charger_update_times[TEST_CHARGER_ID] = int(datetime.now().timestamp()) - 10  # 10 seconds ago
 
     # Setup allocation that would suggest an increase (timing should block this)
     coordinator_single_phase._balancer_algo.compute_availability.return_value = {Phase.L1: 3}
@@ -713,22 +789,22 @@ def test_single_phase_timing_restrictions_work_correctly(coordinator_single_phas
     assert coordinator_single_phase._power_allocator.update_allocation.called
 
     # But charger should not be updated due to timing delay for increases
-    coordinator_single_phase._charger.set_current_limit.assert_not_called()
+    coordinator_single_phase._chargers[0].set_current_limit.assert_not_called()
 
     # Test that decreases (safety) bypass timing restrictions
-    coordinator_single_phase._charger.set_current_limit.reset_mock()
+    coordinator_single_phase._chargers[0].set_current_limit.reset_mock()
     coordinator_single_phase._balancer_algo.compute_availability.return_value = {Phase.L1: -2}
     coordinator_single_phase._power_allocator.update_allocation.return_value = {
         TEST_CHARGER_ID: {Phase.L1: 10}  # Decrease for safety
     }
 
     # Set recent update time to test timing restrictions
-    coordinator_single_phase._last_charger_update_time = int(datetime.now().timestamp()) - 40  # 40 seconds ago
+    coordinator_single_phase._last_charger_update_times[TEST_CHARGER_ID] = int(datetime.now().timestamp()) - 40  # 40 seconds ago
 
     coordinator_single_phase._execute_update_cycle(datetime.now())
 
     # Charger should be updated immediately for safety (decrease)
-    coordinator_single_phase._charger.set_current_limit.assert_called_once_with({Phase.L1: 10})
+    coordinator_single_phase._chargers[0].set_current_limit.assert_called_once_with({Phase.L1: 10})
 
 
 def test_single_phase_allocator_always_called(coordinator_single_phase):
@@ -769,7 +845,7 @@ def test_single_phase_allocator_always_called(coordinator_single_phase):
 def test_single_phase_charger_timing_restrictions(coordinator_single_phase):
     """Test that charger timing restrictions work correctly for single phase."""
     # Set recent update time
-    coordinator_single_phase._last_charger_update_time = int(datetime.now().timestamp()) - 10
+    coordinator_single_phase._last_charger_update_times[TEST_CHARGER_ID] = int(datetime.now().timestamp()) - 10
 
     # Setup an increase scenario (should be blocked by timing)
     coordinator_single_phase._balancer_algo.compute_availability.return_value = {Phase.L1: 2}
@@ -785,7 +861,7 @@ def test_single_phase_charger_timing_restrictions(coordinator_single_phase):
     assert coordinator_single_phase._power_allocator.update_allocation.called
 
     # But charger should not be updated due to timing delay for increases
-    coordinator_single_phase._charger.set_current_limit.assert_not_called()
+    coordinator_single_phase._chargers[0].set_current_limit.assert_not_called()
 
 
 def test_single_phase_charger_update_after_delay(coordinator_single_phase):
@@ -795,17 +871,17 @@ def test_single_phase_charger_update_after_delay(coordinator_single_phase):
     )
 
     # Set update time far enough in the past
-    coordinator_single_phase._last_charger_update_time = int(datetime.now().timestamp()) - (MIN_CHARGER_UPDATE_DELAY + 10 + (min_charge_minutes * 60))
+    coordinator_single_phase._last_charger_update_times[TEST_CHARGER_ID] = int(datetime.now().timestamp()) - (MIN_CHARGER_UPDATE_DELAY + 10 + (min_charge_minutes * 60))
 
     # Execute update cycle
     coordinator_single_phase._execute_update_cycle(datetime.now())
 
     # Charger should be updated
-    coordinator_single_phase._charger.set_current_limit.assert_called_once()
+    coordinator_single_phase._chargers[0].set_current_limit.assert_called_once()
     coordinator_single_phase._execute_update_cycle(datetime.now())
 
     # Charger should be updated
-    coordinator_single_phase._charger.set_current_limit.assert_called_once()
+    coordinator_single_phase._chargers[0].set_current_limit.assert_called_once()
 
 
 def test_charger_update_timing_and_frequency_control(coordinator_single_phase):
@@ -817,10 +893,10 @@ def test_charger_update_timing_and_frequency_control(coordinator_single_phase):
     base_time = datetime.now()
 
     # Setup: Start with positive available current that should trigger an increase
-    coordinator_single_phase._charger.set_current_limits({Phase.L1: 10})
+    coordinator_single_phase._chargers[0].set_current_limits({Phase.L1: 10})
     coordinator_single_phase._balancer_algo.compute_availability.return_value = {Phase.L1: 5}
     coordinator_single_phase._power_allocator.update_allocation.return_value = {
-        coordinator_single_phase._charger.id: {Phase.L1: 12}  # Suggested increase
+        coordinator_single_phase._chargers[0].id: {Phase.L1: 12}  # Suggested increase
     }
 
     # === CYCLE 1: No previous update, should update immediately ===
@@ -828,12 +904,12 @@ def test_charger_update_timing_and_frequency_control(coordinator_single_phase):
 
     # Verify: Power allocator was called and charger was updated
     assert coordinator_single_phase._power_allocator.update_allocation.call_count == 1
-    assert coordinator_single_phase._charger.set_current_limit.call_count == 1
-    coordinator_single_phase._charger.set_current_limit.assert_called_with({Phase.L1: 12})
+    assert coordinator_single_phase._chargers[0].set_current_limit.call_count == 1
+    coordinator_single_phase._chargers[0].set_current_limit.assert_called_with({Phase.L1: 12})
 
     # Reset mocks for next cycles
     coordinator_single_phase._power_allocator.update_allocation.reset_mock()
-    coordinator_single_phase._charger.set_current_limit.reset_mock()
+    coordinator_single_phase._chargers[0].set_current_limit.reset_mock()
 
     # === CYCLE 2: 5 seconds later, still positive current ===
     # Should NOT update due to 30-second minimum delay
@@ -841,7 +917,7 @@ def test_charger_update_timing_and_frequency_control(coordinator_single_phase):
 
     # Verify: Power allocator called (availability checked) but charger NOT updated
     assert coordinator_single_phase._power_allocator.update_allocation.call_count == 1
-    assert coordinator_single_phase._charger.set_current_limit.call_count == 0
+    assert coordinator_single_phase._chargers[0].set_current_limit.call_count == 0
 
     coordinator_single_phase._power_allocator.update_allocation.reset_mock()
 
@@ -851,7 +927,7 @@ def test_charger_update_timing_and_frequency_control(coordinator_single_phase):
 
     # Verify: Power allocator called but charger still NOT updated
     assert coordinator_single_phase._power_allocator.update_allocation.call_count == 1
-    assert coordinator_single_phase._charger.set_current_limit.call_count == 0
+    assert coordinator_single_phase._chargers[0].set_current_limit.call_count == 0
 
     coordinator_single_phase._power_allocator.update_allocation.reset_mock()
 
@@ -859,7 +935,7 @@ def test_charger_update_timing_and_frequency_control(coordinator_single_phase):
 
     # Verify: Power allocator called but charger still NOT updated (needs 15 minutes for increases)
     assert coordinator_single_phase._power_allocator.update_allocation.call_count == 1
-    assert coordinator_single_phase._charger.set_current_limit.call_count == 0
+    assert coordinator_single_phase._chargers[0].set_current_limit.call_count == 0
 
     coordinator_single_phase._power_allocator.update_allocation.reset_mock()
 
@@ -867,42 +943,42 @@ def test_charger_update_timing_and_frequency_control(coordinator_single_phase):
     # Change to negative current (overcurrent)
     coordinator_single_phase._balancer_algo.compute_availability.return_value = {Phase.L1: -3}
     coordinator_single_phase._power_allocator.update_allocation.return_value = {
-        coordinator_single_phase._charger.id: {Phase.L1: 8}  # Suggested decrease
+        coordinator_single_phase._chargers[0].id: {Phase.L1: 8}  # Suggested decrease
     }
 
     coordinator_single_phase._execute_update_cycle(base_time)
 
     # Verify: Should not update immediately if within 20 seconds device limit
     assert coordinator_single_phase._power_allocator.update_allocation.call_count == 1
-    assert coordinator_single_phase._charger.set_current_limit.call_count == 0
+    assert coordinator_single_phase._chargers[0].set_current_limit.call_count == 0
 
     coordinator_single_phase._power_allocator.update_allocation.reset_mock()
-    coordinator_single_phase._charger.set_current_limit.reset_mock()
+    coordinator_single_phase._chargers[0].set_current_limit.reset_mock()
 
     coordinator_single_phase._execute_update_cycle(base_time + timedelta(seconds=21))
 
     # Verify: Should update after 20 seconds device limit
     assert coordinator_single_phase._power_allocator.update_allocation.call_count == 1
-    assert coordinator_single_phase._charger.set_current_limit.call_count == 1
-    coordinator_single_phase._charger.set_current_limit.assert_called_with({Phase.L1: 8})
+    assert coordinator_single_phase._chargers[0].set_current_limit.call_count == 1
+    coordinator_single_phase._chargers[0].set_current_limit.assert_called_with({Phase.L1: 8})
 
     coordinator_single_phase._power_allocator.update_allocation.reset_mock()
-    coordinator_single_phase._charger.set_current_limit.reset_mock()
+    coordinator_single_phase._chargers[0].set_current_limit.reset_mock()
 
     # === CYCLE 6: After 15+ minutes, positive current should allow increase ===
 
     # Back to positive current
     coordinator_single_phase._balancer_algo.compute_availability.return_value = {Phase.L1: 4}
     coordinator_single_phase._power_allocator.update_allocation.return_value = {
-        coordinator_single_phase._charger.id: {Phase.L1: 11}  # Suggested increase
+        coordinator_single_phase._chargers[0].id: {Phase.L1: 11}  # Suggested increase
     }
 
     coordinator_single_phase._execute_update_cycle(base_time + timedelta(minutes=16))
 
     # Verify: Should now allow increase after 15-minute delay
     assert coordinator_single_phase._power_allocator.update_allocation.call_count == 1
-    assert coordinator_single_phase._charger.set_current_limit.call_count == 1
-    coordinator_single_phase._charger.set_current_limit.assert_called_with({Phase.L1: 11})
+    assert coordinator_single_phase._chargers[0].set_current_limit.call_count == 1
+    coordinator_single_phase._chargers[0].set_current_limit.assert_called_with({Phase.L1: 11})
 
 
 def test_allocator_called_every_cycle_regardless_of_availability_changes(coordinator_single_phase):
@@ -911,17 +987,17 @@ def test_allocator_called_every_cycle_regardless_of_availability_changes(coordin
     # Setup: Initial availability
     coordinator_single_phase._balancer_algo.compute_availability.return_value = {Phase.L1: 5}
     coordinator_single_phase._power_allocator.update_allocation.return_value = {
-        coordinator_single_phase._charger.id: {Phase.L1: 12}
+        coordinator_single_phase._chargers[0].id: {Phase.L1: 12}
     }
 
     # === CYCLE 1: First run, should call allocator ===
     coordinator_single_phase._execute_update_cycle(datetime.now())
 
     assert coordinator_single_phase._power_allocator.update_allocation.call_count == 1
-    assert coordinator_single_phase._charger.set_current_limit.call_count == 1
+    assert coordinator_single_phase._chargers[0].set_current_limit.call_count == 1
 
     coordinator_single_phase._power_allocator.update_allocation.reset_mock()
-    coordinator_single_phase._charger.set_current_limit.reset_mock()
+    coordinator_single_phase._chargers[0].set_current_limit.reset_mock()
 
     # === CYCLE 2: Same availability, should STILL call allocator ===
     # (We always check current power, no previous availability tracking)
@@ -931,7 +1007,7 @@ def test_allocator_called_every_cycle_regardless_of_availability_changes(coordin
     assert coordinator_single_phase._balancer_algo.compute_availability.call_count == 2
     assert coordinator_single_phase._power_allocator.update_allocation.call_count == 1
     # Charger not updated due to timing restrictions, but allocator still called
-    assert coordinator_single_phase._charger.set_current_limit.call_count == 0
+    assert coordinator_single_phase._chargers[0].set_current_limit.call_count == 0
 
     # === CYCLE 3: Different availability, should call allocator ===
     coordinator_single_phase._balancer_algo.compute_availability.return_value = {Phase.L1: 3}
@@ -954,12 +1030,12 @@ def test_overcurrent_bypasses_user_configured_timing_restrictions(coordinator_si
     """Test that overcurrent situations bypass timing restrictions for immediate action."""
 
     # Setup: Recent charger update (within all timing windows)
-    coordinator_single_phase._last_charger_update_time = int(datetime.now().timestamp()) - 35
+    coordinator_single_phase._last_charger_update_times[TEST_CHARGER_ID] = int(datetime.now().timestamp()) - 35
 
     # Setup: Overcurrent situation
     coordinator_single_phase._balancer_algo.compute_availability.return_value = {Phase.L1: -5}
     coordinator_single_phase._power_allocator.update_allocation.return_value = {
-        coordinator_single_phase._charger.id: {Phase.L1: 8}  # Emergency reduction
+        coordinator_single_phase._chargers[0].id: {Phase.L1: 8}  # Emergency reduction
     }
 
     # Execute cycle
@@ -967,27 +1043,27 @@ def test_overcurrent_bypasses_user_configured_timing_restrictions(coordinator_si
 
     # Verify: Despite recent update, charger should be updated immediately for safety
     assert coordinator_single_phase._power_allocator.update_allocation.call_count == 1
-    assert coordinator_single_phase._charger.set_current_limit.call_count == 1
-    coordinator_single_phase._charger.set_current_limit.assert_called_with({Phase.L1: 8})
+    assert coordinator_single_phase._chargers[0].set_current_limit.call_count == 1
+    coordinator_single_phase._chargers[0].set_current_limit.assert_called_with({Phase.L1: 8})
 
 
 def test_overcurrent_does_not_bypass_fixed_timing_restrictions(coordinator_single_phase):
     """Test that overcurrent situations don't bypass default 20 seconds timing restriction."""
 
     # Setup: Recent charger update (within all timing windows)
-    coordinator_single_phase._last_charger_update_time = int(datetime.now().timestamp()) - 1
+    coordinator_single_phase._last_charger_update_times[TEST_CHARGER_ID] = int(datetime.now().timestamp()) - 1
 
     # Setup: Overcurrent situation
     coordinator_single_phase._balancer_algo.compute_availability.return_value = {Phase.L1: -5}
     coordinator_single_phase._power_allocator.update_allocation.return_value = {
-        coordinator_single_phase._charger.id: {Phase.L1: 8}  # Emergency reduction
+        coordinator_single_phase._chargers[0].id: {Phase.L1: 8}  # Emergency reduction
     }
 
     # Execute cycle
     coordinator_single_phase._execute_update_cycle(datetime.now())
 
     assert coordinator_single_phase._power_allocator.update_allocation.call_count == 1
-    assert coordinator_single_phase._charger.set_current_limit.call_count == 0
+    assert coordinator_single_phase._chargers[0].set_current_limit.call_count == 0
 
 
 def test_timing_prevents_rapid_increases_but_allows_decreases(coordinator_single_phase):
@@ -996,34 +1072,770 @@ def test_timing_prevents_rapid_increases_but_allows_decreases(coordinator_single
     base_time = int(datetime.now().timestamp())
 
     # Setup: Recent charger update
-    coordinator_single_phase._last_charger_update_time = base_time - 10
+    coordinator_single_phase._last_charger_update_times[TEST_CHARGER_ID] = base_time - 10
 
     # === Test 1: Positive current (increase) should be blocked ===
     coordinator_single_phase._balancer_algo.compute_availability.return_value = {Phase.L1: 3}
     coordinator_single_phase._power_allocator.update_allocation.return_value = {
-        coordinator_single_phase._charger.id: {Phase.L1: 13}  # Increase
+        coordinator_single_phase._chargers[0].id: {Phase.L1: 13}  # Increase
     }
 
     coordinator_single_phase._execute_update_cycle(datetime.now())
 
     # Verify: Allocator called but charger NOT updated (blocked by timing)
     assert coordinator_single_phase._power_allocator.update_allocation.call_count == 1
-    assert coordinator_single_phase._charger.set_current_limit.call_count == 0
+    assert coordinator_single_phase._chargers[0].set_current_limit.call_count == 0
 
     coordinator_single_phase._power_allocator.update_allocation.reset_mock()
 
     # Setup: Recent charger update
-    coordinator_single_phase._last_charger_update_time = base_time - 40
+    coordinator_single_phase._last_charger_update_times[TEST_CHARGER_ID] = base_time - 40
 
     # === Test 2: Negative current (decrease) should NOT be blocked ===
     coordinator_single_phase._balancer_algo.compute_availability.return_value = {Phase.L1: -2}
     coordinator_single_phase._power_allocator.update_allocation.return_value = {
-        coordinator_single_phase._charger.id: {Phase.L1: 7}  # Decrease
+        coordinator_single_phase._chargers[0].id: {Phase.L1: 7}  # Decrease
     }
 
     coordinator_single_phase._execute_update_cycle(datetime.now())
 
     # Verify: Both allocator and charger should be called (safety override)
     assert coordinator_single_phase._power_allocator.update_allocation.call_count == 1
-    assert coordinator_single_phase._charger.set_current_limit.call_count == 1
-    coordinator_single_phase._charger.set_current_limit.assert_called_with({Phase.L1: 7})
+    assert coordinator_single_phase._chargers[0].set_current_limit.call_count == 1
+    coordinator_single_phase._chargers[0].set_current_limit.assert_called_with({Phase.L1: 7})
+
+
+def _state_changed_event(old_value, new_value):
+    """Create a state changed event for a meter entity."""
+    event = MagicMock()
+    event.data = {
+        "entity_id": "sensor.power_l1",
+        "old_state": MagicMock(state=old_value) if old_value is not None else None,
+        "new_state": MagicMock(state=new_value) if new_value is not None else None,
+    }
+    return event
+
+
+def test_meter_state_change_schedules_cycle(coordinator):
+    """Test that a changed meter reading schedules an update cycle."""
+    coordinator._cycle_scheduler = MagicMock()
+
+    coordinator._handle_meter_state_change(_state_changed_event("1.2", "1.5"))
+
+    coordinator._cycle_scheduler.async_schedule.assert_called_once()
+
+
+def test_meter_state_change_without_new_value_is_ignored(coordinator):
+    """Test that attribute-only updates and removals don't schedule a cycle."""
+    coordinator._cycle_scheduler = MagicMock()
+
+    coordinator._handle_meter_state_change(_state_changed_event("1.2", "1.2"))
+    coordinator._handle_meter_state_change(_state_changed_event("1.2", None))
+
+    coordinator._cycle_scheduler.async_schedule.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_async_setup_tracks_meter_entities(coordinator):
+    """Test that setup subscribes to meter entities with a slow safety-net timer."""
+    coordinator._meter.get_tracking_entities.return_value = ["sensor.power_l1"]
+
+    with patch(
+        "custom_components.evse_load_balancer.coordinator.async_track_state_change_event"
+    ) as mock_track_state, patch(
+        "custom_components.evse_load_balancer.coordinator.async_track_time_interval"
+    ) as mock_track_interval:
+        await coordinator.async_setup()
+
+    mock_track_state.assert_called_once_with(
+        coordinator.hass,
+        ["sensor.power_l1"],
+        coordinator._handle_meter_state_change,
+    )
+    assert mock_track_interval.call_args[0][2] == timedelta(
+        seconds=SAFETY_NET_CYCLE_DELAY
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_setup_polls_without_tracking_entities(coordinator):
+    """Test that setup falls back to polling when there is nothing to track."""
+    coordinator._meter.get_tracking_entities.return_value = []
+
+    with patch(
+        "custom_components.evse_load_balancer.coordinator.async_track_state_change_event"
+    ) as mock_track_state, patch(
+        "custom_components.evse_load_balancer.coordinator.async_track_time_interval"
+    ) as mock_track_interval:
+        await coordinator.async_setup()
+
+    mock_track_state.assert_not_called()
+    assert mock_track_interval.call_args[0][2] == timedelta(
+        seconds=EXECUTION_CYCLE_DELAY
+    )
+
+
+@pytest.mark.asyncio
+async def test_async_setup_follows_pushing_meter(coordinator):
+    """Test that a meter pushing its readings drives the cycles."""
+    coordinator._meter.get_tracking_entities.return_value = []
+    unsub_meter_updates = MagicMock()
+    coordinator._meter.async_track_updates.return_value = unsub_meter_updates
+
+    with patch(
+        "custom_components.evse_load_balancer.coordinator.async_track_state_change_event"
+    ) as mock_track_state, patch(
+        "custom_components.evse_load_balancer.coordinator.async_track_time_interval"
+    ) as mock_track_interval:
+        await coordinator.async_setup()
+
+    mock_track_state.assert_not_called()
+    coordinator._meter.async_track_updates.assert_called_once_with(
+        coordinator._handle_meter_update
+    )
+    assert mock_track_interval.call_args[0][2] == timedelta(
+        seconds=SAFETY_NET_CYCLE_DELAY
+    )
+    assert unsub_meter_updates in coordinator._unsub
+
+
+def test_pushed_meter_update_schedules_cycle(coordinator):
+    """Test that a reading pushed by the meter schedules an update cycle."""
+    coordinator._cycle_scheduler = MagicMock()
+
+    coordinator._handle_meter_update()
+
+    coordinator._cycle_scheduler.async_schedule.assert_called_once()
+
+
+def test_update_cycle_records_stage_latencies(coordinator):
+    """Test that every stage of a full cycle is timed."""
+    coordinator._execute_update_cycle(datetime.now())
+
+    stages = coordinator.instrumentation.stages
+    for stage in [
+        STAGE_CYCLE,
+        STAGE_METER_READ,
+        STAGE_COMPUTE_AVAILABILITY,
+        STAGE_UPDATE_ALLOCATION,
+        STAGE_GET_CURRENT_LIMIT,
+    ]:
+        assert stages[stage].count == 1
+    assert coordinator.get_cycle_latency is not None
+
+
+def test_charger_update_is_submitted_to_pipeline(coordinator):
+    """Test that new limits go through the charger command pipeline."""
+    coordinator._charger_pipelines[TEST_CHARGER_ID] = MagicMock()
+    now = datetime.now()
+
+    coordinator._execute_update_cycle(now)
+
+    coordinator._charger_pipelines[TEST_CHARGER_ID].submit.assert_called_once_with(
+        {Phase.L1: 14, Phase.L2: 16, Phase.L3: 16}, now.timestamp()
+    )
+
+
+def test_dispatched_command_is_recorded_as_applied(coordinator):
+    """Test that the allocator sees dispatched limits while the charger settles."""
+    # Keep the command in flight
+    coordinator.hass.async_create_task.side_effect = lambda coro, **_: coro.close()
+    coordinator._execute_update_cycle(datetime.now())
+
+    coordinator._power_allocator.update_applied_current.assert_called_once()
+    kwargs = coordinator._power_allocator.update_applied_current.call_args[1]
+    assert kwargs["charger_id"] == TEST_CHARGER_ID
+    assert kwargs["applied_current"] == {Phase.L1: 14, Phase.L2: 16, Phase.L3: 16}
+
+
+def test_failed_command_falls_back_to_charger_limits(coordinator):
+    """Test that a failed command records the limits the charger reports."""
+    command = ChargerCommand(limits={Phase.L1: 6, Phase.L2: 6, Phase.L3: 6}, timestamp=0)
+
+    coordinator._handle_charger_command_failed(coordinator._chargers[0], command)
+
+    kwargs = coordinator._power_allocator.update_applied_current.call_args[1]
+    assert kwargs["applied_current"] == {Phase.L1: 16, Phase.L2: 16, Phase.L3: 16}
+
+
+def test_sensor_without_meaningful_change_is_not_written(coordinator):
+    """Test that sensors are only written when they report a meaningful change."""
+    unchanged, changed = MagicMock(), MagicMock()
+    unchanged.should_write_state.return_value = False
+    changed.should_write_state.return_value = True
+    coordinator._sensors = [unchanged, changed]
+
+    coordinator._execute_update_cycle(datetime.now())
+
+    unchanged.async_write_ha_state.assert_not_called()
+    changed.async_write_ha_state.assert_called_once()
+
+
+def test_cycle_delay_idle_without_charging(coordinator):
+    """Test that cycles run at the idle rate when no charger can charge."""
+    coordinator._active_cycle_delay = SAFETY_NET_CYCLE_DELAY
+    coordinator._power_allocator.should_monitor.return_value = False
+
+    assert coordinator._select_cycle_delay() == IDLE_CYCLE_DELAY
+
+
+def test_cycle_delay_keeps_polling_meter_without_updates(coordinator):
+    """Test that a meter without updates to wake up on is polled while idle."""
+    coordinator._active_cycle_delay = EXECUTION_CYCLE_DELAY
+    coordinator._power_allocator.should_monitor.return_value = False
+
+    assert coordinator._select_cycle_delay() == EXECUTION_CYCLE_DELAY
+
+
+def test_cycle_delay_fastest_with_trip_risk(coordinator):
+    """Test that accumulated trip risk switches to the fastest rate."""
+    coordinator._active_cycle_delay = SAFETY_NET_CYCLE_DELAY
+    coordinator._balancer_algo.has_trip_risk.return_value = True
+
+    assert coordinator._select_cycle_delay() == EXECUTION_CYCLE_DELAY
+
+
+def test_cycle_delay_regular_once_breaker_cooled_down(coordinator):
+    """Test that the fastest rate ends once the breaker has cooled down enough."""
+    coordinator._active_cycle_delay = SAFETY_NET_CYCLE_DELAY
+    coordinator._available_currents = dict.fromkeys(Phase, 10)
+    balancer = OptimisedLoadBalancer(max_limits=dict.fromkeys(Phase, 25))
+    coordinator._balancer_algo = balancer
+
+    balancer.compute_availability(dict.fromkeys(Phase, 10), 0)
+    balancer.compute_availability(dict.fromkeys(Phase, -25), 1)
+    balancer.compute_availability(dict.fromkeys(Phase, -25), 30)
+    assert coordinator._select_cycle_delay() == EXECUTION_CYCLE_DELAY
+
+    balancer.compute_availability(dict.fromkeys(Phase, 10), 31)
+    assert coordinator._select_cycle_delay() == EXECUTION_CYCLE_DELAY
+
+    # Long before the thermal load is completely gone
+    balancer.compute_availability(dict.fromkeys(Phase, 10), 31 + 15 * 60)
+    assert balancer.statistics()["l1"]["thermal_load"] > 0
+    assert coordinator._select_cycle_delay() == SAFETY_NET_CYCLE_DELAY
+
+
+def test_cycle_delay_fastest_with_low_headroom(coordinator):
+    """Test that a phase close to its limit switches to the fastest rate."""
+    coordinator._active_cycle_delay = SAFETY_NET_CYCLE_DELAY
+    coordinator._balancer_algo.has_trip_risk.return_value = False
+    coordinator._available_currents = {
+        Phase.L1: 10,
+        Phase.L2: HEADROOM_MARGIN - 1,
+        Phase.L3: 10,
+    }
+
+    assert coordinator._select_cycle_delay() == EXECUTION_CYCLE_DELAY
+
+
+def test_cycle_delay_regular_while_charging(coordinator):
+    """Test that a charging session with headroom uses the regular rate."""
+    coordinator._active_cycle_delay = SAFETY_NET_CYCLE_DELAY
+    coordinator._balancer_algo.has_trip_risk.return_value = False
+    coordinator._available_currents = dict.fromkeys(Phase, 10)
+
+    assert coordinator._select_cycle_delay() == SAFETY_NET_CYCLE_DELAY
+
+
+def test_cycle_timer_follows_selected_delay(coordinator):
+    """Test that the cycle timer is restarted when the selected delay changes."""
+    coordinator._active_cycle_delay = SAFETY_NET_CYCLE_DELAY
+    coordinator._balancer_algo.has_trip_risk.return_value = False
+    cancel_timer = MagicMock()
+    coordinator._cycle_delay = SAFETY_NET_CYCLE_DELAY
+    coordinator._cancel_cycle_timer = cancel_timer
+
+    with patch(
+        "custom_components.evse_load_balancer.coordinator.async_track_time_interval"
+    ) as mock_track_interval:
+        coordinator._power_allocator.should_monitor.return_value = False
+        coordinator._execute_update_cycle(datetime.now())
+
+    cancel_timer.assert_called_once()
+    assert mock_track_interval.call_args[0][2] == timedelta(seconds=IDLE_CYCLE_DELAY)
+    assert coordinator._cycle_delay == IDLE_CYCLE_DELAY
+
+
+def test_meter_state_change_ignored_while_idle(coordinator):
+    """Test that meter updates don't schedule cycles while idle."""
+    coordinator._cycle_scheduler = MagicMock()
+    coordinator._cycle_delay = IDLE_CYCLE_DELAY
+    coordinator._power_allocator.should_monitor.return_value = False
+
+    coordinator._handle_meter_state_change(_state_changed_event("1.2", "1.5"))
+
+    coordinator._cycle_scheduler.async_schedule.assert_not_called()
+
+
+def test_charger_starting_while_idle_is_balanced_right_away(coordinator, mock_charger):
+    """Test that a meter update while idle balances a charger that started."""
+    coordinator._cycle_scheduler = MagicMock()
+    # The scheduler runs the cycle at the end of its coalescing window
+    coordinator._cycle_scheduler.async_schedule.side_effect = (
+        lambda: coordinator._execute_update_cycle(datetime.now())
+    )
+    coordinator._cycle_delay = IDLE_CYCLE_DELAY
+    coordinator._cancel_cycle_timer = MagicMock()
+    coordinator._active_cycle_delay = SAFETY_NET_CYCLE_DELAY
+
+    with patch(
+        "custom_components.evse_load_balancer.coordinator.async_track_time_interval"
+    ):
+        coordinator._handle_meter_state_change(_state_changed_event("1.2", "8.5"))
+
+    mock_charger.set_current_limit.assert_called_once_with(
+        {Phase.L1: 14, Phase.L2: 16, Phase.L3: 16}
+    )
+    assert coordinator._cycle_delay != IDLE_CYCLE_DELAY
+
+
+async def test_restore_state(coordinator):
+    """Test that saved state is handed to the balancer and allocator."""
+    saved_at = datetime.now().timestamp() - 30
+    coordinator._state_store = MagicMock()
+    coordinator._state_store.async_load = AsyncMock(
+        return_value={
+            "balancer": {"l1": {"phase_limit": 5, "trip_risk": 10}},
+            "allocator": {TEST_CHARGER_ID: {}},
+            "last_charger_update_times": {TEST_CHARGER_ID: 1234, "removed": 1},
+            ATTR_SAVED_AT: saved_at,
+        }
+    )
+
+    await coordinator._async_restore_state()
+
+    state, elapsed = coordinator._balancer_algo.restore_state.call_args[0]
+    assert state == {"l1": {"phase_limit": 5, "trip_risk": 10}}
+    assert elapsed == pytest.approx(30, abs=1)
+    coordinator._power_allocator.restore_state.assert_called_once_with(
+        {TEST_CHARGER_ID: {}}
+    )
+    assert coordinator._last_charger_update_times == {TEST_CHARGER_ID: 1234}
+
+
+async def test_restore_without_state(coordinator):
+    """Test that nothing is restored when there is no (recent) state."""
+    coordinator._state_store = MagicMock()
+    coordinator._state_store.async_load = AsyncMock(return_value=None)
+
+    await coordinator._async_restore_state()
+
+    coordinator._balancer_algo.restore_state.assert_not_called()
+    coordinator._power_allocator.restore_state.assert_not_called()
+    assert coordinator._last_charger_update_times == {}
+
+
+def test_state_saved_while_charging(coordinator):
+    """Test that a save is scheduled after cycles while a charger can charge."""
+    coordinator._state_store = MagicMock()
+    coordinator._cycle_delay = SAFETY_NET_CYCLE_DELAY
+    coordinator._cancel_cycle_timer = MagicMock()
+
+    with patch(
+        "custom_components.evse_load_balancer.coordinator.async_track_time_interval"
+    ):
+        coordinator._power_allocator.should_monitor.return_value = True
+        coordinator._execute_update_cycle(datetime.now())
+        coordinator._state_store.async_schedule_save.assert_called_once()
+
+        coordinator._state_store.reset_mock()
+        coordinator._power_allocator.should_monitor.return_value = False
+        coordinator._execute_update_cycle(datetime.now())
+        coordinator._state_store.async_schedule_save.assert_not_called()
+
+
+async def test_options_update_applied_in_place(coordinator, mock_hass):
+    """Test that changed options are applied without reloading the entry."""
+    mock_hass.config_entries.async_reload = AsyncMock()
+    coordinator._cycle_scheduler = MagicMock()
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=dict(coordinator.config_entry.data),
+        options={
+            of.OPTION_MAX_FUSE_LOAD_AMPS: 20,
+            of.OPTION_ALLOW_TEMPORARY_OVERCURRENT: False,
+        },
+    )
+
+    await coordinator._handle_options_update(mock_hass, entry)
+
+    mock_hass.config_entries.async_reload.assert_not_called()
+    assert coordinator.fuse_size == 20
+    assert coordinator._fuse_tree.root.fuse_size == 20
+    coordinator._power_allocator.set_fuse_tree.assert_called_once_with(
+        coordinator._fuse_tree
+    )
+    coordinator._balancer_algo.reconfigure.assert_called_once_with(
+        max_limits=dict.fromkeys(Phase, 20),
+        overcurrent_mode=OvercurrentMode.CONSERVATIVE,
+        breaker_curve=BreakerCurve.C,
+        cooling_time_constant=300,
+    )
+    coordinator._cycle_scheduler.async_schedule.assert_called_once()
+
+
+async def test_switching_algorithm_keeps_state(coordinator, mock_hass):
+    """Test that a new balancing algorithm takes over the monitored state."""
+    coordinator._cycle_scheduler = MagicMock()
+    coordinator._power_allocator.export_state.return_value = {}
+    balancer = OptimisedLoadBalancer(max_limits=dict.fromkeys(Phase, 25))
+    balancer.compute_availability(dict.fromkeys(Phase, 5), 0)
+    balancer.compute_availability(dict.fromkeys(Phase, -10), 10)
+    coordinator._balancer_algo = balancer
+    thermal_load = balancer.export_state()["l1"]["thermal_load"]
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=dict(coordinator.config_entry.data),
+        options={of.OPTION_BALANCER_ALGORITHM: BalancerAlgorithm.FORECASTING.value},
+    )
+    await coordinator._handle_options_update(mock_hass, entry)
+
+    assert isinstance(coordinator._balancer_algo, ForecastingLoadBalancer)
+    # The minimum delay between charger updates plus the settle time
+    assert coordinator._balancer_algo.horizon == 20 + 15
+    assert coordinator._balancer_algo.export_state()["l1"]["thermal_load"] == (
+        thermal_load
+    )
+
+
+async def test_switching_to_ramp_controller(coordinator, mock_hass):
+    """Test that the ramp controller can be selected as balancing algorithm."""
+    coordinator._cycle_scheduler = MagicMock()
+    coordinator._power_allocator.export_state.return_value = {}
+    coordinator._balancer_algo = OptimisedLoadBalancer(
+        max_limits=dict.fromkeys(Phase, 25)
+    )
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=dict(coordinator.config_entry.data),
+        options={of.OPTION_BALANCER_ALGORITHM: BalancerAlgorithm.RAMP.value},
+    )
+    await coordinator._handle_options_update(mock_hass, entry)
+
+    assert isinstance(coordinator._balancer_algo, RampControllerLoadBalancer)
+
+
+async def test_changing_algorithm_options_recreates_balancers(
+    coordinator, mock_hass
+):
+    """Test that new options of the algorithm apply to the running balancers."""
+    coordinator._cycle_scheduler = MagicMock()
+    coordinator._power_allocator.export_state.return_value = {}
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=dict(coordinator.config_entry.data),
+        options={
+            of.OPTION_BALANCER_ALGORITHM: BalancerAlgorithm.MEDIAN.value,
+            of.OPTION_MEDIAN_PERIOD: 2,
+        },
+    )
+    await coordinator._handle_options_update(mock_hass, entry)
+    assert isinstance(coordinator._balancer_algo, DefaultLoadBalancer)
+    assert coordinator._balancer_algo.hysteresis_period == 120
+    balancer = coordinator._balancer_algo
+
+    await coordinator._handle_options_update(mock_hass, entry)
+    assert coordinator._balancer_algo is balancer
+
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data=dict(coordinator.config_entry.data),
+        options={
+            of.OPTION_BALANCER_ALGORITHM: BalancerAlgorithm.MEDIAN.value,
+            of.OPTION_MEDIAN_PERIOD: 3,
+        },
+    )
+    await coordinator._handle_options_update(mock_hass, entry)
+    assert coordinator._balancer_algo.hysteresis_period == 180
+
+
+def test_significant_state_ignores_small_changes(coordinator):
+    """Test that only limits and steps of the thermal load are significant."""
+    coordinator._power_allocator.export_state.return_value = {"charger": 16}
+    balancer = OptimisedLoadBalancer(max_limits=dict.fromkeys(Phase, 25))
+    coordinator._balancer_algo = balancer
+    balancer.compute_availability(dict.fromkeys(Phase, 5), 0)
+    significant = coordinator._significant_state()
+
+    # A different available current alone isn't significant
+    balancer.compute_availability(dict.fromkeys(Phase, 8), 1)
+    assert coordinator._significant_state() == significant
+
+    # Heating the breaker is
+    balancer.compute_availability(dict.fromkeys(Phase, -20), 2)
+    balancer.compute_availability(dict.fromkeys(Phase, -20), 200)
+    assert coordinator._significant_state() != significant
+
+
+async def test_data_update_reloads_entry(coordinator, mock_hass):
+    """Test that a change of the setup data reloads the entry."""
+    mock_hass.config_entries.async_reload = AsyncMock()
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={**coordinator.config_entry.data, cf.CONF_CHARGER_DEVICE: "other"},
+    )
+
+    await coordinator._handle_options_update(mock_hass, entry)
+
+    mock_hass.config_entries.async_reload.assert_called_once_with(entry.entry_id)
+    coordinator._balancer_algo.reconfigure.assert_not_called()
+
+
+def test_multiple_chargers_share_single_balancer_pass(
+    mock_hass, mock_config_entry, mock_meter, mock_balancer_algo, mock_power_allocator
+):
+    """Test that one cycle balances all chargers with per-charger timing."""
+    chargers = []
+    for charger_id in ("charger_a", "charger_b"):
+        charger = MockCharger(initial_current=16, charger_id=charger_id)
+        charger.set_can_charge(True)
+        charger.set_current_limit = MagicMock(side_effect=charger.set_current_limit)
+        chargers.append(charger)
+
+    with patch(
+        "custom_components.evse_load_balancer.coordinator.create_balancer",
+        return_value=mock_balancer_algo,
+    ), patch(
+        "custom_components.evse_load_balancer.coordinator.PowerAllocator",
+        return_value=mock_power_allocator,
+    ):
+        coordinator = EVSELoadBalancerCoordinator(
+            hass=mock_hass,
+            config_entry=mock_config_entry,
+            meter=mock_meter,
+            chargers=chargers,
+        )
+    coordinator._device = MagicMock()
+    coordinator._balancer_algo = mock_balancer_algo
+    coordinator._power_allocator = mock_power_allocator
+
+    new_limits = {Phase.L1: 14, Phase.L2: 16, Phase.L3: 16}
+    mock_power_allocator.update_allocation.return_value = {
+        "charger_a": new_limits,
+        "charger_b": new_limits,
+    }
+    # charger_b was updated too recently to change again
+    coordinator._last_charger_update_times["charger_b"] = int(
+        datetime.now().timestamp()
+    )
+
+    coordinator._execute_update_cycle(datetime.now())
+
+    mock_balancer_algo.compute_availability.assert_called_once()
+    mock_power_allocator.update_allocation.assert_called_once()
+    chargers[0].set_current_limit.assert_called_once_with(new_limits)
+    chargers[1].set_current_limit.assert_not_called()
+    assert coordinator.get_charger_last_update_time("charger_a") is not None
+    assert coordinator.get_charger_current_limit("charger_a") == 14
+    assert coordinator.get_charger_current_limit("charger_b") == 16
+
+
+@pytest.fixture
+def coordinator_with_fuse_group(mock_hass, mock_meter, mock_charger):
+    """Create a coordinator with the charger behind a 3x20A fuse group."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            cf.CONF_FUSE_SIZE: 25,
+            cf.CONF_FUSE_GROUPS: [
+                {
+                    cf.CONF_FUSE_GROUP_NAME: "garage",
+                    cf.CONF_FUSE_SIZE: 20,
+                    cf.CONF_FUSE_GROUP_PARENT: "main",
+                    cf.CONF_CHARGER_DEVICE: [TEST_CHARGER_ID],
+                }
+            ],
+        },
+    )
+    coordinator = EVSELoadBalancerCoordinator(
+        hass=mock_hass, config_entry=entry, meter=mock_meter, chargers=[mock_charger]
+    )
+    coordinator._device = MagicMock()
+    coordinator._balancer_algo = MagicMock()
+    coordinator._balancer_algo.compute_availability.return_value = dict.fromkeys(
+        Phase, 5
+    )
+    coordinator._power_allocator = MagicMock()
+    coordinator._power_allocator.update_allocation.return_value = {}
+    return coordinator
+
+
+def test_fuse_group_availability_derived_from_charger_limits(
+    coordinator_with_fuse_group,
+):
+    """Test that a group without sensors is limited by its chargers' limits."""
+    group = coordinator_with_fuse_group._fuse_tree.groups[0]
+
+    available = coordinator_with_fuse_group._get_group_available_currents(group)
+
+    # The charger is set to 16A on every phase behind a 20A group
+    assert available == dict.fromkeys(Phase, 4)
+
+
+def test_fuse_group_availability_from_current_sensors(
+    mock_hass, mock_meter, mock_charger
+):
+    """Test that a group with current sensors uses the measured currents."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            cf.CONF_FUSE_SIZE: 25,
+            cf.CONF_FUSE_GROUPS: [
+                {
+                    cf.CONF_FUSE_GROUP_NAME: "garage",
+                    cf.CONF_FUSE_SIZE: 20,
+                    cf.CONF_CHARGER_DEVICE: [TEST_CHARGER_ID],
+                    **{phase.value: f"sensor.garage_{phase.value}" for phase in Phase},
+                }
+            ],
+        },
+    )
+    coordinator = EVSELoadBalancerCoordinator(
+        hass=mock_hass, config_entry=entry, meter=mock_meter, chargers=[mock_charger]
+    )
+    group = coordinator._fuse_tree.groups[0]
+    states = {
+        "sensor.garage_l1": State("sensor.garage_l1", "12.5", {"unit_of_measurement": "A"}),
+        "sensor.garage_l2": State("sensor.garage_l2", "3000", {"unit_of_measurement": "mA"}),
+        "sensor.garage_l3": State("sensor.garage_l3", "0"),
+    }
+    mock_hass.states.get = states.get
+
+    available = coordinator._get_group_available_currents(group)
+    assert available == {Phase.L1: 7, Phase.L2: 17, Phase.L3: 20}
+
+    states["sensor.garage_l2"] = State("sensor.garage_l2", "unavailable")
+    assert coordinator._get_group_available_currents(group) is None
+    assert coordinator._group_current_parsers["sensor.garage_l2"].invalid_count == 1
+
+
+def test_fuse_group_availability_passed_to_allocator(coordinator_with_fuse_group):
+    """Test that each cycle hands the group availability to the allocator."""
+    group_balancer = MagicMock()
+    group_balancer.compute_availability.return_value = dict.fromkeys(Phase, 4)
+    coordinator_with_fuse_group._group_balancers = {"garage": group_balancer}
+    coordinator_with_fuse_group._power_allocator.should_monitor.return_value = True
+
+    coordinator_with_fuse_group._execute_update_cycle(datetime.now())
+
+    group_balancer.compute_availability.assert_called_once()
+    kwargs = coordinator_with_fuse_group._power_allocator.update_allocation.call_args[1]
+    assert kwargs["group_available_currents"] == {"garage": dict.fromkeys(Phase, 4)}
+
+
+def test_meter_read_once_per_cycle(coordinator):
+    """Test that the phase values come from a single meter snapshot per cycle."""
+    coordinator._execute_update_cycle(datetime.now())
+
+    coordinator._meter.read_snapshot.assert_called_once_with(
+        coordinator._available_phases
+    )
+    assert coordinator.meter_snapshot.current(Phase.L1) == 14
+
+    # Reading the available current, as the phase sensors do, doesn't read
+    # the meter again
+    calls = coordinator._meter.get_active_phase_current.call_count
+    assert coordinator.get_available_current_for_phase(Phase.L1) == 11
+    assert coordinator.get_available_current_for_phase(Phase.L2) == 9
+    assert coordinator._meter.get_active_phase_current.call_count == calls
+    coordinator._meter.read_snapshot.assert_called_once()
+
+
+def test_meter_history_recorded_each_cycle(coordinator):
+    """Test that the snapshot of every cycle is added to the meter history."""
+    coordinator._execute_update_cycle(datetime.now())
+    coordinator._execute_update_cycle(datetime.now())
+
+    window = coordinator.meter_history.window(Phase.L1)
+    assert len(window) == 2
+    assert list(window.currents) == [14, 14]
+
+
+def _set_meter_data_age(coordinator, seconds):
+    """Make the meter return readings of the given age."""
+    def read_snapshot(phases):
+        taken_at = datetime.now()
+        return MeterSnapshot(
+            taken_at=taken_at,
+            phases={
+                phase: PhaseReading(
+                    current=coordinator._meter.get_active_phase_current(phase),
+                    updated_at=taken_at - timedelta(seconds=seconds),
+                )
+                for phase in phases
+            },
+        )
+    coordinator._meter.read_snapshot.side_effect = read_snapshot
+
+
+def _set_staleness_policy(coordinator, policy):
+    coordinator._config = dataclasses.replace(
+        coordinator._config, staleness_budget_seconds=30, staleness_policy=policy
+    )
+
+
+def test_fresh_readings_are_balanced(coordinator):
+    """Test that readings within the staleness budget are balanced on."""
+    _set_staleness_policy(coordinator, StalenessPolicy.PAUSE)
+    _set_meter_data_age(coordinator, 5)
+
+    coordinator._execute_update_cycle(datetime.now())
+
+    assert coordinator.get_meter_data_age == pytest.approx(5)
+    coordinator._balancer_algo.compute_availability.assert_called_once()
+    coordinator._power_allocator.update_allocation.assert_called_once()
+
+
+def test_stale_readings_hold_limits(coordinator):
+    """Test that the hold policy leaves the charger limits untouched."""
+    _set_staleness_policy(coordinator, StalenessPolicy.HOLD)
+    _set_meter_data_age(coordinator, 45)
+
+    coordinator._execute_update_cycle(datetime.now())
+
+    assert coordinator.get_meter_data_age == pytest.approx(45)
+    coordinator._balancer_algo.compute_availability.assert_not_called()
+    coordinator._power_allocator.update_allocation.assert_not_called()
+    coordinator._chargers[0].set_current_limit.assert_not_called()
+
+
+def test_stale_readings_degrade_limits(coordinator):
+    """Test that the degrade policy lowers the chargers to the minimum current."""
+    _set_staleness_policy(coordinator, StalenessPolicy.DEGRADE)
+    _set_meter_data_age(coordinator, 45)
+
+    coordinator._execute_update_cycle(datetime.now())
+
+    coordinator._balancer_algo.compute_availability.assert_not_called()
+    coordinator._power_allocator.update_allocation.assert_not_called()
+    coordinator._chargers[0].set_current_limit.assert_called_once_with(
+        dict.fromkeys(Phase, DEGRADED_CHARGER_CURRENT)
+    )
+
+
+def test_stale_readings_pause_charging(coordinator):
+    """Test that the pause policy lowers the chargers to 0A."""
+    _set_staleness_policy(coordinator, StalenessPolicy.PAUSE)
+    _set_meter_data_age(coordinator, 45)
+
+    coordinator._execute_update_cycle(datetime.now())
+
+    coordinator._chargers[0].set_current_limit.assert_called_once_with(
+        dict.fromkeys(Phase, 0)
+    )
+
+
+def test_stale_readings_never_raise_limits(coordinator):
+    """Test that the fail-safe limits don't raise a charger below them."""
+    _set_staleness_policy(coordinator, StalenessPolicy.DEGRADE)
+    _set_meter_data_age(coordinator, 45)
+    coordinator._chargers[0].get_current_limit.side_effect = lambda: dict.fromkeys(
+        Phase, 4
+    )
+
+    coordinator._execute_update_cycle(datetime.now())
+
+    coordinator._chargers[0].set_current_limit.assert_not_called()
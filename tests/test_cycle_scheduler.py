@@ -0,0 +1,69 @@
+"""Tests for the CoalescingCycleScheduler."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+from custom_components.evse_load_balancer.cycle_scheduler import (
+    CoalescingCycleScheduler,
+)
+
+
+async def test_burst_runs_single_cycle(hass):
+    """Test that a burst of updates results in a single cycle."""
+    action = MagicMock()
+    scheduler = CoalescingCycleScheduler(hass, action, window=0.05, max_delay=1)
+
+    for _ in range(6):
+        scheduler.async_schedule()
+    assert scheduler.is_pending
+
+    await asyncio.sleep(0.15)
+
+    action.assert_called_once()
+    assert scheduler.last_merged_events == 6
+    assert not scheduler.is_pending
+
+
+async def test_updates_extend_window(hass):
+    """Test that updates within the window postpone the cycle."""
+    action = MagicMock()
+    scheduler = CoalescingCycleScheduler(hass, action, window=0.1, max_delay=1)
+
+    scheduler.async_schedule()
+    await asyncio.sleep(0.06)
+    scheduler.async_schedule()
+    await asyncio.sleep(0.06)
+
+    # Second update came in 0.06s ago, window hasn't settled yet
+    action.assert_not_called()
+
+    await asyncio.sleep(0.1)
+    action.assert_called_once()
+    assert scheduler.last_merged_events == 2
+
+
+async def test_max_delay_bounds_postponing(hass):
+    """Test that a continuous stream of updates can't postpone past the deadline."""
+    action = MagicMock()
+    scheduler = CoalescingCycleScheduler(hass, action, window=0.05, max_delay=0.15)
+
+    for _ in range(10):
+        scheduler.async_schedule()
+        await asyncio.sleep(0.03)
+
+    # Updates never settled for 0.05s, but the deadline forced at least one cycle
+    assert action.call_count >= 1
+    scheduler.async_cancel()
+
+
+async def test_cancel_drops_scheduled_cycle(hass):
+    """Test that cancelling prevents a scheduled cycle from running."""
+    action = MagicMock()
+    scheduler = CoalescingCycleScheduler(hass, action, window=0.05)
+
+    scheduler.async_schedule()
+    scheduler.async_cancel()
+    await asyncio.sleep(0.1)
+
+    action.assert_not_called()
+    assert not scheduler.is_pending
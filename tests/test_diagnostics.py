@@ -0,0 +1,65 @@
+"""Tests for the config entry diagnostics."""
+
+from unittest.mock import MagicMock
+
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.evse_load_balancer import config_flow as cf
+from custom_components.evse_load_balancer.const import DOMAIN
+from custom_components.evse_load_balancer.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.evse_load_balancer.instrumentation import (
+    STAGE_CYCLE,
+    CycleInstrumentation,
+)
+
+
+async def test_diagnostics_include_latency_histograms(hass):
+    """Test that the diagnostics download contains the cycle latencies."""
+    entry = MockConfigEntry(domain=DOMAIN, data={"fuse_size": 25})
+    coordinator = MagicMock()
+    coordinator.instrumentation = CycleInstrumentation()
+    coordinator.instrumentation.record(STAGE_CYCLE, 0.002)
+    coordinator.last_merged_events = 6
+    coordinator.meter.invalid_readings = {"sensor.voltage": 3}
+    coordinator.balancer_statistics = {"l1": {"average": 4.2}}
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"]["data"] == {"fuse_size": 25}
+    assert diagnostics["coordinator"]["last_merged_events"] == 6
+    assert diagnostics["meter"]["invalid_readings"] == {"sensor.voltage": 3}
+    assert diagnostics["balancer"] == {"l1": {"average": 4.2}}
+    assert diagnostics["latency"][STAGE_CYCLE]["count"] == 1
+    assert diagnostics["latency"][STAGE_CYCLE]["last"] == 2.0
+
+
+async def test_diagnostics_redact_meter_addresses(hass):
+    """Test that the P1 port and MQTT topics are left out of the download."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            "fuse_size": 25,
+            cf.CONF_P1_PORT: "192.168.1.30:8088",
+            cf.CONF_MQTT_METER: True,
+            cf.CONF_PHASE_KEY_ONE: {
+                cf.CONF_PHASE_SENSOR_CONSUMPTION: "tele/home-meter/SENSOR#Power",
+                cf.CONF_PHASE_SENSOR_VOLTAGE: "",
+            },
+        },
+    )
+    coordinator = MagicMock()
+    coordinator.instrumentation = CycleInstrumentation()
+    hass.data[DOMAIN] = {entry.entry_id: coordinator}
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    data = diagnostics["entry"]["data"]
+    assert data["fuse_size"] == 25
+    assert data[cf.CONF_P1_PORT] == "**REDACTED**"
+    assert data[cf.CONF_PHASE_KEY_ONE] == {
+        cf.CONF_PHASE_SENSOR_CONSUMPTION: "**REDACTED**",
+        cf.CONF_PHASE_SENSOR_VOLTAGE: "",
+    }
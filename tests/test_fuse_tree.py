@@ -0,0 +1,58 @@
+"""Tests for the FuseTree."""
+
+import pytest
+
+from custom_components.evse_load_balancer.fuse_tree import (
+    ROOT_NODE_ID,
+    FuseNode,
+    FuseTree,
+)
+
+ROOT = FuseNode(ROOT_NODE_ID, 50, parent_id=None)
+
+
+def test_paths_and_chargers_below():
+    """Test that paths and charger sets cover every level of the tree."""
+    tree = FuseTree(
+        ROOT,
+        [
+            FuseNode("garage", 25, charger_ids=("charger_a",)),
+            FuseNode("carport", 16, parent_id="garage", charger_ids=("charger_b",)),
+        ],
+        charger_ids=["charger_a", "charger_b", "charger_c"],
+    )
+
+    assert tree.path("charger_b") == (ROOT_NODE_ID, "garage", "carport")
+    assert tree.group_path("charger_a") == ("garage",)
+    assert tree.group_path("charger_c") == ()
+    assert tree.chargers_below(ROOT_NODE_ID) == {"charger_a", "charger_b", "charger_c"}
+    assert tree.chargers_below("garage") == {"charger_a", "charger_b"}
+    assert tree.chargers_below("carport") == {"charger_b"}
+    # Groups come before their parents
+    assert [group.node_id for group in tree.groups] == ["carport", "garage"]
+
+
+def test_unknown_charger_is_behind_main_fuse():
+    """Test that chargers outside of any group are only behind the main fuse."""
+    tree = FuseTree(ROOT)
+
+    assert tree.path("unknown") == (ROOT_NODE_ID,)
+
+
+@pytest.mark.parametrize(
+    "groups",
+    [
+        [FuseNode("garage", 25, parent_id="missing")],
+        [FuseNode("a", 25, parent_id="b"), FuseNode("b", 25, parent_id="a")],
+        [FuseNode("a", 25), FuseNode("a", 16)],
+        [
+            FuseNode("a", 25, charger_ids=("charger",)),
+            FuseNode("b", 25, charger_ids=("charger",)),
+        ],
+    ],
+    ids=["unknown_parent", "cycle", "duplicate", "charger_in_two_groups"],
+)
+def test_invalid_tree(groups):
+    """Test that invalid trees are rejected."""
+    with pytest.raises(ValueError):
+        FuseTree(ROOT, groups)
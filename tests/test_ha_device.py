@@ -0,0 +1,99 @@
+"""Tests for the HaDevice entity lookups."""
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.evse_load_balancer.ha_device import HaDevice
+
+
+@pytest.fixture
+def device(hass: HomeAssistant) -> HaDevice:
+    """Create a HaDevice for a device with a few entities."""
+    entry = MockConfigEntry(domain="test")
+    entry.add_to_hass(hass)
+    device_entry = dr.async_get(hass).async_get_or_create(
+        config_entry_id=entry.entry_id, identifiers={("test", "device")}
+    )
+    entity_registry = er.async_get(hass)
+    for unique_id, translation_key in [
+        ("serial_circuit_current_l1", "circuit_current"),
+        ("serial_current_l1", "current"),
+        ("serial_voltage", None),
+    ]:
+        entity_registry.async_get_or_create(
+            "sensor",
+            "test",
+            unique_id,
+            device_id=device_entry.id,
+            translation_key=translation_key,
+        )
+
+    ha_device = HaDevice(hass, device_entry)
+    ha_device.refresh_entities()
+    return ha_device
+
+
+async def test_lookup_by_translation_key(device: HaDevice):
+    """Test that entities are found by their translation key."""
+    assert (
+        device._get_entity_id_by_translation_key("current")
+        == "sensor.test_serial_current_l1"
+    )
+    with pytest.raises(ValueError):
+        device._get_entity_id_by_translation_key("missing")
+
+
+async def test_lookup_by_unique_id(device: HaDevice):
+    """Test that entities are found by their unique ID."""
+    assert device._get_entity_id_by_unique_id("serial_voltage") == (
+        "sensor.test_serial_voltage"
+    )
+    with pytest.raises(ValueError):
+        device._get_entity_id_by_unique_id("voltage")
+
+
+async def test_lookup_by_key(device: HaDevice):
+    """Test that entities are found by the end of their unique ID."""
+    # The first entity ending with the key wins
+    assert device._get_entity_id_by_key("current_l1") == (
+        "sensor.test_serial_circuit_current_l1"
+    )
+    assert device._get_entity_id_by_key("circuit_current_l1") == (
+        "sensor.test_serial_circuit_current_l1"
+    )
+    assert device._get_entity_id_by_key("voltage") == "sensor.test_serial_voltage"
+    with pytest.raises(ValueError):
+        # Only complete parts of the unique ID are keys
+        device._get_entity_id_by_key("rrent_l1")
+
+
+async def test_registry_updates_refresh_entities(hass: HomeAssistant, device: HaDevice):
+    """Test that entity registry changes of the device refresh the lookups."""
+    unsub = device.async_track_entity_registry_updates()
+    entity_registry = er.async_get(hass)
+
+    entity_registry.async_get_or_create(
+        "sensor",
+        "test",
+        "serial_power",
+        device_id=device.device_entry.id,
+        translation_key="power",
+    )
+    await hass.async_block_till_done()
+    assert device._get_entity_id_by_translation_key("power") == (
+        "sensor.test_serial_power"
+    )
+
+    entity_registry.async_update_entity(
+        "sensor.test_serial_power", new_entity_id="sensor.renamed_power"
+    )
+    await hass.async_block_till_done()
+    assert device._get_entity_id_by_key("power") == "sensor.renamed_power"
+
+    unsub()
+    entity_registry.async_remove("sensor.renamed_power")
+    await hass.async_block_till_done()
+    assert device._get_entity_id_by_key("power") == "sensor.renamed_power"
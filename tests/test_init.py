@@ -1,10 +1,29 @@
 """Test component setup."""
 
 from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
+from custom_components.evse_load_balancer import async_migrate_entry
+from custom_components.evse_load_balancer import config_flow as cf
 from custom_components.evse_load_balancer.const import DOMAIN
 
 
 async def test_async_setup(hass):
     """Test the component gets setup."""
     assert await async_setup_component(hass, DOMAIN, {}) is True
+
+
+async def test_migrate_single_charger_device(hass):
+    """Test that a single charger device is migrated to a list of devices."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        version=1,
+        minor_version=1,
+        data={cf.CONF_CHARGER_DEVICE: "abc-123", cf.CONF_FUSE_SIZE: 25},
+    )
+    entry.add_to_hass(hass)
+
+    assert await async_migrate_entry(hass, entry) is True
+
+    assert entry.data[cf.CONF_CHARGER_DEVICE] == ["abc-123"]
+    assert entry.minor_version == 2
@@ -0,0 +1,56 @@
+"""Tests for the cycle latency instrumentation."""
+
+from custom_components.evse_load_balancer.instrumentation import (
+    CYCLE_STAGES,
+    STAGE_CYCLE,
+    STAGE_METER_READ,
+    CycleInstrumentation,
+    LatencyHistogram,
+)
+
+
+def test_empty_histogram():
+    """Test that an empty histogram has no statistics."""
+    histogram = LatencyHistogram()
+
+    assert histogram.count == 0
+    assert histogram.mean is None
+    assert histogram.percentile(50) is None
+    assert histogram.summary()["max"] is None
+
+
+def test_histogram_records_durations():
+    """Test that recorded durations end up in the summary."""
+    histogram = LatencyHistogram()
+    for duration in [0.2, 0.3, 0.4, 4.0]:
+        histogram.record(duration)
+
+    summary = histogram.summary()
+    assert summary["count"] == 4
+    assert summary["last"] == 4.0
+    assert summary["max"] == 4.0
+    assert summary["mean"] == 1.225
+    # Median lands in the 0.25-0.5ms bucket, p95 in the 2.5-5ms bucket
+    assert summary["p50"] == 0.5
+    assert summary["p95"] == 4.0
+
+
+def test_histogram_overflow_bucket():
+    """Test that durations above the largest bucket are counted as overflow."""
+    histogram = LatencyHistogram()
+    histogram.record(45000)
+
+    data = histogram.as_dict()
+    assert data["buckets"]["overflow"] == 1
+    assert data["p50"] == 45000
+
+
+def test_cycle_instrumentation_records_seconds_as_ms():
+    """Test that stage durations are recorded in milliseconds."""
+    instrumentation = CycleInstrumentation()
+    instrumentation.record(STAGE_CYCLE, 0.0015)
+    instrumentation.record(STAGE_METER_READ, 0.0005)
+
+    assert instrumentation.last_cycle_duration == 1.5
+    assert set(instrumentation.summary()) == set(CYCLE_STAGES)
+    assert instrumentation.stages[STAGE_METER_READ].count == 1
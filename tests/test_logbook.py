@@ -0,0 +1,59 @@
+"""Tests for the logbook descriptions of the EVSE Load Balancer events."""
+
+from homeassistant.components.logbook import LOGBOOK_ENTRY_MESSAGE
+from homeassistant.core import Event
+from homeassistant.helpers import device_registry as dr
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.evse_load_balancer.const import (
+    DOMAIN,
+    EVENT_ACTION_NEW_CHARGER_LIMITS,
+    EVENT_ATTR_ACTION,
+    EVENT_ATTR_CHARGER_ID,
+    EVENT_ATTR_NEW_LIMITS,
+    EVSE_LOAD_BALANCER_COORDINATOR_EVENT,
+    Phase,
+)
+from custom_components.evse_load_balancer.logbook import async_describe_events
+
+
+def _describe(hass):
+    described = {}
+    async_describe_events(
+        hass, lambda domain, event, describe: described.setdefault(event, describe)
+    )
+    return described[EVSE_LOAD_BALANCER_COORDINATOR_EVENT]
+
+
+def _event(charger_id):
+    return Event(
+        EVSE_LOAD_BALANCER_COORDINATOR_EVENT,
+        {
+            EVENT_ATTR_CHARGER_ID: charger_id,
+            EVENT_ATTR_ACTION: EVENT_ACTION_NEW_CHARGER_LIMITS,
+            EVENT_ATTR_NEW_LIMITS: {Phase.L1: 16, Phase.L2: 10},
+        },
+    )
+
+
+async def test_describe_new_limits_names_the_charger(hass):
+    config_entry = MockConfigEntry(domain=DOMAIN)
+    config_entry.add_to_hass(hass)
+    device = dr.async_get(hass).async_get_or_create(
+        config_entry_id=config_entry.entry_id,
+        identifiers={("easee", "EH123456")},
+        name="Driveway charger",
+    )
+    describe = _describe(hass)
+
+    assert describe(_event(device.id))[LOGBOOK_ENTRY_MESSAGE] == (
+        "Driveway charger limits set to: l1: 16A, l2: 10A"
+    )
+
+
+async def test_describe_new_limits_of_unknown_charger(hass):
+    describe = _describe(hass)
+
+    assert describe(_event("abc-123"))[LOGBOOK_ENTRY_MESSAGE] == (
+        "charger abc-123 limits set to: l1: 16A, l2: 10A"
+    )
@@ -0,0 +1,114 @@
+"""Tests for the ring buffer of meter readings."""
+
+from datetime import UTC, datetime, timedelta
+from math import isnan
+from types import MappingProxyType
+
+import pytest
+
+from custom_components.evse_load_balancer.meter_history import (
+    DEFAULT_CAPACITY,
+    MISSING_CURRENT,
+    MeterHistory,
+)
+from custom_components.evse_load_balancer.meters.meter import (
+    MeterSnapshot,
+    Phase,
+    PhaseReading,
+)
+
+START = datetime(2025, 6, 1, 12, 0, tzinfo=UTC)
+
+
+def _snapshot(second, current, voltage=230.0, power=None):
+    return MeterSnapshot(
+        taken_at=START + timedelta(seconds=second),
+        phases=MappingProxyType(
+            {
+                Phase.L1: PhaseReading(current=current, voltage=voltage, power=power),
+                Phase.L2: PhaseReading(),
+            }
+        ),
+    )
+
+
+def test_record_and_window():
+    history = MeterHistory([Phase.L1, Phase.L2], capacity=10)
+    for second in range(5):
+        history.record(_snapshot(second, current=second, power=second / 10))
+
+    window = history.window(Phase.L1)
+    assert len(history) == len(window) == 5
+    assert list(window.currents) == [0, 1, 2, 3, 4]
+    assert window.powers[-1] == pytest.approx(0.4)
+    assert window.timestamps[0] == START.timestamp()
+
+    missing = history.window(Phase.L2)
+    assert list(missing.currents) == [MISSING_CURRENT] * 5
+    assert isnan(missing.voltages[0])
+    assert list(missing.valid_currents()) == []
+
+
+def test_ring_buffer_overwrites_oldest_samples():
+    history = MeterHistory([Phase.L1], capacity=4)
+    for second in range(10):
+        history.record(_snapshot(second, current=second))
+
+    assert len(history) == 4
+    assert list(history.window(Phase.L1).currents) == [6, 7, 8, 9]
+    # The window wraps around the end of the buffer
+    window = history.window(Phase.L1, seconds=2)
+    assert list(window.currents) == [7, 8, 9]
+    assert window.currents[1:] == [8, 9]
+
+
+def test_window_relative_to_now():
+    history = MeterHistory([Phase.L1], capacity=100)
+    for second in range(0, 60, 5):
+        history.record(_snapshot(second, current=second))
+
+    now = (START + timedelta(seconds=30)).timestamp()
+    assert list(history.window(Phase.L1, 10, now=now).currents) == [20, 25, 30]
+    assert len(history.window(Phase.L1, 10, now=now + 3600)) == 0
+    assert list(history.window(Phase.L1, now=now - 20).currents) == [0, 5, 10]
+
+
+def test_views_are_not_copies():
+    history = MeterHistory([Phase.L1], capacity=3)
+    history.record(_snapshot(0, current=1))
+    window = history.window(Phase.L1)
+
+    history.record(_snapshot(1, current=2))
+    history.record(_snapshot(2, current=3))
+    history.record(_snapshot(3, current=4))
+
+    assert window.currents[0] == 4
+
+
+def test_hour_of_readings_fits_in_a_few_hundred_kilobytes():
+    history = MeterHistory()
+    assert history.capacity == DEFAULT_CAPACITY == 60 * 60
+    assert history.nbytes < 150 * 1024
+
+
+def test_as_dict():
+    history = MeterHistory([Phase.L1], capacity=10)
+    assert history.as_dict()["phases"]["l1"]["current_mean"] is None
+    for second in range(4):
+        history.record(_snapshot(second, current=10 + second, voltage=230.0))
+
+    summary = history.as_dict()
+    assert summary["samples"] == 4
+    assert summary["span_seconds"] == 3
+    assert summary["phases"]["l1"] == {
+        "samples": 4,
+        "current_min": 10,
+        "current_max": 13,
+        "current_mean": 11.5,
+        "voltage_mean": 230.0,
+    }
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        MeterHistory(capacity=0)
@@ -1,8 +1,12 @@
 """Test the Simple Integration config flow."""
 
 from custom_components.evse_load_balancer.options_flow import (
+    OPTION_BALANCER_ALGORITHM,
     OPTION_MAX_FUSE_LOAD_AMPS,
     OPTION_CHARGE_LIMIT_HYSTERESIS,
+    OPTION_MEDIAN_PERIOD,
+    OPTION_RAMP_DEADBAND,
+    OPTION_RAMP_MARGIN,
     EvseLoadBalancerOptionsFlow,
 )
 from custom_components.evse_load_balancer.const import DOMAIN
@@ -112,3 +116,53 @@ async def test_options_flow_init(hass):
     assert result["errors"] == {}
     assert OPTION_CHARGE_LIMIT_HYSTERESIS in result["data_schema"].schema
     assert OPTION_MAX_FUSE_LOAD_AMPS in result["data_schema"].schema
+
+
+@pytest.mark.asyncio
+async def test_options_flow_asks_for_algorithm_options(hass):
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="unique_balancer_id",
+        data={cf.CONF_FUSE_SIZE: 25},
+        options={OPTION_MEDIAN_PERIOD: 10},
+    )
+    config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {OPTION_CHARGE_LIMIT_HYSTERESIS: 15, OPTION_BALANCER_ALGORITHM: "ramp"},
+    )
+    assert result["type"] == "form"
+    assert result["step_id"] == "algorithm"
+    assert set(result["data_schema"].schema) == {
+        OPTION_RAMP_MARGIN,
+        OPTION_RAMP_DEADBAND,
+    }
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], {OPTION_RAMP_MARGIN: 2, OPTION_RAMP_DEADBAND: 3}
+    )
+    assert result["type"] == "create_entry"
+    assert config_entry.options[OPTION_BALANCER_ALGORITHM] == "ramp"
+    assert config_entry.options[OPTION_RAMP_MARGIN] == 2
+    assert config_entry.options[OPTION_RAMP_DEADBAND] == 3
+    # The options of the other algorithms are kept
+    assert config_entry.options[OPTION_MEDIAN_PERIOD] == 10
+
+
+@pytest.mark.asyncio
+async def test_options_flow_skips_algorithm_step_without_options(hass):
+    config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        unique_id="unique_balancer_id",
+        data={cf.CONF_FUSE_SIZE: 25},
+    )
+    config_entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {OPTION_CHARGE_LIMIT_HYSTERESIS: 15, OPTION_BALANCER_ALGORITHM: "optimised"},
+    )
+    assert result["type"] == "create_entry"
@@ -3,6 +3,7 @@
 import pytest
 from custom_components.evse_load_balancer.power_allocator import ChargerState, PowerAllocator
 from custom_components.evse_load_balancer.const import Phase
+from custom_components.evse_load_balancer.fuse_tree import ROOT_NODE_ID, FuseNode, FuseTree
 from .helpers.mock_charger import MockCharger
 from datetime import datetime
 from time import time
@@ -494,3 +495,103 @@ def test_single_phase_manual_override_detection(power_allocator: PowerAllocator)
         Phase.L2: 14,
         Phase.L3: 14
     }
+
+
+def test_export_and_restore_state(power_allocator: PowerAllocator):
+    """Test that the allocation state survives a restart."""
+    mock_charger = MockCharger(initial_current=10, charger_id="charger1")
+    mock_charger.set_can_charge(True)
+    power_allocator.add_charger_and_initialize(mock_charger)
+    state = power_allocator._chargers["charger1"]
+    state.requested_current = dict.fromkeys(Phase, 16)
+    state.last_update_time = 1234
+
+    exported = power_allocator.export_state()
+    assert exported["charger1"]["requested_current"] == {"l1": 16, "l2": 16, "l3": 16}
+
+    restored = PowerAllocator()
+    restored.add_charger(mock_charger)
+    restored.restore_state(exported)
+    restored_state = restored._chargers["charger1"]
+
+    assert restored_state.initialized is True
+    assert restored_state.requested_current == dict.fromkeys(Phase, 16)
+    assert restored_state.last_applied_current == dict.fromkeys(Phase, 10)
+    assert restored_state.last_update_time == 1234
+
+    # The ongoing session isn't mistaken for a new one
+    restored_state.detect_manual_override()
+    assert restored_state.requested_current == dict.fromkeys(Phase, 16)
+
+
+def test_restore_state_ignores_unknown_chargers(power_allocator: PowerAllocator):
+    """Test that state of chargers no longer managed is ignored."""
+    mock_charger = MockCharger(initial_current=10, charger_id="charger1")
+    power_allocator.add_charger(mock_charger)
+
+    power_allocator.restore_state(
+        {"other": {"requested_current": {"l1": 6}, "last_applied_current": {"l1": 6}}}
+    )
+
+    assert power_allocator._chargers["charger1"].initialized is False
+
+
+# ===== FUSE TREE TESTS =====
+
+def _fuse_tree_allocator() -> tuple[PowerAllocator, list[MockCharger]]:
+    """Create an allocator with two chargers behind a group and one behind main."""
+    tree = FuseTree(
+        FuseNode(ROOT_NODE_ID, 50, parent_id=None),
+        [FuseNode("garage", 25, charger_ids=("charger_a", "charger_b"))],
+        charger_ids=["charger_a", "charger_b", "charger_c"],
+    )
+    allocator = PowerAllocator(fuse_tree=tree)
+    chargers = []
+    for charger_id in ("charger_a", "charger_b", "charger_c"):
+        charger = MockCharger(initial_current=10, charger_id=charger_id)
+        charger.set_can_charge(True)
+        allocator.add_charger_and_initialize(charger)
+        allocator._chargers[charger_id].requested_current = dict.fromkeys(Phase, 16)
+        chargers.append(charger)
+    return allocator, chargers
+
+
+def test_fuse_group_cuts_count_towards_main_fuse():
+    """Test that cuts for a group reduce the deficit left for the main fuse."""
+    allocator, _ = _fuse_tree_allocator()
+
+    result = allocator.update_allocation(
+        dict.fromkeys(Phase, -6),
+        group_available_currents={"garage": dict.fromkeys(Phase, -4)},
+    )
+
+    # The group's deficit of 4A is cut from its own chargers first, the
+    # remaining 2A of the main fuse is spread over all chargers
+    assert result["charger_a"] == dict.fromkeys(Phase, 7)
+    assert result["charger_b"] == dict.fromkeys(Phase, 7)
+    assert result["charger_c"] == dict.fromkeys(Phase, 9)
+
+
+def test_fuse_group_limits_increases():
+    """Test that increases respect the surplus of every group on the path."""
+    allocator, _ = _fuse_tree_allocator()
+
+    result = allocator.update_allocation(
+        dict.fromkeys(Phase, 12),
+        group_available_currents={"garage": dict.fromkeys(Phase, 4)},
+    )
+
+    assert result["charger_a"] == dict.fromkeys(Phase, 12)
+    assert result["charger_b"] == dict.fromkeys(Phase, 12)
+    assert result["charger_c"] == dict.fromkeys(Phase, 14)
+
+
+def test_fuse_group_without_availability_blocks_increases():
+    """Test that chargers behind a group with unknown availability stay put."""
+    allocator, _ = _fuse_tree_allocator()
+
+    result = allocator.update_allocation(dict.fromkeys(Phase, 12))
+
+    assert "charger_a" not in result
+    assert "charger_b" not in result
+    assert result["charger_c"] == dict.fromkeys(Phase, 16)
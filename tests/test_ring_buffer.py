@@ -0,0 +1,49 @@
+"""Tests for the ring buffer shared by the meter history and the statistics."""
+
+import pytest
+
+from custom_components.evse_load_balancer.ring_buffer import RingBuffer
+
+COLUMNS = (("d", 0.0), ("h", -1))
+
+
+def test_full_buffer_overwrites_oldest_row():
+    buffer = RingBuffer(COLUMNS, capacity=3)
+    for i in range(5):
+        buffer.append(i * 1.5, i)
+
+    assert len(buffer) == 3
+    assert buffer.capacity == 3
+    assert [buffer.get(1, i) for i in range(3)] == [2, 3, 4]
+    assert buffer.get(0, -1) == 6.0
+
+
+def test_growable_buffer_keeps_every_row():
+    buffer = RingBuffer(COLUMNS, capacity=2, growable=True)
+    buffer.append(0, 0)
+    buffer.append(1, 1)
+    buffer.pop_first()
+    for i in range(2, 5):
+        buffer.append(i, i)
+
+    assert buffer.capacity == 4
+    assert list(buffer.view(1)) == [1, 2, 3, 4]
+    buffer.pop_last()
+    assert buffer.get(1, -1) == 3
+
+
+def test_view_wraps_around_the_end():
+    buffer = RingBuffer(COLUMNS, capacity=4)
+    for i in range(6):
+        buffer.append(i, i)
+
+    view = buffer.view(1, start=1, length=3)
+    assert list(view) == [3, 4, 5]
+    assert view[-1] == 5
+    assert view[0:2] == [3, 4]
+    assert buffer.nbytes == 4 * (8 + 2)
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        RingBuffer(COLUMNS, capacity=0)
@@ -0,0 +1,137 @@
+"""Tests for the RuntimeConfig."""
+
+import dataclasses
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.evse_load_balancer import config_flow as cf
+from custom_components.evse_load_balancer import options_flow as of
+from custom_components.evse_load_balancer.const import (
+    DOMAIN,
+    BalancerAlgorithm,
+    BreakerCurve,
+    OvercurrentMode,
+    Phase,
+    StalenessPolicy,
+)
+from custom_components.evse_load_balancer.runtime_config import RuntimeConfig
+
+
+def test_defaults_from_config_entry_data():
+    """Test that the runtime config falls back to the setup data and defaults."""
+    entry = MockConfigEntry(domain=DOMAIN, data={cf.CONF_FUSE_SIZE: 25})
+
+    config = RuntimeConfig.from_config_entry(entry)
+
+    assert config.fuse_size == 25
+    assert config.phases == (Phase.L1, Phase.L2, Phase.L3)
+    assert config.charge_limit_hysteresis_seconds == 15 * 60
+    assert config.overcurrent_mode == OvercurrentMode.OPTIMISED
+    assert config.max_limits == dict.fromkeys(Phase, 25)
+    assert config.staleness_budget_seconds == 60
+    assert config.staleness_policy == StalenessPolicy.DEGRADE
+    assert config.breaker_curve == BreakerCurve.C
+    assert config.breaker_cooling_seconds == 5 * 60
+    assert config.balancer_algorithm == BalancerAlgorithm.OPTIMISED
+    assert config.balancer_options == {}
+
+
+def test_options_override_data():
+    """Test that the options override the setup data."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={cf.CONF_FUSE_SIZE: 25, cf.CONF_PHASE_COUNT: 1},
+        options={
+            of.OPTION_MAX_FUSE_LOAD_AMPS: 20.0,
+            of.OPTION_CHARGE_LIMIT_HYSTERESIS: 2,
+            of.OPTION_ALLOW_TEMPORARY_OVERCURRENT: False,
+            of.OPTION_STALENESS_BUDGET: 30,
+            of.OPTION_STALENESS_POLICY: "pause",
+            of.OPTION_BREAKER_CURVE: "b",
+            of.OPTION_BREAKER_COOLING: 2,
+            of.OPTION_BALANCER_ALGORITHM: "forecasting",
+        },
+    )
+
+    config = RuntimeConfig.from_config_entry(entry)
+
+    assert config.fuse_size == 20
+    assert isinstance(config.fuse_size, int)
+    assert config.phases == (Phase.L1,)
+    assert config.charge_limit_hysteresis_seconds == 120
+    assert config.overcurrent_mode == OvercurrentMode.CONSERVATIVE
+    assert config.max_limits == {Phase.L1: 20}
+    assert config.staleness_budget_seconds == 30
+    assert config.staleness_policy == StalenessPolicy.PAUSE
+    assert config.breaker_curve == BreakerCurve.B
+    assert config.breaker_cooling_seconds == 120
+    assert config.balancer_algorithm == BalancerAlgorithm.FORECASTING
+
+
+@pytest.mark.parametrize(
+    ("options", "expected"),
+    [
+        (
+            {of.OPTION_BALANCER_ALGORITHM: "median", of.OPTION_MEDIAN_PERIOD: 2},
+            {"hysteresis_period": 120},
+        ),
+        (
+            {of.OPTION_BALANCER_ALGORITHM: "ramp", of.OPTION_RAMP_DEADBAND: 3},
+            {"margin": 1, "deadband": 3},
+        ),
+        (
+            {of.OPTION_BALANCER_ALGORITHM: "optimised", of.OPTION_RAMP_MARGIN: 3},
+            {},
+        ),
+    ],
+)
+def test_balancer_options_of_the_algorithm(options, expected):
+    """Test that only the options of the chosen algorithm are passed on."""
+    entry = MockConfigEntry(
+        domain=DOMAIN, data={cf.CONF_FUSE_SIZE: 25}, options=options
+    )
+
+    config = RuntimeConfig.from_config_entry(entry)
+
+    assert config.balancer_options == expected
+
+
+def test_runtime_config_is_immutable():
+    """Test that the runtime config can't be changed in place."""
+    config = RuntimeConfig.from_config_entry(
+        MockConfigEntry(domain=DOMAIN, data={cf.CONF_FUSE_SIZE: 25})
+    )
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.fuse_size = 30
+    assert not hasattr(config, "__dict__")
+
+
+def test_fuse_groups_from_config_entry_data():
+    """Test that fuse groups are parsed into fuse nodes."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            cf.CONF_FUSE_SIZE: 50,
+            cf.CONF_PHASE_COUNT: 3,
+            cf.CONF_FUSE_GROUPS: [
+                {
+                    cf.CONF_FUSE_GROUP_NAME: "garage",
+                    cf.CONF_FUSE_SIZE: 25,
+                    cf.CONF_FUSE_GROUP_PARENT: "main",
+                    cf.CONF_CHARGER_DEVICE: ["charger_a", "charger_b"],
+                    cf.CONF_PHASE_KEY_ONE: "sensor.garage_l1",
+                }
+            ],
+        },
+    )
+
+    config = RuntimeConfig.from_config_entry(entry)
+
+    (group,) = config.fuse_groups
+    assert group.node_id == "garage"
+    assert group.fuse_size == 25
+    assert group.parent_id == "main"
+    assert group.charger_ids == ("charger_a", "charger_b")
+    assert group.current_entities == {Phase.L1: "sensor.garage_l1"}
@@ -0,0 +1,181 @@
+"""Tests for the EVSE Load Balancer sensors."""
+
+from datetime import UTC, datetime
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.components.sensor import SensorDeviceClass
+
+from custom_components.evse_load_balancer.load_balancer_charger_sensor import (
+    SENSOR_KEY_CHARGER_CURRENT_LIMIT,
+    SENSOR_KEY_CHARGER_LAST_UPDATE,
+    LoadBalancerChargerSensor,
+)
+from custom_components.evse_load_balancer.load_balancer_phase_sensor import (
+    SENSOR_KEY_AVAILABLE_CURRENT_L1,
+    LoadBalancerPhaseSensor,
+)
+from custom_components.evse_load_balancer.load_balancer_sensor import (
+    LoadBalancerSensor,
+    LoadBalancerSensorEntityDescription,
+)
+
+from .helpers.mock_charger import MockCharger
+
+
+@pytest.fixture
+def mock_coordinator():
+    """Create a mock coordinator exposing a single value."""
+    coordinator = MagicMock()
+    coordinator.config_entry.entry_id = "test_entry"
+    coordinator.sensor_value = 10
+    return coordinator
+
+
+def _create_sensor(coordinator, **kwargs) -> LoadBalancerSensor:
+    return LoadBalancerSensor(
+        coordinator,
+        LoadBalancerSensorEntityDescription(key="sensor_value", **kwargs),
+    )
+
+
+def test_first_state_is_always_written(mock_coordinator):
+    """Test that a sensor without written state always writes."""
+    sensor = _create_sensor(mock_coordinator, min_update_interval=60)
+
+    assert sensor.should_write_state(0)
+
+
+def test_unchanged_state_is_not_written(mock_coordinator):
+    """Test that an unchanged value isn't written again."""
+    sensor = _create_sensor(mock_coordinator)
+
+    assert sensor.should_write_state(0)
+    assert not sensor.should_write_state(100)
+
+    mock_coordinator.sensor_value = 11
+    assert sensor.should_write_state(101)
+
+
+def test_min_update_interval_limits_writes(mock_coordinator):
+    """Test that changes within the minimum interval are not written."""
+    sensor = _create_sensor(mock_coordinator, min_update_interval=60)
+    assert sensor.should_write_state(0)
+
+    mock_coordinator.sensor_value = 11
+    assert not sensor.should_write_state(30)
+    assert sensor.should_write_state(60)
+
+
+def test_deadband_ignores_small_changes(mock_coordinator):
+    """Test that numeric changes within the deadband are not written."""
+    sensor = _create_sensor(mock_coordinator, deadband=2)
+    assert sensor.should_write_state(0)
+
+    mock_coordinator.sensor_value = 11
+    assert not sensor.should_write_state(1)
+
+    mock_coordinator.sensor_value = 12
+    assert sensor.should_write_state(2)
+
+
+def test_deadband_does_not_hide_unavailability(mock_coordinator):
+    """Test that changes to and from None are always written."""
+    sensor = _create_sensor(mock_coordinator, deadband=2)
+    assert sensor.should_write_state(0)
+
+    mock_coordinator.sensor_value = None
+    assert sensor.should_write_state(1)
+
+    mock_coordinator.sensor_value = 10
+    assert sensor.should_write_state(2)
+
+
+def _create_phase_sensor(coordinator) -> LoadBalancerPhaseSensor:
+    return LoadBalancerPhaseSensor(
+        coordinator,
+        LoadBalancerSensorEntityDescription(
+            key=SENSOR_KEY_AVAILABLE_CURRENT_L1,
+            device_class=SensorDeviceClass.CURRENT,
+            min_update_interval=5,
+            deadband=1,
+            attributes_update_interval=60,
+        ),
+    )
+
+
+def test_drifting_statistics_within_deadband_are_not_written(mock_coordinator):
+    """Test that statistics drifting every cycle don't bypass the deadband."""
+    mock_coordinator.balancer_statistics = {"l1": {"average": 4.0}}
+    mock_coordinator.get_available_current_for_phase.return_value = 4
+    sensor = _create_phase_sensor(mock_coordinator)
+    assert sensor.should_write_state(0)
+
+    for now in range(5, 60, 5):
+        mock_coordinator.balancer_statistics = {"l1": {"average": 4.0 + now / 100}}
+        mock_coordinator.get_available_current_for_phase.return_value = 4.5 - now % 2
+        assert not sensor.should_write_state(now)
+
+
+def test_changed_attributes_are_written_eventually(mock_coordinator):
+    """Test that new attributes are written once their interval has passed."""
+    mock_coordinator.balancer_statistics = {"l1": {"average": 4.0}}
+    mock_coordinator.get_available_current_for_phase.return_value = 4
+    sensor = _create_phase_sensor(mock_coordinator)
+    assert sensor.should_write_state(0)
+
+    mock_coordinator.balancer_statistics = {"l1": {"average": 4.5}}
+    assert not sensor.should_write_state(30)
+    assert sensor.should_write_state(60)
+    assert not sensor.should_write_state(120)
+
+    # A change of the value beyond the deadband is written right away
+    mock_coordinator.get_available_current_for_phase.return_value = 6
+    assert sensor.should_write_state(125)
+
+
+def test_phase_sensor_registers_once(mock_coordinator):
+    """Test that a phase sensor is registered with the coordinator only once."""
+    sensor = LoadBalancerPhaseSensor(
+        mock_coordinator,
+        LoadBalancerSensorEntityDescription(key=SENSOR_KEY_AVAILABLE_CURRENT_L1),
+    )
+
+    mock_coordinator.register_sensor.assert_called_once_with(sensor)
+
+
+def test_charger_sensors(mock_coordinator):
+    """Test that charger sensors report the values of their own charger."""
+    charger = MockCharger(charger_id="charger_a")
+    mock_coordinator.get_charger_current_limit.return_value = 16
+    mock_coordinator.get_charger_last_update_time.return_value = 0
+
+    limit_sensor = LoadBalancerChargerSensor(
+        mock_coordinator,
+        LoadBalancerSensorEntityDescription(key=SENSOR_KEY_CHARGER_CURRENT_LIMIT),
+        charger,
+    )
+    update_sensor = LoadBalancerChargerSensor(
+        mock_coordinator,
+        LoadBalancerSensorEntityDescription(key=SENSOR_KEY_CHARGER_LAST_UPDATE),
+        charger,
+    )
+
+    assert limit_sensor.unique_id == "test_entry_charger_a_charger_current_limit"
+    assert limit_sensor.native_value == 16
+    mock_coordinator.get_charger_current_limit.assert_called_with("charger_a")
+    assert update_sensor.native_value == datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def test_phase_sensor_statistics(mock_coordinator):
+    """Test that phase sensors expose the statistics of their own phase."""
+    mock_coordinator.balancer_statistics = {
+        "l1": {"average": 4.5, "minimum": 2, "maximum": 6},
+        "l2": {"average": 1.0, "minimum": 0, "maximum": 2},
+    }
+    sensor = LoadBalancerPhaseSensor(
+        mock_coordinator,
+        LoadBalancerSensorEntityDescription(key=SENSOR_KEY_AVAILABLE_CURRENT_L1),
+    )
+
+    assert sensor.extra_state_attributes == {"average": 4.5, "minimum": 2, "maximum": 6}
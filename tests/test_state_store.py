@@ -0,0 +1,142 @@
+"""Tests for the BalancerStateStore."""
+
+from datetime import timedelta
+from time import time
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.evse_load_balancer.const import DOMAIN
+from custom_components.evse_load_balancer.state_store import (
+    ATTR_SAVED_AT,
+    STATE_MAX_AGE,
+    STATE_REFRESH_DELAY,
+    STATE_SAVE_DELAY,
+    STORAGE_VERSION,
+    BalancerStateStore,
+    async_remove_state,
+)
+
+ENTRY_ID = "test_entry"
+STORAGE_KEY = f"{DOMAIN}.{ENTRY_ID}"
+
+
+def _stored(data: dict) -> dict:
+    return {"version": STORAGE_VERSION, "key": STORAGE_KEY, "data": data}
+
+
+async def test_save_and_load(hass: HomeAssistant, hass_storage):
+    """Test that the exported state is saved with a timestamp and loaded back."""
+    store = BalancerStateStore(hass, ENTRY_ID, lambda: {"foo": 1})
+
+    await store.async_save()
+
+    saved = hass_storage[STORAGE_KEY]["data"]
+    assert saved["foo"] == 1
+    assert saved[ATTR_SAVED_AT] <= time()
+
+    loaded = await BalancerStateStore(hass, ENTRY_ID, dict).async_load()
+    assert loaded["foo"] == 1
+
+
+async def test_load_without_state(hass: HomeAssistant, hass_storage):
+    """Test that nothing is loaded when no state was saved."""
+    store = BalancerStateStore(hass, ENTRY_ID, dict)
+
+    assert await store.async_load() is None
+
+
+async def test_load_discards_stale_state(hass: HomeAssistant, hass_storage):
+    """Test that state older than the maximum age is discarded."""
+    hass_storage[STORAGE_KEY] = _stored(
+        {"foo": 1, ATTR_SAVED_AT: time() - STATE_MAX_AGE - 1}
+    )
+    store = BalancerStateStore(hass, ENTRY_ID, dict)
+
+    assert await store.async_load() is None
+
+
+async def test_schedule_save_is_debounced(hass: HomeAssistant, hass_storage):
+    """Test that a scheduled save writes the latest state once."""
+    calls = []
+
+    def export_state() -> dict:
+        calls.append(len(calls))
+        return {"calls": len(calls)}
+
+    store = BalancerStateStore(hass, ENTRY_ID, export_state)
+
+    store.async_schedule_save()
+    store.async_schedule_save()
+    assert calls == []
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=STATE_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+
+    assert len(calls) == 1
+    assert hass_storage[STORAGE_KEY]["data"]["calls"] == 1
+
+    # A new save can be scheduled once the previous one was written
+    store.async_schedule_save()
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=2 * STATE_SAVE_DELAY + 2)
+    )
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
+async def test_unchanged_state_is_only_refreshed(hass: HomeAssistant, hass_storage):
+    """Test that state without significant changes is written at the refresh delay."""
+    significant = {"limits": 16}
+    calls = []
+
+    def export_state() -> dict:
+        calls.append(len(calls))
+        return {"limits": significant["limits"]}
+
+    store = BalancerStateStore(
+        hass, ENTRY_ID, export_state, significant_state=lambda: dict(significant)
+    )
+    start = dt_util.utcnow()
+
+    # The first state is significant
+    store.async_schedule_save()
+    async_fire_time_changed(hass, start + timedelta(seconds=STATE_SAVE_DELAY + 1))
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    # Unchanged state isn't written at the save delay
+    store.async_schedule_save()
+    async_fire_time_changed(hass, start + timedelta(seconds=3 * STATE_SAVE_DELAY))
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+
+    # A significant change brings the pending write forward
+    significant["limits"] = 10
+    store.async_schedule_save()
+    async_fire_time_changed(hass, start + timedelta(seconds=5 * STATE_SAVE_DELAY))
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+    assert hass_storage[STORAGE_KEY]["data"]["limits"] == 10
+
+    # And unchanged state is still refreshed before it goes stale
+    store.async_schedule_save()
+    async_fire_time_changed(
+        hass,
+        start + timedelta(seconds=5 * STATE_SAVE_DELAY + STATE_REFRESH_DELAY + 1),
+    )
+    await hass.async_block_till_done()
+    assert len(calls) == 3
+    assert STATE_REFRESH_DELAY < STATE_MAX_AGE
+
+
+async def test_remove_state(hass: HomeAssistant, hass_storage):
+    """Test that the stored state of an entry is removed."""
+    hass_storage[STORAGE_KEY] = _stored({"foo": 1, ATTR_SAVED_AT: time()})
+
+    await async_remove_state(hass, ENTRY_ID)
+
+    assert STORAGE_KEY not in hass_storage